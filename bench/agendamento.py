@@ -0,0 +1,300 @@
+"""Benchmark dos caminhos quentes de agendamento.
+
+Gera cargas sintéticas e mede, por função, vazão (ops/s) e latência
+(p50/p99, em microssegundos):
+
+- povoamento: N salas x M eventos agendados via `fachada.agendar_evento_ui`;
+- misto: agendar/atualizar/cancelar/listar em proporções fixas, com conflitos;
+- contenção: todos os pedidos na mesma sala, metade colidindo;
+- regras: `regras.encontrar_conflito` sobre a lista de eventos de uma sala.
+
+Os resultados podem ser salvos em JSON e comparados com um baseline salvo
+antes; o processo termina com código 1 se alguma função ficar mais lenta que
+a tolerância.
+
+Uso (na raiz do projeto):
+
+    uv run python bench/agendamento.py --saída bench/baseline.json
+    uv run python bench/agendamento.py --baseline bench/baseline.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from app import fachada
+from app.container import (
+    Container,
+    criar_container_memória,
+    criar_container_sqlite,
+)
+from domínio.regras import encontrar_conflito
+
+_BASE = datetime(2025, 1, 6, 8, 0)
+_SLOT = timedelta(minutes=30)
+
+
+def _texto(dt: datetime) -> str:
+    return dt.strftime(fachada.FORMATO_DATETIME)
+
+
+def _slot(i: int) -> datetime:
+    return _BASE + i * _SLOT
+
+
+class Medidor:
+    """Acumula latências (em ns) por nome de função."""
+
+    def __init__(self) -> None:
+        self.amostras: dict[str, list[int]] = {}
+
+    def medir(self, nome: str, fn: Callable, *args, **kwargs):
+        t0 = time.perf_counter_ns()
+        resultado = fn(*args, **kwargs)
+        self.amostras.setdefault(nome, []).append(time.perf_counter_ns() - t0)
+        return resultado
+
+    def resumo(self) -> dict[str, dict]:
+        return {nome: _estatísticas(ns) for nome, ns in self.amostras.items()}
+
+
+def _percentil(ordenadas: list[int], p: float) -> int:
+    # "nearest rank": simples e estável para amostras pequenas
+    i = max(0, min(len(ordenadas) - 1, round(p * len(ordenadas)) - 1))
+    return ordenadas[i]
+
+
+def _estatísticas(ns: list[int]) -> dict:
+    ordenadas = sorted(ns)
+    total = sum(ordenadas)
+    return {
+        "n": len(ordenadas),
+        "ops_s": len(ordenadas) / (total / 1e9) if total else float("inf"),
+        "p50_us": _percentil(ordenadas, 0.50) / 1000,
+        "p99_us": _percentil(ordenadas, 0.99) / 1000,
+    }
+
+
+# ----------------------------
+# Cenários
+# ----------------------------
+
+
+def povoar(m: Medidor, c: Container, salas: int, eventos: int) -> None:
+    """Cadastra `salas` salas e agenda `eventos` eventos sem conflito em cada."""
+    for s in range(salas):
+        fachada.cadastrar_sala_ui(c, f"Sala {s + 1}", "30")
+    # intercala as salas, como chegariam pedidos reais
+    for i in range(eventos):
+        ini, fim = _texto(_slot(2 * i)), _texto(_slot(2 * i + 1))
+        for s in range(1, salas + 1):
+            m.medir(
+                "agendar_evento_ui",
+                fachada.agendar_evento_ui,
+                c,
+                str(s),
+                "Aula",
+                ini,
+                fim,
+            )
+
+
+def misto(
+    m: Medidor,
+    c: Container,
+    salas: int,
+    eventos: int,
+    operações: int,
+    rng: random.Random,
+) -> None:
+    """Mistura escritas e leituras sobre um container já povoado."""
+    janela = 2 * eventos  # slots ocupáveis por sala
+    ids = [e["id"] for e in fachada.listar_eventos_ui(c)]
+    for _ in range(operações):
+        sorteio = rng.random()
+        sala = str(rng.randint(1, salas))
+        i = rng.randrange(janela)
+        ini, fim = _texto(_slot(i)), _texto(_slot(i + 1))
+        if sorteio < 0.40:
+            ok, ev = m.medir(
+                "agendar_evento_ui",
+                fachada.agendar_evento_ui,
+                c,
+                sala,
+                "Extra",
+                ini,
+                fim,
+            )
+            if ok:
+                ids.append(ev.id)
+        elif sorteio < 0.65 and ids:
+            eid = str(rng.choice(ids))
+            m.medir(
+                "atualizar_evento_ui",
+                fachada.atualizar_evento_ui,
+                c,
+                eid,
+                inicio=ini,
+                fim=fim,
+            )
+        elif sorteio < 0.80 and ids:
+            eid = ids.pop(rng.randrange(len(ids)))
+            m.medir("cancelar_evento_ui", fachada.cancelar_evento_ui, c, str(eid))
+        elif sorteio < 0.95:
+            dia = _slot(i).replace(hour=0, minute=0)
+            m.medir(
+                "listar_eventos_no_intervalo_ui",
+                fachada.listar_eventos_no_intervalo_ui,
+                c,
+                _texto(dia),
+                _texto(dia + timedelta(days=1)),
+            )
+        else:
+            m.medir("listar_eventos_ui", fachada.listar_eventos_ui, c)
+
+
+def contenção(m: Medidor, c: Container, eventos: int, rng: random.Random) -> None:
+    """Todos os pedidos na mesma sala; cerca de metade colide com algum existente."""
+    fachada.cadastrar_sala_ui(c, "Disputada", "30")
+    for _ in range(eventos):
+        i = rng.randrange(eventos)
+        ini, fim = _texto(_slot(i)), _texto(_slot(i + 1))
+        m.medir(
+            "agendar_evento_ui", fachada.agendar_evento_ui, c, "1", "Aula", ini, fim
+        )
+
+
+def regras(m: Medidor, c: Container, repetições: int, rng: random.Random) -> None:
+    """`encontrar_conflito` puro sobre a lista (grande) de eventos da sala 1."""
+    evs = c.evento_repo.listar_por_sala(1)
+    n = max(len(evs), 1)
+    for _ in range(repetições):
+        i = rng.randrange(2 * n)
+        m.medir(
+            "encontrar_conflito", encontrar_conflito, evs, 1, _slot(i), _slot(i + 1)
+        )
+
+
+def executar(args: argparse.Namespace) -> dict:
+    def novo_container() -> Container:
+        if args.backend == "sqlite":
+            return criar_container_sqlite(":memory:")
+        return criar_container_memória()
+
+    rng = random.Random(args.semente)
+    resultados: dict[str, dict] = {}
+
+    c = novo_container()
+    m = Medidor()
+    povoar(m, c, args.salas, args.eventos)
+    resultados["povoamento"] = m.resumo()
+
+    m = Medidor()
+    misto(m, c, args.salas, args.eventos, args.operações, rng)
+    resultados["misto"] = m.resumo()
+
+    c = novo_container()
+    m = Medidor()
+    contenção(m, c, args.salas * args.eventos, rng)
+    resultados["contenção"] = m.resumo()
+
+    m = Medidor()
+    regras(m, c, args.operações, rng)
+    resultados["regras"] = m.resumo()
+
+    return {
+        "parâmetros": {
+            "backend": args.backend,
+            "salas": args.salas,
+            "eventos": args.eventos,
+            "operações": args.operações,
+            "semente": args.semente,
+        },
+        "python": platform.python_version(),
+        "resultados": resultados,
+    }
+
+
+# ----------------------------
+# Relatório e comparação
+# ----------------------------
+
+
+def imprimir(relatório: dict) -> None:
+    print(f"{'cenário/função':45} {'n':>7} {'ops/s':>12} {'p50 µs':>10} {'p99 µs':>10}")
+    for cenário, funções in relatório["resultados"].items():
+        for nome, r in funções.items():
+            print(
+                f"{cenário + '/' + nome:45} {r['n']:>7} {r['ops_s']:>12.0f}"
+                f" {r['p50_us']:>10.1f} {r['p99_us']:>10.1f}"
+            )
+
+
+def comparar(atual: dict, baseline: dict, tolerância: float) -> list[str]:
+    """Compara vazões com o baseline; retorna as chaves que regrediram."""
+    if atual["parâmetros"] != baseline["parâmetros"]:
+        print("[aviso] parâmetros diferentes do baseline; comparação aproximada")
+    regressões = []
+    print(
+        f"\n{'cenário/função':45} {'ops/s base':>12} {'ops/s atual':>12} {'variação':>9}"
+    )
+    for cenário, funções in atual["resultados"].items():
+        for nome, r in funções.items():
+            base = baseline["resultados"].get(cenário, {}).get(nome)
+            if base is None:
+                continue
+            variação = r["ops_s"] / base["ops_s"] - 1
+            marca = ""
+            if variação < -tolerância:
+                marca = "  <- regressão"
+                regressões.append(f"{cenário}/{nome}")
+            print(
+                f"{cenário + '/' + nome:45} {base['ops_s']:>12.0f}"
+                f" {r['ops_s']:>12.0f} {variação:>+9.1%}{marca}"
+            )
+    return regressões
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--backend", choices=("memória", "sqlite"), default="memória")
+    p.add_argument("--salas", type=int, default=20)
+    p.add_argument("--eventos", type=int, default=100, help="eventos por sala")
+    p.add_argument("--operações", type=int, default=5000)
+    p.add_argument("--semente", type=int, default=42)
+    p.add_argument("--saída", type=Path, help="salva os resultados em JSON")
+    p.add_argument("--baseline", type=Path, help="JSON salvo para comparar")
+    p.add_argument(
+        "--tolerância",
+        type=float,
+        default=0.10,
+        help="queda de ops/s aceita antes de acusar regressão (padrão 10%%)",
+    )
+    args = p.parse_args(argv)
+
+    relatório = executar(args)
+    imprimir(relatório)
+    if args.saída:
+        args.saída.write_text(
+            json.dumps(relatório, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        print(f"\n[ok] resultados salvos em {args.saída}")
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressões = comparar(relatório, baseline, args.tolerância)
+        if regressões:
+            print(f"\n[erro] {len(regressões)} regressão(ões): {', '.join(regressões)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
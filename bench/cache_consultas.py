@@ -0,0 +1,110 @@
+"""Mede o cache LRU de consultas de eventos (`infra.repos_cache`).
+
+Carga de leitura dominante (`--leituras` por escrita, padrão 200:1) sobre
+uma agenda povoada: as leituras são "a sala X está livre no horário Y?"
+(`encontrar_conflito`) e "eventos de hoje" (`listar_no_intervalo`, de uma
+sala ou de todas), concentradas nos dias próximos como numa agenda real; as
+escritas agendam eventos novos pelo serviço. Compara cada backend com e sem
+cache e mostra a taxa de acerto para dimensionar `--capacidade`.
+
+Uso (na raiz do projeto):
+
+    uv run python bench/cache_consultas.py
+    uv run python bench/cache_consultas.py --capacidade 1000 --leituras 50
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from app.container import (
+    Container,
+    criar_container_com_cache,
+    criar_container_memória,
+    criar_container_sqlite,
+)
+from domínio.serviços import agendar_evento
+
+_BASE = datetime(2025, 1, 6, 8, 0)
+_SLOT = timedelta(minutes=30)
+_DIA = timedelta(days=1)
+
+
+def _povoar(c: Container, salas: int, dias: int, rng: random.Random) -> None:
+    for s in range(salas):
+        c.sala_repo.criar(f"Sala {s + 1}", 10 + s)
+    c.evento_repo.criar_em_lote(
+        (sala, "Aula", inicio, inicio + _SLOT)
+        for d in range(dias)
+        for sala in range(1, salas + 1)
+        for k in range(0, 20, 2)
+        if rng.random() < 0.6
+        for inicio in (_BASE + d * _DIA + k * _SLOT,)
+    )
+
+
+def _carga(
+    c: Container, operações: int, leituras: int, salas: int, dias: int, semente: int
+) -> float:
+    rng = random.Random(semente)
+    repo = c.evento_repo
+    t0 = time.perf_counter()
+    for i in range(operações):
+        # dias próximos são muito mais consultados (distribuição geométrica)
+        dia = min(int(rng.expovariate(0.5)), dias - 1)
+        sala = rng.randint(1, salas)
+        inicio = _BASE + dia * _DIA + rng.randrange(20) * _SLOT
+        if i % (leituras + 1) == 0:
+            agendar_evento(repo, c.sala_repo, sala, "Extra", inicio, inicio + _SLOT)
+        elif rng.random() < 0.7:
+            repo.encontrar_conflito(sala, inicio, inicio + _SLOT)
+        else:
+            manhã = _BASE + dia * _DIA
+            repo.listar_no_intervalo(
+                manhã, manhã + 10 * _SLOT, sala if rng.random() < 0.8 else None
+            )
+    return time.perf_counter() - t0
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--salas", type=int, default=50)
+    p.add_argument("--dias", type=int, default=60)
+    p.add_argument("--operações", type=int, default=100_000)
+    p.add_argument("--leituras", type=int, default=200, help="leituras por escrita")
+    p.add_argument("--capacidade", type=int, default=4096)
+    p.add_argument("--semente", type=int, default=42)
+    args = p.parse_args(argv)
+
+    fábricas = {
+        "memória": criar_container_memória,
+        "sqlite": lambda: criar_container_sqlite(":memory:"),
+    }
+    print(f"{'backend':20}{'ops/s':>12}{'acertos':>10}")
+    for nome, fábrica in fábricas.items():
+        for com_cache in (False, True):
+            c = fábrica()
+            _povoar(c, args.salas, args.dias, random.Random(args.semente))
+            if com_cache:
+                c = criar_container_com_cache(c, args.capacidade)
+            segundos = _carga(
+                c, args.operações, args.leituras, args.salas, args.dias, args.semente
+            )
+            acertos = (
+                f"{c.evento_repo.estatísticas().taxa_de_acerto:.0%}"
+                if com_cache
+                else "-"
+            )
+            rótulo = f"{nome} + cache" if com_cache else nome
+            print(f"{rótulo:20}{args.operações / segundos:12.0f}{acertos:>10}")
+            c.fechar()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+"""Gerador de carga para o servidor HTTP (`app.servidor`).
+
+Abre `--conexões` conexões keep-alive (uma por thread cliente) e dispara
+`--requisições` requisições no total, numa mistura de leitura e escrita:
+
+- 60% GET /salas/disponiveis (consulta de disponibilidade);
+- 20% GET /eventos?inicio=&fim= (visão de um dia);
+- 20% POST /eventos (parte colide com horários já ocupados -> 409).
+
+Mede requisições/s e latência p50/p99 vista pelo cliente, e a média do
+tempo de fachada informado no cabeçalho `Server-Timing`. Sem `--url`, sobe
+um servidor em processo (porta livre) e o povoa antes de medir.
+
+Uso (na raiz do projeto):
+
+    uv run python bench/carga_http.py --conexões 8 --requisições 20000
+    uv run python bench/carga_http.py --url http://127.0.0.1:8000
+"""
+
+import argparse
+import http.client
+import json
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from urllib.parse import quote, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from app.fachada import FORMATO_DATETIME
+from app.servidor import ServidorHTTP
+
+_BASE = datetime(2025, 1, 6, 8, 0)
+_SLOT = timedelta(minutes=30)
+
+
+def _texto(dt: datetime) -> str:
+    return dt.strftime(FORMATO_DATETIME)
+
+
+class Cliente:
+    """Uma conexão keep-alive; devolve (status, corpo, ms de fachada)."""
+
+    def __init__(self, host: str, porta: int) -> None:
+        self.con = http.client.HTTPConnection(host, porta, timeout=30)
+
+    def pedir(
+        self, método: str, caminho: str, corpo: dict | None = None
+    ) -> tuple[int, bytes, float]:
+        dados = None if corpo is None else json.dumps(corpo).encode()
+        cabeçalhos = {"Content-Type": "application/json"} if dados else {}
+        self.con.request(método, caminho, body=dados, headers=cabeçalhos)
+        r = self.con.getresponse()
+        conteúdo = r.read()
+        return r.status, conteúdo, _fachada_ms(r.getheader("Server-Timing", ""))
+
+
+def _fachada_ms(server_timing: str) -> float:
+    for métrica in server_timing.split(","):
+        nome, _, dur = métrica.strip().partition(";dur=")
+        if nome == "fachada":
+            return float(dur)
+    return 0.0
+
+
+def povoar(c: Cliente, salas: int, eventos: int) -> None:
+    for s in range(salas):
+        c.pedir("POST", "/salas", {"nome": f"Sala {s + 1}", "capacidade": 10 + s})
+    lote = [
+        {
+            "sala_id": s,
+            "titulo": "Aula",
+            "inicio": _texto(_BASE + 2 * i * _SLOT),
+            "fim": _texto(_BASE + (2 * i + 1) * _SLOT),
+        }
+        for i in range(eventos)
+        for s in range(1, salas + 1)
+    ]
+    status, _, _ = c.pedir("POST", "/eventos/lote", lote)
+    assert status == 200, status
+
+
+def trabalho(
+    host: str,
+    porta: int,
+    n: int,
+    salas: int,
+    eventos: int,
+    semente: int,
+    latências: list[float],
+    fachada: list[float],
+    status: dict[int, int],
+    trava: threading.Lock,
+) -> None:
+    rng = random.Random(semente)
+    c = Cliente(host, porta)
+    minhas: list[float] = []
+    minhas_fachada: list[float] = []
+    meus_status: dict[int, int] = {}
+    for _ in range(n):
+        sorteio = rng.random()
+        i = rng.randrange(2 * eventos)
+        ini, fim = _BASE + i * _SLOT, _BASE + (i + 1) * _SLOT
+        if sorteio < 0.6:
+            caminho = (
+                f"/salas/disponiveis?capacidade={rng.randint(10, 10 + salas)}"
+                f"&inicio={quote(_texto(ini))}&fim={quote(_texto(fim))}"
+            )
+            pedido = ("GET", caminho, None)
+        elif sorteio < 0.8:
+            dia = ini.replace(hour=0, minute=0)
+            caminho = (
+                f"/eventos?inicio={quote(_texto(dia))}"
+                f"&fim={quote(_texto(dia + timedelta(days=1)))}"
+            )
+            pedido = ("GET", caminho, None)
+        else:
+            corpo = {
+                "sala_id": rng.randint(1, salas),
+                "titulo": "Extra",
+                "inicio": _texto(ini),
+                "fim": _texto(fim),
+            }
+            pedido = ("POST", "/eventos", corpo)
+        t0 = time.perf_counter()
+        código, _, ms = c.pedir(*pedido)
+        minhas.append((time.perf_counter() - t0) * 1000)
+        minhas_fachada.append(ms)
+        meus_status[código] = meus_status.get(código, 0) + 1
+    c.con.close()
+    with trava:
+        latências.extend(minhas)
+        fachada.extend(minhas_fachada)
+        for código, qtd in meus_status.items():
+            status[código] = status.get(código, 0) + qtd
+
+
+def _percentil(ordenadas: list[float], p: float) -> float:
+    i = max(0, min(len(ordenadas) - 1, round(p * len(ordenadas)) - 1))
+    return ordenadas[i]
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--url", help="servidor já em execução (padrão: sobe um local)")
+    p.add_argument("--conexões", type=int, default=8)
+    p.add_argument("--requisições", type=int, default=20000)
+    p.add_argument("--threads-servidor", type=int, default=16)
+    p.add_argument("--salas", type=int, default=20)
+    p.add_argument("--eventos", type=int, default=50, help="eventos por sala")
+    p.add_argument("--semente", type=int, default=42)
+    args = p.parse_args(argv)
+
+    servidor = None
+    if args.url:
+        alvo = urlsplit(args.url)
+        host, porta = alvo.hostname or "127.0.0.1", alvo.port or 80
+    else:
+        servidor = ServidorHTTP(("127.0.0.1", 0), threads=args.threads_servidor)
+        threading.Thread(target=servidor.serve_forever, daemon=True).start()
+        host, porta = "127.0.0.1", servidor.server_port
+        povoar(Cliente(host, porta), args.salas, args.eventos)
+
+    latências: list[float] = []
+    fachada: list[float] = []
+    status: dict[int, int] = {}
+    trava = threading.Lock()
+    por_conexão = args.requisições // args.conexões
+    clientes = [
+        threading.Thread(
+            target=trabalho,
+            args=(
+                host,
+                porta,
+                por_conexão,
+                args.salas,
+                args.eventos,
+                args.semente + k,
+                latências,
+                fachada,
+                status,
+                trava,
+            ),
+        )
+        for k in range(args.conexões)
+    ]
+    t0 = time.perf_counter()
+    for t in clientes:
+        t.start()
+    for t in clientes:
+        t.join()
+    segundos = time.perf_counter() - t0
+
+    if servidor is not None:
+        servidor.shutdown()
+        servidor.server_close()
+
+    latências.sort()
+    total = len(latências)
+    print(f"requisições:   {total} em {segundos:.2f} s ({args.conexões} conexões)")
+    print(f"vazão:         {total / segundos:.0f} req/s")
+    print(f"latência p50:  {_percentil(latências, 0.50):.2f} ms")
+    print(f"latência p99:  {_percentil(latências, 0.99):.2f} ms")
+    print(f"fachada média: {sum(fachada) / max(total, 1):.3f} ms (Server-Timing)")
+    print("status:        " + ", ".join(f"{k}={v}" for k, v in sorted(status.items())))
+    return 0 if not any(k >= 500 for k in status) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
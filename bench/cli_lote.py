@@ -0,0 +1,88 @@
+"""Compara N processos do CLI (um comando cada) com um único `lote`.
+
+Os dois caminhos aplicam os mesmos comandos (`salas add` e `eventos add`)
+num diário em diretório temporário; o primeiro lança um processo por
+comando, como um script de shell que chama o CLI em laço, e o segundo passa
+todos a `main.py lote` pela entrada padrão. Imprime as operações/s de cada
+um. Os processos avulsos são poucos (`--avulsos`): o custo por processo não
+depende do tamanho da agenda.
+
+Uso (na raiz do projeto):
+
+    uv run python bench/cli_lote.py
+    uv run python bench/cli_lote.py --operações 50000 --avulsos 50
+"""
+
+import argparse
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+_SRC = Path(__file__).resolve().parent.parent / "src"
+_BASE = datetime(2025, 1, 6, 8, 0)
+_FORMATO = "%Y-%m-%d %H:%M"
+
+
+def _comandos(operações: int, salas: int) -> list[list[str]]:
+    cmds = [["salas", "add", f"Sala {s + 1}", "30"] for s in range(salas)]
+    for i in range(operações - salas):
+        inicio = _BASE + timedelta(hours=i // salas)
+        fim = inicio + timedelta(hours=1)
+        cmds.append(
+            [
+                "eventos",
+                "add",
+                str(i % salas + 1),
+                f"Evento {i}",
+                inicio.strftime(_FORMATO),
+                fim.strftime(_FORMATO),
+            ]
+        )
+    return cmds
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--operações", type=int, default=10_000)
+    p.add_argument("--avulsos", type=int, default=30, help="processos avulsos")
+    p.add_argument("--salas", type=int, default=10)
+    args = p.parse_args(argv)
+    cmds = _comandos(args.operações, args.salas)
+    main_py = [sys.executable, str(_SRC / "main.py")]
+
+    with tempfile.TemporaryDirectory() as dados:
+        t0 = time.perf_counter()
+        for cmd in cmds[: args.avulsos]:
+            subprocess.run(
+                [*main_py, "--dados", dados, *cmd],
+                check=True,
+                stdout=subprocess.DEVNULL,
+            )
+        avulsos = args.avulsos / (time.perf_counter() - t0)
+
+    with tempfile.TemporaryDirectory() as dados:
+        entrada = "".join(shlex.join(cmd) + "\n" for cmd in cmds)
+        t0 = time.perf_counter()
+        r = subprocess.run(
+            [*main_py, "--dados", dados, "lote"],
+            input=entrada,
+            capture_output=True,
+            text=True,
+        )
+        lote = len(cmds) / (time.perf_counter() - t0)
+        falhas = r.stdout.count('"ok":false')
+
+    print(f"{'um processo por comando':28}{avulsos:10.0f} ops/s")
+    print(f"{'lote (um processo)':28}{lote:10.0f} ops/s  ({lote / avulsos:.0f}x)")
+    if falhas:
+        print(f"[erro] {falhas} comandos recusados no lote")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
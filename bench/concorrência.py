@@ -0,0 +1,130 @@
+"""Benchmark de agendamento concorrente (threads) com travas por sala.
+
+Cada thread agenda eventos via `serviços.agendar_evento_detalhado` sobre o
+mesmo container em memória; mede a vazão total (agendamentos/s) para 1, 2,
+4, 8... threads em dois modos:
+
+- por-sala: `MemEventoRepository.travar_salas` (uma trava por sala);
+- global: todas as salas dividem a mesma trava (referência para comparação).
+
+Com o GIL, trabalho puramente de CPU não escala com threads; o que a trava
+por sala permite é sobrepor a espera de quem está dentro da seção crítica.
+`--latência-ms` simula essa espera (ex.: I/O de um backend remoto) dentro
+de cada gravação. No fim de cada rodada o script confere que nenhuma sala
+ficou com eventos sobrepostos.
+
+Uso (na raiz do projeto):
+
+    uv run python bench/concorrência.py
+    uv run python bench/concorrência.py --salas 16 --latência-ms 1
+"""
+
+import argparse
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from itertools import pairwise
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from app.container import Container, criar_container_memória
+from domínio.modelos import Sala
+from domínio.serviços import agendar_evento_detalhado
+
+_BASE = datetime(2025, 1, 6, 8, 0)
+_SLOT = timedelta(minutes=30)
+
+
+def preparar(salas: int, modo: str, latência: float) -> Container:
+    c = criar_container_memória()
+    for sid in range(1, salas + 1):
+        c.sala_repo.adicionar(Sala(id=sid, nome=f"Sala {sid}", capacidade=30))
+    repo = c.evento_repo
+    if modo == "global":
+        travar = repo.travar_salas
+        repo.travar_salas = lambda *_: travar(0)  # type: ignore[method-assign]
+    if latência:
+        criar = repo.criar
+
+        def criar_lento(*args, **kwargs):
+            time.sleep(latência)
+            return criar(*args, **kwargs)
+
+        repo.criar = criar_lento  # type: ignore[method-assign]
+    return c
+
+
+def rodada(c: Container, salas: int, threads: int, pedidos: int) -> tuple[float, int]:
+    """Agenda `pedidos` pedidos repartidos entre `threads`; retorna (segundos,
+    aceitos). Cada slot é pedido duas vezes (exceto, talvez, os da última
+    volta), então cerca de metade dos pedidos colide."""
+    início = threading.Barrier(threads)
+
+    def trabalho(t: int) -> int:
+        aceitos = 0
+        início.wait()
+        for i in range(t, pedidos, threads):
+            sala = i % salas + 1
+            slot = _BASE + (i // (2 * salas)) * _SLOT
+            r = agendar_evento_detalhado(
+                c.evento_repo, c.sala_repo, sala, "Aula", slot, slot + _SLOT
+            )
+            aceitos += r.ok
+        return aceitos
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        aceitos = sum(pool.map(trabalho, range(threads)))
+    return time.perf_counter() - t0, aceitos
+
+
+def esperados(salas: int, pedidos: int) -> int:
+    """Quantos pedidos de `rodada` devem ser aceitos: um por slot distinto
+    (vale também quando `pedidos` não é múltiplo de 2 * `salas`)."""
+    return len({(i % salas, i // (2 * salas)) for i in range(pedidos)})
+
+
+def sobreposições(c: Container, salas: int) -> int:
+    total = 0
+    for sid in range(1, salas + 1):
+        evs = c.evento_repo.listar_por_sala(sid)  # ordenados por início
+        total += sum(a.fim > b.inicio for a, b in pairwise(evs))
+    return total
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--salas", type=int, default=8)
+    p.add_argument("--pedidos", type=int, default=4000)
+    p.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8], metavar="N")
+    p.add_argument(
+        "--latência-ms",
+        type=float,
+        default=0.2,
+        help="espera simulada dentro de cada gravação (padrão 0.2 ms; 0 desliga)",
+    )
+    args = p.parse_args(argv)
+    latência = args.latência_ms / 1000
+
+    print(f"{'modo':8} {'threads':>7} {'agend/s':>10} {'escala':>7} {'aceitos':>8}")
+    erros = 0
+    esperado = esperados(args.salas, args.pedidos)
+    for modo in ("por-sala", "global"):
+        base = None
+        for n in args.threads:
+            c = preparar(args.salas, modo, latência)
+            segundos, aceitos = rodada(c, args.salas, n, args.pedidos)
+            vazão = args.pedidos / segundos
+            base = base or vazão
+            print(f"{modo:8} {n:>7} {vazão:>10.0f} {vazão / base:>6.1f}x {aceitos:>8}")
+            if aceitos != esperado or sobreposições(c, args.salas):
+                print("[erro] agendamento duplicado detectado")
+                erros += 1
+    return 1 if erros else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
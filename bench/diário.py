@@ -0,0 +1,108 @@
+"""Mede o diário (`infra.diário`): escrita, compactação e tempo de reabertura.
+
+1. grava `--eventos` eventos pelo repositório com diário (`criar_em_lote`),
+   em registros/s;
+2. reabre reaplicando só o diário (sem snapshot);
+3. compacta (grava o snapshot) e reabre a partir dele;
+4. acrescenta `--cauda` escritas depois do snapshot e reabre (snapshot +
+   diário), o caso comum depois de um tempo rodando.
+
+Cada reabertura confere que o estado carregado é igual ao gravado. Os arquivos
+ficam num diretório temporário, apagado ao fim.
+
+Uso (na raiz do projeto):
+
+    uv run python bench/diário.py                     # 1 milhão de eventos
+    uv run python bench/diário.py --eventos 200000 --salas 50
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from app.container import Container, criar_container_diário
+
+_BASE = datetime(2025, 1, 6, 8, 0)
+_SLOT = timedelta(minutes=30)
+
+
+def _abrir(diretório: Path) -> tuple[Container, float]:
+    t0 = time.perf_counter()
+    c = criar_container_diário(diretório, intervalo=3600, compactar_após=10**12)
+    return c, time.perf_counter() - t0
+
+
+def _tamanho_mb(diretório: Path) -> float:
+    return sum(p.stat().st_size for p in diretório.iterdir()) / 1e6
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--eventos", type=int, default=1_000_000)
+    p.add_argument("--salas", type=int, default=200)
+    p.add_argument("--cauda", type=int, default=10_000, help="escritas pós-snapshot")
+    args = p.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        diretório = Path(tmp)
+        c, _ = _abrir(diretório)
+        for s in range(args.salas):
+            c.sala_repo.criar(f"Sala {s + 1}", 10 + s)
+        dados = (
+            (
+                1 + i % args.salas,
+                "Aula",
+                _BASE + 2 * (i // args.salas) * _SLOT,
+                _BASE + (2 * (i // args.salas) + 1) * _SLOT,
+            )
+            for i in range(args.eventos)
+        )
+        t0 = time.perf_counter()
+        c.evento_repo.criar_em_lote(dados)
+        c.diário.sincronizar()
+        segundos = time.perf_counter() - t0
+        esperado = c.evento_repo.listar()
+        c.fechar()
+        print(
+            f"escrita:            {args.eventos / segundos:>9.0f} registros/s "
+            f"({segundos:.2f} s, {_tamanho_mb(diretório):.1f} MB de diário)"
+        )
+
+        c, segundos = _abrir(diretório)
+        assert c.evento_repo.listar() == esperado
+        print(f"reabrir (diário):   {segundos:>9.2f} s")
+        t0 = time.perf_counter()
+        c.diário.compactar()
+        print(
+            f"compactar:          {time.perf_counter() - t0:>9.2f} s "
+            f"({_tamanho_mb(diretório):.1f} MB de snapshot)"
+        )
+        c.fechar()
+
+        c, segundos = _abrir(diretório)
+        assert c.evento_repo.listar() == esperado
+        print(f"reabrir (snapshot): {segundos:>9.2f} s")
+        for eid in range(1, args.cauda + 1):
+            if eid % 2:
+                c.evento_repo.remover(eid)
+            else:
+                c.evento_repo.criar(
+                    1, "Extra", _BASE - eid * _SLOT, _BASE - eid * _SLOT + _SLOT
+                )
+        esperado = c.evento_repo.listar()
+        c.fechar()
+
+        c, segundos = _abrir(diretório)
+        assert c.evento_repo.listar() == esperado
+        print(f"reabrir (+ {args.cauda} no diário): {segundos:.2f} s")
+        c.fechar()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""Mede o custo da instrumentação (`app.instrumentação`).
+
+Roda a mesma carga pela fachada (agendar eventos e consultar conflitos e
+intervalos, como um cliente da API) com a instrumentação desligada, ligada
+e ligada com amostragem de `cProfile`, e imprime as chamadas/s de cada
+variante e o relatório da última.
+
+Uso (na raiz do projeto):
+
+    uv run python bench/instrumentação.py
+    uv run python bench/instrumentação.py --operações 50000 --amostragem 0.01
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from app import fachada
+from app.container import Container, criar_container_memória
+from app.instrumentação import Instrumentação
+
+_BASE = datetime(2025, 1, 6, 8, 0)
+_SLOT = timedelta(minutes=30)
+_FORMATO = "%Y-%m-%d %H:%M"
+
+
+def _carga(c: Container, operações: int, salas: int, semente: int) -> float:
+    rng = random.Random(semente)
+    t0 = time.perf_counter()
+    for i in range(operações):
+        inicio = _BASE + rng.randrange(30 * 20) * _SLOT
+        ini, fim = inicio.strftime(_FORMATO), (inicio + _SLOT).strftime(_FORMATO)
+        sala = str(rng.randint(1, salas))
+        if i % 4 == 0:
+            fachada.agendar_evento_ui(c, sala, "Aula", ini, fim)
+        elif i % 4 == 1:
+            fachada.listar_eventos_no_intervalo_ui(c, ini, fim, sala)
+        else:
+            fachada.buscar_salas_disponíveis_ui(c, "1", ini, fim)
+    return time.perf_counter() - t0
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--salas", type=int, default=20)
+    p.add_argument("--operações", type=int, default=20_000)
+    p.add_argument("--amostragem", type=float, default=0.001)
+    p.add_argument("--repetições", type=int, default=3, help="vale a melhor")
+    p.add_argument("--semente", type=int, default=42)
+    args = p.parse_args(argv)
+
+    variantes = [
+        ("desligada", None),
+        ("ligada", Instrumentação()),
+        (
+            f"ligada + cProfile ({args.amostragem:.1%})",
+            Instrumentação(perfil_limite=0.0, perfil_amostragem=args.amostragem),
+        ),
+    ]
+    melhores = [0.0] * len(variantes)
+    # variantes intercaladas: ruído da máquina afeta todas por igual
+    for _ in range(args.repetições):
+        for k, (_, inst) in enumerate(variantes):
+            c = criar_container_memória()
+            for s in range(args.salas):
+                c.sala_repo.criar(f"Sala {s + 1}", 10 + s)
+            if inst is not None:
+                inst.limpar()
+                c = inst.instrumentar(c)
+                inst.ativar()
+            try:
+                segundos = _carga(c, args.operações, args.salas, args.semente)
+            finally:
+                if inst is not None:
+                    inst.desativar()
+            melhores[k] = max(melhores[k], args.operações / segundos)
+    for (nome, _), taxa in zip(variantes, melhores):
+        print(f"{nome:32}{taxa:10.0f} ops/s  ({taxa / melhores[0] - 1:+.0%})")
+    print()
+    print(variantes[-1][1].relatório(12))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""Mede a importação e a exportação em streaming (`infra.intercâmbio`).
+
+Gera um CSV de eventos em disco (sem montá-lo em memória), importa-o num
+container em memória e exporta os eventos de volta para outro arquivo.
+Imprime as linhas/s de cada etapa e o pico de memória alocada (via
+`tracemalloc`) além dos próprios eventos guardados no repositório: é o que
+mostra que a leitura e a escrita não dependem do tamanho do arquivo.
+
+Uso (na raiz do projeto):
+
+    uv run python bench/intercâmbio.py
+    uv run python bench/intercâmbio.py --linhas 500000 --formato jsonl
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from infra.intercâmbio import exportar_eventos, importar_eventos
+from infra.repos_memória import MemEventoRepository, MemSalaRepository
+
+_BASE = datetime(2025, 1, 6, 8, 0)
+
+
+def _gerar(caminho: Path, linhas: int, salas: int, formato: str) -> None:
+    with open(caminho, "w", encoding="utf-8") as f:
+        if formato == "csv":
+            f.write("sala_id,titulo,inicio,fim\n")
+        for i in range(linhas):
+            inicio = _BASE + timedelta(minutes=30 * (i // salas))
+            registro = (
+                i % salas + 1,
+                f"Evento {i}",
+                inicio.isoformat(" ", "minutes"),
+                (inicio + timedelta(minutes=30)).isoformat(" ", "minutes"),
+            )
+            if formato == "csv":
+                f.write(",".join(map(str, registro)) + "\n")
+            else:
+                chaves = ("sala_id", "titulo", "inicio", "fim")
+                f.write(json.dumps(dict(zip(chaves, registro))) + "\n")
+
+
+def _medir(função):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    resultado = função()
+    segundos = time.perf_counter() - t0
+    atual, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, segundos, pico - atual
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--linhas", type=int, default=200_000)
+    p.add_argument("--salas", type=int, default=50)
+    p.add_argument("--formato", choices=("csv", "jsonl"), default="csv")
+    p.add_argument("--lote", type=int, default=1000, help="linhas por bloco")
+    args = p.parse_args(argv)
+
+    salas, eventos = MemSalaRepository(), MemEventoRepository()
+    for s in range(args.salas):
+        salas.criar(f"Sala {s + 1}", 20)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        entrada = Path(tmp) / f"eventos.{args.formato}"
+        _gerar(entrada, args.linhas, args.salas, args.formato)
+
+        def importar():
+            with open(entrada, encoding="utf-8", newline="") as f:
+                return importar_eventos(
+                    f, eventos, salas, args.formato, tamanho_lote=args.lote
+                )
+
+        def exportar():
+            with open(Path(tmp) / "saída", "w", encoding="utf-8", newline="") as f:
+                return exportar_eventos(eventos, f, args.formato)
+
+        resumo, t_imp, extra_imp = _medir(importar)
+        exportados, t_exp, extra_exp = _medir(exportar)
+
+    print(
+        f"importação: {resumo.importados / t_imp:10.0f} linhas/s"
+        f"  ({resumo.importados} importadas, {resumo.recusados} recusadas)"
+    )
+    print(f"exportação: {exportados / t_exp:10.0f} linhas/s")
+    print(
+        f"pico além dos eventos guardados: importação {extra_imp / 2**20:.1f} MiB,"
+        f" exportação {extra_exp / 2**20:.1f} MiB"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
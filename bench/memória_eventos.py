@@ -0,0 +1,87 @@
+"""Mede a memória ocupada por evento (bytes/evento) com `tracemalloc`.
+
+Compara o `Evento` atual (`slots=True`) com uma réplica sem slots (cada
+instância com seu `__dict__`, como antes), e mostra o custo total por evento
+dentro do `MemEventoRepository` (entidade + índices).
+
+Uso (na raiz do projeto):
+
+    uv run python bench/memória_eventos.py [n_eventos]
+"""
+
+import sys
+import tracemalloc
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domínio.modelos import Evento
+from infra.repos_memória import MemEventoRepository
+
+
+@dataclass
+class EventoSemSlots:
+    """Réplica de `Evento` sem slots, usada como referência ("antes")."""
+
+    id: int
+    sala_id: int
+    titulo: str
+    inicio: datetime
+    fim: datetime
+
+
+_BASE = datetime(2025, 1, 6, 8, 0)
+
+
+def _argumentos(i: int) -> dict:
+    # datetimes distintos por evento, como num histórico real
+    inicio = _BASE + timedelta(minutes=30 * i)
+    return {
+        "id": i + 1,
+        "sala_id": i % 50 + 1,
+        "titulo": "Aula",
+        "inicio": inicio,
+        "fim": inicio + timedelta(minutes=30),
+    }
+
+
+def bytes_por_evento(criar, n: int) -> float:
+    """Bytes alocados por evento ao manter `n` eventos vivos."""
+    tracemalloc.start()
+    antes, _ = tracemalloc.get_traced_memory()
+    vivos = criar(n)
+    depois, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del vivos
+    return (depois - antes) / n
+
+
+def _lista(cls):
+    return lambda n: [cls(**_argumentos(i)) for i in range(n)]
+
+
+def _repositório(n: int) -> MemEventoRepository:
+    repo = MemEventoRepository()
+    for i in range(n):
+        repo.adicionar(Evento(**_argumentos(i)))
+    return repo
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    assert [f.name for f in fields(EventoSemSlots)] == [f.name for f in fields(Evento)]
+
+    antes = bytes_por_evento(_lista(EventoSemSlots), n)
+    depois = bytes_por_evento(_lista(Evento), n)
+    repo = bytes_por_evento(_repositório, n)
+    print(f"eventos: {n}")
+    print(f"Evento sem slots (antes): {antes:8.1f} bytes/evento")
+    print(f"Evento com slots (atual): {depois:8.1f} bytes/evento")
+    print(f"economia:                 {antes - depois:8.1f} bytes/evento")
+    print(f"MemEventoRepository:      {repo:8.1f} bytes/evento (entidade + índices)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Micro-benchmark do parsing de datas da fachada (`YYYY-MM-DD HH:MM`).
+
+Compara, em ns por chamada:
+
+- strptime: `datetime.strptime(texto, FORMATO_DATETIME)` (o parser antigo);
+- fromisoformat: `datetime.fromisoformat` (referência; aceita outras formas);
+- rápido: o caminho de largura fixa da fachada, sem cache;
+- fachada (textos distintos): `_parse_dt` com cache, sempre errando o cache;
+- fachada (repetidos): `_parse_dt` com textos que se repetem, como numa
+  importação em que muitos eventos começam nos mesmos horários.
+
+Antes de medir, confere que o parser da fachada devolve o mesmo que o
+strptime para todos os textos gerados.
+
+Uso (na raiz do projeto):
+
+    uv run python bench/parse_datas.py
+    uv run python bench/parse_datas.py --textos 200000
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from app import fachada
+
+
+def gerar(n: int, distintos: int, semente: int) -> list[str]:
+    """`n` textos sorteados entre `distintos` horários de meia em meia hora."""
+    rng = random.Random(semente)
+    base = datetime(2025, 1, 6, 8, 0)
+    horários = [
+        (base + k * timedelta(minutes=30)).strftime(fachada.FORMATO_DATETIME)
+        for k in range(distintos)
+    ]
+    return [rng.choice(horários) for _ in range(n)]
+
+
+def medir(nome: str, fn, textos: list[str], repetições: int) -> float:
+    def rodar():
+        for t in textos:
+            fn(t)
+
+    melhor = min(timeit.repeat(rodar, number=1, repeat=repetições))
+    ns = melhor / len(textos) * 1e9
+    print(f"{nome:32} {ns:>9.0f} ns/chamada")
+    return ns
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--textos", type=int, default=100_000)
+    p.add_argument("--repetidos", type=int, default=500, help="horários distintos")
+    p.add_argument("--repetições", type=int, default=5)
+    p.add_argument("--semente", type=int, default=42)
+    args = p.parse_args(argv)
+
+    únicos = gerar(args.textos, args.textos * 4, args.semente)
+    repetidos = gerar(args.textos, args.repetidos, args.semente)
+
+    formato = fachada.FORMATO_DATETIME
+    for t in únicos[:10_000] + repetidos[:1000]:
+        if fachada._parse_dt(t) != datetime.strptime(t, formato):
+            print(f"[erro] divergência em {t!r}")
+            return 1
+
+    rápido = fachada._parse_dt_texto.__wrapped__
+
+    def fachada_sem_acerto(t: str):
+        fachada._parse_dt_texto.cache_clear()
+        return fachada._parse_dt(t)
+
+    base = medir(
+        "strptime", lambda t: datetime.strptime(t, formato), únicos, args.repetições
+    )
+    medir("fromisoformat", datetime.fromisoformat, únicos, args.repetições)
+    r = medir("rápido (sem cache)", rápido, únicos, args.repetições)
+    medir("fachada (textos distintos)", fachada_sem_acerto, únicos, args.repetições)
+    fachada._parse_dt_texto.cache_clear()
+    c = medir("fachada (repetidos)", fachada._parse_dt, repetidos, args.repetições)
+    print(f"\nganho sobre strptime: rápido {base / r:.1f}x, com cache {base / c:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
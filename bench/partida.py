@@ -0,0 +1,124 @@
+"""Mede a partida a frio do CLI (`src/main.py`) com `python -X importtime`.
+
+Cada cenário roda `--repetições` vezes num processo novo; o tempo de import
+vem das linhas do `-X importtime` (soma dos módulos de primeiro nível, sem
+a inicialização do interpretador) e o tempo total, do relógio de parede.
+Cenários:
+
+- "interpretador": `python -c pass`, a referência;
+- "import main": o que todo comando paga;
+- "primeiro uso": import de `main` + criação do container e da fachada, o
+  que um comando que toca nos dados paga.
+
+Antes de medir, uma rodada grava os `.pyc` (mesmo com
+PYTHONDONTWRITEBYTECODE no ambiente): sem eles a medida seria a do
+compilador. Sai com código 1 se a mediana do import do "primeiro uso"
+passar de `--orçamento` ms, para uso em CI. Com `--detalhar`, lista os
+módulos que mais pesam nesse cenário.
+
+O orçamento padrão (90 ms) deixa folga sobre os 45-60 ms medidos em
+máquinas diferentes. Uns 25-30 ms deles são de `dataclasses` (que importa
+`inspect`), de que as entidades de `domínio.modelos` dependem: tirá-lo de
+`app.container` só mudaria quem aparece pagando por ele no `--detalhar`.
+
+Uso (na raiz do projeto):
+
+    uv run python bench/partida.py
+    uv run python bench/partida.py --orçamento 75 --detalhar 15
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+_SRC = Path(__file__).resolve().parent.parent / "src"
+
+_CENÁRIOS = {
+    "interpretador": "pass",
+    "import main": "import main",
+    "primeiro uso": "import main; main._obter_container(); main._fachada()",
+}
+
+
+def _rodar(código: str) -> tuple[float, list[tuple[int, int, str]]]:
+    """Roda `código` num processo novo; devolve (segundos, linhas do
+    importtime como (própria µs, acumulada µs, módulo indentado))."""
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    t0 = time.perf_counter()
+    r = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", código],
+        cwd=_SRC,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    segundos = time.perf_counter() - t0
+    linhas = []
+    for linha in r.stderr.splitlines():
+        if not linha.startswith("import time:") or "self [us]" in linha:
+            continue
+        própria, acumulada, módulo = linha[len("import time:") :].split("|")
+        linhas.append((int(própria), int(acumulada), módulo.rstrip()))
+    return segundos, linhas
+
+
+def _import_ms(linhas: list[tuple[int, int, str]], partida: set[str]) -> float:
+    # soma dos módulos de primeiro nível (um espaço de indentação) que não
+    # são importados pela partida do próprio interpretador (site, ...)
+    return (
+        sum(
+            acumulada
+            for _, acumulada, módulo in linhas
+            if módulo[:2] != "  " and módulo not in partida
+        )
+        / 1e3
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--repetições", type=int, default=15)
+    p.add_argument(
+        "--orçamento", type=float, default=90.0, help="ms de import no primeiro uso"
+    )
+    p.add_argument("--detalhar", type=int, default=0, metavar="N")
+    args = p.parse_args(argv)
+
+    for código in _CENÁRIOS.values():
+        _rodar(código)  # grava os .pyc
+
+    partida = {m for _, _, m in _rodar("pass")[1]}
+    print(f"{'cenário':16}{'total ms':>10}{'import ms':>11}")
+    medianas = {}
+    for cenário, código in _CENÁRIOS.items():
+        totais, imports = [], []
+        for _ in range(args.repetições):
+            segundos, linhas = _rodar(código)
+            totais.append(segundos * 1e3)
+            imports.append(_import_ms(linhas, partida))
+        medianas[cenário] = statistics.median(imports)
+        print(f"{cenário:16}{statistics.median(totais):10.1f}{medianas[cenário]:11.1f}")
+
+    if args.detalhar:
+        _, linhas = _rodar(_CENÁRIOS["primeiro uso"])
+        print(f"\n{'módulo':48}{'própria ms':>11}{'acumulada ms':>14}")
+        for própria, acumulada, módulo in sorted(linhas, key=lambda x: -x[1])[
+            : args.detalhar
+        ]:
+            print(f"{módulo[:47]:48}{própria / 1e3:11.1f}{acumulada / 1e3:14.1f}")
+
+    gasto = medianas["primeiro uso"]
+    if gasto > args.orçamento:
+        print(f"\n[erro] import no primeiro uso: {gasto:.1f} ms > {args.orçamento} ms")
+        return 1
+    print(f"\n[ok] import no primeiro uso: {gasto:.1f} ms <= {args.orçamento} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""Compara a partida a frio com o snapshot binário (`infra.repos_mmap`).
+
+Grava `--eventos` eventos em três formatos e mede o tempo até o repositório
+estar pronto para consultas:
+
+- binário mapeado (`criar_container_mmap`): só mapeia e lê o cabeçalho;
+- diário/snapshot CSV (`criar_container_diário`): monta todos os eventos;
+- carga clássica: um `Evento(...)` validado por linha, inserido um a um.
+
+Depois mede a latência (µs por chamada) de consultas comuns no repositório
+mapeado e no em memória: `obter_por_id`, `encontrar_conflito` e
+`listar_no_intervalo` de um dia numa sala.
+
+Uso (na raiz do projeto):
+
+    uv run python bench/snapshot_binário.py
+    uv run python bench/snapshot_binário.py --eventos 200000
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from app.container import criar_container_diário, criar_container_mmap
+from domínio.modelos import Evento, Sala
+from infra.repos_memória import MemEventoRepository
+from infra.repos_mmap import gravar_snapshot_binário
+
+_BASE = datetime(2025, 1, 6, 8, 0)
+_SLOT = timedelta(minutes=30)
+
+
+def _cronometrar(fn):
+    t0 = time.perf_counter()
+    resultado = fn()
+    return resultado, time.perf_counter() - t0
+
+
+def _latência_us(fn, argumentos: list[tuple]) -> float:
+    t0 = time.perf_counter()
+    for a in argumentos:
+        fn(*a)
+    return (time.perf_counter() - t0) / len(argumentos) * 1e6
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--eventos", type=int, default=1_000_000)
+    p.add_argument("--salas", type=int, default=200)
+    p.add_argument("--consultas", type=int, default=2000)
+    p.add_argument("--semente", type=int, default=42)
+    args = p.parse_args(argv)
+
+    salas = [Sala(s, f"Sala {s}", 10 + s) for s in range(1, args.salas + 1)]
+    linhas = [
+        (
+            i + 1,
+            1 + i % args.salas,
+            "Aula",
+            _BASE + 2 * (i // args.salas) * _SLOT,
+            _BASE + (2 * (i // args.salas) + 1) * _SLOT,
+        )
+        for i in range(args.eventos)
+    ]
+    eventos = [Evento(*campos) for campos in linhas]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        binário = Path(tmp) / "agenda.bin"
+        _, segundos = _cronometrar(
+            lambda: gravar_snapshot_binário(binário, salas, eventos)
+        )
+        tamanho = binário.stat().st_size / 1e6
+        print(f"gravar binário:       {segundos:8.2f} s ({tamanho:.1f} MB)")
+
+        diário = criar_container_diário(Path(tmp) / "diario", intervalo=3600)
+        diário.sala_repo._carregar(salas)
+        diário.evento_repo._carregar(eventos)
+        diário.diário.compactar()
+        diário.fechar()
+        del diário
+
+        print("partida a frio (até a primeira consulta):")
+        mapeado, segundos = _cronometrar(lambda: criar_container_mmap(binário))
+        print(f"  binário mapeado:    {segundos * 1000:8.2f} ms")
+        c, segundos = _cronometrar(
+            lambda: criar_container_diário(Path(tmp) / "diario", intervalo=3600)
+        )
+        print(f"  snapshot CSV:       {segundos * 1000:8.0f} ms")
+        c.fechar()
+        del c
+
+        def carga_clássica() -> MemEventoRepository:
+            repo = MemEventoRepository()
+            for campos in linhas:
+                repo.adicionar(Evento(*campos))
+            return repo
+
+        memória, segundos = _cronometrar(carga_clássica)
+        print(f"  Evento(...) um a um: {segundos * 1000:7.0f} ms")
+
+        rng = random.Random(args.semente)
+        n = args.consultas
+        ids = [(rng.randint(1, args.eventos),) for _ in range(n)]
+        dias = args.eventos // args.salas // 24 + 1
+        janelas = []
+        for _ in range(n):
+            inicio = _BASE + rng.randrange(dias * 48) * _SLOT
+            janelas.append((rng.randint(1, args.salas), inicio, inicio + _SLOT))
+        dias_sala = [
+            (inicio.replace(hour=0), inicio.replace(hour=0) + timedelta(days=1), sala)
+            for sala, inicio, _ in janelas
+        ]
+        print("latência por consulta (µs): mapeado / memória")
+        for nome, método, argumentos in (
+            ("obter_por_id", "obter_por_id", ids),
+            ("encontrar_conflito", "encontrar_conflito", janelas),
+            ("listar_no_intervalo (dia)", "listar_no_intervalo", dias_sala),
+        ):
+            a = _latência_us(getattr(mapeado.evento_repo, método), argumentos)
+            b = _latência_us(getattr(memória, método), argumentos)
+            print(f"  {nome:26} {a:8.1f} / {b:8.1f}")
+        for args_ in janelas[:200]:
+            assert mapeado.evento_repo.encontrar_conflito(
+                *args_
+            ) == memória.encontrar_conflito(*args_)
+        mapeado.fechar()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""Compara formas de revalidar a agenda inteira (`relatórios.validar_agenda`).
+
+Povoa salas com eventos aleatórios (alguns em conflito, como depois de uma
+mudança de regra) e mede:
+
+- "por evento": `regras.encontrar_conflito` de cada evento contra os demais
+  da sala, O(n²) por sala (e só acha o primeiro conflito de cada um);
+- "varredura": `validar_agenda` em Python;
+- "numpy": `validar_agenda(usar_numpy=True)`, que converte os eventos
+  para arrays a cada chamada (se o NumPy estiver instalado);
+- "numpy int64": só `pares_em_conflito` sobre colunas int64 já prontas (em
+  minutos), o caso de quem guarda a agenda em arrays.
+
+Uso (na raiz do projeto):
+
+    uv run python bench/validação.py
+    uv run python bench/validação.py --eventos 200000 --folga 15 --sem-força-bruta
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domínio.modelos import Evento
+from domínio.regras import encontrar_conflito
+from domínio.relatórios import _numpy, pares_em_conflito, validar_agenda
+from infra.repos_memória import MemEventoRepository
+
+
+def _povoar(eventos: int, salas: int, semente: int) -> MemEventoRepository:
+    rng = random.Random(semente)
+    base = datetime(2025, 1, 6)
+    dias = max(1, eventos // (salas * 8))  # ~8 eventos de até 1h por sala/dia
+    lista = []
+    for i in range(eventos):
+        inicio = base + timedelta(minutes=rng.randrange(dias * 24 * 60))
+        fim = inicio + timedelta(minutes=rng.randint(15, 60))
+        lista.append(Evento(i + 1, rng.randint(1, salas), "x", inicio, fim))
+    repo = MemEventoRepository()
+    repo._carregar(lista)
+    return repo
+
+
+def _por_evento(repo: MemEventoRepository, folga: timedelta) -> int:
+    com_conflito = 0
+    por_sala: dict[int, list[Evento]] = {}
+    for e in repo.listar():
+        por_sala.setdefault(e.sala_id, []).append(e)
+    for lista in por_sala.values():
+        for e in lista:
+            if encontrar_conflito(lista, e.sala_id, e.inicio, e.fim + folga, e.id):
+                com_conflito += 1
+    return com_conflito
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--eventos", type=int, default=20_000)
+    p.add_argument("--salas", type=int, default=20)
+    p.add_argument("--folga", type=int, default=0, help="minutos")
+    p.add_argument("--semente", type=int, default=42)
+    p.add_argument("--sem-força-bruta", action="store_true")
+    args = p.parse_args(argv)
+
+    repo = _povoar(args.eventos, args.salas, args.semente)
+    folga = timedelta(minutes=args.folga)
+    variantes = [
+        ("varredura", lambda: len(validar_agenda(repo, folga, usar_numpy=False)))
+    ]
+    np = _numpy()
+    if np is not None:
+        variantes.append(
+            ("numpy", lambda: len(validar_agenda(repo, folga, usar_numpy=True)))
+        )
+        lista = repo.listar()
+        minuto = timedelta(minutes=1)
+        colunas = (
+            np.array([e.sala_id for e in lista], dtype=np.int64),
+            np.array(
+                [(e.inicio - lista[0].inicio) // minuto for e in lista], dtype=np.int64
+            ),
+            np.array(
+                [(e.fim - lista[0].inicio) // minuto for e in lista], dtype=np.int64
+            ),
+        )
+        variantes.append(
+            ("numpy int64", lambda: len(pares_em_conflito(*colunas, args.folga)[0]))
+        )
+    if not args.sem_força_bruta:
+        variantes.insert(0, ("por evento", lambda: _por_evento(repo, folga)))
+
+    for nome, função in variantes:
+        t0 = time.perf_counter()
+        n = função()
+        segundos = time.perf_counter() - t0
+        unidade = "eventos com conflito" if nome == "por evento" else "pares"
+        print(f"{nome:12}{segundos * 1e3:10.1f} ms  ({n} {unidade})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,481 @@
+"""CLI não interativo: subcomandos e modo lote sobre a fachada.
+
+    python main.py [--dados DIR | --sqlite ARQ] GRUPO AÇÃO [ARGS] [--json]
+
+    salas add NOME CAPACIDADE
+    salas list
+    salas get ID
+    salas rm ID [--modo recusar|cascata|arquivar]
+    salas arquivados [--sala ID]      eventos de salas removidas com "arquivar"
+    salas restaurar ID DESTINO        reagenda os arquivados da sala ID
+    salas import ARQUIVO
+    salas export [ARQUIVO]
+    salas livres CAPACIDADE INICIO FIM
+    eventos add SALA_ID TITULO INICIO FIM
+    eventos list [--inicio I --fim F [--sala ID]]
+    eventos update ID [--titulo T] [--sala ID] [--inicio I] [--fim F]
+    eventos rm ID
+    eventos validar [--folga MINUTOS] [--inicio I --fim F]
+    eventos import ARQUIVO            CSV ou JSONL (`infra.intercâmbio`)
+    eventos export [ARQUIVO]          "-" ou omitido: saída padrão
+    relatorio INICIO FIM [--agrupar dia|semana]
+    lote [ARQUIVO] [--parar-no-erro]  um comando por linha ("-": entrada padrão)
+
+A saída padrão é texto separado por tabulação, uma linha por item; com
+`--json`, um único valor JSON (as listas são escritas à medida que saem do
+repositório). Recusas da fachada vão para o stderr e o código de saída é 1;
+erros de uso saem com 2.
+
+`lote` roda todas as linhas no mesmo processo e no mesmo container (linhas
+vazias e começadas por `#` são ignoradas) e escreve uma linha JSON por
+comando: {"linha": n, "ok": true, "resultado": ...} ou {"linha": n, "ok":
+false, "erro": mensagem}. Sai com 1 se algum comando falhou.
+
+Sem `--dados` nem `--sqlite` os dados ficam só em memória e somem ao fim do
+processo: úteis para um `lote` que cria e consulta no mesmo arquivo.
+"""
+
+import argparse
+import shlex
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import nullcontext
+from typing import IO, Any, NoReturn
+
+from app import fachada
+from app.container import Container
+from app.serialização import para_json, para_texto_json
+
+# Resposta da fachada: (ok, dados ou mensagem de erro)
+Resultado = tuple[bool, Any]
+
+# linhas do CSV entregues por vez a `agendar_eventos_em_lote_ui`
+_LOTE_IMPORTAÇÃO = 1000
+
+
+class ErroUso(Exception):
+    """Argumentos inválidos para um subcomando."""
+
+
+class _Parser(argparse.ArgumentParser):
+    # no modo lote um erro de uso falha só aquela linha, sem sair do processo
+    def error(self, message: str) -> NoReturn:
+        raise ErroUso(message)
+
+
+class _ParserLote(_Parser):
+    # `-h` numa linha do lote: a ajuda iria para a saída no meio das linhas
+    # JSON (e o `exit` em seguida encerraria o lote). Os subparsers herdam a
+    # classe do parser pai, então isto vale para todos os níveis
+    def print_help(self, file: IO[str] | None = None) -> NoReturn:
+        raise ErroUso("ajuda não disponível no lote")
+
+
+# ------------------------------
+# Subcomandos (container, args) -> (ok, dados)
+# ------------------------------
+
+
+def _salas_add(c: Container, a: argparse.Namespace) -> Resultado:
+    return fachada.cadastrar_sala_ui(c, a.nome, a.capacidade)
+
+
+def _salas_list(c: Container, a: argparse.Namespace) -> Resultado:
+    return True, fachada.iterar_salas_ui(c)
+
+
+def _salas_get(c: Container, a: argparse.Namespace) -> Resultado:
+    return fachada.buscar_sala_por_id_ui(c, a.id)
+
+
+def _salas_rm(c: Container, a: argparse.Namespace) -> Resultado:
+    return fachada.remover_sala_ui(c, a.id, a.modo)
+
+
+def _salas_arquivados(c: Container, a: argparse.Namespace) -> Resultado:
+    return fachada.listar_arquivados_ui(c, a.sala)
+
+
+def _salas_restaurar(c: Container, a: argparse.Namespace) -> Resultado:
+    return fachada.restaurar_arquivados_ui(c, a.id, a.destino)
+
+
+def _salas_livres(c: Container, a: argparse.Namespace) -> Resultado:
+    return fachada.buscar_salas_disponíveis_ui(c, a.capacidade, a.inicio, a.fim)
+
+
+def _eventos_add(c: Container, a: argparse.Namespace) -> Resultado:
+    return fachada.agendar_evento_ui(c, a.sala, a.titulo, a.inicio, a.fim)
+
+
+def _eventos_list(c: Container, a: argparse.Namespace) -> Resultado:
+    if a.inicio is None and a.fim is None:
+        if a.sala is not None:
+            raise ErroUso("--sala exige --inicio e --fim")
+        return True, fachada.iterar_eventos_ui(c)
+    if a.inicio is None or a.fim is None:
+        raise ErroUso("--inicio e --fim devem ser usados juntos")
+    return fachada.listar_eventos_no_intervalo_ui(c, a.inicio, a.fim, a.sala)
+
+
+def _eventos_update(c: Container, a: argparse.Namespace) -> Resultado:
+    return fachada.atualizar_evento_ui(
+        c, a.id, titulo=a.titulo, sala_id=a.sala, inicio=a.inicio, fim=a.fim
+    )
+
+
+def _eventos_rm(c: Container, a: argparse.Namespace) -> Resultado:
+    return fachada.cancelar_evento_ui(c, a.id)
+
+
+def _formato(a: argparse.Namespace) -> str:
+    if a.formato is not None:
+        return a.formato
+    return "jsonl" if a.arquivo.lower().endswith(".jsonl") else "csv"
+
+
+def _resumo(r: Any) -> dict:
+    return {
+        "importados": r.importados,
+        "recusados": r.recusados,
+        "erros": [{"linha": e.linha, "erro": e.erro} for e in r.erros],
+    }
+
+
+def _abrir_importação(a: argparse.Namespace) -> Any:
+    # no lote, "-" leria os próprios comandos restantes da entrada padrão
+    if a.arquivo == "-" and a.em_lote:
+        raise ErroUso("no lote, importe de um arquivo")
+    return _abrir(a.arquivo)
+
+
+def _salas_import(c: Container, a: argparse.Namespace) -> Resultado:
+    from infra.intercâmbio import importar_salas
+
+    with _abrir_importação(a) as arquivo:
+        r = importar_salas(arquivo, c.sala_repo, _formato(a), max_erros=a.max_erros)
+    return True, _resumo(r)
+
+
+def _eventos_import(c: Container, a: argparse.Namespace) -> Resultado:
+    """Agenda os eventos do arquivo em blocos; uma linha recusada não
+    interrompe as demais e aparece em "erros" com o número da linha."""
+    from infra.intercâmbio import importar_eventos
+
+    with _abrir_importação(a) as arquivo:
+        r = importar_eventos(
+            arquivo,
+            c.evento_repo,
+            c.sala_repo,
+            _formato(a),
+            c.recorrencia_repo,
+            tamanho_lote=_LOTE_IMPORTAÇÃO,
+            max_erros=a.max_erros,
+        )
+    return True, _resumo(r)
+
+
+def _exportar(
+    exportar: Callable[[Any, IO[str], str], int], repo: Any, a: argparse.Namespace
+) -> Resultado:
+    if a.arquivo == "-":
+        if a.em_lote:
+            raise ErroUso("no lote, exporte para um arquivo")
+        exportar(repo, sys.stdout, _formato(a))
+        return True, None
+    with open(a.arquivo, "w", encoding="utf-8", newline="") as destino:
+        return True, {"exportados": exportar(repo, destino, _formato(a))}
+
+
+def _salas_export(c: Container, a: argparse.Namespace) -> Resultado:
+    from infra.intercâmbio import exportar_salas
+
+    return _exportar(exportar_salas, c.sala_repo, a)
+
+
+def _eventos_export(c: Container, a: argparse.Namespace) -> Resultado:
+    from infra.intercâmbio import exportar_eventos
+
+    return _exportar(exportar_eventos, c.evento_repo, a)
+
+
+def _eventos_validar(c: Container, a: argparse.Namespace) -> Resultado:
+    if (a.inicio is None) != (a.fim is None):
+        raise ErroUso("--inicio e --fim devem ser usados juntos")
+    return fachada.validar_agenda_ui(c, a.folga, a.inicio, a.fim)
+
+
+def _relatorio(c: Container, a: argparse.Namespace) -> Resultado:
+    return fachada.relatório_ocupação_ui(c, a.inicio, a.fim, a.agrupar)
+
+
+def _abrir(caminho: str) -> Any:
+    if caminho == "-":
+        return nullcontext(sys.stdin)
+    return open(caminho, encoding="utf-8", newline="")
+
+
+# ------------------------------
+# Parser
+# ------------------------------
+
+
+def _opções_arquivo(a: argparse.ArgumentParser, importar: bool = False) -> None:
+    a.add_argument(
+        "--formato", choices=("csv", "jsonl"), help="padrão: pela extensão (.jsonl)"
+    )
+    if importar:
+        a.add_argument(
+            "--max-erros", type=int, default=100, help="recusas listadas no resumo"
+        )
+
+
+def _criar_parser(classe: type[_Parser] = _Parser) -> _Parser:
+    p = classe(
+        prog="gerenciador",
+        description="Gerenciador de salas e eventos (modo não interativo).",
+    )
+    armazenamento = p.add_mutually_exclusive_group()
+    armazenamento.add_argument(
+        "--dados", metavar="DIR", help="diretório do diário (persistência)"
+    )
+    armazenamento.add_argument("--sqlite", metavar="ARQ", help="banco SQLite")
+    comum = argparse.ArgumentParser(add_help=False)
+    comum.add_argument("--json", action="store_true", help="saída em JSON")
+
+    grupos = p.add_subparsers(dest="grupo", required=True, metavar="GRUPO")
+
+    def ação(
+        sub: Any, nome: str, função: Callable[..., Resultado], ajuda: str
+    ) -> argparse.ArgumentParser:
+        a = sub.add_parser(nome, parents=[comum], help=ajuda)
+        a.set_defaults(executar=função)
+        return a
+
+    salas = grupos.add_parser("salas", help="cadastro de salas")
+    sub = salas.add_subparsers(dest="ação", required=True, metavar="AÇÃO")
+    a = ação(sub, "add", _salas_add, "cadastra uma sala")
+    a.add_argument("nome")
+    a.add_argument("capacidade")
+    ação(sub, "list", _salas_list, "lista as salas")
+    a = ação(sub, "get", _salas_get, "mostra uma sala")
+    a.add_argument("id")
+    a = ação(sub, "rm", _salas_rm, "remove uma sala")
+    a.add_argument("id")
+    a.add_argument(
+        "--modo", default="recusar", help="recusar (padrão), cascata ou arquivar"
+    )
+    a = ação(sub, "arquivados", _salas_arquivados, "eventos de salas removidas")
+    a.add_argument("--sala", help="só os da sala removida com este id")
+    a = ação(sub, "restaurar", _salas_restaurar, "reagenda eventos arquivados")
+    a.add_argument("id", help="id da sala removida")
+    a.add_argument("destino", help="id da sala que recebe os eventos")
+    a = ação(sub, "import", _salas_import, "cadastra as salas de um arquivo")
+    a.add_argument("arquivo", help='nome,capacidade ("-": entrada padrão)')
+    _opções_arquivo(a, importar=True)
+    a = ação(sub, "export", _salas_export, "grava as salas num arquivo")
+    a.add_argument("arquivo", nargs="?", default="-", help='"-": saída padrão')
+    _opções_arquivo(a)
+    a = ação(sub, "livres", _salas_livres, "salas livres no intervalo")
+    a.add_argument("capacidade")
+    a.add_argument("inicio")
+    a.add_argument("fim")
+
+    eventos = grupos.add_parser("eventos", help="agenda de eventos")
+    sub = eventos.add_subparsers(dest="ação", required=True, metavar="AÇÃO")
+    a = ação(sub, "add", _eventos_add, "agenda um evento")
+    a.add_argument("sala")
+    a.add_argument("titulo")
+    a.add_argument("inicio")
+    a.add_argument("fim")
+    a = ação(sub, "list", _eventos_list, "lista os eventos (todos ou no intervalo)")
+    a.add_argument("--inicio")
+    a.add_argument("--fim")
+    a.add_argument("--sala")
+    a = ação(sub, "update", _eventos_update, "altera um evento")
+    a.add_argument("id")
+    a.add_argument("--titulo")
+    a.add_argument("--sala")
+    a.add_argument("--inicio")
+    a.add_argument("--fim")
+    a = ação(
+        sub,
+        "validar",
+        _eventos_validar,
+        "lista os pares de reservas (eventos e ocorrências) em conflito",
+    )
+    a.add_argument("--folga", default="0", help="minutos livres exigidos entre eventos")
+    a.add_argument("--inicio", help="só a janela [inicio, fim) (padrão: tudo)")
+    a.add_argument("--fim")
+    a = ação(sub, "rm", _eventos_rm, "cancela um evento")
+    a.add_argument("id")
+    a = ação(sub, "import", _eventos_import, "agenda os eventos de um arquivo")
+    a.add_argument("arquivo", help='sala_id,titulo,inicio,fim ("-": entrada padrão)')
+    _opções_arquivo(a, importar=True)
+    a = ação(sub, "export", _eventos_export, "grava os eventos num arquivo")
+    a.add_argument("arquivo", nargs="?", default="-", help='"-": saída padrão')
+    _opções_arquivo(a)
+
+    a = grupos.add_parser("relatorio", parents=[comum], help="relatório de ocupação")
+    a.set_defaults(executar=_relatorio)
+    a.add_argument("inicio")
+    a.add_argument("fim")
+    a.add_argument("--agrupar", default="dia", help="dia (padrão) ou semana")
+
+    a = grupos.add_parser("lote", help="executa um arquivo de comandos")
+    a.set_defaults(executar=None)
+    p.set_defaults(em_lote=False)
+    a.add_argument("arquivo", nargs="?", default="-")
+    a.add_argument(
+        "--parar-no-erro", action="store_true", help="para no primeiro comando recusado"
+    )
+    return p
+
+
+def _criar_container(args: argparse.Namespace) -> Container:
+    # import tardio: só o armazenamento escolhido é carregado
+    from app import container
+
+    if args.dados:
+        return container.criar_container_diário(args.dados)
+    if args.sqlite:
+        return container.criar_container_sqlite(args.sqlite)
+    return container.criar_container_memória()
+
+
+# ------------------------------
+# Saída
+# ------------------------------
+
+
+def _texto(valor: Any) -> str:
+    if valor is None:
+        return ""
+    if isinstance(valor, (str, int, float)):
+        return str(valor)
+    if isinstance(valor, (list, tuple, dict)):
+        return para_texto_json(valor)
+    return str(para_json(valor))
+
+
+def _campos(item: Any) -> Iterable[Any]:
+    if isinstance(item, dict):
+        return item.values()
+    try:
+        return para_json(item).values()  # dataclass do domínio
+    except (TypeError, AttributeError):
+        return (item,)
+
+
+def _linhas_texto(dados: Any) -> Iterator[str]:
+    if dados is None:
+        return
+    itens = dados if isinstance(dados, (list, Iterator)) else (dados,)
+    for item in itens:
+        yield "\t".join(_texto(v) for v in _campos(item))
+
+
+def _escrever_json(saída: IO[str], dados: Any) -> None:
+    if not isinstance(dados, Iterator):
+        saída.write(para_texto_json(dados) + "\n")
+        return
+    # listas em streaming: um item por vez, sem montar a lista inteira
+    saída.write("[")
+    for i, item in enumerate(dados):
+        if i:
+            saída.write(",")
+        saída.write(para_texto_json(item))
+    saída.write("]\n")
+
+
+def _escrever(saída: IO[str], resultado: Resultado, como_json: bool) -> int:
+    ok, dados = resultado
+    if not ok:
+        print(f"[erro] {dados}", file=sys.stderr)
+        return 1
+    if como_json:
+        _escrever_json(saída, dados)
+    else:
+        for linha in _linhas_texto(dados):
+            saída.write(linha + "\n")
+    return 0
+
+
+# ------------------------------
+# Execução
+# ------------------------------
+
+
+def _erro_de_arquivo(e: OSError) -> str:
+    if e.strerror and e.filename is not None:
+        return f"{e.strerror}: {e.filename}"
+    return str(e)
+
+
+def executar_lote(
+    container: Container,
+    linhas: Iterable[str],
+    saída: IO[str],
+    parar_no_erro: bool = False,
+) -> int:
+    """Executa um comando por linha contra `container`, escrevendo uma linha
+    JSON por comando em `saída`. Retorna 1 se algum comando falhou."""
+    parser = _criar_parser(_ParserLote)
+    falhou = False
+    for n, linha in enumerate(linhas, 1):
+        linha = linha.strip()
+        if not linha or linha.startswith("#"):
+            continue
+        try:
+            args = parser.parse_args(shlex.split(linha))
+            if args.dados or args.sqlite:
+                raise ErroUso("--dados e --sqlite só valem na linha de comando")
+            if args.executar is None:
+                raise ErroUso("lote não pode ser aninhado")
+            args.em_lote = True
+            ok, dados = args.executar(container, args)
+            if isinstance(dados, Iterator):
+                dados = list(dados)
+        except ErroUso as e:
+            ok, dados = False, f"uso: {e}"
+        except ValueError as e:  # aspas sem fechar no shlex
+            ok, dados = False, f"uso: {e}"
+        except OSError as e:  # arquivo de import/export inacessível
+            ok, dados = False, _erro_de_arquivo(e)
+        if ok:
+            registro = {"linha": n, "ok": True, "resultado": dados}
+        else:
+            registro = {"linha": n, "ok": False, "erro": dados}
+            falhou = True
+        saída.write(para_texto_json(registro) + "\n")
+        if falhou and parar_no_erro:
+            break
+    return 1 if falhou else 0
+
+
+def executar(argv: list[str], saída: IO[str] | None = None) -> int:
+    """Roda um subcomando (ou um lote) e retorna o código de saída."""
+    saída = saída if saída is not None else sys.stdout
+    parser = _criar_parser()
+    try:
+        args = parser.parse_args(argv)
+    except ErroUso as e:
+        parser.print_usage(sys.stderr)
+        print(f"{parser.prog}: erro: {e}", file=sys.stderr)
+        return 2
+    container = _criar_container(args)
+    try:
+        if args.executar is None:
+            with _abrir(args.arquivo) as arquivo:
+                return executar_lote(container, arquivo, saída, args.parar_no_erro)
+        try:
+            resultado = args.executar(container, args)
+        except ErroUso as e:
+            print(f"{parser.prog}: erro: {e}", file=sys.stderr)
+            return 2
+        return _escrever(saída, resultado, args.json)
+    except OSError as e:
+        print(f"[erro] {_erro_de_arquivo(e)}", file=sys.stderr)
+        return 1
+    finally:
+        container.fechar()
@@ -1,21 +1,233 @@
-from dataclasses import dataclass
+from __future__ import annotations
 
-from domínio.repositórios import SalaRepository, EventoRepository
-from infra.repos_memória import MemSalaRepository, MemEventoRepository
+import os
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING
+
+from domínio.repositórios import (
+    SalaRepository,
+    EventoRepository,
+    RecorrênciaRepository,
+)
+from infra.repos_memória import (
+    MemSalaRepository,
+    MemEventoRepository,
+    MemRecorrênciaRepository,
+)
+
+if TYPE_CHECKING:
+    # só para as anotações: o container síncrono não carrega asyncio nem
+    # concurrent.futures (que importa logging), caros na partida do CLI
+    from concurrent.futures import Executor
+
+    from domínio.repositórios_async import (
+        AsyncSalaRepository,
+        AsyncEventoRepository,
+        AsyncRecorrênciaRepository,
+    )
+    from infra.diário import Diário
 
 
 @dataclass
 class Container:
     """Container simples de composição de dependências.
 
-    Fornece instâncias de repositórios para a aplicação. Mantém tudo
-    em memória, sem efeitos de I/O externos.
+    Fornece instâncias de repositórios para a aplicação. A fábrica em
+    memória não tem efeitos de I/O externos; a fábrica SQLite persiste
+    os dados em arquivo, e a de diário persiste os repositórios em memória
+    num diário + snapshot (`diário`, fechado por `fechar()`).
     """
 
     sala_repo: SalaRepository
     evento_repo: EventoRepository
+    recorrencia_repo: RecorrênciaRepository = field(
+        default_factory=MemRecorrênciaRepository
+    )
+    diário: Diário | None = None
+    # destino dos eventos de salas removidas com `ModoRemoçãoSala.ARQUIVAR`;
+    # persistido junto com os demais nas fábricas SQLite e de diário
+    arquivo_repo: EventoRepository = field(default_factory=MemEventoRepository)
+
+    def fechar(self) -> None:
+        """Sincroniza e fecha o diário, se houver, e libera repositórios
+        que mantêm arquivos abertos (ex.: o snapshot binário mapeado)."""
+        if self.diário is not None:
+            self.diário.fechar()
+        fechar_eventos = getattr(self.evento_repo, "fechar", None)
+        if fechar_eventos is not None:
+            fechar_eventos()
 
 
 def criar_container_memória() -> Container:
     """Cria um container com repositórios em memória independentes."""
-    return Container(sala_repo=MemSalaRepository(), evento_repo=MemEventoRepository())
+    return Container(
+        sala_repo=MemSalaRepository(),
+        evento_repo=MemEventoRepository(),
+        recorrencia_repo=MemRecorrênciaRepository(),
+    )
+
+
+def criar_container_sqlite(caminho: str | os.PathLike[str]) -> Container:
+    """Cria um container com repositórios SQLite no arquivo `caminho`.
+
+    Use ":memory:" para um banco temporário (útil em testes).
+    """
+    # import tardio: quem só usa memória não paga o custo do sqlite3
+    from infra.repos_sqlite import (
+        SQLiteEventoRepository,
+        SQLiteRecorrênciaRepository,
+        SQLiteSalaRepository,
+        conectar,
+    )
+
+    con = conectar(caminho)
+    return Container(
+        sala_repo=SQLiteSalaRepository(con),
+        evento_repo=SQLiteEventoRepository(con),
+        recorrencia_repo=SQLiteRecorrênciaRepository(con),
+        arquivo_repo=SQLiteEventoRepository(con, "eventos_arquivados"),
+    )
+
+
+def criar_container_diário(
+    diretório: str | os.PathLike[str],
+    lote: int = 256,
+    intervalo: float = 0.5,
+    compactar_após: int = 100_000,
+) -> Container:
+    """Cria um container com repositórios em memória persistidos por diário
+    (`infra.diário`) no `diretório`, carregando o estado já salvo nele.
+
+    As escritas vão para o disco a cada `lote` registros ou `intervalo`
+    segundos; o diário é compactado num snapshot a cada `compactar_após`
+    registros. Chame `fechar()` ao terminar (também feito na saída do
+    processo).
+    """
+    from infra.diário import Diário
+
+    diário = Diário.abrir(
+        diretório, lote=lote, intervalo=intervalo, compactar_após=compactar_após
+    )
+    return Container(
+        sala_repo=diário.sala_repo,
+        evento_repo=diário.evento_repo,
+        recorrencia_repo=diário.recorrencia_repo,
+        diário=diário,
+        arquivo_repo=diário.arquivo_repo,
+    )
+
+
+def criar_container_mmap(caminho: str | os.PathLike[str]) -> Container:
+    """Cria um container a partir de um snapshot binário (`infra.repos_mmap`).
+
+    Abrir é O(1) no número de eventos: o arquivo é mapeado em memória e os
+    eventos são lidos dele sob demanda (`MmapEventoRepository`); as salas,
+    poucas, vão para um repositório em memória. Escritas ficam só em memória
+    até um novo `gravar_snapshot_binário`.
+    """
+    from infra.repos_mmap import MmapEventoRepository, SnapshotBinário
+
+    snapshot = SnapshotBinário(caminho)
+    salas = MemSalaRepository()
+    salas._carregar(snapshot.salas(), snapshot.último_id_sala)
+    return Container(
+        sala_repo=salas,
+        evento_repo=MmapEventoRepository(snapshot),
+        recorrencia_repo=MemRecorrênciaRepository(),
+    )
+
+
+def criar_container_com_cache(
+    base: Container | None = None, capacidade: int = 4096
+) -> Container:
+    """Cópia de `base` (padrão: um container em memória novo) com o
+    repositório de eventos atrás de um cache LRU de `capacidade` consultas
+    (`infra.repos_cache`), para cargas com muito mais leituras que escritas.
+
+    As escritas devem passar pelo container retornado, não pelo de `base`:
+    são elas que invalidam o cache.
+    """
+    from infra.repos_cache import CacheEventoRepository
+
+    base = base if base is not None else criar_container_memória()
+    return replace(
+        base, evento_repo=CacheEventoRepository(base.evento_repo, capacidade)
+    )
+
+
+@dataclass
+class ContainerAsync:
+    """Container com os repositórios assíncronos (`domínio.repositórios_async`),
+    para uso com `domínio.serviços_async` a partir de um loop `asyncio`.
+
+    `executor` é o pool onde os adaptadores rodam os repositórios síncronos
+    (None quando os repositórios já são nativamente assíncronos).
+    """
+
+    sala_repo: AsyncSalaRepository
+    evento_repo: AsyncEventoRepository
+    recorrencia_repo: AsyncRecorrênciaRepository
+    executor: Executor | None = None
+
+    def fechar(self) -> None:
+        """Encerra o pool de threads dos adaptadores, se houver."""
+        if self.executor is not None:
+            self.executor.shutdown()
+
+
+def criar_container_async(
+    base: Container | None = None, max_threads: int | None = None
+) -> ContainerAsync:
+    """Expõe os repositórios síncronos de `base` (padrão: um container em
+    memória novo) como assíncronos, rodando cada chamada em um pool de
+    `max_threads` threads.
+
+    Os repositórios de `base` precisam aceitar chamadas de várias threads
+    (os em memória aceitam); para SQLite use `criar_container_async_sqlite`.
+    """
+    from infra.repos_async import (
+        EventoRepositoryEmThreads,
+        RecorrênciaRepositoryEmThreads,
+        SalaRepositoryEmThreads,
+    )
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    base = base if base is not None else criar_container_memória()
+    executor = ThreadPoolExecutor(max_threads, thread_name_prefix="repos")
+    return ContainerAsync(
+        sala_repo=SalaRepositoryEmThreads(base.sala_repo, executor),
+        evento_repo=EventoRepositoryEmThreads(base.evento_repo, executor),
+        recorrencia_repo=RecorrênciaRepositoryEmThreads(
+            base.recorrencia_repo, executor
+        ),
+        executor=executor,
+    )
+
+
+def criar_container_async_sqlite(caminho: str | os.PathLike[str]) -> ContainerAsync:
+    """Container assíncrono sobre SQLite no arquivo `caminho`.
+
+    A conexão SQLite só pode ser usada pela thread que a criou, então o pool
+    tem uma única thread, que abre a conexão e atende todas as chamadas (em
+    ordem de chegada): o loop não bloqueia, mas o banco não é consultado em
+    paralelo.
+    """
+    from infra.repos_async import (
+        EventoRepositoryEmThreads,
+        RecorrênciaRepositoryEmThreads,
+        SalaRepositoryEmThreads,
+    )
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    executor = ThreadPoolExecutor(1, thread_name_prefix="sqlite")
+    base = executor.submit(criar_container_sqlite, caminho).result()
+    return ContainerAsync(
+        sala_repo=SalaRepositoryEmThreads(base.sala_repo, executor),
+        evento_repo=EventoRepositoryEmThreads(base.evento_repo, executor),
+        recorrencia_repo=RecorrênciaRepositoryEmThreads(
+            base.recorrencia_repo, executor
+        ),
+        executor=executor,
+    )
@@ -1,19 +1,37 @@
 from __future__ import annotations
 
-from dataclasses import asdict
-from datetime import datetime
-from typing import Any, Tuple
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, Sequence, Tuple
 
 from domínio.serviços import (
     cadastrar_sala as _cadastrar_sala,
     listar_salas as _listar_salas,
-    remover_sala as _remover_sala,
-    agendar_evento as _agendar_evento,
+    remover_sala_detalhado as _remover_sala_detalhado,
+    listar_arquivados as _listar_arquivados,
+    restaurar_arquivados as _restaurar_arquivados,
+    ModoRemoçãoSala,
+    agendar_evento_detalhado as _agendar_evento_detalhado,
     cancelar_evento as _cancelar_evento,
-    atualizar_evento as _atualizar_evento,
+    atualizar_evento_detalhado as _atualizar_evento_detalhado,
+    MotivoRecusa,
     listar_eventos as _listar_eventos,
+    agendar_eventos_em_lote as _agendar_eventos_em_lote,
+    PedidoEvento,
+    buscar_salas_disponíveis as _buscar_salas_disponíveis,
+    listar_salas_paginado as _listar_salas_paginado,
+    iterar_salas as _iterar_salas,
+    listar_eventos_paginado as _listar_eventos_paginado,
+    iterar_eventos as _iterar_eventos,
+    listar_eventos_no_intervalo as _listar_eventos_no_intervalo,
+    agendar_recorrência as _agendar_recorrência,
+    cancelar_recorrência as _cancelar_recorrência,
+    cancelar_ocorrência as _cancelar_ocorrência,
+    listar_ocorrências as _listar_ocorrências,
 )
-from domínio.regras import validar_intervalo, encontrar_conflito
+from domínio.modelos import Sala, Evento, Frequência, Ocorrência
+from domínio.repositórios import CursorEvento
+from domínio.regras import validar_intervalo
 from app.container import Container
 
 
@@ -28,12 +46,54 @@ def _parse_int(texto: str) -> int | None:
 
 
 def _parse_dt(texto: str) -> datetime | None:
+    if not isinstance(texto, str):
+        return None
+    return _parse_dt_texto(texto)
+
+
+# datetimes são imutáveis: o mesmo objeto pode ser devolvido a todos que
+# pedirem o mesmo texto (importações e APIs repetem muito os mesmos horários)
+@lru_cache(maxsize=4096)
+def _parse_dt_texto(texto: str) -> datetime | None:
+    # Caminho rápido: exatamente "YYYY-MM-DD HH:MM" com dígitos ASCII. Aceita
+    # e recusa o mesmo que o strptime; datas impossíveis (ex.: 02-30, 24:00)
+    # fazem o construtor do datetime levantar ValueError, como lá.
+    if (
+        len(texto) == 16
+        and texto[4] == "-"
+        and texto[7] == "-"
+        and texto[10] == " "
+        and texto[13] == ":"
+        and texto.isascii()
+        and (texto[:4] + texto[5:7] + texto[8:10] + texto[11:13] + texto[14:]).isdigit()
+    ):
+        try:
+            return datetime(
+                int(texto[:4]),
+                int(texto[5:7]),
+                int(texto[8:10]),
+                int(texto[11:13]),
+                int(texto[14:]),
+            )
+        except ValueError:
+            return None
+    # Demais formas que o strptime também aceita ("2025-1-6 8:05", vários
+    # espaços entre data e hora...): raras, ficam com o caminho lento
     try:
         return datetime.strptime(texto, FORMATO_DATETIME)
-    except (TypeError, ValueError):
+    except ValueError:
         return None
 
 
+def parse_datetime_ui(texto: str) -> datetime | None:
+    """Converte `texto` no formato FORMATO_DATETIME; None se inválido.
+
+    Mesmo parser (e cache) usado pelas operações da fachada: quem valida a
+    data antes de chamá-las não paga o parsing duas vezes.
+    """
+    return _parse_dt(texto)
+
+
 # ----------------------------
 # Operações de Sala (UI -> Domínio)
 # ----------------------------
@@ -52,31 +112,182 @@ def cadastrar_sala_ui(
     return True, sala
 
 
+def _sala_dict(s: Sala) -> dict:
+    # montado à mão: `asdict` faz cópia profunda recursiva, cara por linha
+    return {"id": s.id, "nome": s.nome, "capacidade": s.capacidade}
+
+
+def _evento_dict(e: Evento) -> dict:
+    return {
+        "id": e.id,
+        "sala_id": e.sala_id,
+        "titulo": e.titulo,
+        "inicio": e.inicio,
+        "fim": e.fim,
+    }
+
+
 def listar_salas_ui(container: Container) -> list[dict]:
     salas = _listar_salas(container.sala_repo)
     # retorna estruturas simples (dict) para UI
-    return [asdict(s) for s in salas]
+    return [_sala_dict(s) for s in salas]
+
+
+def listar_salas_pagina_ui(
+    container: Container, limite: int = 100, após: int | None = None
+) -> tuple[list[dict], int | None]:
+    """Retorna uma página de salas e o cursor para a próxima (ou None no fim)."""
+    salas = _listar_salas_paginado(container.sala_repo, limite, após)
+    próximo = salas[-1].id if salas and len(salas) == limite else None
+    return [_sala_dict(s) for s in salas], próximo
+
+
+def iterar_salas_ui(container: Container) -> Iterator[dict]:
+    """Versão em streaming de `listar_salas_ui` (um dict por vez)."""
+    return (_sala_dict(s) for s in _iterar_salas(container.sala_repo))
 
 
-def remover_sala_ui(container: Container, sala_id_str: str) -> tuple[bool, Any]:
+_MODOS_REMOÇÃO = {
+    "recusar": ModoRemoçãoSala.RECUSAR,
+    "cascata": ModoRemoçãoSala.CASCATA,
+    "arquivar": ModoRemoçãoSala.ARQUIVAR,
+}
+
+
+def remover_sala_ui(
+    container: Container, sala_id_str: str, modo: str = "recusar"
+) -> tuple[bool, Any]:
     """Remove uma sala pelo id informado como string.
 
-    Retorna (True, None) em caso de sucesso, ou (False, mensagem) em erro.
+    `modo` diz o que fazer se a sala tiver eventos ou recorrências:
+    "recusar" (padrão; falha com "sala possui reservas"), "cascata" (remove
+    tudo) ou "arquivar" (move os eventos para `container.arquivo_repo`).
+    Retorna (True, dict com o id e quantos eventos e recorrências saíram
+    junto) em caso de sucesso, ou (False, mensagem) em erro.
     """
     sala_id = _parse_int(sala_id_str)
     if sala_id is None or sala_id <= 0:
         return False, "id da sala inválido"
+    modo_enum = _MODOS_REMOÇÃO.get((modo or "").strip().lower())
+    if modo_enum is None:
+        return False, "modo de remoção inválido (recusar, cascata ou arquivar)"
+
+    resultado = _remover_sala_detalhado(
+        container.sala_repo,
+        container.evento_repo,
+        sala_id,
+        modo_enum,
+        container.recorrencia_repo,
+        container.arquivo_repo,
+    )
+    if resultado.motivo is MotivoRecusa.SALA_INEXISTENTE:
+        return False, "sala não encontrada"
+    if not resultado.ok:
+        return False, _MENSAGENS_RECUSA[resultado.motivo]
+    return True, {
+        "id": sala_id,
+        "eventos": len(resultado.eventos),
+        "recorrencias": len(resultado.recorrências),
+    }
+
+
+def listar_arquivados_ui(
+    container: Container, sala_id_str: str | None = None
+) -> tuple[bool, Any]:
+    """Lista os eventos arquivados (de salas removidas no modo "arquivar"),
+    com os ids originais: os da sala informada ou, sem sala, todos.
+
+    Retorna (True, lista de dicts) ou (False, mensagem) se o id for inválido.
+    """
+    sala_id = None
+    if sala_id_str is not None:
+        sala_id = _parse_int(sala_id_str)
+        if sala_id is None or sala_id <= 0:
+            return False, "id da sala inválido"
+    eventos = _listar_arquivados(container.arquivo_repo, sala_id)
+    return True, [_evento_dict(e) for e in eventos]
+
+
+def restaurar_arquivados_ui(
+    container: Container, sala_id_arquivada_str: str, sala_destino_str: str
+) -> tuple[bool, Any]:
+    """Reagenda na sala de destino os eventos arquivados de uma sala removida.
+
+    Retorna (True, {"restaurados": eventos criados, "recusados": arquivados
+    que conflitam com a sala de destino e continuam no arquivo}) ou (False,
+    mensagem) se os ids forem inválidos, a sala de destino não existir ou
+    não houver eventos arquivados da sala.
+    """
+    sala_id_arquivada = _parse_int(sala_id_arquivada_str)
+    sala_destino = _parse_int(sala_destino_str)
+    if sala_id_arquivada is None or sala_id_arquivada <= 0:
+        return False, "id da sala inválido"
+    if sala_destino is None or sala_destino <= 0:
+        return False, "id da sala de destino inválido"
+
+    resultado = _restaurar_arquivados(
+        container.arquivo_repo,
+        container.evento_repo,
+        container.sala_repo,
+        sala_id_arquivada,
+        sala_destino,
+        container.recorrencia_repo,
+    )
+    if resultado.motivo is MotivoRecusa.SALA_INEXISTENTE:
+        return False, "sala não encontrada"
+    if not resultado.restaurados and not resultado.recusados:
+        return False, "nenhum evento arquivado da sala"
+    return True, {
+        "restaurados": [_evento_dict(e) for e in resultado.restaurados],
+        "recusados": [_evento_dict(e) for e in resultado.recusados],
+    }
 
-    ok = _remover_sala(container.sala_repo, sala_id)
-    if ok:
-        return True, None
-    return False, "sala não encontrada"
+
+def buscar_salas_disponíveis_ui(
+    container: Container, capacidade_min_str: str, inicio_str: str, fim_str: str
+) -> tuple[bool, Any]:
+    """Busca salas com capacidade mínima livres no intervalo informado.
+
+    Retorna (True, lista de dicts ordenada pelo melhor encaixe) ou
+    (False, mensagem) em caso de entrada inválida.
+    """
+    cap = _parse_int(capacidade_min_str)
+    if cap is None or cap <= 0:
+        return False, "capacidade inválida"
+    inicio = _parse_dt(inicio_str)
+    fim = _parse_dt(fim_str)
+    if inicio is None or fim is None:
+        return False, "formato de data inválido (YYYY-MM-DD HH:MM)"
+    if not validar_intervalo(inicio, fim):
+        return False, "intervalo de datas inválido"
+
+    salas = _buscar_salas_disponíveis(
+        container.evento_repo,
+        container.sala_repo,
+        cap,
+        inicio,
+        fim,
+        container.recorrencia_repo,
+    )
+    return True, [
+        {"id": s.id, "nome": s.nome, "capacidade": s.capacidade} for s in salas
+    ]
 
 
 # ------------------------------
 # Operações de Evento (UI -> Domínio)
 # ------------------------------
 
+_MENSAGENS_RECUSA = {
+    MotivoRecusa.EVENTO_INEXISTENTE: "evento não encontrado",
+    MotivoRecusa.SALA_INEXISTENTE: "sala não existe",
+    MotivoRecusa.TITULO_INVALIDO: "título inválido",
+    MotivoRecusa.INTERVALO_INVALIDO: "intervalo de datas inválido",
+    MotivoRecusa.CONFLITO: "conflito de horário",
+    MotivoRecusa.RECORRENCIA_INVALIDA: "recorrência inválida",
+    MotivoRecusa.SALA_COM_RESERVAS: "sala possui reservas",
+}
+
 
 def agendar_evento_ui(
     container: Container,
@@ -94,26 +305,71 @@ def agendar_evento_ui(
     if inicio is None or fim is None:
         return False, "formato de data inválido (YYYY-MM-DD HH:MM)"
 
-    # Mensagens mais específicas quando possível
-    if container.sala_repo.obter_por_id(sala_id) is None:
-        return False, "sala não existe"
-    if not (titulo or "").strip():
-        return False, "título inválido"
-    if not validar_intervalo(inicio, fim):
-        return False, "intervalo de datas inválido"
+    # Uma única passada pelas regras do domínio; o motivo vira a mensagem
+    resultado = _agendar_evento_detalhado(
+        container.evento_repo,
+        container.sala_repo,
+        sala_id,
+        titulo,
+        inicio,
+        fim,
+        container.recorrencia_repo,
+    )
+    if not resultado.ok:
+        return False, _MENSAGENS_RECUSA[resultado.motivo]
+    return True, resultado.evento
+
 
-    # Checa conflito antecipadamente para dar mensagem clara
-    existentes = container.evento_repo.listar_por_sala(sala_id)
-    if encontrar_conflito(existentes, sala_id, inicio, fim) is not None:
-        return False, "conflito de horário"
+def agendar_eventos_em_lote_ui(
+    container: Container, linhas: Iterable[Sequence[str]]
+) -> list[Tuple[bool, Any]]:
+    """Agenda vários eventos a partir de linhas (sala_id, titulo, inicio, fim).
 
-    ev = _agendar_evento(
-        container.evento_repo, container.sala_repo, sala_id, titulo, inicio, fim
+    Retorna uma lista alinhada com `linhas`, com (True, Evento) para cada
+    evento agendado ou (False, mensagem) para cada linha recusada. Uma linha
+    inválida não impede o agendamento das demais.
+    """
+    resultados: list[Tuple[bool, Any]] = []
+    pedidos: list[PedidoEvento] = []
+    posições: list[int] = []
+    salas_existentes: dict[int, bool] = {}  # evita consultar a mesma sala
+
+    for sala_id_str, titulo, inicio_str, fim_str in linhas:
+        sala_id = _parse_int(sala_id_str)
+        inicio = _parse_dt(inicio_str)
+        fim = _parse_dt(fim_str)
+        erro = None
+        if sala_id is None or sala_id <= 0:
+            erro = "id da sala inválido"
+        elif inicio is None or fim is None:
+            erro = "formato de data inválido (YYYY-MM-DD HH:MM)"
+        else:
+            if sala_id not in salas_existentes:
+                salas_existentes[sala_id] = (
+                    container.sala_repo.obter_por_id(sala_id) is not None
+                )
+            if not salas_existentes[sala_id]:
+                erro = "sala não existe"
+            elif not (titulo or "").strip():
+                erro = "título inválido"
+            elif not validar_intervalo(inicio, fim):
+                erro = "intervalo de datas inválido"
+        if erro is not None:
+            resultados.append((False, erro))
+            continue
+        posições.append(len(resultados))
+        resultados.append((False, "não foi possível agendar o evento"))
+        pedidos.append(PedidoEvento(sala_id, titulo, inicio, fim))
+
+    agendados = _agendar_eventos_em_lote(
+        container.evento_repo, container.sala_repo, pedidos, container.recorrencia_repo
     )
-    if ev is None:
-        # Fallback genérico (em cenários não diferenciáveis)
-        return False, "não foi possível agendar o evento"
-    return True, ev
+    for pos, ev in zip(posições, agendados):
+        # linhas já validadas: a única recusa possível é o conflito
+        resultados[pos] = (
+            (True, ev) if ev is not None else (False, "conflito de horário")
+        )
+    return resultados
 
 
 def cancelar_evento_ui(container: Container, evento_id_str: str) -> Tuple[bool, Any]:
@@ -141,66 +397,34 @@ def atualizar_evento_ui(
     if evento_id is None or evento_id <= 0:
         return False, "id do evento inválido"
 
-    # Evento deve existir
-    atual = container.evento_repo.obter_por_id(evento_id)
-    if atual is None:
-        return False, "evento não encontrado"
-
     # Parse opcional do id de sala
     if sala_id is None or sala_id == "":
         sala_id_int: int | None = None
-        sala_destino = atual.sala_id
     else:
         sala_id_int = _parse_int(sala_id)
         if sala_id_int is None or sala_id_int <= 0:
             return False, "id da sala inválido"
-        sala_destino = sala_id_int
 
     # Parse opcional de datas
     if inicio is None or inicio == "":
         inicio_dt: datetime | None = None
-        efetivo_inicio = atual.inicio
     else:
         inicio_dt = _parse_dt(inicio)
         if inicio_dt is None:
             return False, "formato de data inválido (YYYY-MM-DD HH:MM)"
-        efetivo_inicio = inicio_dt
 
     if fim is None or fim == "":
         fim_dt: datetime | None = None
-        efetivo_fim = atual.fim
     else:
         fim_dt = _parse_dt(fim)
         if fim_dt is None:
             return False, "formato de data inválido (YYYY-MM-DD HH:MM)"
-        efetivo_fim = fim_dt
 
     # Título: manter se None, aceitar string vazia como manter (caller deve normalizar)
 
-    # Sala deve existir se fornecida
-    if (
-        sala_id_int is not None
-        and container.sala_repo.obter_por_id(sala_id_int) is None
-    ):
-        return False, "sala não existe"
-
-    # Intervalo válido após aplicar defaults
-    if not validar_intervalo(efetivo_inicio, efetivo_fim):
-        return False, "intervalo de datas inválido"
-
-    # Conflito (ignorar o próprio evento)
-    existentes = [
-        e
-        for e in container.evento_repo.listar_por_sala(sala_destino)
-        if e.id != atual.id
-    ]
-    if (
-        encontrar_conflito(existentes, sala_destino, efetivo_inicio, efetivo_fim)
-        is not None
-    ):
-        return False, "conflito de horário"
-
-    ev = _atualizar_evento(
+    # Existência, sala, intervalo e conflito (ignorando o próprio evento) são
+    # verificados uma única vez pelo serviço
+    resultado = _atualizar_evento_detalhado(
         container.evento_repo,
         container.sala_repo,
         evento_id,
@@ -208,23 +432,299 @@ def atualizar_evento_ui(
         sala_id=sala_id_int,
         inicio=inicio_dt,
         fim=fim_dt,
+        recorrências=container.recorrencia_repo,
     )
-    if ev is None:
-        return False, "não foi possível atualizar o evento"
-    return True, ev
+    if not resultado.ok:
+        return False, _MENSAGENS_RECUSA[resultado.motivo]
+    return True, resultado.evento
 
 
 def listar_eventos_ui(container: Container) -> list[dict]:
     eventos = _listar_eventos(container.evento_repo)
-    return [
+    return [_evento_dict(e) for e in eventos]
+
+
+def listar_eventos_pagina_ui(
+    container: Container, limite: int = 100, após: CursorEvento | None = None
+) -> tuple[list[dict], CursorEvento | None]:
+    """Retorna uma página de eventos e o cursor para a próxima (ou None no fim).
+
+    O cursor é a tupla (inicio, sala_id, id) do último evento da página.
+    """
+    eventos = _listar_eventos_paginado(container.evento_repo, limite, após)
+    próximo = None
+    if eventos and len(eventos) == limite:
+        último = eventos[-1]
+        próximo = (último.inicio, último.sala_id, último.id)
+    return [_evento_dict(e) for e in eventos], próximo
+
+
+def iterar_eventos_ui(container: Container) -> Iterator[dict]:
+    """Versão em streaming de `listar_eventos_ui` (um dict por vez)."""
+    return (_evento_dict(e) for e in _iterar_eventos(container.evento_repo))
+
+
+def listar_eventos_no_intervalo_ui(
+    container: Container,
+    inicio_str: str,
+    fim_str: str,
+    sala_id_str: str | None = None,
+) -> Tuple[bool, Any]:
+    """Lista (como dicts) os eventos que se sobrepõem a [inicio, fim).
+
+    Sem `sala_id_str` considera todas as salas (visão de dia/semana).
+    """
+    sala_id = None
+    if sala_id_str is not None:
+        sala_id = _parse_int(sala_id_str)
+        if sala_id is None or sala_id <= 0:
+            return False, "id da sala inválido"
+
+    inicio = _parse_dt(inicio_str)
+    fim = _parse_dt(fim_str)
+    if inicio is None or fim is None:
+        return False, "formato de data inválido (YYYY-MM-DD HH:MM)"
+    if not validar_intervalo(inicio, fim):
+        return False, "intervalo de datas inválido"
+
+    eventos = _listar_eventos_no_intervalo(container.evento_repo, inicio, fim, sala_id)
+    return True, [_evento_dict(e) for e in eventos]
+
+
+# ------------------------------
+# Operações de Recorrência (UI -> Domínio)
+# ------------------------------
+
+_FREQUÊNCIAS = {
+    "diária": Frequência.DIÁRIA,
+    "diaria": Frequência.DIÁRIA,
+    "semanal": Frequência.SEMANAL,
+}
+
+
+def agendar_recorrência_ui(
+    container: Container,
+    sala_id_str: str,
+    titulo: str,
+    inicio_str: str,
+    fim_str: str,
+    frequência_str: str,
+    até_str: str,
+    intervalo_str: str = "1",
+) -> Tuple[bool, Any]:
+    """Agenda uma recorrência ("diária" ou "semanal", a cada `intervalo`).
+
+    `inicio_str`/`fim_str` descrevem a primeira ocorrência e `até_str` a
+    última data/hora em que uma ocorrência pode começar.
+    """
+    sala_id = _parse_int(sala_id_str)
+    if sala_id is None or sala_id <= 0:
+        return False, "id da sala inválido"
+    frequência = _FREQUÊNCIAS.get((frequência_str or "").strip().lower())
+    if frequência is None:
+        return False, "frequência inválida (diária ou semanal)"
+    intervalo = _parse_int(intervalo_str)
+    if intervalo is None or intervalo <= 0:
+        return False, "intervalo inválido"
+
+    inicio = _parse_dt(inicio_str)
+    fim = _parse_dt(fim_str)
+    até = _parse_dt(até_str)
+    if inicio is None or fim is None or até is None:
+        return False, "formato de data inválido (YYYY-MM-DD HH:MM)"
+
+    resultado = _agendar_recorrência(
+        container.recorrencia_repo,
+        container.evento_repo,
+        container.sala_repo,
+        sala_id,
+        titulo,
+        inicio,
+        fim,
+        frequência,
+        até,
+        intervalo,
+    )
+    if not resultado.ok:
+        return False, _MENSAGENS_RECUSA[resultado.motivo]
+    return True, resultado.recorrência
+
+
+def cancelar_recorrência_ui(
+    container: Container, recorrência_id_str: str
+) -> Tuple[bool, Any]:
+    recorrência_id = _parse_int(recorrência_id_str)
+    if recorrência_id is None or recorrência_id <= 0:
+        return False, "id da recorrência inválido"
+    if _cancelar_recorrência(container.recorrencia_repo, recorrência_id):
+        return True, None
+    return False, "recorrência não encontrada"
+
+
+def cancelar_ocorrência_ui(
+    container: Container, recorrência_id_str: str, inicio_str: str
+) -> Tuple[bool, Any]:
+    """Cancela só a ocorrência que começa em `inicio_str`."""
+    recorrência_id = _parse_int(recorrência_id_str)
+    if recorrência_id is None or recorrência_id <= 0:
+        return False, "id da recorrência inválido"
+    inicio = _parse_dt(inicio_str)
+    if inicio is None:
+        return False, "formato de data inválido (YYYY-MM-DD HH:MM)"
+    r = _cancelar_ocorrência(
+        container.recorrencia_repo, recorrência_id, inicio, container.evento_repo
+    )
+    if r is None:
+        return False, "ocorrência não encontrada"
+    return True, r
+
+
+def _ocorrência_dict(o: Ocorrência) -> dict:
+    return {
+        "recorrencia_id": o.recorrencia_id,
+        "sala_id": o.sala_id,
+        "titulo": o.titulo,
+        "inicio": o.inicio,
+        "fim": o.fim,
+    }
+
+
+def listar_ocorrências_ui(
+    container: Container,
+    inicio_str: str,
+    fim_str: str,
+    sala_id_str: str | None = None,
+) -> Tuple[bool, Any]:
+    """Lista (como dicts) as ocorrências de recorrências em [inicio, fim)."""
+    sala_id = None
+    if sala_id_str is not None:
+        sala_id = _parse_int(sala_id_str)
+        if sala_id is None or sala_id <= 0:
+            return False, "id da sala inválido"
+
+    inicio = _parse_dt(inicio_str)
+    fim = _parse_dt(fim_str)
+    if inicio is None or fim is None:
+        return False, "formato de data inválido (YYYY-MM-DD HH:MM)"
+    if not validar_intervalo(inicio, fim):
+        return False, "intervalo de datas inválido"
+
+    ocorrências = _listar_ocorrências(container.recorrencia_repo, inicio, fim, sala_id)
+    return True, [_ocorrência_dict(o) for o in ocorrências]
+
+
+# ------------------------------
+# Relatórios (UI -> Domínio)
+# ------------------------------
+
+_AGRUPAMENTOS = {
+    "dia": timedelta(days=1),
+    "semana": timedelta(weeks=1),
+}
+
+
+def relatório_ocupação_ui(
+    container: Container, inicio_str: str, fim_str: str, agrupar_por: str = "dia"
+) -> Tuple[bool, Any]:
+    """Relatório de ocupação das salas em [inicio, fim), por "dia" ou "semana".
+
+    Retorna (True, dict) com os inícios dos períodos, uma linha por sala
+    (horas por período, total, utilização e pico de reservas simultâneas) e
+    os totais (pico de salas e de assentos, ocupação ponderada pela
+    capacidade), ou (False, mensagem) em caso de entrada inválida.
+    """
+    passo = _AGRUPAMENTOS.get((agrupar_por or "").strip().lower())
+    if passo is None:
+        return False, "agrupamento inválido (dia ou semana)"
+    inicio = _parse_dt(inicio_str)
+    fim = _parse_dt(fim_str)
+    if inicio is None or fim is None:
+        return False, "formato de data inválido (YYYY-MM-DD HH:MM)"
+    if not validar_intervalo(inicio, fim):
+        return False, "intervalo de datas inválido"
+
+    # import tardio: a varredura (e o NumPy, se houver) só carrega quando usada
+    from domínio.relatórios import relatório_ocupação as _relatório_ocupação
+
+    r = _relatório_ocupação(
+        container.evento_repo,
+        container.sala_repo,
+        inicio,
+        fim,
+        passo,
+        container.recorrencia_repo,
+    )
+    return True, {
+        "periodos": r.períodos,
+        "salas": [
+            {
+                "id": s.sala_id,
+                "nome": s.nome,
+                "capacidade": s.capacidade,
+                "horas_por_periodo": s.horas_por_período,
+                "horas": s.horas,
+                "utilizacao": s.utilização,
+                "pico": s.pico,
+            }
+            for s in r.salas
+        ],
+        "pico_salas": r.pico_salas,
+        "pico_assentos": r.pico_assentos,
+        "ocupacao_ponderada": r.ocupação_ponderada,
+    }
+
+
+def _referência_reserva(r: Evento | Ocorrência) -> int | dict:
+    # evento: o id; ocorrência: a regra e o início (como em `cancelar_ocorrência_ui`)
+    if isinstance(r, Evento):
+        return r.id
+    return {"recorrencia_id": r.recorrencia_id, "inicio": r.inicio}
+
+
+def validar_agenda_ui(
+    container: Container,
+    folga_minutos_str: str = "0",
+    inicio_str: str | None = None,
+    fim_str: str | None = None,
+) -> Tuple[bool, Any]:
+    """Revalida a agenda exigindo `folga_minutos_str` minutos livres entre
+    reservas da mesma sala, eventos avulsos e ocorrências de recorrências.
+
+    Com `inicio_str` e `fim_str`, só as reservas que tocam a janela; sem
+    eles, a agenda inteira (cada recorrência em toda a sua vigência).
+    Retorna (True, lista de dicts {"sala_id", "primeiro", "segundo"}, onde
+    cada reserva do par é o id do evento ou {"recorrencia_id", "inicio"} da
+    ocorrência) ou (False, mensagem).
+    """
+    folga = _parse_int(folga_minutos_str)
+    if folga is None or folga < 0:
+        return False, "folga inválida (minutos >= 0)"
+    inicio = fim = None
+    if inicio_str is not None or fim_str is not None:
+        inicio = _parse_dt(inicio_str)
+        fim = _parse_dt(fim_str)
+        if inicio is None or fim is None:
+            return False, "formato de data inválido (YYYY-MM-DD HH:MM)"
+        if not validar_intervalo(inicio, fim):
+            return False, "intervalo de datas inválido"
+
+    # import tardio, como em `relatório_ocupação_ui`
+    from domínio.relatórios import validar_agenda as _validar_agenda
+
+    conflitos = _validar_agenda(
+        container.evento_repo,
+        timedelta(minutes=folga),
+        recorrências=container.recorrencia_repo,
+        inicio=inicio,
+        fim=fim,
+    )
+    return True, [
         {
-            "id": e.id,
-            "sala_id": e.sala_id,
-            "titulo": e.titulo,
-            "inicio": e.inicio,
-            "fim": e.fim,
+            "sala_id": c.sala_id,
+            "primeiro": _referência_reserva(c.primeiro),
+            "segundo": _referência_reserva(c.segundo),
         }
-        for e in eventos
+        for c in conflitos
     ]
 
 
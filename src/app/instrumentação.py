@@ -0,0 +1,317 @@
+"""Instrumentação opcional: contagem, tempo e latência das chamadas.
+
+`Instrumentação` mede três camadas:
+
+- os métodos dos repositórios de um container (`instrumentar`, que devolve
+  uma cópia do container com cada repositório atrás de um proxy medido);
+- as funções públicas de `domínio.serviços` e de `app.fachada` (`ativar`,
+  que troca as funções nos módulos por versões medidas, e `desativar`, que
+  devolve as originais).
+
+Desligada, não custa nada: nenhum proxy ou função medida fica no caminho.
+Ligada, cada chamada custa duas leituras do relógio e uma atualização de
+contadores sob uma trava curta. O tempo é inclusivo: um serviço chamado
+pela fachada conta nos dois, e as chamadas aos repositórios, nos três.
+
+Para cada nome ficam o número de chamadas, o tempo total, o máximo e um
+histograma de latência em faixas de potência de 2 (em µs), de onde saem os
+percentis aproximados do `relatório()`. Com `perfil_limite`, uma fração
+`perfil_amostragem` das chamadas roda sob `cProfile` e o perfil da mais
+lenta acima do limite fica guardado em `perfil` para inspeção.
+"""
+
+import cProfile
+import functools
+import inspect
+import io
+import pstats
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import fields, replace
+from types import ModuleType
+from typing import Any, NamedTuple
+
+from app.container import Container
+
+# faixa k do histograma: latências em [2**(k-1), 2**k) µs (a 0 é < 1 µs)
+_FAIXAS = 40
+
+# funções trocadas por `ativar`: (módulo, nome) -> função original
+_originais: dict[tuple[ModuleType, str], Callable[..., Any]] = {}
+_ativa: "Instrumentação | None" = None
+
+
+class EstatísticasChamada(NamedTuple):
+    nome: str
+    chamadas: int
+    total: float  # segundos
+    máximo: float  # segundos
+    histograma: tuple[int, ...]  # chamadas por faixa de latência
+
+    @property
+    def média(self) -> float:
+        return self.total / self.chamadas if self.chamadas else 0.0
+
+    def percentil(self, p: float) -> float:
+        """Limite superior (em segundos) da faixa que contém o percentil `p`
+        (0 < p <= 100): uma estimativa que erra no máximo por 2x para cima."""
+        alvo = self.chamadas * p / 100
+        acumulado = 0
+        for k, n in enumerate(self.histograma):
+            acumulado += n
+            if n and acumulado >= alvo:
+                return min((1 << k) / 1e6, self.máximo)
+        return self.máximo
+
+
+class PerfilLento(NamedTuple):
+    nome: str
+    duração: float  # segundos
+    texto: str  # saída do `pstats`, ordenada por tempo acumulado
+
+
+class _Métrica:
+    __slots__ = ("chamadas", "histograma", "máximo", "total")
+
+    def __init__(self) -> None:
+        self.chamadas = 0
+        self.total = 0.0
+        self.máximo = 0.0
+        self.histograma = [0] * _FAIXAS
+
+
+class Instrumentação:
+    """Coletor das métricas; seguro para uso com threads."""
+
+    def __init__(
+        self,
+        perfil_limite: float | None = None,
+        perfil_amostragem: float = 0.01,
+        semente: int | None = None,
+    ) -> None:
+        if not 0 <= perfil_amostragem <= 1:
+            raise ValueError("perfil_amostragem deve estar entre 0 e 1")
+        self.perfil_limite = perfil_limite
+        self.perfil_amostragem = perfil_amostragem
+        self.perfil: PerfilLento | None = None
+        self._métricas: dict[str, _Métrica] = {}
+        self._trava = threading.Lock()
+        # o cProfile não aninha: um perfil por vez, em qualquer thread
+        self._trava_perfil = threading.Lock()
+        self._sorteio = random.Random(semente).random
+
+    # --- coleta ---
+
+    def _métrica(self, nome: str) -> _Métrica:
+        with self._trava:
+            m = self._métricas.get(nome)
+            if m is None:
+                m = self._métricas[nome] = _Métrica()
+            return m
+
+    def registrar(self, nome: str, segundos: float) -> None:
+        self._somar(self._métrica(nome), segundos)
+
+    def _somar(self, m: _Métrica, segundos: float) -> None:
+        faixa = min(int(segundos * 1e6).bit_length(), _FAIXAS - 1)
+        with self._trava:
+            m.chamadas += 1
+            m.total += segundos
+            m.máximo = max(m.máximo, segundos)
+            m.histograma[faixa] += 1
+
+    def medir(self, nome: str, função: Callable[..., Any]) -> Callable[..., Any]:
+        """Versão de `função` que registra cada chamada sob `nome`."""
+        # tudo o que não muda entre chamadas é resolvido aqui, uma vez
+        m = self._métrica(nome)
+        trava = self._trava
+        relógio = time.perf_counter
+        último = _FAIXAS - 1
+        perfilar = self.perfil_limite is not None and self.perfil_amostragem > 0
+
+        @functools.wraps(função)
+        def medida(*args: Any, **kwargs: Any) -> Any:
+            if perfilar and self._sorteio() < self.perfil_amostragem:
+                return self._chamar_com_perfil(m, nome, função, args, kwargs)
+            t0 = relógio()
+            try:
+                return função(*args, **kwargs)
+            finally:
+                segundos = relógio() - t0
+                faixa = int(segundos * 1e6).bit_length()
+                with trava:
+                    m.chamadas += 1
+                    m.total += segundos
+                    if segundos > m.máximo:
+                        m.máximo = segundos
+                    m.histograma[faixa if faixa < último else último] += 1
+
+        return medida
+
+    def _chamar_com_perfil(
+        self,
+        m: _Métrica,
+        nome: str,
+        função: Callable[..., Any],
+        args: tuple,
+        kwargs: dict,
+    ) -> Any:
+        perfil = None  # sem perfil se outro estiver em andamento (talvez nesta pilha)
+        if self._trava_perfil.acquire(blocking=False):
+            perfil = cProfile.Profile()
+            try:
+                perfil.enable()
+            except ValueError:  # outra ferramenta de perfil está ativa
+                self._trava_perfil.release()
+                perfil = None
+        t0 = time.perf_counter()
+        try:
+            return função(*args, **kwargs)
+        finally:
+            segundos = time.perf_counter() - t0
+            if perfil is not None:
+                perfil.disable()
+                self._trava_perfil.release()
+                self._guardar_perfil(nome, segundos, perfil)
+            self._somar(m, segundos)
+
+    def _guardar_perfil(
+        self, nome: str, segundos: float, perfil: cProfile.Profile
+    ) -> None:
+        if segundos < self.perfil_limite:
+            return
+        if self.perfil is not None and segundos <= self.perfil.duração:
+            return
+        saída = io.StringIO()
+        pstats.Stats(perfil, stream=saída).sort_stats("cumulative").print_stats(25)
+        self.perfil = PerfilLento(nome, segundos, saída.getvalue())
+
+    # --- consulta ---
+
+    def estatísticas(self) -> list[EstatísticasChamada]:
+        """Métricas por nome, do maior tempo total para o menor."""
+        with self._trava:
+            lista = [
+                EstatísticasChamada(
+                    nome, m.chamadas, m.total, m.máximo, tuple(m.histograma)
+                )
+                for nome, m in self._métricas.items()
+                if m.chamadas
+            ]
+        lista.sort(key=lambda e: (-e.total, e.nome))
+        return lista
+
+    def relatório(self, limite: int | None = None) -> str:
+        """Tabela de texto com as `limite` entradas de maior tempo total e,
+        se houver, o perfil da chamada lenta capturada."""
+        cabeçalho = (
+            f"{'chamada':<44}{'n':>9}{'total ms':>11}{'média µs':>11}"
+            f"{'p50 µs':>9}{'p99 µs':>9}{'máx µs':>10}"
+        )
+        linhas = [cabeçalho]
+        for e in self.estatísticas()[:limite]:
+            linhas.append(
+                f"{e.nome[:43]:<44}{e.chamadas:>9}{e.total * 1e3:>11.1f}"
+                f"{e.média * 1e6:>11.1f}{e.percentil(50) * 1e6:>9.0f}"
+                f"{e.percentil(99) * 1e6:>9.0f}{e.máximo * 1e6:>10.0f}"
+            )
+        if len(linhas) == 1:
+            linhas.append("(nenhuma chamada registrada)")
+        if self.perfil is not None:
+            linhas.append("")
+            linhas.append(
+                f"perfil da chamada lenta: {self.perfil.nome}"
+                f" ({self.perfil.duração * 1e3:.1f} ms)"
+            )
+            linhas.append(self.perfil.texto.rstrip())
+        return "\n".join(linhas)
+
+    def limpar(self) -> None:
+        """Zera as métricas e descarta o perfil guardado."""
+        # zera no lugar: as funções medidas guardam a referência da métrica
+        with self._trava:
+            for m in self._métricas.values():
+                m.__init__()
+            self.perfil = None
+
+    # --- instalação ---
+
+    def instrumentar(self, container: Container) -> Container:
+        """Cópia de `container` com cada repositório atrás de um proxy que
+        mede seus métodos públicos (nomes "<campo>.<método>", ex.:
+        "evento_repo.encontrar_conflito"). As escritas continuam indo para
+        os mesmos repositórios: o original e a cópia veem os mesmos dados."""
+        trocas = {
+            f.name: _RepositórioMedido(getattr(container, f.name), f.name, self)
+            for f in fields(container)
+            if f.name.endswith("_repo")
+        }
+        return replace(container, **trocas)
+
+    def ativar(self) -> None:
+        """Troca as funções públicas de `domínio.serviços` e de `app.fachada`
+        por versões medidas ("serviços.<nome>", "fachada.<nome>"). As
+        referências a serviços guardadas na fachada (`_agendar_evento...`)
+        também são trocadas. Substitui outra instrumentação ativa."""
+        from app import fachada
+        from domínio import serviços
+
+        global _ativa
+        _restaurar()
+        medidas: dict[int, Callable[..., Any]] = {}
+        for módulo, prefixo in ((serviços, "serviços"), (fachada, "fachada")):
+            for nome, valor in vars(módulo).items():
+                if (
+                    not nome.startswith("_")
+                    and inspect.isfunction(valor)
+                    and valor.__module__ == módulo.__name__
+                ):
+                    medidas[id(valor)] = self.medir(f"{prefixo}.{nome}", valor)
+        for módulo in (serviços, fachada):
+            for nome, valor in list(vars(módulo).items()):
+                medida = medidas.get(id(valor))
+                if medida is not None:
+                    _originais[(módulo, nome)] = valor
+                    setattr(módulo, nome, medida)
+        _ativa = self
+
+    def desativar(self) -> None:
+        """Devolve as funções originais, se esta for a instrumentação ativa."""
+        if _ativa is self:
+            _restaurar()
+
+    @property
+    def ativa(self) -> bool:
+        return _ativa is self
+
+
+def _restaurar() -> None:
+    global _ativa
+    for (módulo, nome), original in _originais.items():
+        setattr(módulo, nome, original)
+    _originais.clear()
+    _ativa = None
+
+
+class _RepositórioMedido:
+    """Proxy de um repositório: os métodos públicos são medidos; o resto
+    (atributos, métodos com `_`) é repassado sem custo extra."""
+
+    def __init__(self, alvo: Any, prefixo: str, instrumentação: Instrumentação):
+        self._alvo = alvo
+        self._prefixo = prefixo
+        self._instrumentação = instrumentação
+
+    def __getattr__(self, nome: str) -> Any:
+        valor = getattr(self._alvo, nome)
+        if nome.startswith("_") or not callable(valor):
+            return valor
+        medido = self._instrumentação.medir(f"{self._prefixo}.{nome}", valor)
+        # guarda no próprio proxy: as próximas buscas não passam por aqui
+        self.__dict__[nome] = medido
+        return medido
+
+    def __repr__(self) -> str:
+        return f"<medido {self._alvo!r}>"
@@ -0,0 +1,36 @@
+"""Conversão dos resultados da fachada para JSON (servidor HTTP e CLI)."""
+
+import json
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+
+def para_json(obj: Any) -> Any:
+    """`default` do `json.dumps`: só o que o JSON não conhece.
+
+    Objetos do domínio viram dicts rasos (um getattr por campo), sem a
+    cópia profunda recursiva de `dataclasses.asdict`.
+    """
+    if isinstance(obj, datetime):
+        # mesmo texto de FORMATO_DATETIME, sem o custo do strftime
+        return obj.isoformat(" ", "minutes")
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if isinstance(obj, Enum):
+        return obj.name.lower()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"{type(obj).__name__} não é serializável")
+
+
+def para_texto_json(dados: Any) -> str:
+    """`dados` como JSON compacto numa linha (UTF-8 sem escapes)."""
+    return json.dumps(
+        dados, default=para_json, ensure_ascii=False, separators=(",", ":")
+    )
+
+
+def serializar(dados: Any) -> bytes:
+    return para_texto_json(dados).encode("utf-8")
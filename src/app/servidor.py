@@ -0,0 +1,475 @@
+"""Servidor HTTP/JSON sobre a fachada (apenas biblioteca padrão).
+
+Expõe as operações de `app.fachada` como endpoints JSON:
+
+    GET    /salas                     [?limite=&apos=]  lista (ou página) de salas
+    POST   /salas                     {"nome", "capacidade"}
+    GET    /salas/disponiveis         ?capacidade=&inicio=&fim=
+    GET    /salas/<id>
+    DELETE /salas/<id>                 [?modo=recusar|cascata|arquivar]
+    GET    /arquivo                   [?sala_id=]  eventos de salas removidas
+    POST   /arquivo/<sala_id>/restaurar  {"sala_id"}  reagenda na sala informada
+    GET    /eventos                   [?inicio=&fim=&sala_id=]  todos ou no intervalo
+    POST   /eventos                   {"sala_id", "titulo", "inicio", "fim"}
+    POST   /eventos/lote              [{"sala_id", "titulo", "inicio", "fim"}, ...]
+    PATCH  /eventos/<id>              {"titulo"?, "sala_id"?, "inicio"?, "fim"?}
+    DELETE /eventos/<id>
+    POST   /recorrencias              {"sala_id", "titulo", "inicio", "fim",
+                                       "frequencia", "ate", "intervalo"?}
+    DELETE /recorrencias/<id>
+    DELETE /recorrencias/<id>/ocorrencias?inicio=
+    GET    /ocorrencias               ?inicio=&fim=[&sala_id=]
+
+Datas no formato da fachada (`YYYY-MM-DD HH:MM`). Sucesso responde 200 (201
+ao criar) com o resultado em JSON; recusa responde 400/404/409 com
+{"erro": mensagem da fachada}.
+
+Conexões HTTP/1.1 são mantidas abertas (keep-alive) e atendidas por um pool
+fixo de threads; cada resposta traz `Server-Timing` com o tempo gasto na
+fachada e no total da requisição. O container é o de memória, que aceita
+chamadas concorrentes; com `--dados DIR`, os repositórios em memória são
+persistidos num diário nesse diretório (`infra.diário`), e com `--cache N`
+as consultas de conflito/intervalo passam por um cache LRU de N entradas
+(`infra.repos_cache`). Com `--instrumentar`, serviços, repositórios e
+fachada são medidos (`app.instrumentação`): o relatório sai no stderr ao
+receber SIGUSR1 e ao encerrar.
+
+Uso (a partir de `src/`):
+
+    python -m app.servidor --porta 8000 --threads 16
+    python -m app.servidor --dados ../dados --cache 10000
+    python -m app.servidor --instrumentar --perfil-lento 50
+"""
+
+import argparse
+import json
+import signal
+import socket
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import TYPE_CHECKING, Any, Callable
+from urllib.parse import parse_qs, urlsplit
+
+from app import fachada
+from app.container import (
+    Container,
+    criar_container_com_cache,
+    criar_container_diário,
+    criar_container_memória,
+)
+from app.serialização import serializar
+
+if TYPE_CHECKING:
+    from app.instrumentação import Instrumentação
+
+# Resposta da fachada: (ok, dados ou mensagem de erro)
+Resultado = tuple[bool, Any]
+
+_STATUS_RECUSA = {
+    "sala não encontrada": HTTPStatus.NOT_FOUND,
+    "evento não encontrado": HTTPStatus.NOT_FOUND,
+    "recorrência não encontrada": HTTPStatus.NOT_FOUND,
+    "ocorrência não encontrada": HTTPStatus.NOT_FOUND,
+    "nenhum evento arquivado da sala": HTTPStatus.NOT_FOUND,
+    "conflito de horário": HTTPStatus.CONFLICT,
+    "sala possui reservas": HTTPStatus.CONFLICT,
+}
+
+
+class ErroRequisição(Exception):
+    """Requisição malformada (JSON inválido, campo ausente, rota inexistente)."""
+
+    def __init__(self, status: HTTPStatus, mensagem: str) -> None:
+        super().__init__(mensagem)
+        self.status = status
+        self.mensagem = mensagem
+
+
+# ----------------------------
+# Rotas
+# ----------------------------
+
+
+def _texto(valor: Any) -> str | None:
+    # a fachada recebe strings (como vindas de um formulário)
+    return None if valor is None else str(valor)
+
+
+def _objeto(corpo: Any) -> dict:
+    if not isinstance(corpo, dict):
+        raise ErroRequisição(HTTPStatus.BAD_REQUEST, "esperado um objeto JSON")
+    return corpo
+
+
+def _campo(corpo: Any, nome: str) -> str:
+    corpo = _objeto(corpo)
+    if nome not in corpo:
+        raise ErroRequisição(HTTPStatus.BAD_REQUEST, f"campo ausente: {nome}")
+    return str(corpo[nome])
+
+
+def _opcional(corpo: Any, nome: str) -> str | None:
+    return _texto(_objeto(corpo).get(nome))
+
+
+def _param(consulta: dict[str, list[str]], nome: str) -> str | None:
+    valores = consulta.get(nome)
+    return valores[-1] if valores else None
+
+
+def _obrigatório(consulta: dict[str, list[str]], nome: str) -> str:
+    valor = _param(consulta, nome)
+    if valor is None:
+        raise ErroRequisição(HTTPStatus.BAD_REQUEST, f"parâmetro ausente: {nome}")
+    return valor
+
+
+def _listar_salas(c: Container, consulta: dict, _corpo: Any) -> Resultado:
+    limite = _param(consulta, "limite")
+    if limite is None:
+        return True, fachada.listar_salas_ui(c)
+    após = _param(consulta, "apos")
+    try:
+        página, próximo = fachada.listar_salas_pagina_ui(
+            c, int(limite), int(após) if após else None
+        )
+    except ValueError:
+        return False, "paginação inválida"
+    return True, {"salas": página, "proximo": próximo}
+
+
+def _listar_eventos(c: Container, consulta: dict, _corpo: Any) -> Resultado:
+    inicio, fim = _param(consulta, "inicio"), _param(consulta, "fim")
+    if inicio is None and fim is None:
+        return True, fachada.listar_eventos_ui(c)
+    return fachada.listar_eventos_no_intervalo_ui(
+        c, inicio or "", fim or "", _param(consulta, "sala_id")
+    )
+
+
+def _agendar_lote(c: Container, _consulta: dict, corpo: Any) -> Resultado:
+    if not isinstance(corpo, list):
+        raise ErroRequisição(HTTPStatus.BAD_REQUEST, "esperada uma lista de eventos")
+    linhas = [
+        (
+            _campo(item, "sala_id"),
+            _campo(item, "titulo"),
+            _campo(item, "inicio"),
+            _campo(item, "fim"),
+        )
+        for item in corpo
+    ]
+    resultados = fachada.agendar_eventos_em_lote_ui(c, linhas)
+    return True, [
+        {"ok": ok, "evento": r} if ok else {"ok": ok, "erro": r} for ok, r in resultados
+    ]
+
+
+# (método, partes do caminho com None no lugar do id) -> manipulador, chamado
+# com (container, consulta, corpo[, id])
+_ROTAS: dict[tuple[str, tuple[str | None, ...]], Callable[..., Resultado]] = {
+    ("GET", ("salas",)): _listar_salas,
+    ("POST", ("salas",)): lambda c, q, b: fachada.cadastrar_sala_ui(
+        c, _campo(b, "nome"), _campo(b, "capacidade")
+    ),
+    ("GET", ("salas", "disponiveis")): lambda c, q, b: (
+        fachada.buscar_salas_disponíveis_ui(
+            c,
+            _obrigatório(q, "capacidade"),
+            _obrigatório(q, "inicio"),
+            _obrigatório(q, "fim"),
+        )
+    ),
+    ("GET", ("salas", None)): lambda c, q, b, ident: fachada.buscar_sala_por_id_ui(
+        c, ident
+    ),
+    ("DELETE", ("salas", None)): lambda c, q, b, ident: fachada.remover_sala_ui(
+        c, ident, _param(q, "modo") or "recusar"
+    ),
+    ("GET", ("arquivo",)): lambda c, q, b: fachada.listar_arquivados_ui(
+        c, _param(q, "sala_id")
+    ),
+    ("POST", ("arquivo", None, "restaurar")): lambda c, q, b, ident: (
+        fachada.restaurar_arquivados_ui(c, ident, _campo(b, "sala_id"))
+    ),
+    ("GET", ("eventos",)): _listar_eventos,
+    ("POST", ("eventos",)): lambda c, q, b: fachada.agendar_evento_ui(
+        c,
+        _campo(b, "sala_id"),
+        _campo(b, "titulo"),
+        _campo(b, "inicio"),
+        _campo(b, "fim"),
+    ),
+    ("POST", ("eventos", "lote")): _agendar_lote,
+    ("PATCH", ("eventos", None)): lambda c, q, b, ident: fachada.atualizar_evento_ui(
+        c,
+        ident,
+        titulo=_opcional(b, "titulo"),
+        sala_id=_opcional(b, "sala_id"),
+        inicio=_opcional(b, "inicio"),
+        fim=_opcional(b, "fim"),
+    ),
+    ("DELETE", ("eventos", None)): lambda c, q, b, ident: fachada.cancelar_evento_ui(
+        c, ident
+    ),
+    ("POST", ("recorrencias",)): lambda c, q, b: fachada.agendar_recorrência_ui(
+        c,
+        _campo(b, "sala_id"),
+        _campo(b, "titulo"),
+        _campo(b, "inicio"),
+        _campo(b, "fim"),
+        _campo(b, "frequencia"),
+        _campo(b, "ate"),
+        _opcional(b, "intervalo") or "1",
+    ),
+    ("DELETE", ("recorrencias", None)): lambda c, q, b, ident: (
+        fachada.cancelar_recorrência_ui(c, ident)
+    ),
+    ("DELETE", ("recorrencias", None, "ocorrencias")): lambda c, q, b, ident: (
+        fachada.cancelar_ocorrência_ui(c, ident, _obrigatório(q, "inicio"))
+    ),
+    ("GET", ("ocorrencias",)): lambda c, q, b: fachada.listar_ocorrências_ui(
+        c, _obrigatório(q, "inicio"), _obrigatório(q, "fim"), _param(q, "sala_id")
+    ),
+}
+
+
+_CAMINHOS = {caminho for _, caminho in _ROTAS}
+
+
+def _resolver(método: str, caminho: str) -> tuple[Callable[..., Resultado], list[str]]:
+    """Acha o manipulador da rota; retorna também os ids capturados."""
+    partes = tuple(p for p in caminho.split("/") if p)
+    # rotas fixas têm precedência sobre as com id (ex.: /salas/disponiveis)
+    candidatos = [(partes, [])]
+    if len(partes) >= 2:
+        candidatos.append(((partes[0], None, *partes[2:]), [partes[1]]))
+    for chave, ids in candidatos:
+        manipulador = _ROTAS.get((método, chave))
+        if manipulador is not None:
+            return manipulador, ids
+    if any(chave in _CAMINHOS for chave, _ in candidatos):
+        raise ErroRequisição(HTTPStatus.METHOD_NOT_ALLOWED, "método não permitido")
+    raise ErroRequisição(HTTPStatus.NOT_FOUND, "rota não encontrada")
+
+
+def _decodificar_corpo(bruto: bytes) -> Any:
+    if not bruto:
+        return {}
+    try:
+        return json.loads(bruto)
+    except (UnicodeDecodeError, ValueError):
+        raise ErroRequisição(HTTPStatus.BAD_REQUEST, "JSON inválido") from None
+
+
+# ----------------------------
+# HTTP
+# ----------------------------
+
+
+class ManipuladorHTTP(BaseHTTPRequestHandler):
+    """Traduz requisições HTTP em chamadas à fachada do `server.container`."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive: exige Content-Length em tudo
+    server_version = "gerenciador-salas"
+    timeout = 30  # conexão ociosa por mais tempo que isso libera a thread
+    # cabeçalhos e corpo saem em writes separados: sem isto, Nagle + ACK
+    # atrasado do cliente somam ~40 ms a cada resposta em keep-alive
+    disable_nagle_algorithm = True
+
+    server: "ServidorHTTP"
+
+    def do_GET(self) -> None:
+        self._atender()
+
+    def do_POST(self) -> None:
+        self._atender()
+
+    def do_PATCH(self) -> None:
+        self._atender()
+
+    def do_DELETE(self) -> None:
+        self._atender()
+
+    def do_PUT(self) -> None:
+        self._atender()  # nenhuma rota usa PUT: responde 405 em JSON
+
+    def _atender(self) -> None:
+        t0 = time.perf_counter()
+        t_fachada = 0.0
+        try:
+            # o corpo sai da conexão antes de qualquer recusa: um corpo não
+            # lido viraria o começo da próxima requisição (keep-alive)
+            bruto = self._ler_corpo_bruto()
+            url = urlsplit(self.path)
+            manipulador, ids = _resolver(self.command, url.path)
+            corpo = _decodificar_corpo(bruto)
+            consulta = parse_qs(url.query)
+            t1 = time.perf_counter()
+            ok, dados = manipulador(self.server.container, consulta, corpo, *ids)
+            t_fachada = time.perf_counter() - t1
+            if ok:
+                criou = self.command == "POST" and manipulador is not _agendar_lote
+                status = HTTPStatus.CREATED if criou else HTTPStatus.OK
+                resposta = dados
+            else:
+                status = _STATUS_RECUSA.get(dados, HTTPStatus.BAD_REQUEST)
+                resposta = {"erro": dados}
+        except ErroRequisição as e:
+            status, resposta = e.status, {"erro": e.mensagem}
+        except Exception:
+            self.log_error("erro interno em %s %s", self.command, self.path)
+            status, resposta = (
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                {"erro": "erro interno"},
+            )
+        self._responder(status, serializar(resposta), t0, t_fachada)
+
+    def _ler_corpo_bruto(self) -> bytes:
+        try:
+            tamanho = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            tamanho = -1
+        if tamanho < 0:
+            # sem saber onde o corpo termina, a conexão não pode ser reusada
+            self.close_connection = True
+            raise ErroRequisição(HTTPStatus.BAD_REQUEST, "Content-Length inválido")
+        return self.rfile.read(tamanho) if tamanho else b""
+
+    def _responder(
+        self, status: HTTPStatus, corpo: bytes, t0: float, t_fachada: float
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(corpo)))
+        total_ms = (time.perf_counter() - t0) * 1000
+        self.send_header(
+            "Server-Timing",
+            f"fachada;dur={t_fachada * 1000:.3f}, total;dur={total_ms:.3f}",
+        )
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verboso:
+            super().log_message(format, *args)
+
+
+class ServidorHTTP(HTTPServer):
+    """`HTTPServer` que atende cada conexão em um pool fixo de threads.
+
+    Diferente de `ThreadingHTTPServer` (uma thread nova por conexão), o
+    número de threads é limitado: conexões além de `threads` esperam na fila
+    até uma thread ficar livre.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        endereço: tuple[str, int],
+        container: Container | None = None,
+        threads: int = 16,
+        verboso: bool = False,
+    ) -> None:
+        super().__init__(endereço, ManipuladorHTTP)
+        self.container = (
+            container if container is not None else criar_container_memória()
+        )
+        self.verboso = verboso
+        self._pool = ThreadPoolExecutor(threads, thread_name_prefix="http")
+
+    def process_request(self, request: socket.socket, client_address: Any) -> None:
+        self._pool.submit(self._processar, request, client_address)
+
+    def _processar(self, request: socket.socket, client_address: Any) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _instrumentar(perfil_lento_ms: float | None) -> "Instrumentação":
+    # import tardio: sem --instrumentar, nada disso é carregado
+    from app.instrumentação import Instrumentação
+
+    instrumentação = Instrumentação(
+        perfil_limite=perfil_lento_ms / 1e3 if perfil_lento_ms else None
+    )
+    instrumentação.ativar()
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(
+            signal.SIGUSR1,
+            lambda *_: print(instrumentação.relatório(20), file=sys.stderr),
+        )
+    return instrumentação
+
+
+def main(argv: list[str] | None = None) -> None:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--porta", type=int, default=8000)
+    p.add_argument("--threads", type=int, default=16, help="tamanho do pool")
+    p.add_argument("-v", "--verboso", action="store_true", help="log por requisição")
+    p.add_argument(
+        "--dados", help="diretório do diário (persistência); padrão: só memória"
+    )
+    p.add_argument(
+        "--cache",
+        type=int,
+        default=0,
+        help="entradas do cache LRU de consultas de eventos (0 desliga)",
+    )
+    p.add_argument(
+        "--instrumentar",
+        action="store_true",
+        help="mede serviços, repositórios e fachada; SIGUSR1 imprime o relatório",
+    )
+    p.add_argument(
+        "--perfil-lento",
+        type=float,
+        metavar="MS",
+        help="com --instrumentar, guarda o cProfile de uma chamada amostrada"
+        " mais lenta que MS milissegundos",
+    )
+    args = p.parse_args(argv)
+
+    container = criar_container_diário(args.dados) if args.dados else None
+    if args.cache > 0:
+        container = criar_container_com_cache(container, args.cache)
+    instrumentação = None
+    if args.instrumentar:
+        instrumentação = _instrumentar(args.perfil_lento)
+        container = instrumentação.instrumentar(container or criar_container_memória())
+    servidor = ServidorHTTP(
+        (args.host, args.porta),
+        container=container,
+        threads=args.threads,
+        verboso=args.verboso,
+    )
+    print(
+        f"[ok] servindo em http://{args.host}:{servidor.server_port} (Ctrl+C encerra)"
+    )
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+        servidor.container.fechar()
+        if instrumentação is not None:
+            print(instrumentação.relatório(), file=sys.stderr)
+            instrumentação.desativar()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 """Camada de domínio do Gerenciador de Salas.
 
 Contém:
-- modelos (dataclasses para Sala e Evento)
+- modelos (dataclasses para Sala, Evento e Recorrência)
 - regras (funções puras de validação e checagem de conflitos)
 - repositórios (interfaces abstratas para persistência)
 - serviços (funções de caso de uso que usam repos e regras, sem I/O)
@@ -10,6 +10,6 @@ Observação: mantenha esta camada livre de prints/input e de qualquer
 acoplamento a UI/CLI. Ela deve ser facilmente testável.
 """
 
-from .modelos import Sala, Evento
+from .modelos import Sala, Evento, Recorrência, Frequência, Ocorrência
 
-__all__ = ["Sala", "Evento"]
+__all__ = ["Sala", "Evento", "Recorrência", "Frequência", "Ocorrência"]
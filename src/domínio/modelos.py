@@ -1,10 +1,12 @@
-from dataclasses import dataclass
-from datetime import datetime
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import Enum
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Sala:
-    """Entidade de domínio para Sala.
+    """Entidade de domínio para Sala (imutável; use `dataclasses.replace`).
 
     Atributos:
     - id: identificador único (inteiro positivo)
@@ -25,9 +27,12 @@ class Sala:
             raise ValueError("capacidade deve ser inteiro > 0")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Evento:
-    """Entidade de domínio para Evento.
+    """Entidade de domínio para Evento (imutável; use `dataclasses.replace`).
+
+    Com `slots=True` a instância não carrega um `__dict__`, o que reduz o
+    custo por evento quando muitos ficam em memória (ver `bench/`).
 
     Atributos:
     - id: identificador do evento (inteiro positivo)
@@ -54,3 +59,111 @@ class Evento:
             raise ValueError("inicio e fim devem ser datetime")
         if self.fim <= self.inicio:
             raise ValueError("fim deve ser maior que início")
+
+
+class Frequência(Enum):
+    """Passo básico de uma recorrência (multiplicado por `intervalo`)."""
+
+    DIÁRIA = timedelta(days=1)
+    SEMANAL = timedelta(weeks=1)
+
+
+@dataclass(slots=True, frozen=True)
+class Ocorrência:
+    """Uma ocorrência (instância) de uma `Recorrência`, gerada sob demanda."""
+
+    recorrencia_id: int
+    sala_id: int
+    titulo: str
+    inicio: datetime
+    fim: datetime
+
+
+@dataclass(slots=True, frozen=True)
+class Recorrência:
+    """Regra de repetição de um evento (ex.: aula semanal durante o semestre).
+
+    Guarda só a regra, nunca as ocorrências: a k-ésima começa em
+    `inicio + k * período` e dura `fim - inicio`, enquanto começar até `até`.
+
+    Atributos:
+    - id: identificador da recorrência (inteiro positivo)
+    - sala_id: id da sala existente
+    - titulo: título das ocorrências (não vazio)
+    - inicio, fim: primeira ocorrência (fim > início)
+    - frequência: `Frequência.DIÁRIA` ou `Frequência.SEMANAL`
+    - até: última data/hora em que uma ocorrência pode começar (>= início)
+    - intervalo: repete a cada `intervalo` dias/semanas (inteiro > 0)
+    - exceções: inícios de ocorrências canceladas
+    """
+
+    id: int
+    sala_id: int
+    titulo: str
+    inicio: datetime
+    fim: datetime
+    frequência: Frequência
+    até: datetime
+    intervalo: int = 1
+    exceções: frozenset[datetime] = field(default_factory=frozenset)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.id, int) or self.id <= 0:
+            raise ValueError("id da recorrência deve ser inteiro > 0")
+        if not isinstance(self.sala_id, int) or self.sala_id <= 0:
+            raise ValueError("sala_id deve ser inteiro > 0")
+        if not isinstance(self.titulo, str) or not self.titulo.strip():
+            raise ValueError("título da recorrência não pode ser vazio")
+        if not isinstance(self.inicio, datetime) or not isinstance(self.fim, datetime):
+            raise ValueError("inicio e fim devem ser datetime")
+        if self.fim <= self.inicio:
+            raise ValueError("fim deve ser maior que início")
+        if not isinstance(self.frequência, Frequência):
+            raise ValueError("frequência inválida")
+        if not isinstance(self.intervalo, int) or self.intervalo <= 0:
+            raise ValueError("intervalo deve ser inteiro > 0")
+        if not isinstance(self.até, datetime) or self.até < self.inicio:
+            raise ValueError("até deve ser datetime >= início")
+        if self.duração > self.período:
+            raise ValueError("duração não pode exceder o período da recorrência")
+        object.__setattr__(self, "exceções", frozenset(self.exceções))
+
+    @property
+    def período(self) -> timedelta:
+        return self.frequência.value * self.intervalo
+
+    @property
+    def duração(self) -> timedelta:
+        return self.fim - self.inicio
+
+    @property
+    def último_índice(self) -> int:
+        """Índice k da última ocorrência possível (ignorando exceções)."""
+        return (self.até - self.inicio) // self.período
+
+    @property
+    def fim_da_vigência(self) -> datetime:
+        """Fim da última ocorrência possível (ignorando exceções)."""
+        return self.início_de(self.último_índice) + self.duração
+
+    def início_de(self, k: int) -> datetime:
+        return self.inicio + k * self.período
+
+    def ocorrências(self, inicio: datetime, fim: datetime) -> Iterator[Ocorrência]:
+        """Gera, em ordem, as ocorrências que se sobrepõem a [inicio, fim).
+
+        O primeiro índice é calculado direto (sem percorrer as anteriores), e
+        só as ocorrências dentro da janela são criadas.
+        """
+        # primeira ocorrência com início > inicio - duração
+        k = max(0, (inicio - self.duração - self.inicio) // self.período + 1)
+        último = self.último_índice
+        while k <= último:
+            ini = self.início_de(k)
+            if ini >= fim:
+                break
+            if ini not in self.exceções:
+                yield Ocorrência(
+                    self.id, self.sala_id, self.titulo, ini, ini + self.duração
+                )
+            k += 1
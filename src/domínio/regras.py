@@ -1,7 +1,8 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from math import lcm
 from typing import Iterable
 
-from .modelos import Evento
+from .modelos import Evento, Ocorrência, Recorrência
 
 
 def validar_intervalo(inicio: datetime, fim: datetime) -> bool:
@@ -46,3 +47,62 @@ def encontrar_conflito(
         if intervalos_sobrepostos(inicio, fim, e.inicio, e.fim):
             return e
     return None
+
+
+def conflito_com_recorrência(
+    recorrência: Recorrência, sala_id: int, inicio: datetime, fim: datetime
+) -> Ocorrência | None:
+    """Retorna a primeira ocorrência da recorrência (na `sala_id`) que se
+    sobrepõe a [inicio, fim), se houver, sem expandir as demais."""
+    if recorrência.sala_id != sala_id or not validar_intervalo(inicio, fim):
+        return None
+    return next(recorrência.ocorrências(inicio, fim), None)
+
+
+_MICROSSEGUNDO = timedelta(microseconds=1)
+
+
+def conflito_entre_recorrências(
+    a: Recorrência, b: Recorrência
+) -> tuple[Ocorrência, Ocorrência] | None:
+    """Retorna o primeiro par de ocorrências de `a` e `b` que se sobrepõem.
+
+    Não expande as recorrências: para cada ocorrência de `a`, as de `b` que
+    podem cruzá-la são achadas por aritmética. Como o padrão de cruzamentos
+    se repete a cada hiperperíodo (o mmc dos dois períodos), se nenhum par
+    aparecer no primeiro hiperperíodo comum não há conflito algum; o custo
+    não depende da quantidade de ocorrências. Exceções só estendem a busca
+    enquanto os pares encontrados caem em ocorrências canceladas.
+    """
+    if a.sala_id != b.sala_id:
+        return None
+    da, db = a.duração, b.duração
+    hiperperíodo = _MICROSSEGUNDO * lcm(
+        a.período // _MICROSSEGUNDO, b.período // _MICROSSEGUNDO
+    )
+    horizonte = max(a.inicio, b.inicio) + max(da, db) + hiperperíodo
+    fim_b = b.fim_da_vigência
+    último_a, último_b = a.último_índice, b.último_índice
+
+    encontrou_par = False
+    # primeira ocorrência de `a` que termina depois do início de `b`
+    k = max(0, (b.inicio - da - a.inicio) // a.período + 1)
+    while k <= último_a:
+        ini_a = a.início_de(k)
+        if ini_a >= fim_b or (not encontrou_par and ini_a > horizonte):
+            break
+        # ocorrências de `b` com início em (ini_a - db, ini_a + da)
+        j = max(0, (ini_a - db - b.inicio) // b.período + 1)
+        while j <= último_b:
+            ini_b = b.início_de(j)
+            if ini_b >= ini_a + da:
+                break
+            encontrou_par = True
+            if ini_a not in a.exceções and ini_b not in b.exceções:
+                return (
+                    Ocorrência(a.id, a.sala_id, a.titulo, ini_a, ini_a + da),
+                    Ocorrência(b.id, b.sala_id, b.titulo, ini_b, ini_b + db),
+                )
+            j += 1
+        k += 1
+    return None
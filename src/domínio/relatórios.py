@@ -0,0 +1,462 @@
+"""Relatórios de ocupação das salas (sem I/O).
+
+Para um período [inicio, fim) dividido em fatias de `passo` (um dia, uma
+semana...), calcula por sala as horas ocupadas em cada fatia, a utilização e
+o pico de reservas simultâneas e, para o conjunto, o pico de salas e de
+assentos em uso e a ocupação ponderada pela capacidade.
+
+Tudo sai de uma única varredura (sweep line) sobre os extremos dos eventos
+ordenados: O(n log n) pela ordenação, em vez de cruzar cada fatia com cada
+evento. Com NumPy instalado (opcional, nunca obrigatório), a varredura de
+entradas grandes é feita com operações vetorizadas sobre arrays int64.
+
+`validar_agenda` revalida a agenda inteira (por exemplo, ao exigir uma folga
+entre reservas) e lista todos os pares de reservas em conflito, eventos e
+ocorrências de recorrências, com a mesma estratégia: ordenação única e
+varredura, com um caminho NumPy opcional.
+"""
+
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from functools import cache
+from operator import attrgetter
+from typing import NamedTuple
+
+from .modelos import Evento, Ocorrência
+from .regras import validar_intervalo
+from .repositórios import EventoRepository, RecorrênciaRepository, SalaRepository
+from .serviços import listar_ocorrências
+
+_MICROSSEGUNDO = timedelta(microseconds=1)
+_MICROSSEGUNDOS_POR_HORA = 3_600_000_000
+# abaixo disso montar os arrays custa mais do que a varredura em Python
+_MÍNIMO_NUMPY = 2_000
+
+
+class OcupaçãoSala(NamedTuple):
+    sala_id: int
+    nome: str
+    capacidade: int
+    horas_por_período: list[float]  # horas ocupadas em cada fatia
+    horas: float  # total ocupado no período (sobreposições contam uma vez)
+    utilização: float  # horas / duração do período, entre 0 e 1
+    pico: int  # máximo de reservas simultâneas na sala
+
+
+class RelatórioOcupação(NamedTuple):
+    inicio: datetime
+    fim: datetime
+    passo: timedelta
+    períodos: list[datetime]  # início de cada fatia
+    salas: list[OcupaçãoSala]  # ordenadas por id
+    pico_salas: int  # máximo de salas ocupadas ao mesmo tempo
+    pico_assentos: int  # máximo da soma das capacidades das salas ocupadas
+    ocupação_ponderada: float  # assentos·hora ocupados / assentos·hora do período
+
+
+class _Varredura(NamedTuple):
+    # resultado bruto, em microssegundos desde `inicio`
+    fatias: list[list[int]]  # por sala (índice), ocupado em cada fatia
+    picos: list[int]  # por sala (índice)
+    pico_salas: int
+    pico_assentos: int
+
+
+@cache
+def _numpy():
+    """Retorna o módulo NumPy, ou None se não estiver instalado (importado
+    só no primeiro relatório grande, não ao importar este módulo)."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def relatório_ocupação(
+    eventos: EventoRepository,
+    salas: SalaRepository,
+    inicio: datetime,
+    fim: datetime,
+    passo: timedelta = timedelta(days=1),
+    recorrências: RecorrênciaRepository | None = None,
+    usar_numpy: bool | None = None,
+) -> RelatórioOcupação | None:
+    """Calcula a ocupação de todas as salas em [inicio, fim), por fatias de `passo`.
+
+    Eventos (e, se informado, ocorrências de `recorrências`) são recortados
+    ao período; os de salas inexistentes são ignorados. A última fatia pode
+    ser menor que `passo`. `usar_numpy=None` escolhe sozinho (NumPy, se
+    instalado, para entradas grandes); True exige NumPy e False nunca o usa.
+    Intervalo ou passo inválidos retornam None.
+    """
+    if not validar_intervalo(inicio, fim) or passo <= timedelta(0):
+        return None
+    numpy = _numpy() if usar_numpy is not False else None
+    if usar_numpy and numpy is None:
+        raise ModuleNotFoundError("usar_numpy=True requer o NumPy instalado")
+
+    lista_salas = salas.listar()
+    índice = {s.id: i for i, s in enumerate(lista_salas)}
+    total = (fim - inicio) // _MICROSSEGUNDO
+    n_fatias = -(-total // (passo // _MICROSSEGUNDO))
+
+    reservas = eventos.listar_no_intervalo(inicio, fim)
+    if recorrências is not None:
+        # a varredura em Python espera as reservas ordenadas por início
+        reservas = sorted(
+            [*reservas, *listar_ocorrências(recorrências, inicio, fim)],
+            key=attrgetter("inicio"),
+        )
+    reservas = [r for r in reservas if r.sala_id in índice]
+    salas_das_reservas = [índice[r.sala_id] for r in reservas]
+    capacidades = [s.capacidade for s in lista_salas]
+
+    # o caminho NumPy põe cada sala numa faixa própria de um eixo int64
+    cabe_em_int64 = len(lista_salas) * (total + 1) < 2**63
+    if (
+        numpy is not None
+        and cabe_em_int64
+        and (usar_numpy or len(reservas) >= _MÍNIMO_NUMPY)
+    ):
+        v = _varrer_numpy(
+            numpy, reservas, salas_das_reservas, capacidades, inicio, fim, passo
+        )
+    else:
+        v = _varrer(reservas, salas_das_reservas, capacidades, inicio, fim, passo)
+
+    ocupação: list[OcupaçãoSala] = []
+    assentos_ocupados = 0
+    for i, s in enumerate(lista_salas):
+        ocupado = sum(v.fatias[i])
+        assentos_ocupados += ocupado * s.capacidade
+        ocupação.append(
+            OcupaçãoSala(
+                s.id,
+                s.nome,
+                s.capacidade,
+                [us / _MICROSSEGUNDOS_POR_HORA for us in v.fatias[i]],
+                ocupado / _MICROSSEGUNDOS_POR_HORA,
+                ocupado / total,
+                v.picos[i],
+            )
+        )
+    assentos_disponíveis = sum(capacidades) * total
+    return RelatórioOcupação(
+        inicio,
+        fim,
+        passo,
+        [inicio + k * passo for k in range(n_fatias)],
+        ocupação,
+        v.pico_salas,
+        v.pico_assentos,
+        assentos_ocupados / assentos_disponíveis if assentos_disponíveis else 0.0,
+    )
+
+
+def _varrer(
+    reservas: list,
+    salas_das_reservas: list[int],
+    capacidades: list[int],
+    inicio: datetime,
+    fim: datetime,
+    passo: timedelta,
+) -> _Varredura:
+    n_salas = len(capacidades)
+    n_fatias = -(-(fim - inicio) // passo)
+    fatias = [[0] * n_fatias for _ in range(n_salas)]
+    picos = [0] * n_salas
+    ativas = [0] * n_salas  # reservas em andamento por sala
+    desde = [inicio] * n_salas  # início do trecho ocupado atual de cada sala
+
+    # Os inícios já vêm ordenados do repositório; só os términos são
+    # ordenados (pelo índice, comparando só datetimes) e as duas sequências
+    # são intercaladas. Todas as reservas cruzam [inicio, fim): nenhum término
+    # cai antes de `inicio` nem um início depois de `fim`, então o recorte ao
+    # período é feito uma vez por trecho ocupado, não por reserva.
+    inícios = [r.inicio for r in reservas]
+    fins = [r.fim for r in reservas]
+    n = len(reservas)
+    k = 0  # próximo início
+    salas_ocupadas = assentos = pico_salas = pico_assentos = 0
+    for j in sorted(range(n), key=fins.__getitem__):
+        t = fins[j]
+        # inícios antes deste término; no mesmo instante o término vem antes:
+        # [a, b) e [b, c) não são simultâneos
+        while k < n and inícios[k] < t:
+            i = salas_das_reservas[k]
+            k += 1
+            m = ativas[i] + 1
+            ativas[i] = m
+            if m == 1:  # a sala fica ocupada
+                desde[i] = inícios[k - 1]
+                salas_ocupadas += 1
+                assentos += capacidades[i]
+                if salas_ocupadas > pico_salas:
+                    pico_salas = salas_ocupadas
+                if assentos > pico_assentos:
+                    pico_assentos = assentos
+            if m > picos[i]:
+                picos[i] = m
+        i = salas_das_reservas[j]
+        ativas[i] -= 1
+        if ativas[i] == 0:  # a sala fica livre: reparte [desde, t) pelas fatias
+            a, b = max(desde[i], inicio), min(t, fim)
+            f = (a - inicio) // passo
+            limite = inicio + (f + 1) * passo
+            por_fatia = fatias[i]
+            while b > limite:
+                por_fatia[f] += (limite - a) // _MICROSSEGUNDO
+                a, f, limite = limite, f + 1, limite + passo
+            por_fatia[f] += (b - a) // _MICROSSEGUNDO
+            salas_ocupadas -= 1
+            assentos -= capacidades[i]
+    return _Varredura(fatias, picos, pico_salas, pico_assentos)
+
+
+def _varrer_numpy(
+    np,
+    reservas: list,
+    salas_das_reservas: list[int],
+    capacidades: list[int],
+    inicio: datetime,
+    fim: datetime,
+    passo: timedelta,
+) -> _Varredura:
+    n_salas = len(capacidades)
+    total = (fim - inicio) // _MICROSSEGUNDO
+    passo = passo // _MICROSSEGUNDO
+    n_fatias = -(-total // passo)
+    if not reservas:
+        return _Varredura([[0] * n_fatias for _ in range(n_salas)], [0] * n_salas, 0, 0)
+
+    # microssegundos desde `inicio`, recortados ao período
+    n = len(reservas)
+    ini = np.fromiter(
+        ((r.inicio - inicio) // _MICROSSEGUNDO for r in reservas), np.int64, n
+    )
+    fim = np.fromiter(
+        ((r.fim - inicio) // _MICROSSEGUNDO for r in reservas), np.int64, n
+    )
+    np.clip(ini, 0, total, out=ini)
+    np.clip(fim, 0, total, out=fim)
+    sala = np.array(salas_das_reservas, dtype=np.int64)
+    cap = np.array(capacidades, dtype=np.int64)
+    # Pico por sala: extremos ordenados por (sala, tempo, término antes de
+    # início); a soma acumulada dos +1/-1 volta a zero no fim de cada sala.
+    t = np.concatenate((ini, fim))
+    d = np.concatenate((np.ones_like(ini), -np.ones_like(fim)))
+    s = np.concatenate((sala, sala))
+    ordem = np.lexsort((d, t, s))
+    picos = np.zeros(n_salas, dtype=np.int64)
+    np.maximum.at(picos, s[ordem], np.cumsum(d[ordem]))
+
+    # União dos intervalos de cada sala: com as salas deslocadas para faixas
+    # disjuntas do eixo, um máximo acumulado dos fins separa os trechos.
+    base = np.int64(total + 1)
+    ordem = np.lexsort((ini, sala))
+    chave_ini = sala[ordem] * base + ini[ordem]
+    fim_acumulado = np.maximum.accumulate(sala[ordem] * base + fim[ordem])
+    novo = np.empty(len(ordem), dtype=bool)
+    novo[0] = True
+    novo[1:] = chave_ini[1:] > fim_acumulado[:-1]
+    começos = np.flatnonzero(novo)
+    S = chave_ini[começos]
+    E = fim_acumulado[np.append(começos[1:] - 1, len(ordem) - 1)]
+    sala_trecho = sala[ordem][começos]
+
+    # Ocupado antes de cada limite de fatia, por sala: soma dos trechos que
+    # começam antes do limite menos o que deles passa do limite.
+    acumulado = np.concatenate(([0], np.cumsum(E - S)))
+    limites = np.minimum(np.arange(n_fatias + 1, dtype=np.int64) * passo, total)
+    x = np.arange(n_salas, dtype=np.int64)[:, None] * base + limites[None, :]
+    j = np.searchsorted(S, x, side="right")
+    excesso = np.where(j > 0, np.maximum(E[j - 1] - x, 0), 0)
+    fatias = np.diff(acumulado[j] - excesso, axis=1)
+
+    # Picos do conjunto sobre os trechos unidos (uma sala conta uma vez)
+    t = np.concatenate((S, E)) - np.concatenate((sala_trecho, sala_trecho)) * base
+    d = np.concatenate((np.ones_like(S), -np.ones_like(E)))
+    ordem = np.lexsort((d, t))
+    w = np.concatenate((cap[sala_trecho], -cap[sala_trecho]))[ordem]
+    return _Varredura(
+        fatias.tolist(),
+        picos.tolist(),
+        int(np.cumsum(d[ordem]).max()),
+        int(np.cumsum(w).max()),
+    )
+
+
+# ------------------------------
+# Validação da agenda inteira
+# ------------------------------
+
+
+class Conflito(NamedTuple):
+    sala_id: int
+    # o que começa antes (no empate, o evento avulso e depois o de menor id)
+    primeiro: Evento | Ocorrência
+    segundo: Evento | Ocorrência
+
+
+def _chave_reserva(r: Evento | Ocorrência) -> tuple:
+    if isinstance(r, Evento):
+        return (r.inicio, 0, r.id)
+    return (r.inicio, 1, r.recorrencia_id)
+
+
+def validar_agenda(
+    eventos: EventoRepository,
+    folga: timedelta = timedelta(0),
+    usar_numpy: bool = False,
+    recorrências: RecorrênciaRepository | None = None,
+    inicio: datetime | None = None,
+    fim: datetime | None = None,
+) -> list[Conflito]:
+    """Lista todos os pares de reservas da mesma sala em conflito.
+
+    Duas reservas conflitam se se sobrepõem ou se o intervalo entre elas é
+    menor que `folga` (folga zero: a regra do agendamento, em que [a, b) e
+    [b, c) não conflitam). Os pares saem ordenados por sala e pelo início do
+    `primeiro` e do `segundo`.
+
+    Com `recorrências`, as ocorrências das regras também entram (contra os
+    eventos avulsos e entre si), geradas sob demanda: nenhuma é gravada.
+    Com a janela [`inicio`, `fim`), só as reservas que a tocam são
+    validadas; sem ela, a agenda inteira, com cada regra expandida em toda
+    a sua vigência (custo proporcional ao número de ocorrências).
+
+    Cada sala é ordenada uma vez por início; para cada reserva, as que
+    conflitam com ela entre as seguintes formam uma faixa contígua achada
+    por busca binária (quem começa antes do seu fim + folga). Custo
+    O(n log n + k) para n reservas e k pares, em vez de comparar cada uma
+    com todas as outras da sala.
+
+    Com `usar_numpy=True` a busca é feita por `pares_em_conflito` sobre
+    arrays int64. Aqui as reservas chegam como objetos e convertê-las custa
+    mais que a própria varredura em Python, por isso ela é o padrão; o
+    NumPy compensa para quem já tem as colunas em arrays.
+    """
+    if folga < timedelta(0):
+        raise ValueError("folga não pode ser negativa")
+    if (inicio is None) != (fim is None):
+        raise ValueError("inicio e fim devem ser usados juntos")
+    if inicio is not None and not validar_intervalo(inicio, fim):
+        raise ValueError("intervalo de datas inválido")
+
+    # iterar_ordenado (e listar_no_intervalo) já entregam na ordem
+    # (inicio, sala_id, id): separar por sala mantém cada sala ordenada por
+    # (inicio, id), sem ordenar de novo
+    por_sala: dict[int, list[Evento | Ocorrência]] = {}
+    avulsos = (
+        eventos.iterar_ordenado()
+        if inicio is None
+        else eventos.listar_no_intervalo(inicio, fim)
+    )
+    for e in avulsos:
+        lista = por_sala.get(e.sala_id)
+        if lista is None:
+            lista = por_sala[e.sala_id] = []
+        lista.append(e)
+    if recorrências is not None:
+        if inicio is None:
+            ocorrências = (
+                o
+                for r in recorrências.listar()
+                for o in r.ocorrências(r.inicio, r.fim_da_vigência)
+            )
+        else:
+            ocorrências = listar_ocorrências(recorrências, inicio, fim)
+        com_ocorrências: set[int] = set()
+        for o in ocorrências:
+            por_sala.setdefault(o.sala_id, []).append(o)
+            com_ocorrências.add(o.sala_id)
+        # só as salas que receberam ocorrências precisam ser reordenadas
+        for sala_id in com_ocorrências:
+            por_sala[sala_id].sort(key=_chave_reserva)
+
+    salas = sorted(por_sala)
+    if usar_numpy:
+        todos = [e for sala_id in salas for e in por_sala[sala_id]]
+        return [
+            Conflito(todos[i].sala_id, todos[i], todos[j])
+            for i, j in zip(*(a.tolist() for a in _pares_numpy(todos, folga)))
+        ]
+    conflitos: list[Conflito] = []
+    for sala_id in salas:
+        lista = por_sala[sala_id]
+        inícios = [e.inicio for e in lista]
+        for i, e in enumerate(lista):
+            # seguintes que começam antes do fim (+ folga) desta: como começam
+            # depois dela, todas conflitam
+            for j in range(i + 1, bisect_left(inícios, e.fim + folga, i + 1)):
+                conflitos.append(Conflito(sala_id, e, lista[j]))
+    return conflitos
+
+
+def _pares_numpy(todos: list[Evento | Ocorrência], folga: timedelta):
+    np = _numpy()
+    if np is None:
+        raise ModuleNotFoundError("usar_numpy=True requer o NumPy instalado")
+    n = len(todos)
+    if n == 0:
+        return pares_em_conflito([], [], [])
+    base = min(e.inicio for e in todos)
+    return pares_em_conflito(
+        np.fromiter((e.sala_id for e in todos), np.int64, n),
+        np.fromiter(((e.inicio - base) // _MICROSSEGUNDO for e in todos), np.int64, n),
+        np.fromiter(((e.fim - base) // _MICROSSEGUNDO for e in todos), np.int64, n),
+        folga // _MICROSSEGUNDO,
+    )
+
+
+def pares_em_conflito(sala, inicio, fim, folga: int = 0):
+    """Versão vetorizada (NumPy) da busca de `validar_agenda`.
+
+    Recebe arrays int64 alinhados, um elemento por evento (sala, início e
+    fim em qualquer unidade inteira, como minutos ou microssegundos, com
+    fim > início) e a `folga` na mesma unidade. Retorna dois arrays de
+    índices (i, j) nas entradas, um par por conflito, com o evento `i`
+    começando antes do `j` (no empate, o de menor índice), ordenados por
+    sala, início de `i` e início de `j`. O(n log n + k) sem laço em Python.
+    """
+    np = _numpy()
+    if np is None:
+        raise ModuleNotFoundError("pares_em_conflito requer o NumPy instalado")
+    sala = np.asarray(sala, dtype=np.int64)
+    inicio = np.asarray(inicio, dtype=np.int64)
+    fim = np.asarray(fim, dtype=np.int64)
+    n = len(inicio)
+    vazio = np.empty(0, dtype=np.int64)
+    if n == 0:
+        return vazio, vazio
+
+    ordem = np.lexsort((inicio, sala))  # estável: empate pelo índice
+    s, a, b = sala[ordem], inicio[ordem], fim[ordem] + folga
+    menor = min(int(a.min()), int(b.min()))
+    a, b = a - menor, b - menor
+    # Cada sala numa faixa própria do eixo (como em `_varrer_numpy`): a busca
+    # binária de um evento não passa para a sala seguinte. Se as faixas não
+    # couberem em int64, a busca é feita sala a sala.
+    nova_sala = np.flatnonzero(s[1:] != s[:-1]) + 1
+    faixa = int(max(a.max(), b.max())) + 1
+    if (len(nova_sala) + 1) * faixa < 2**63:
+        deslocamento = np.zeros(n, dtype=np.int64)
+        deslocamento[nova_sala] = faixa
+        deslocamento = np.cumsum(deslocamento)
+        limite = np.searchsorted(a + deslocamento, b + deslocamento, side="left")
+    else:
+        limite = np.empty(n, dtype=np.int64)
+        for c, f in zip([0, *nova_sala.tolist()], [*nova_sala.tolist(), n]):
+            limite[c:f] = c + np.searchsorted(a[c:f], b[c:f], side="left")
+
+    # pares (p, q) para q em [p + 1, limite[p]), as faixas concatenadas
+    posição = np.arange(n, dtype=np.int64)
+    quantos = np.maximum(limite - posição - 1, 0)
+    k = int(quantos.sum())
+    if k == 0:
+        return vazio, vazio
+    p = np.repeat(posição, quantos)
+    começo = np.cumsum(quantos) - quantos  # onde começa a faixa de cada p
+    q = p + 1 + np.arange(k, dtype=np.int64) - np.repeat(começo, quantos)
+    return ordem[p], ordem[q]
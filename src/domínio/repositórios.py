@@ -1,6 +1,20 @@
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import replace
+from datetime import datetime
+from itertools import islice
+from typing import Iterable, Iterator
 
-from .modelos import Sala, Evento
+from .modelos import Sala, Evento, Recorrência
+from .regras import encontrar_conflito as _encontrar_conflito, validar_intervalo
+
+
+# Posição de um evento na ordem de listagem: (inicio, sala_id, id)
+CursorEvento = tuple[datetime, int, int]
+
+
+def _chave_evento(e: Evento) -> CursorEvento:
+    return (e.inicio, e.sala_id, e.id)
 
 
 class SalaRepository(ABC):
@@ -36,6 +50,46 @@ class SalaRepository(ABC):
     def atualizar(self, sala: Sala) -> Sala:
         raise NotImplementedError
 
+    def criar(self, nome: str, capacidade: int) -> Sala:
+        """Cria e persiste uma sala nova com o próximo id livre.
+
+        Implementação padrão: `proximo_id` seguido de `adicionar`; ver a
+        ressalva de atomicidade em `EventoRepository.criar`.
+        """
+        return self.adicionar(Sala(self.proximo_id(), nome, capacidade))
+
+    def listar_pagina(self, limite: int, após: int | None = None) -> list[Sala]:
+        """Retorna até `limite` salas com id > `após` (ou desde o início), por id.
+
+        Implementação padrão: ordena `listar()` a cada chamada; repositórios
+        que mantêm as salas ordenadas devem sobrescrever.
+        """
+        ordenadas = sorted(self.listar(), key=lambda s: s.id)
+        return list(
+            islice(
+                (s for s in ordenadas if após is None or s.id > após), max(limite, 0)
+            )
+        )
+
+    def iterar_ordenado(self, tamanho_lote: int = 1000) -> Iterator[Sala]:
+        """Itera todas as salas por id, sem montar uma lista completa.
+
+        Implementação padrão: uma única ordenação de `listar()`.
+        `tamanho_lote` é uma dica para implementações que buscam em páginas.
+        """
+        yield from sorted(self.listar(), key=lambda s: s.id)
+
+    def listar_por_capacidade_mínima(self, capacidade_min: int) -> list[Sala]:
+        """Lista salas com capacidade >= `capacidade_min`, da menor para a maior.
+
+        Empates são ordenados por id. Implementação padrão: filtra e ordena
+        `listar()`; repositórios com índice por capacidade devem sobrescrever.
+        """
+        return sorted(
+            (s for s in self.listar() if s.capacidade >= capacidade_min),
+            key=lambda s: (s.capacidade, s.id),
+        )
+
 
 class EventoRepository(ABC):
     """Interface abstrata para persistência de eventos."""
@@ -68,3 +122,199 @@ class EventoRepository(ABC):
     @abstractmethod
     def listar_por_sala(self, sala_id: int) -> list[Evento]:
         raise NotImplementedError
+
+    def remover_por_sala(self, sala_id: int) -> list[Evento]:
+        """Remove todos os eventos da sala e os retorna (ordem de `listar_por_sala`).
+
+        Implementação padrão: `listar_por_sala` e um `remover` por evento,
+        custo proporcional aos eventos da sala quando `listar_por_sala` usa
+        um índice. Repositórios podem sobrescrever para remover de uma vez.
+        """
+        eventos = self.listar_por_sala(sala_id)
+        return [e for e in eventos if self.remover(e.id)]
+
+    def listar_pagina(
+        self, limite: int, após: CursorEvento | None = None
+    ) -> list[Evento]:
+        """Retorna até `limite` eventos na ordem (inicio, sala_id, id).
+
+        A página começa logo depois do cursor `após` (exclusivo), que é a
+        chave do último evento da página anterior. Implementação padrão:
+        ordena `listar()` a cada chamada; repositórios que mantêm os eventos
+        pré-ordenados devem sobrescrever.
+        """
+        ordenados = sorted(self.listar(), key=_chave_evento)
+        return list(
+            islice(
+                (e for e in ordenados if após is None or _chave_evento(e) > após),
+                max(limite, 0),
+            )
+        )
+
+    def iterar_ordenado(self, tamanho_lote: int = 1000) -> Iterator[Evento]:
+        """Itera todos os eventos na ordem (inicio, sala_id, id), em streaming.
+
+        Implementação padrão: uma única ordenação de `listar()`.
+        `tamanho_lote` é uma dica para implementações que buscam em páginas.
+        """
+        yield from sorted(self.listar(), key=_chave_evento)
+
+    def listar_no_intervalo(
+        self, inicio: datetime, fim: datetime, sala_id: int | None = None
+    ) -> list[Evento]:
+        """Lista os eventos que se sobrepõem a [inicio, fim), opcionalmente de
+        uma única sala, na ordem (inicio, sala_id, id).
+
+        Um intervalo inválido (fim <= inicio) resulta em lista vazia.
+        Implementação padrão: filtra `listar()` (ou `listar_por_sala`) e
+        ordena; repositórios com índice por início devem sobrescrever.
+        """
+        if not validar_intervalo(inicio, fim):
+            return []
+        candidatos = self.listar() if sala_id is None else self.listar_por_sala(sala_id)
+        return sorted(
+            (e for e in candidatos if e.inicio < fim and e.fim > inicio),
+            key=_chave_evento,
+        )
+
+    def travar_salas(self, *sala_ids: int) -> AbstractContextManager[None]:
+        """Contexto que dá exclusividade de escrita nas salas informadas.
+
+        Os serviços seguram este contexto entre a checagem de conflito e a
+        gravação, para que duas requisições concorrentes não reservem o mesmo
+        horário. Implementação padrão: não trava nada (uso em uma thread só);
+        repositórios compartilhados entre threads devem sobrescrever com uma
+        trava por sala, para que salas diferentes sigam em paralelo.
+        """
+        return nullcontext()
+
+    def criar(
+        self, sala_id: int, titulo: str, inicio: datetime, fim: datetime
+    ) -> Evento:
+        """Cria e persiste um evento novo com o próximo id livre.
+
+        Implementação padrão: `proximo_id` seguido de `adicionar`.
+        Repositórios usados por várias threads devem sobrescrever para que a
+        reserva do id e a gravação sejam atômicas.
+        """
+        return self.adicionar(Evento(self.proximo_id(), sala_id, titulo, inicio, fim))
+
+    def criar_em_lote(
+        self, dados: Iterable[tuple[int, str, datetime, datetime]]
+    ) -> list[Evento]:
+        """Cria vários eventos novos, tuplas (sala_id, titulo, inicio, fim), com
+        ids sequenciais na ordem recebida.
+
+        Implementação padrão: ids a partir de `proximo_id` e uma chamada a
+        `adicionar_em_lote` (mesma ressalva de atomicidade de `criar`).
+        """
+        prox = self.proximo_id()
+        return self.adicionar_em_lote(
+            Evento(prox + k, *campos) for k, campos in enumerate(dados)
+        )
+
+    def adicionar_em_lote(self, eventos: Iterable[Evento]) -> list[Evento]:
+        """Persiste vários eventos novos de uma vez e os retorna.
+
+        Implementação padrão: chama `adicionar` para cada evento. Repositórios
+        com custo fixo por escrita (ex.: transações) devem sobrescrever.
+        """
+        return [self.adicionar(e) for e in eventos]
+
+    def encontrar_conflito(
+        self,
+        sala_id: int,
+        inicio: datetime,
+        fim: datetime,
+        ignorar_evento_id: int | None = None,
+    ) -> Evento | None:
+        """Retorna um evento da sala que se sobrepõe a [inicio, fim), se houver.
+
+        Implementação padrão: percorre `listar_por_sala` (O(n) por sala).
+        Repositórios com índice por sala devem sobrescrever este método.
+        """
+        return _encontrar_conflito(
+            self.listar_por_sala(sala_id), sala_id, inicio, fim, ignorar_evento_id
+        )
+
+    def existe_sobreposição(
+        self,
+        sala_id: int,
+        inicio: datetime,
+        fim: datetime,
+        ignorar_evento_id: int | None = None,
+    ) -> bool:
+        """Retorna True se algum evento da sala se sobrepõe a [inicio, fim)."""
+        return (
+            self.encontrar_conflito(sala_id, inicio, fim, ignorar_evento_id) is not None
+        )
+
+
+class RecorrênciaRepository(ABC):
+    """Interface abstrata para persistência de recorrências.
+
+    Guarda apenas as regras; as ocorrências são expandidas sob demanda
+    (`Recorrência.ocorrências`), então o armazenamento cresce com o número
+    de regras e não com o de ocorrências.
+    """
+
+    @abstractmethod
+    def proximo_id(self) -> int:
+        """Retorna o próximo id disponível para uma nova recorrência."""
+        raise NotImplementedError
+
+    def criar(self, recorrência: Recorrência) -> Recorrência:
+        """Persiste `recorrência` com o próximo id livre (o id recebido é
+        ignorado) e a retorna.
+
+        Implementação padrão: `proximo_id` seguido de `adicionar`; ver a
+        ressalva de atomicidade em `EventoRepository.criar`.
+        """
+        return self.adicionar(replace(recorrência, id=self.proximo_id()))
+
+    @abstractmethod
+    def adicionar(self, recorrência: Recorrência) -> Recorrência:
+        raise NotImplementedError
+
+    @abstractmethod
+    def atualizar(self, recorrência: Recorrência) -> Recorrência:
+        raise NotImplementedError
+
+    @abstractmethod
+    def remover(self, recorrência_id: int) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def obter_por_id(self, recorrência_id: int) -> Recorrência | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def listar(self) -> list[Recorrência]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def listar_por_sala(self, sala_id: int) -> list[Recorrência]:
+        raise NotImplementedError
+
+    def remover_por_sala(self, sala_id: int) -> list[Recorrência]:
+        """Remove todas as recorrências da sala e as retorna.
+
+        Implementação padrão: `listar_por_sala` e um `remover` por regra.
+        """
+        regras = self.listar_por_sala(sala_id)
+        return [r for r in regras if self.remover(r.id)]
+
+    def listar_ativas_no_intervalo(
+        self, inicio: datetime, fim: datetime, sala_id: int | None = None
+    ) -> list[Recorrência]:
+        """Lista as recorrências cujo período de vigência (da primeira
+        ocorrência ao fim da última possível) cruza [inicio, fim), por id.
+
+        Só as regras retornadas podem ter ocorrências na janela.
+        Implementação padrão: filtra `listar()` (ou `listar_por_sala`).
+        """
+        candidatas = self.listar() if sala_id is None else self.listar_por_sala(sala_id)
+        return sorted(
+            (r for r in candidatas if r.inicio < fim and r.fim_da_vigência > inicio),
+            key=lambda r: r.id,
+        )
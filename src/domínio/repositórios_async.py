@@ -0,0 +1,238 @@
+"""Interfaces assíncronas de persistência (espelho de `repositórios`).
+
+Para backends com I/O (banco remoto, rede) usados a partir de um loop
+`asyncio`: cada operação é uma corrotina, então o loop segue atendendo
+outras requisições enquanto espera. Os contratos (ordem, cursores, retorno
+None/False) são os mesmos das interfaces síncronas; `infra.repos_async`
+adapta os repositórios síncronos existentes.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, nullcontext
+from datetime import datetime
+from itertools import islice
+
+from .modelos import Sala, Evento, Recorrência
+from .regras import encontrar_conflito as _encontrar_conflito, validar_intervalo
+from .repositórios import CursorEvento, _chave_evento
+
+
+class AsyncSalaRepository(ABC):
+    """Interface assíncrona para persistência de salas."""
+
+    @abstractmethod
+    async def proximo_id(self) -> int:
+        """Retorna o próximo id disponível para uma nova sala."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def adicionar(self, sala: Sala) -> Sala:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def obter_por_id(self, sala_id: int) -> Sala | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def listar(self) -> list[Sala]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remover(self, sala_id: int) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def atualizar(self, sala: Sala) -> Sala:
+        raise NotImplementedError
+
+    async def criar(self, nome: str, capacidade: int) -> Sala:
+        """Cria e persiste uma sala nova com o próximo id livre.
+
+        Implementação padrão: `proximo_id` seguido de `adicionar`.
+        """
+        return await self.adicionar(Sala(await self.proximo_id(), nome, capacidade))
+
+    async def listar_pagina(self, limite: int, após: int | None = None) -> list[Sala]:
+        """Até `limite` salas com id > `após`, por id (ver `SalaRepository`).
+
+        Implementação padrão: ordena `listar()` a cada chamada.
+        """
+        ordenadas = sorted(await self.listar(), key=lambda s: s.id)
+        return list(
+            islice(
+                (s for s in ordenadas if após is None or s.id > após), max(limite, 0)
+            )
+        )
+
+    async def iterar_ordenado(self, tamanho_lote: int = 1000) -> AsyncIterator[Sala]:
+        """Itera as salas por id (`async for`), buscando em páginas."""
+        após: int | None = None
+        while página := await self.listar_pagina(tamanho_lote, após):
+            for s in página:
+                yield s
+            após = página[-1].id
+
+    async def listar_por_capacidade_mínima(self, capacidade_min: int) -> list[Sala]:
+        """Salas com capacidade >= `capacidade_min`, da menor para a maior."""
+        return sorted(
+            (s for s in await self.listar() if s.capacidade >= capacidade_min),
+            key=lambda s: (s.capacidade, s.id),
+        )
+
+
+class AsyncEventoRepository(ABC):
+    """Interface assíncrona para persistência de eventos."""
+
+    @abstractmethod
+    async def proximo_id(self) -> int:
+        """Retorna o próximo id disponível para um novo evento."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def adicionar(self, evento: Evento) -> Evento:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def atualizar(self, evento: Evento) -> Evento:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remover(self, evento_id: int) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def obter_por_id(self, evento_id: int) -> Evento | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def listar(self) -> list[Evento]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def listar_por_sala(self, sala_id: int) -> list[Evento]:
+        raise NotImplementedError
+
+    def travar_salas(self, *sala_ids: int) -> AbstractAsyncContextManager[None]:
+        """Contexto (`async with`) de exclusividade de escrita nas salas.
+
+        Mesmo papel de `EventoRepository.travar_salas`. Implementação padrão:
+        não trava nada.
+        """
+        return nullcontext()
+
+    async def criar(
+        self, sala_id: int, titulo: str, inicio: datetime, fim: datetime
+    ) -> Evento:
+        """Cria e persiste um evento novo com o próximo id livre.
+
+        Implementação padrão: `proximo_id` seguido de `adicionar`.
+        """
+        prox = await self.proximo_id()
+        return await self.adicionar(Evento(prox, sala_id, titulo, inicio, fim))
+
+    async def listar_pagina(
+        self, limite: int, após: CursorEvento | None = None
+    ) -> list[Evento]:
+        """Até `limite` eventos na ordem (inicio, sala_id, id), depois do cursor
+        `após` (exclusivo). Implementação padrão: ordena `listar()`.
+        """
+        ordenados = sorted(await self.listar(), key=_chave_evento)
+        return list(
+            islice(
+                (e for e in ordenados if após is None or _chave_evento(e) > após),
+                max(limite, 0),
+            )
+        )
+
+    async def iterar_ordenado(self, tamanho_lote: int = 1000) -> AsyncIterator[Evento]:
+        """Itera os eventos na ordem (inicio, sala_id, id), buscando em páginas."""
+        após: CursorEvento | None = None
+        while página := await self.listar_pagina(tamanho_lote, após):
+            for e in página:
+                yield e
+            após = _chave_evento(página[-1])
+
+    async def listar_no_intervalo(
+        self, inicio: datetime, fim: datetime, sala_id: int | None = None
+    ) -> list[Evento]:
+        """Eventos que se sobrepõem a [inicio, fim), na ordem (inicio, sala_id, id).
+
+        Implementação padrão: filtra `listar()` (ou `listar_por_sala`).
+        """
+        if not validar_intervalo(inicio, fim):
+            return []
+        if sala_id is None:
+            candidatos = await self.listar()
+        else:
+            candidatos = await self.listar_por_sala(sala_id)
+        return sorted(
+            (e for e in candidatos if e.inicio < fim and e.fim > inicio),
+            key=_chave_evento,
+        )
+
+    async def encontrar_conflito(
+        self,
+        sala_id: int,
+        inicio: datetime,
+        fim: datetime,
+        ignorar_evento_id: int | None = None,
+    ) -> Evento | None:
+        """Um evento da sala que se sobrepõe a [inicio, fim), se houver.
+
+        Implementação padrão: percorre `listar_por_sala`.
+        """
+        return _encontrar_conflito(
+            await self.listar_por_sala(sala_id), sala_id, inicio, fim, ignorar_evento_id
+        )
+
+    async def existe_sobreposição(
+        self,
+        sala_id: int,
+        inicio: datetime,
+        fim: datetime,
+        ignorar_evento_id: int | None = None,
+    ) -> bool:
+        """Retorna True se algum evento da sala se sobrepõe a [inicio, fim)."""
+        conflito = await self.encontrar_conflito(
+            sala_id, inicio, fim, ignorar_evento_id
+        )
+        return conflito is not None
+
+
+class AsyncRecorrênciaRepository(ABC):
+    """Interface assíncrona para recorrências: o necessário para consultar e
+    gravar regras e para as checagens de conflito dos serviços assíncronos."""
+
+    @abstractmethod
+    async def proximo_id(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def adicionar(self, recorrência: Recorrência) -> Recorrência:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remover(self, recorrência_id: int) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def obter_por_id(self, recorrência_id: int) -> Recorrência | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def listar_por_sala(self, sala_id: int) -> list[Recorrência]:
+        raise NotImplementedError
+
+    async def listar_ativas_no_intervalo(
+        self, inicio: datetime, fim: datetime, sala_id: int
+    ) -> list[Recorrência]:
+        """Recorrências da sala cuja vigência cruza [inicio, fim), por id."""
+        return sorted(
+            (
+                r
+                for r in await self.listar_por_sala(sala_id)
+                if r.inicio < fim and r.fim_da_vigência > inicio
+            ),
+            key=lambda r: r.id,
+        )
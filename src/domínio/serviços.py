@@ -1,9 +1,23 @@
+from contextlib import nullcontext
 from dataclasses import replace
 from datetime import datetime
+from enum import Enum, auto
+from heapq import merge
+from itertools import groupby
+from typing import Iterable, Iterator, NamedTuple
 
-from .modelos import Sala, Evento
-from .regras import validar_intervalo, encontrar_conflito
-from .repositórios import SalaRepository, EventoRepository
+from .modelos import Sala, Evento, Frequência, Ocorrência, Recorrência
+from .regras import (
+    validar_intervalo,
+    conflito_com_recorrência,
+    conflito_entre_recorrências,
+)
+from .repositórios import (
+    SalaRepository,
+    EventoRepository,
+    RecorrênciaRepository,
+    CursorEvento,
+)
 
 
 # ----------------------------
@@ -22,69 +36,189 @@ def cadastrar_sala(repo: SalaRepository, nome: str, capacidade: int) -> Sala | N
     if not isinstance(capacidade, int) or capacidade <= 0:
         return None
 
-    nova = Sala(id=repo.proximo_id(), nome=nome, capacidade=capacidade)
-    return repo.adicionar(nova)
+    return repo.criar(nome, capacidade)
 
 
 def listar_salas(repo: SalaRepository) -> list[Sala]:
     """Retorna a lista de salas cadastradas (ordenada por id)."""
-    return sorted(repo.listar(), key=lambda s: s.id)
+    return list(repo.iterar_ordenado())
+
+
+def listar_salas_paginado(
+    repo: SalaRepository, limite: int, após: int | None = None
+) -> list[Sala]:
+    """Retorna até `limite` salas com id maior que `após`, ordenadas por id."""
+    return repo.listar_pagina(limite, após)
+
+
+def iterar_salas(repo: SalaRepository) -> Iterator[Sala]:
+    """Itera as salas ordenadas por id, sem montar a lista completa."""
+    return repo.iterar_ordenado()
 
 
 def remover_sala(repo: SalaRepository, sala_id: int) -> bool:
-    """Remove uma sala por id. Retorna True se removeu."""
+    """Remove uma sala por id. Retorna True se removeu.
+
+    Não olha as reservas da sala; ver `remover_sala_detalhado`.
+    """
     return repo.remover(sala_id)
 
 
+def buscar_salas_disponíveis(
+    eventos: EventoRepository,
+    salas: SalaRepository,
+    capacidade_min: int,
+    inicio: datetime,
+    fim: datetime,
+    recorrências: RecorrênciaRepository | None = None,
+) -> list[Sala]:
+    """Lista as salas com capacidade >= `capacidade_min` livres em [inicio, fim).
+
+    O resultado vem ordenado pelo melhor encaixe: menor capacidade suficiente
+    primeiro (empate por id). Salas pequenas demais são descartadas pelo
+    índice de capacidade sem consultar seus eventos; as demais usam a
+    checagem de sobreposição do repositório de eventos e, se informado, as
+    recorrências vigentes da sala.
+    """
+    if not validar_intervalo(inicio, fim):
+        return []
+    return [
+        s
+        for s in salas.listar_por_capacidade_mínima(capacidade_min)
+        if not eventos.existe_sobreposição(s.id, inicio, fim)
+        and _conflito_com_recorrências(recorrências, s.id, inicio, fim) is None
+    ]
+
+
 # ------------------------------
 # Serviços para Eventos (sem I/O)
 # ------------------------------
 
 
-def agendar_evento(
+class MotivoRecusa(Enum):
+    """Por que uma operação de agendamento ou de remoção foi recusada."""
+
+    EVENTO_INEXISTENTE = auto()
+    SALA_INEXISTENTE = auto()
+    TITULO_INVALIDO = auto()
+    INTERVALO_INVALIDO = auto()
+    CONFLITO = auto()
+    RECORRENCIA_INVALIDA = auto()
+    SALA_COM_RESERVAS = auto()
+
+
+class ResultadoEvento(NamedTuple):
+    """Resultado de `agendar_evento_detalhado`/`atualizar_evento_detalhado`.
+
+    Em caso de sucesso `evento` é o evento persistido e `motivo` é None; na
+    recusa `evento` é None, `motivo` diz a regra violada e, se a recusa foi
+    por conflito, `conflito` traz o evento (ou a ocorrência de uma
+    recorrência) que ocupa o horário.
+    """
+
+    evento: Evento | None
+    motivo: MotivoRecusa | None = None
+    conflito: Evento | Ocorrência | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.evento is not None
+
+
+def _recusa(
+    motivo: MotivoRecusa, conflito: Evento | Ocorrência | None = None
+) -> ResultadoEvento:
+    return ResultadoEvento(None, motivo, conflito)
+
+
+def _conflito_com_recorrências(
+    recorrências: RecorrênciaRepository | None,
+    sala_id: int,
+    inicio: datetime,
+    fim: datetime,
+) -> Ocorrência | None:
+    # só as regras vigentes na janela; cada uma é testada sem expandir
+    if recorrências is None:
+        return None
+    for r in recorrências.listar_ativas_no_intervalo(inicio, fim, sala_id):
+        ocorrência = conflito_com_recorrência(r, sala_id, inicio, fim)
+        if ocorrência is not None:
+            return ocorrência
+    return None
+
+
+def agendar_evento_detalhado(
     eventos: EventoRepository,
     salas: SalaRepository,
     sala_id: int,
     titulo: str,
     inicio: datetime,
     fim: datetime,
-) -> Evento | None:
+    recorrências: RecorrênciaRepository | None = None,
+) -> ResultadoEvento:
     """Agenda um novo evento se as regras permitirem.
 
-    Regras:
+    Regras (verificadas nesta ordem):
     - sala deve existir
     - título não vazio
     - fim > início
-    - não pode haver conflito de horário na mesma sala
+    - não pode haver conflito de horário na mesma sala, nem com eventos nem
+      (se `recorrências` for informado) com ocorrências de recorrências
+
+    A checagem de conflito e a gravação acontecem sob a trava da sala
+    (`eventos.travar_salas`): pedidos concorrentes para o mesmo horário
+    resultam em um único evento.
     """
     if salas.obter_por_id(sala_id) is None:
-        return None
+        return _recusa(MotivoRecusa.SALA_INEXISTENTE)
     titulo = (titulo or "").strip()
     if not titulo:
-        return None
+        return _recusa(MotivoRecusa.TITULO_INVALIDO)
     if not validar_intervalo(inicio, fim):
-        return None
+        return _recusa(MotivoRecusa.INTERVALO_INVALIDO)
 
-    existentes = eventos.listar_por_sala(sala_id)
-    if encontrar_conflito(existentes, sala_id, inicio, fim) is not None:
-        return None
+    with eventos.travar_salas(sala_id):
+        # relê sob a trava: a sala pode ter sido removida (`remover_sala_detalhado`)
+        if salas.obter_por_id(sala_id) is None:
+            return _recusa(MotivoRecusa.SALA_INEXISTENTE)
+        # Consulta delegada ao repositório (pode usar índice por sala)
+        conflito = eventos.encontrar_conflito(
+            sala_id, inicio, fim
+        ) or _conflito_com_recorrências(recorrências, sala_id, inicio, fim)
+        if conflito is not None:
+            return _recusa(MotivoRecusa.CONFLITO, conflito)
+        return ResultadoEvento(eventos.criar(sala_id, titulo, inicio, fim))
 
-    novo = Evento(
-        id=eventos.proximo_id(),
-        sala_id=sala_id,
-        titulo=titulo,
-        inicio=inicio,
-        fim=fim,
-    )
-    return eventos.adicionar(novo)
+
+def agendar_evento(
+    eventos: EventoRepository,
+    salas: SalaRepository,
+    sala_id: int,
+    titulo: str,
+    inicio: datetime,
+    fim: datetime,
+    recorrências: RecorrênciaRepository | None = None,
+) -> Evento | None:
+    """Agenda um novo evento; retorna None se alguma regra for violada.
+
+    Ver `agendar_evento_detalhado` para as regras e o motivo da recusa.
+    """
+    return agendar_evento_detalhado(
+        eventos, salas, sala_id, titulo, inicio, fim, recorrências
+    ).evento
 
 
 def cancelar_evento(eventos: EventoRepository, evento_id: int) -> bool:
     """Cancela (remove) um evento por id."""
-    return eventos.remover(evento_id)
+    atual = eventos.obter_por_id(evento_id)
+    if atual is None:
+        return False
+    # sob a trava da sala, para não cruzar com uma atualização do mesmo evento
+    with eventos.travar_salas(atual.sala_id):
+        return eventos.remover(evento_id)
 
 
-def atualizar_evento(
+def atualizar_evento_detalhado(
     eventos: EventoRepository,
     salas: SalaRepository,
     evento_id: int,
@@ -93,35 +227,60 @@ def atualizar_evento(
     sala_id: int | None = None,
     inicio: datetime | None = None,
     fim: datetime | None = None,
-) -> Evento | None:
+    recorrências: RecorrênciaRepository | None = None,
+) -> ResultadoEvento:
     """Atualiza campos de um evento existente.
 
-    Campos não informados são mantidos. Retorna o evento atualizado ou None
-    se o evento não existir ou se alguma regra for violada.
+    Campos não informados são mantidos. As regras são as de
+    `agendar_evento_detalhado`, aplicadas aos valores finais; o conflito
+    ignora o próprio evento. Trava a sala atual e a de destino.
     """
-    atual = eventos.obter_por_id(evento_id)
-    if atual is None:
-        return None
+    while True:
+        atual = eventos.obter_por_id(evento_id)
+        if atual is None:
+            return _recusa(MotivoRecusa.EVENTO_INEXISTENTE)
+        novo_sala_id = sala_id if sala_id is not None else atual.sala_id
+        with eventos.travar_salas(atual.sala_id, novo_sala_id):
+            # relê sob a trava: outra thread pode ter mudado ou removido o evento
+            relido = eventos.obter_por_id(evento_id)
+            if relido is None:
+                return _recusa(MotivoRecusa.EVENTO_INEXISTENTE)
+            if relido.sala_id != atual.sala_id:
+                continue  # mudou de sala entre a leitura e a trava
+            return _atualizar_evento(
+                eventos, salas, relido, titulo, novo_sala_id, inicio, fim, recorrências
+            )
+
+
+def _atualizar_evento(
+    eventos: EventoRepository,
+    salas: SalaRepository,
+    atual: Evento,
+    titulo: str | None,
+    novo_sala_id: int,
+    inicio: datetime | None,
+    fim: datetime | None,
+    recorrências: RecorrênciaRepository | None,
+) -> ResultadoEvento:
+    # chamada com as travas das salas (origem e destino) já seguras
+    if salas.obter_por_id(novo_sala_id) is None:
+        return _recusa(MotivoRecusa.SALA_INEXISTENTE)
 
     novo_titulo = titulo if titulo is not None else atual.titulo
     novo_titulo = (novo_titulo or "").strip()
     if not novo_titulo:
-        return None
-
-    novo_sala_id = sala_id if sala_id is not None else atual.sala_id
-    if salas.obter_por_id(novo_sala_id) is None:
-        return None
+        return _recusa(MotivoRecusa.TITULO_INVALIDO)
 
     novo_inicio = inicio if inicio is not None else atual.inicio
     novo_fim = fim if fim is not None else atual.fim
     if not validar_intervalo(novo_inicio, novo_fim):
-        return None
+        return _recusa(MotivoRecusa.INTERVALO_INVALIDO)
 
-    existentes = eventos.listar_por_sala(novo_sala_id)
-    if encontrar_conflito(
-        existentes, novo_sala_id, novo_inicio, novo_fim, ignorar_evento_id=atual.id
-    ):
-        return None
+    conflito = eventos.encontrar_conflito(
+        novo_sala_id, novo_inicio, novo_fim, ignorar_evento_id=atual.id
+    ) or _conflito_com_recorrências(recorrências, novo_sala_id, novo_inicio, novo_fim)
+    if conflito is not None:
+        return _recusa(MotivoRecusa.CONFLITO, conflito)
 
     atualizado = replace(
         atual,
@@ -130,9 +289,446 @@ def atualizar_evento(
         inicio=novo_inicio,
         fim=novo_fim,
     )
-    return eventos.atualizar(atualizado)
+    return ResultadoEvento(eventos.atualizar(atualizado))
+
+
+def atualizar_evento(
+    eventos: EventoRepository,
+    salas: SalaRepository,
+    evento_id: int,
+    *,
+    titulo: str | None = None,
+    sala_id: int | None = None,
+    inicio: datetime | None = None,
+    fim: datetime | None = None,
+    recorrências: RecorrênciaRepository | None = None,
+) -> Evento | None:
+    """Atualiza campos de um evento existente.
+
+    Campos não informados são mantidos. Retorna o evento atualizado ou None
+    se o evento não existir ou se alguma regra for violada.
+    """
+    return atualizar_evento_detalhado(
+        eventos,
+        salas,
+        evento_id,
+        titulo=titulo,
+        sala_id=sala_id,
+        inicio=inicio,
+        fim=fim,
+        recorrências=recorrências,
+    ).evento
+
+
+class PedidoEvento(NamedTuple):
+    """Dados de um evento a agendar em lote (ainda sem id)."""
+
+    sala_id: int
+    titulo: str
+    inicio: datetime
+    fim: datetime
+
+
+def agendar_eventos_em_lote(
+    eventos: EventoRepository,
+    salas: SalaRepository,
+    pedidos: Iterable[PedidoEvento],
+    recorrências: RecorrênciaRepository | None = None,
+) -> list[Evento | None]:
+    """Agenda vários eventos de uma vez, com as mesmas regras de `agendar_evento`.
+
+    Retorna uma lista alinhada com `pedidos`: o `Evento` criado ou None se o
+    pedido violar alguma regra. Pedidos são agrupados por sala e ordenados por
+    início; uma única varredura por sala detecta conflitos tanto com os
+    eventos já existentes quanto entre os próprios pedidos (em caso de
+    conflito dentro do lote, vence o pedido que começa antes e, no empate, o
+    que aparece primeiro). Custo: O(p log p + n) para p pedidos e n eventos
+    existentes que tocam a janela (primeiro início, último fim) dos pedidos
+    de cada sala, em vez de uma consulta por pedido. As salas do lote ficam
+    travadas da varredura até a gravação.
+    """
+    pedidos = list(pedidos)
+    resultado: list[Evento | None] = [None] * len(pedidos)
+
+    # Validações que não dependem de outros eventos
+    válidos: list[tuple[int, PedidoEvento]] = []
+    for i, (sala_id, titulo, inicio, fim) in enumerate(pedidos):
+        titulo = (titulo or "").strip()
+        if titulo and validar_intervalo(inicio, fim):
+            válidos.append((i, PedidoEvento(sala_id, titulo, inicio, fim)))
+
+    # Agrupa por sala e, dentro da sala, ordena por início (sort estável)
+    válidos.sort(key=lambda item: (item[1].sala_id, item[1].inicio))
+    with eventos.travar_salas(*(p.sala_id for _, p in válidos)):
+        for i, ev in _agendar_lote_travado(eventos, salas, válidos, recorrências):
+            resultado[i] = ev
+    return resultado
+
+
+def _agendar_lote_travado(
+    eventos: EventoRepository,
+    salas: SalaRepository,
+    válidos: list[tuple[int, PedidoEvento]],
+    recorrências: RecorrênciaRepository | None,
+) -> Iterator[tuple[int, Evento]]:
+    # chamada com as travas de todas as salas do lote já seguras
+    aceitos: list[tuple[int, PedidoEvento]] = []
+    for sala_id, grupo in groupby(válidos, key=lambda item: item[1].sala_id):
+        if salas.obter_por_id(sala_id) is None:
+            continue
+        grupo = list(grupo)
+        # só os existentes que tocam a janela dos pedidos podem conflitar:
+        # importações em blocos não releem a sala inteira a cada bloco
+        janela_fim = max(p.fim for _, p in grupo)
+        existentes = sorted(
+            eventos.listar_no_intervalo(grupo[0][1].inicio, janela_fim, sala_id),
+            key=lambda e: e.inicio,
+        )
+        j = 0
+        # maior fim entre os existentes/aceitos que começam até o pedido atual
+        fim_max: datetime | None = None
+        for i, p in grupo:
+            while j < len(existentes) and existentes[j].inicio <= p.inicio:
+                if fim_max is None or existentes[j].fim > fim_max:
+                    fim_max = existentes[j].fim
+                j += 1
+            if fim_max is not None and fim_max > p.inicio:
+                continue  # sobrepõe quem começou antes
+            if j < len(existentes) and existentes[j].inicio < p.fim:
+                continue  # sobrepõe o próximo existente
+            if _conflito_com_recorrências(recorrências, sala_id, p.inicio, p.fim):
+                continue  # sobrepõe uma ocorrência de recorrência
+            aceitos.append((i, p))
+            if fim_max is None or p.fim > fim_max:
+                fim_max = p.fim
+
+    # Ids sequenciais na ordem original dos pedidos
+    aceitos.sort()
+    criados = eventos.criar_em_lote(p for _, p in aceitos)
+    return zip((i for i, _ in aceitos), criados)
 
 
 def listar_eventos(eventos: EventoRepository) -> list[Evento]:
     """Lista eventos ordenando por (inicio, sala_id, id)."""
-    return sorted(eventos.listar(), key=lambda e: (e.inicio, e.sala_id, e.id))
+    return list(eventos.iterar_ordenado())
+
+
+def listar_eventos_no_intervalo(
+    eventos: EventoRepository,
+    inicio: datetime,
+    fim: datetime,
+    sala_id: int | None = None,
+) -> list[Evento]:
+    """Lista os eventos que se sobrepõem a [inicio, fim) (ex.: um dia ou uma
+    semana), de todas as salas ou só de `sala_id`, na ordem (inicio, sala_id, id).
+
+    Eventos que começam antes de `inicio` mas ainda estão em andamento entram
+    no resultado. Intervalo inválido retorna lista vazia.
+    """
+    return eventos.listar_no_intervalo(inicio, fim, sala_id)
+
+
+def listar_eventos_paginado(
+    eventos: EventoRepository, limite: int, após: CursorEvento | None = None
+) -> list[Evento]:
+    """Retorna até `limite` eventos na ordem (inicio, sala_id, id).
+
+    `após` é o cursor (inicio, sala_id, id) do último evento da página
+    anterior; None começa do início.
+    """
+    return eventos.listar_pagina(limite, após)
+
+
+def iterar_eventos(eventos: EventoRepository) -> Iterator[Evento]:
+    """Itera os eventos na ordem (inicio, sala_id, id), sem montar a lista."""
+    return eventos.iterar_ordenado()
+
+
+# ---------------------------------
+# Serviços para Recorrências (sem I/O)
+# ---------------------------------
+
+
+class ResultadoRecorrência(NamedTuple):
+    """Resultado de `agendar_recorrência`, no mesmo formato de `ResultadoEvento`."""
+
+    recorrência: Recorrência | None
+    motivo: MotivoRecusa | None = None
+    conflito: Evento | Ocorrência | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.recorrência is not None
+
+
+def agendar_recorrência(
+    recorrências: RecorrênciaRepository,
+    eventos: EventoRepository,
+    salas: SalaRepository,
+    sala_id: int,
+    titulo: str,
+    inicio: datetime,
+    fim: datetime,
+    frequência: Frequência,
+    até: datetime,
+    intervalo: int = 1,
+    exceções: Iterable[datetime] = (),
+) -> ResultadoRecorrência:
+    """Agenda uma regra de repetição (ex.: aula semanal no semestre).
+
+    Mesmas regras de `agendar_evento_detalhado`, aplicadas a todas as
+    ocorrências, mais as da própria `Recorrência` (intervalo > 0, até >=
+    início, duração <= período). Conflitos com outras regras da sala são
+    testados regra a regra (`conflito_entre_recorrências`), sem expandir
+    ocorrências; com eventos avulsos, só os que caem na vigência da regra.
+    """
+    if salas.obter_por_id(sala_id) is None:
+        return ResultadoRecorrência(None, MotivoRecusa.SALA_INEXISTENTE)
+    titulo = (titulo or "").strip()
+    if not titulo:
+        return ResultadoRecorrência(None, MotivoRecusa.TITULO_INVALIDO)
+    if not validar_intervalo(inicio, fim):
+        return ResultadoRecorrência(None, MotivoRecusa.INTERVALO_INVALIDO)
+    try:
+        # id provisório: o definitivo é reservado na gravação (`criar`)
+        nova = Recorrência(
+            id=recorrências.proximo_id(),
+            sala_id=sala_id,
+            titulo=titulo,
+            inicio=inicio,
+            fim=fim,
+            frequência=frequência,
+            até=até,
+            intervalo=intervalo,
+            exceções=frozenset(exceções),
+        )
+    except ValueError:
+        return ResultadoRecorrência(None, MotivoRecusa.RECORRENCIA_INVALIDA)
+
+    vigência = (nova.inicio, nova.fim_da_vigência)
+    # mesma trava por sala dos eventos avulsos: os dois tipos disputam horários
+    with eventos.travar_salas(sala_id):
+        if salas.obter_por_id(sala_id) is None:
+            return ResultadoRecorrência(None, MotivoRecusa.SALA_INEXISTENTE)
+        for outra in recorrências.listar_ativas_no_intervalo(*vigência, sala_id):
+            par = conflito_entre_recorrências(nova, outra)
+            if par is not None:
+                return ResultadoRecorrência(None, MotivoRecusa.CONFLITO, par[1])
+        for e in eventos.listar_no_intervalo(*vigência, sala_id):
+            if conflito_com_recorrência(nova, sala_id, e.inicio, e.fim) is not None:
+                return ResultadoRecorrência(None, MotivoRecusa.CONFLITO, e)
+        return ResultadoRecorrência(recorrências.criar(nova))
+
+
+def cancelar_recorrência(
+    recorrências: RecorrênciaRepository, recorrência_id: int
+) -> bool:
+    """Cancela (remove) uma recorrência inteira por id."""
+    return recorrências.remover(recorrência_id)
+
+
+def cancelar_ocorrência(
+    recorrências: RecorrênciaRepository,
+    recorrência_id: int,
+    inicio: datetime,
+    eventos: EventoRepository | None = None,
+) -> Recorrência | None:
+    """Cancela uma única ocorrência, registrando `inicio` como exceção.
+
+    Retorna a recorrência atualizada, ou None se ela não existir ou se não
+    houver ocorrência (ainda não cancelada) começando em `inicio`. Com
+    `eventos`, a leitura e a gravação da regra acontecem sob a trava da sala
+    (`eventos.travar_salas`, a mesma do agendamento): dois cancelamentos
+    simultâneos da mesma regra não partem da mesma versão, e nenhum se perde.
+    """
+    r = recorrências.obter_por_id(recorrência_id)
+    if r is None:
+        return None
+    trava = eventos.travar_salas(r.sala_id) if eventos is not None else nullcontext()
+    with trava:
+        # relida sob a trava: outro cancelamento pode ter gravado antes
+        r = recorrências.obter_por_id(recorrência_id)
+        if r is None:
+            return None
+        # a janela [inicio, inicio + duração) pega no máximo a anterior e a
+        # procurada
+        ocorrências = r.ocorrências(inicio, inicio + r.duração)
+        if all(o.inicio != inicio for o in ocorrências):
+            return None
+        return recorrências.atualizar(replace(r, exceções=r.exceções | {inicio}))
+
+
+def listar_ocorrências(
+    recorrências: RecorrênciaRepository,
+    inicio: datetime,
+    fim: datetime,
+    sala_id: int | None = None,
+) -> list[Ocorrência]:
+    """Lista as ocorrências que se sobrepõem a [inicio, fim), na ordem
+    (inicio, sala_id, recorrencia_id).
+
+    Só as regras vigentes na janela são consultadas, e cada uma gera apenas
+    as ocorrências dentro dela.
+    """
+    if not validar_intervalo(inicio, fim):
+        return []
+    regras = recorrências.listar_ativas_no_intervalo(inicio, fim, sala_id)
+    return list(
+        merge(
+            *(r.ocorrências(inicio, fim) for r in regras),
+            key=lambda o: (o.inicio, o.sala_id, o.recorrencia_id),
+        )
+    )
+
+
+# --------------------------------------
+# Remoção de salas com reservas (sem I/O)
+# --------------------------------------
+
+
+class ModoRemoçãoSala(Enum):
+    """O que fazer com as reservas de uma sala removida."""
+
+    RECUSAR = auto()  # não remove se a sala tiver eventos ou recorrências
+    CASCATA = auto()  # remove a sala, seus eventos e suas recorrências
+    ARQUIVAR = auto()  # move os eventos para o arquivo; remove as recorrências
+
+
+class ResultadoRemoçãoSala(NamedTuple):
+    """Resultado de `remover_sala_detalhado`.
+
+    Em caso de sucesso `removida` é a sala removida e `eventos` e
+    `recorrências` são as reservas removidas (ou arquivadas) com ela; na
+    recusa `removida` é None, `motivo` diz a regra violada e, se a recusa foi
+    por `SALA_COM_RESERVAS`, `eventos` e `recorrências` são as que impedem.
+    """
+
+    removida: Sala | None
+    motivo: MotivoRecusa | None = None
+    eventos: tuple[Evento, ...] = ()
+    recorrências: tuple[Recorrência, ...] = ()
+
+    @property
+    def ok(self) -> bool:
+        return self.removida is not None
+
+
+def remover_sala_detalhado(
+    salas: SalaRepository,
+    eventos: EventoRepository,
+    sala_id: int,
+    modo: ModoRemoçãoSala = ModoRemoçãoSala.RECUSAR,
+    recorrências: RecorrênciaRepository | None = None,
+    arquivo: EventoRepository | None = None,
+) -> ResultadoRemoçãoSala:
+    """Remove uma sala sem deixar eventos órfãos.
+
+    Os eventos (e recorrências, se `recorrências` for informado) da sala vêm
+    do índice por sala dos repositórios (`listar_por_sala`,
+    `remover_por_sala`): o custo é proporcional às reservas da sala, não ao
+    total. Em `ARQUIVAR` os eventos são gravados em `arquivo` com os mesmos
+    ids (ver `listar_arquivados` e `restaurar_arquivados`). Tudo acontece
+    sob a trava da sala: um agendamento concorrente ou fica de fora ou entra
+    antes e é tratado junto.
+    """
+    if modo is ModoRemoçãoSala.ARQUIVAR and arquivo is None:
+        raise ValueError("modo ARQUIVAR exige um repositório de arquivo")
+    with eventos.travar_salas(sala_id):
+        sala = salas.obter_por_id(sala_id)
+        if sala is None:
+            return ResultadoRemoçãoSala(None, MotivoRecusa.SALA_INEXISTENTE)
+        if modo is ModoRemoçãoSala.RECUSAR:
+            da_sala = tuple(eventos.listar_por_sala(sala_id))
+            regras = tuple(
+                recorrências.listar_por_sala(sala_id) if recorrências else ()
+            )
+            if da_sala or regras:
+                return ResultadoRemoçãoSala(
+                    None, MotivoRecusa.SALA_COM_RESERVAS, da_sala, regras
+                )
+            removidos: list[Evento] = []
+            removidas: list[Recorrência] = []
+        else:
+            if modo is ModoRemoçãoSala.ARQUIVAR:
+                # arquivo antes da remoção: uma interrupção no meio deixa no
+                # máximo cópias no arquivo, nunca eventos perdidos. Ids não
+                # são reutilizados: um id já arquivado é de uma tentativa
+                # anterior interrompida, e não é gravado de novo
+                novos = [
+                    e
+                    for e in eventos.listar_por_sala(sala_id)
+                    if arquivo.obter_por_id(e.id) is None
+                ]
+                if novos:
+                    arquivo.adicionar_em_lote(novos)
+            # reservas antes da sala: uma interrupção no meio nunca deixa órfãos
+            removidos = eventos.remover_por_sala(sala_id)
+            removidas = recorrências.remover_por_sala(sala_id) if recorrências else []
+        salas.remover(sala_id)
+        return ResultadoRemoçãoSala(sala, None, tuple(removidos), tuple(removidas))
+
+
+def listar_arquivados(
+    arquivo: EventoRepository, sala_id: int | None = None
+) -> list[Evento]:
+    """Eventos arquivados (de salas removidas com `ModoRemoçãoSala.ARQUIVAR`),
+    com os ids originais: os da sala `sala_id`, por (inicio, id), ou todos,
+    por (inicio, sala_id, id)."""
+    if sala_id is None:
+        return list(arquivo.iterar_ordenado())
+    return sorted(arquivo.listar_por_sala(sala_id), key=lambda e: (e.inicio, e.id))
+
+
+class ResultadoRestauração(NamedTuple):
+    """Resultado de `restaurar_arquivados`.
+
+    `restaurados` são os eventos criados na sala de destino (com ids novos) e
+    `recusados` os arquivados que conflitam com a agenda dela e continuam no
+    arquivo. Se a sala de destino não existe, `motivo` é `SALA_INEXISTENTE` e
+    nada é restaurado.
+    """
+
+    restaurados: tuple[Evento, ...] = ()
+    recusados: tuple[Evento, ...] = ()
+    motivo: MotivoRecusa | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.motivo is None
+
+
+def restaurar_arquivados(
+    arquivo: EventoRepository,
+    eventos: EventoRepository,
+    salas: SalaRepository,
+    sala_id_arquivada: int,
+    sala_destino: int,
+    recorrências: RecorrênciaRepository | None = None,
+) -> ResultadoRestauração:
+    """Reagenda na sala `sala_destino` os eventos arquivados da sala
+    removida `sala_id_arquivada` e os tira do arquivo.
+
+    O reagendamento segue as regras de `agendar_eventos_em_lote`; os eventos
+    recusados ficam no arquivo. Os restaurados são criados antes de saírem do
+    arquivo (uma interrupção no meio deixa no máximo cópias, nunca perde
+    eventos), e a trava da sala no arquivo impede duas restaurações
+    simultâneas da mesma sala.
+    """
+    if salas.obter_por_id(sala_destino) is None:
+        return ResultadoRestauração(motivo=MotivoRecusa.SALA_INEXISTENTE)
+    with arquivo.travar_salas(sala_id_arquivada):
+        arquivados = arquivo.listar_por_sala(sala_id_arquivada)
+        criados = agendar_eventos_em_lote(
+            eventos,
+            salas,
+            (PedidoEvento(sala_destino, e.titulo, e.inicio, e.fim) for e in arquivados),
+            recorrências,
+        )
+        restaurados, recusados = [], []
+        for arquivado, novo in zip(arquivados, criados):
+            if novo is None:
+                recusados.append(arquivado)
+            else:
+                arquivo.remover(arquivado.id)
+                restaurados.append(novo)
+    return ResultadoRestauração(tuple(restaurados), tuple(recusados))
@@ -0,0 +1,310 @@
+"""Versões assíncronas dos serviços de salas e eventos.
+
+Mesmas regras, mesma ordem de validação e mesmos resultados de
+`domínio.serviços`, sobre os repositórios de `repositórios_async`. As
+validações puras vêm de `regras`; o que muda é que cada acesso ao
+repositório é aguardado, liberando o loop para outras requisições.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import replace
+from datetime import datetime
+
+from .modelos import Sala, Evento, Ocorrência
+from .regras import validar_intervalo, conflito_com_recorrência
+from .repositórios_async import (
+    AsyncSalaRepository,
+    AsyncEventoRepository,
+    AsyncRecorrênciaRepository,
+)
+from .serviços import MotivoRecusa, ResultadoEvento, _recusa
+
+
+# ----------------------------
+# Salas
+# ----------------------------
+
+
+async def cadastrar_sala(
+    repo: AsyncSalaRepository, nome: str, capacidade: int
+) -> Sala | None:
+    """Cadastra uma sala após validações simples (ver `serviços.cadastrar_sala`)."""
+    nome = (nome or "").strip()
+    if not nome:
+        return None
+    if not isinstance(capacidade, int) or capacidade <= 0:
+        return None
+
+    return await repo.criar(nome, capacidade)
+
+
+async def listar_salas(repo: AsyncSalaRepository) -> list[Sala]:
+    """Retorna a lista de salas cadastradas (ordenada por id)."""
+    return [s async for s in repo.iterar_ordenado()]
+
+
+def iterar_salas(repo: AsyncSalaRepository) -> AsyncIterator[Sala]:
+    """Itera (`async for`) as salas ordenadas por id."""
+    return repo.iterar_ordenado()
+
+
+async def remover_sala(repo: AsyncSalaRepository, sala_id: int) -> bool:
+    """Remove uma sala por id. Retorna True se removeu."""
+    return await repo.remover(sala_id)
+
+
+async def buscar_salas_disponíveis(
+    eventos: AsyncEventoRepository,
+    salas: AsyncSalaRepository,
+    capacidade_min: int,
+    inicio: datetime,
+    fim: datetime,
+    recorrências: AsyncRecorrênciaRepository | None = None,
+) -> list[Sala]:
+    """Lista as salas com capacidade >= `capacidade_min` livres em [inicio, fim),
+    pelo melhor encaixe (ver `serviços.buscar_salas_disponíveis`).
+
+    As salas candidatas são consultadas concorrentemente.
+    """
+    if not validar_intervalo(inicio, fim):
+        return []
+    candidatas = await salas.listar_por_capacidade_mínima(capacidade_min)
+    livres = await asyncio.gather(
+        *(_sala_livre(eventos, recorrências, s.id, inicio, fim) for s in candidatas)
+    )
+    return [s for s, livre in zip(candidatas, livres) if livre]
+
+
+async def _sala_livre(
+    eventos: AsyncEventoRepository,
+    recorrências: AsyncRecorrênciaRepository | None,
+    sala_id: int,
+    inicio: datetime,
+    fim: datetime,
+) -> bool:
+    if await eventos.existe_sobreposição(sala_id, inicio, fim):
+        return False
+    return await _conflito_com_recorrências(recorrências, sala_id, inicio, fim) is None
+
+
+async def _conflito_com_recorrências(
+    recorrências: AsyncRecorrênciaRepository | None,
+    sala_id: int,
+    inicio: datetime,
+    fim: datetime,
+) -> Ocorrência | None:
+    if recorrências is None:
+        return None
+    for r in await recorrências.listar_ativas_no_intervalo(inicio, fim, sala_id):
+        ocorrência = conflito_com_recorrência(r, sala_id, inicio, fim)
+        if ocorrência is not None:
+            return ocorrência
+    return None
+
+
+# ----------------------------
+# Eventos
+# ----------------------------
+
+
+async def _conflito(
+    eventos: AsyncEventoRepository,
+    recorrências: AsyncRecorrênciaRepository | None,
+    sala_id: int,
+    inicio: datetime,
+    fim: datetime,
+    ignorar_evento_id: int | None = None,
+) -> Evento | Ocorrência | None:
+    conflito = await eventos.encontrar_conflito(sala_id, inicio, fim, ignorar_evento_id)
+    if conflito is not None:
+        return conflito
+    return await _conflito_com_recorrências(recorrências, sala_id, inicio, fim)
+
+
+async def agendar_evento_detalhado(
+    eventos: AsyncEventoRepository,
+    salas: AsyncSalaRepository,
+    sala_id: int,
+    titulo: str,
+    inicio: datetime,
+    fim: datetime,
+    recorrências: AsyncRecorrênciaRepository | None = None,
+) -> ResultadoEvento:
+    """Agenda um novo evento se as regras permitirem.
+
+    Regras e resultado de `serviços.agendar_evento_detalhado`; a checagem de
+    conflito e a gravação acontecem sob `eventos.travar_salas(sala_id)`.
+    """
+    if await salas.obter_por_id(sala_id) is None:
+        return _recusa(MotivoRecusa.SALA_INEXISTENTE)
+    titulo = (titulo or "").strip()
+    if not titulo:
+        return _recusa(MotivoRecusa.TITULO_INVALIDO)
+    if not validar_intervalo(inicio, fim):
+        return _recusa(MotivoRecusa.INTERVALO_INVALIDO)
+
+    async with eventos.travar_salas(sala_id):
+        conflito = await _conflito(eventos, recorrências, sala_id, inicio, fim)
+        if conflito is not None:
+            return _recusa(MotivoRecusa.CONFLITO, conflito)
+        return ResultadoEvento(await eventos.criar(sala_id, titulo, inicio, fim))
+
+
+async def agendar_evento(
+    eventos: AsyncEventoRepository,
+    salas: AsyncSalaRepository,
+    sala_id: int,
+    titulo: str,
+    inicio: datetime,
+    fim: datetime,
+    recorrências: AsyncRecorrênciaRepository | None = None,
+) -> Evento | None:
+    """Agenda um novo evento; retorna None se alguma regra for violada."""
+    resultado = await agendar_evento_detalhado(
+        eventos, salas, sala_id, titulo, inicio, fim, recorrências
+    )
+    return resultado.evento
+
+
+async def cancelar_evento(eventos: AsyncEventoRepository, evento_id: int) -> bool:
+    """Cancela (remove) um evento por id."""
+    atual = await eventos.obter_por_id(evento_id)
+    if atual is None:
+        return False
+    async with eventos.travar_salas(atual.sala_id):
+        return await eventos.remover(evento_id)
+
+
+async def atualizar_evento_detalhado(
+    eventos: AsyncEventoRepository,
+    salas: AsyncSalaRepository,
+    evento_id: int,
+    *,
+    titulo: str | None = None,
+    sala_id: int | None = None,
+    inicio: datetime | None = None,
+    fim: datetime | None = None,
+    recorrências: AsyncRecorrênciaRepository | None = None,
+) -> ResultadoEvento:
+    """Atualiza campos de um evento existente.
+
+    Regras e resultado de `serviços.atualizar_evento_detalhado`; trava a sala
+    atual e a de destino.
+    """
+    while True:
+        atual = await eventos.obter_por_id(evento_id)
+        if atual is None:
+            return _recusa(MotivoRecusa.EVENTO_INEXISTENTE)
+        novo_sala_id = sala_id if sala_id is not None else atual.sala_id
+        async with eventos.travar_salas(atual.sala_id, novo_sala_id):
+            relido = await eventos.obter_por_id(evento_id)
+            if relido is None:
+                return _recusa(MotivoRecusa.EVENTO_INEXISTENTE)
+            if relido.sala_id != atual.sala_id:
+                continue  # mudou de sala entre a leitura e a trava
+            return await _atualizar_evento(
+                eventos, salas, relido, titulo, novo_sala_id, inicio, fim, recorrências
+            )
+
+
+async def _atualizar_evento(
+    eventos: AsyncEventoRepository,
+    salas: AsyncSalaRepository,
+    atual: Evento,
+    titulo: str | None,
+    novo_sala_id: int,
+    inicio: datetime | None,
+    fim: datetime | None,
+    recorrências: AsyncRecorrênciaRepository | None,
+) -> ResultadoEvento:
+    # chamada com as travas das salas (origem e destino) já seguras
+    if await salas.obter_por_id(novo_sala_id) is None:
+        return _recusa(MotivoRecusa.SALA_INEXISTENTE)
+
+    novo_titulo = titulo if titulo is not None else atual.titulo
+    novo_titulo = (novo_titulo or "").strip()
+    if not novo_titulo:
+        return _recusa(MotivoRecusa.TITULO_INVALIDO)
+
+    novo_inicio = inicio if inicio is not None else atual.inicio
+    novo_fim = fim if fim is not None else atual.fim
+    if not validar_intervalo(novo_inicio, novo_fim):
+        return _recusa(MotivoRecusa.INTERVALO_INVALIDO)
+
+    conflito = await _conflito(
+        eventos, recorrências, novo_sala_id, novo_inicio, novo_fim, atual.id
+    )
+    if conflito is not None:
+        return _recusa(MotivoRecusa.CONFLITO, conflito)
+
+    atualizado = replace(
+        atual,
+        titulo=novo_titulo,
+        sala_id=novo_sala_id,
+        inicio=novo_inicio,
+        fim=novo_fim,
+    )
+    return ResultadoEvento(await eventos.atualizar(atualizado))
+
+
+async def atualizar_evento(
+    eventos: AsyncEventoRepository,
+    salas: AsyncSalaRepository,
+    evento_id: int,
+    *,
+    titulo: str | None = None,
+    sala_id: int | None = None,
+    inicio: datetime | None = None,
+    fim: datetime | None = None,
+    recorrências: AsyncRecorrênciaRepository | None = None,
+) -> Evento | None:
+    """Atualiza campos de um evento existente; None se alguma regra falhar."""
+    resultado = await atualizar_evento_detalhado(
+        eventos,
+        salas,
+        evento_id,
+        titulo=titulo,
+        sala_id=sala_id,
+        inicio=inicio,
+        fim=fim,
+        recorrências=recorrências,
+    )
+    return resultado.evento
+
+
+async def listar_eventos(eventos: AsyncEventoRepository) -> list[Evento]:
+    """Lista eventos ordenando por (inicio, sala_id, id)."""
+    return [e async for e in eventos.iterar_ordenado()]
+
+
+def iterar_eventos(eventos: AsyncEventoRepository) -> AsyncIterator[Evento]:
+    """Itera (`async for`) os eventos na ordem (inicio, sala_id, id)."""
+    return eventos.iterar_ordenado()
+
+
+async def listar_eventos_no_intervalo(
+    eventos: AsyncEventoRepository,
+    inicio: datetime,
+    fim: datetime,
+    sala_id: int | None = None,
+) -> list[Evento]:
+    """Eventos que se sobrepõem a [inicio, fim), de todas as salas ou de uma."""
+    return await eventos.listar_no_intervalo(inicio, fim, sala_id)
+
+
+async def sala_disponível(
+    eventos: AsyncEventoRepository,
+    sala_id: int,
+    inicio: datetime,
+    fim: datetime,
+    recorrências: AsyncRecorrênciaRepository | None = None,
+) -> bool:
+    """True se a sala está livre em [inicio, fim) (intervalo inválido: False).
+
+    Consulta de disponibilidade barata, sem trava: o resultado pode mudar
+    antes de um agendamento, que refaz a checagem sob a trava da sala.
+    """
+    if not validar_intervalo(inicio, fim):
+        return False
+    return await _sala_livre(eventos, recorrências, sala_id, inicio, fim)
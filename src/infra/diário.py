@@ -0,0 +1,601 @@
+"""Persistência dos repositórios em memória por diário (journal) + snapshot.
+
+Os dados continuam nos repositórios em memória (mesmos dicts e índices de
+`infra.repos_memória`); cada escrita (`adicionar`/`atualizar`/`remover`)
+também é acrescentada como um registro no fim de um arquivo de diário. Ao
+abrir, o estado é reconstruído a partir do snapshot mais recente, e o diário
+posterior a ele é reaplicado.
+
+Arquivos no diretório:
+- `snapshot.csv`: estado completo num instante. É gravado em um `.tmp` e
+  renomeado, então nunca fica pela metade;
+- `diario-<n>.log`: registros posteriores ao snapshot, em gerações
+  numeradas. Compactar = abrir uma geração nova, gravar um snapshot com o
+  estado até ali e apagar as gerações que ele já contém.
+
+Cada registro é uma linha CSV com o tipo na primeira coluna:
+- `S,id,nome,capacidade`, `E,id,sala_id,titulo,inicio,fim`,
+  `R,id,sala_id,titulo,inicio,fim,frequência,até,intervalo,exceções` e
+  `A,id,sala_id,titulo,inicio,fim` (evento arquivado, ver
+  `ModoRemoçãoSala.ARQUIVAR`): grava a entidade (insere ou substitui);
+- `-S,id`, `-E,id`, `-R,id`, `-A,id`: remove;
+- só no snapshot: `V,<versão>,<geração>` (cabeçalho: primeira geração de
+  diário que não está no snapshot), `#,S|E|R|A,último_id,quantidade` (abre a
+  seção de cada tipo; ids removidos não são reutilizados) e `F,<crc32>`
+  (rodapé). Dentro de cada seção, as entidades seguem a ordem de `listar()`.
+  A seção `A` é opcional (snapshots anteriores ao arquivo não a têm).
+
+Datas são inteiros (microssegundos desde 1970-01-01, como no SQLite). Quebras
+de linha e `\\` em textos são escapadas, então cada registro ocupa exatamente
+uma linha: um registro cortado por uma queda (sem o `\\n` final) é
+descartado ao abrir.
+
+Durabilidade: os registros vão para o disco (`flush` + `os.fsync`) em lotes,
+a cada `lote` registros ou `intervalo` segundos (o que vier primeiro), e em
+`sincronizar()`/`fechar()`. Uma queda perde no máximo o último lote.
+"""
+
+import atexit
+import csv
+import gc
+import io
+import os
+import re
+import threading
+import zlib
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from functools import partial
+from itertools import repeat
+from pathlib import Path
+
+from domínio.modelos import Evento, Frequência, Recorrência, Sala
+from infra.repos_memória import (
+    MemEventoRepository,
+    MemRecorrênciaRepository,
+    MemSalaRepository,
+)
+from infra.travas import sincronizado
+
+
+_VERSÃO = "1"
+_SNAPSHOT = "snapshot.csv"
+_PADRÃO_DIÁRIO = re.compile(r"diario-(\d+)\.log")
+
+_EPOCA = datetime(1970, 1, 1)
+_MICROSSEGUNDO = timedelta(microseconds=1)
+
+_ESCAPES = {"\\": "\\\\", "\n": "\\n", "\r": "\\r"}
+_RE_ESCAPAR = re.compile(r"[\\\n\r]")
+_RE_DESESCAPAR = re.compile(r"\\(.)")
+_DESESCAPES = {"\\": "\\", "n": "\n", "r": "\r"}
+
+
+class DiárioCorrompido(Exception):
+    """O snapshot ou o diário não pôde ser lido."""
+
+
+def _para_int(dt: datetime) -> int:
+    return (dt - _EPOCA) // _MICROSSEGUNDO
+
+
+def _escapar(texto: str) -> str:
+    return _RE_ESCAPAR.sub(lambda m: _ESCAPES[m.group()], texto)
+
+
+def _desescapar(texto: str) -> str:
+    if "\\" not in texto:
+        return texto
+    return _RE_DESESCAPAR.sub(lambda m: _DESESCAPES.get(m.group(1), m.group(1)), texto)
+
+
+# --- registros ---
+
+
+def _registro_sala(s: Sala) -> tuple:
+    return ("S", s.id, _escapar(s.nome), s.capacidade)
+
+
+def _registro_evento(e: Evento, tipo: str = "E") -> tuple:
+    return (
+        tipo,
+        e.id,
+        e.sala_id,
+        _escapar(e.titulo),
+        _para_int(e.inicio),
+        _para_int(e.fim),
+    )
+
+
+def _registro_recorrência(r: Recorrência) -> tuple:
+    exceções = " ".join(str(_para_int(x)) for x in sorted(r.exceções))
+    return (
+        "R",
+        r.id,
+        r.sala_id,
+        _escapar(r.titulo),
+        _para_int(r.inicio),
+        _para_int(r.fim),
+        r.frequência.name,
+        _para_int(r.até),
+        r.intervalo,
+        exceções,
+    )
+
+
+_DEFINIR_ID, _DEFINIR_SALA, _DEFINIR_TITULO, _DEFINIR_INICIO, _DEFINIR_FIM = (
+    Evento.__dict__[campo].__set__ for campo in Evento.__slots__
+)
+
+
+def _data(texto: str) -> datetime:
+    return _EPOCA + timedelta(microseconds=int(texto))
+
+
+def _eventos_do_snapshot(linhas: list[list[str]]) -> dict[int, Evento]:
+    """Monta os eventos do snapshot coluna a coluna.
+
+    Com milhões de eventos, o custo por linha em Python domina a abertura.
+    Aqui cada coluna é convertida com `map` (o laço roda em C), textos e
+    datas repetidos são convertidos uma vez só (e passam a ser o mesmo
+    objeto), e os eventos são montados sem repetir as validações de
+    `__post_init__`: o snapshot é gravado a partir de eventos já validados
+    e tem o conteúdo conferido pelo CRC do rodapé.
+    """
+    if not linhas:
+        return {}
+    _, ids, salas, titulos, inicios, fins = zip(*linhas)
+    ids = list(map(int, ids))
+    textos = {t: _desescapar(t) for t in set(titulos)}
+    datas = {t: _data(t) for t in set(inicios).union(fins)}
+    eventos = list(map(object.__new__, repeat(Evento, len(ids))))
+    for definir, valores in (
+        (_DEFINIR_ID, ids),
+        (_DEFINIR_SALA, map(int, salas)),
+        (_DEFINIR_TITULO, map(textos.__getitem__, titulos)),
+        (_DEFINIR_INICIO, map(datas.__getitem__, inicios)),
+        (_DEFINIR_FIM, map(datas.__getitem__, fins)),
+    ):
+        deque(map(definir, eventos, valores), maxlen=0)
+    return dict(zip(ids, eventos))
+
+
+class _Estado:
+    """Entidades por id (na ordem de inserção, como nos repositórios em
+    memória) e maior id já usado, enquanto o snapshot e o diário são lidos."""
+
+    def __init__(self) -> None:
+        self.salas: dict[int, Sala] = {}
+        self.eventos: dict[int, Evento] = {}
+        self.recorrências: dict[int, Recorrência] = {}
+        self.arquivados: dict[int, Evento] = {}
+        self.últimos = {"S": 0, "E": 0, "R": 0, "A": 0}
+
+    def aplicar(self, linhas: Iterable[Sequence[str]]) -> int:
+        """Aplica os registros em ordem; retorna quantos foram aplicados."""
+        eventos, salas, recorrências = self.eventos, self.salas, self.recorrências
+        # maior id gravado, mesmo que removido depois (ids não são reutilizados)
+        últimos = self.últimos
+        n = 0
+        for campos in linhas:
+            tipo = campos[0]
+            if tipo == "E":
+                eid = int(campos[1])
+                últimos["E"] = max(últimos["E"], eid)
+                eventos[eid] = Evento(
+                    eid,
+                    int(campos[2]),
+                    _desescapar(campos[3]),
+                    _data(campos[4]),
+                    _data(campos[5]),
+                )
+            elif tipo == "S":
+                sid = int(campos[1])
+                últimos["S"] = max(últimos["S"], sid)
+                salas[sid] = Sala(sid, _desescapar(campos[2]), int(campos[3]))
+            elif tipo == "R":
+                rid = int(campos[1])
+                últimos["R"] = max(últimos["R"], rid)
+                recorrências[rid] = Recorrência(
+                    id=rid,
+                    sala_id=int(campos[2]),
+                    titulo=_desescapar(campos[3]),
+                    inicio=_data(campos[4]),
+                    fim=_data(campos[5]),
+                    frequência=Frequência[campos[6]],
+                    até=_data(campos[7]),
+                    intervalo=int(campos[8]),
+                    exceções=frozenset(map(_data, campos[9].split())),
+                )
+            elif tipo == "A":
+                eid = int(campos[1])
+                últimos["A"] = max(últimos["A"], eid)
+                self.arquivados[eid] = Evento(
+                    eid,
+                    int(campos[2]),
+                    _desescapar(campos[3]),
+                    _data(campos[4]),
+                    _data(campos[5]),
+                )
+            elif tipo == "-E":
+                eventos.pop(int(campos[1]), None)
+            elif tipo == "-S":
+                salas.pop(int(campos[1]), None)
+            elif tipo == "-R":
+                recorrências.pop(int(campos[1]), None)
+            elif tipo == "-A":
+                self.arquivados.pop(int(campos[1]), None)
+            else:
+                raise DiárioCorrompido(f"registro desconhecido: {tipo!r}")
+            n += 1
+        return n
+
+
+@contextmanager
+def _coletor_pausado() -> Iterator[None]:
+    """Pausa o coletor de ciclos (`gc`) durante a carga.
+
+    Milhões de tuplas e eventos novos disparariam várias coletas completas,
+    que percorrem todos os objetos sem ter o que liberar (os eventos e os
+    índices não formam ciclos).
+    """
+    ligado = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if ligado:
+            gc.enable()
+
+
+def _ler_linhas(texto: str) -> Iterable[list[str]]:
+    return csv.reader(io.StringIO(texto, newline=""))
+
+
+class Diário:
+    """Arquivo de diário + snapshot de um diretório, e os repositórios em
+    memória (`sala_repo`, `evento_repo`, `recorrencia_repo` e o arquivo de
+    eventos de salas removidas, `arquivo_repo`) que ele mantém.
+
+    Use `Diário.abrir(diretório)` (ou `app.container.criar_container_diário`).
+    Uma thread em segundo plano sincroniza os lotes pendentes a cada
+    `intervalo` segundos e compacta o diário quando ele passa de
+    `compactar_após` registros.
+    """
+
+    def __init__(
+        self,
+        diretório: str | os.PathLike[str],
+        lote: int = 256,
+        intervalo: float = 0.5,
+        compactar_após: int = 100_000,
+    ) -> None:
+        self.diretório = Path(diretório)
+        self.lote = max(lote, 1)
+        self.intervalo = intervalo
+        self.compactar_após = compactar_após
+        self.sala_repo = SalaRepositoryComDiário(self)
+        self.evento_repo = EventoRepositoryComDiário(self)
+        self.recorrencia_repo = RecorrênciaRepositoryComDiário(self)
+        self.arquivo_repo = EventoRepositoryComDiário(self, "A")
+        self._trava = threading.Lock()
+        self._compactação = threading.Lock()
+        self._geração = 1
+        self._arquivo: io.TextIOWrapper | None = None
+        self._escritor = None
+        self._pendentes = 0
+        # registros no diário desde o último snapshot
+        self._registros = 0
+        self._parar = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def abrir(cls, diretório: str | os.PathLike[str], **opções) -> "Diário":
+        """Abre (ou cria) o diário em `diretório` e carrega o estado salvo."""
+        diário = cls(diretório, **opções)
+        diário._carregar()
+        return diário
+
+    # --- escrita ---
+
+    def registrar(self, campos: Sequence) -> None:
+        """Acrescenta um registro; sincroniza se o lote encheu."""
+        with self._trava:
+            if self._escritor is None:
+                raise ValueError("diário fechado")
+            self._escritor.writerow(campos)
+            self._pendentes += 1
+            self._registros += 1
+            if self._pendentes >= self.lote:
+                self._sincronizar()
+
+    def sincronizar(self) -> None:
+        """Grava no disco (`fsync`) os registros pendentes."""
+        with self._trava:
+            self._sincronizar()
+
+    def _sincronizar(self) -> None:
+        if self._pendentes and self._arquivo is not None:
+            self._arquivo.flush()
+            os.fsync(self._arquivo.fileno())
+            self._pendentes = 0
+
+    def compactar(self) -> None:
+        """Grava um snapshot com o estado atual e descarta o diário antigo.
+
+        As escritas ficam bloqueadas só enquanto o estado é copiado (as
+        entidades são imutáveis, então basta copiar as listas) e a geração
+        do diário é trocada; o snapshot é gravado depois, sem travas.
+        """
+        with self._compactação:
+            repos = (
+                self.sala_repo,
+                self.evento_repo,
+                self.recorrencia_repo,
+                self.arquivo_repo,
+            )
+            # segurar as travas de todos impede qualquer escrita durante a cópia
+            with (
+                repos[0]._trava,
+                repos[1]._trava,
+                repos[2]._trava,
+                repos[3]._trava,
+                self._trava,
+            ):
+                if self._arquivo is None:
+                    raise ValueError("diário fechado")
+                cópias = [(list(r._dados.values()), r._ultimo_id) for r in repos]
+                geração = self._geração + 1
+                self._abrir_geração(geração)
+                self._registros = 0
+            self._gravar_snapshot(geração, *cópias)
+            for n, caminho in self._gerações():
+                if n < geração:
+                    caminho.unlink()
+
+    def fechar(self) -> None:
+        """Para a thread de fundo, sincroniza e fecha o arquivo."""
+        atexit.unregister(self.fechar)
+        self._parar.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        with self._trava:
+            if self._arquivo is not None:
+                self._sincronizar()
+                self._arquivo.close()
+                self._arquivo = self._escritor = None
+
+    # --- arquivos ---
+
+    def _gerações(self) -> list[tuple[int, Path]]:
+        encontradas = []
+        for caminho in self.diretório.iterdir():
+            m = _PADRÃO_DIÁRIO.fullmatch(caminho.name)
+            if m:
+                encontradas.append((int(m.group(1)), caminho))
+        return sorted(encontradas)
+
+    def _caminho_geração(self, n: int) -> Path:
+        return self.diretório / f"diario-{n}.log"
+
+    def _abrir_geração(self, n: int) -> None:
+        # chamado com `self._trava` segura (ou antes de haver concorrência)
+        if self._arquivo is not None:
+            self._arquivo.flush()
+            os.fsync(self._arquivo.fileno())
+            self._arquivo.close()
+            self._pendentes = 0
+        # fica aberto até a próxima troca de geração ou `fechar()`
+        self._arquivo = open(
+            self._caminho_geração(n), "a", encoding="utf-8", newline=""
+        )
+        self._escritor = csv.writer(self._arquivo, lineterminator="\n")
+        self._geração = n
+        _sincronizar_diretório(self.diretório)
+
+    def _gravar_snapshot(
+        self,
+        geração: int,
+        salas: tuple[list[Sala], int],
+        eventos: tuple[list[Evento], int],
+        recorrências: tuple[list[Recorrência], int],
+        arquivados: tuple[list[Evento], int],
+    ) -> None:
+        buffer = io.StringIO(newline="")
+        escritor = csv.writer(buffer, lineterminator="\n")
+        escritor.writerow(("V", _VERSÃO, geração))
+        for tipo, (entidades, último), registro in (
+            ("S", salas, _registro_sala),
+            ("E", eventos, _registro_evento),
+            ("R", recorrências, _registro_recorrência),
+            ("A", arquivados, partial(_registro_evento, tipo="A")),
+        ):
+            escritor.writerow(("#", tipo, último, len(entidades)))
+            escritor.writerows(map(registro, entidades))
+        dados = buffer.getvalue().encode("utf-8")
+        rodapé = f"F,{zlib.crc32(dados)}\n".encode()
+
+        temporário = self.diretório / (_SNAPSHOT + ".tmp")
+        with open(temporário, "wb") as f:
+            f.write(dados)
+            f.write(rodapé)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporário, self.diretório / _SNAPSHOT)
+        _sincronizar_diretório(self.diretório)
+
+    # --- abertura ---
+
+    def _carregar(self) -> None:
+        self.diretório.mkdir(parents=True, exist_ok=True)
+        estado = _Estado()
+        with _coletor_pausado():
+            primeira = self._ler_snapshot(estado)
+            gerações = self._gerações()
+            for n, caminho in gerações:
+                if n < primeira:
+                    # já contida no snapshot (queda durante a compactação)
+                    caminho.unlink()
+                    continue
+                linhas = _ler_linhas(_ler_diário(caminho))
+                self._registros += estado.aplicar(linhas)
+
+            self.sala_repo._carregar(estado.salas.values(), estado.últimos["S"])
+            self.evento_repo._carregar(estado.eventos.values(), estado.últimos["E"])
+            self.recorrencia_repo._carregar(
+                estado.recorrências.values(), estado.últimos["R"]
+            )
+            self.arquivo_repo._carregar(estado.arquivados.values(), estado.últimos["A"])
+        # continua na última geração existente (ou na que o snapshot indica)
+        self._abrir_geração(max([primeira] + [n for n, _ in gerações]))
+
+        atexit.register(self.fechar)
+        self._thread = threading.Thread(
+            target=self._em_segundo_plano, name="diario", daemon=True
+        )
+        self._thread.start()
+
+    def _ler_snapshot(self, estado: _Estado) -> int:
+        """Aplica o snapshot em `estado`; retorna a primeira geração de
+        diário que ele não contém (1 se não houver snapshot)."""
+        caminho = self.diretório / _SNAPSHOT
+        if not caminho.exists():
+            return 1
+        dados = caminho.read_bytes()
+        fim = dados.rfind(b"\n", 0, len(dados) - 1) + 1
+        corpo = memoryview(dados)[:fim]
+        if dados[fim:] != f"F,{zlib.crc32(corpo)}\n".encode():
+            raise DiárioCorrompido(f"snapshot inválido: {caminho}")
+
+        linhas = list(_ler_linhas(str(corpo, "utf-8")))
+        if linhas[0][:2] != ["V", _VERSÃO]:
+            raise DiárioCorrompido(f"versão de snapshot desconhecida: {linhas[0]}")
+        # seções "#,tipo,último_id,quantidade" seguidas das entidades
+        i = 1
+        for tipo in ("S", "E", "R", "A"):
+            if tipo == "A" and i == len(linhas):
+                break  # snapshot anterior ao arquivo de eventos
+            _, marca, último, quantidade = linhas[i]
+            if marca != tipo:
+                raise DiárioCorrompido(f"seção inesperada no snapshot: {marca!r}")
+            seção = linhas[i + 1 : i + 1 + int(quantidade)]
+            i += 1 + int(quantidade)
+            if tipo == "E":
+                estado.eventos = _eventos_do_snapshot(seção)
+            elif tipo == "A":
+                estado.arquivados = _eventos_do_snapshot(seção)
+            else:
+                estado.aplicar(seção)
+            estado.últimos[tipo] = max(estado.últimos[tipo], int(último))
+        return int(linhas[0][2])
+
+    def _em_segundo_plano(self) -> None:
+        while not self._parar.wait(self.intervalo):
+            self.sincronizar()
+            if self._registros >= self.compactar_após:
+                self.compactar()
+
+
+def _ler_diário(caminho: Path) -> str:
+    """Conteúdo do diário, sem um último registro incompleto (que também é
+    cortado do arquivo, para as próximas escritas começarem numa linha nova)."""
+    dados = caminho.read_bytes()
+    fim = dados.rfind(b"\n") + 1
+    if fim < len(dados):
+        with open(caminho, "r+b") as f:
+            f.truncate(fim)
+    return dados[:fim].decode("utf-8")
+
+
+def _sincronizar_diretório(diretório: Path) -> None:
+    # garante que criações/renomeações de arquivos sobrevivam a uma queda
+    if hasattr(os, "O_DIRECTORY"):
+        fd = os.open(diretório, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+# --- repositórios ---
+
+
+class SalaRepositoryComDiário(MemSalaRepository):
+    """`MemSalaRepository` que registra cada escrita no diário antes de
+    aplicá-la (`criar` e `atualizar` passam por `adicionar`)."""
+
+    def __init__(self, diário: Diário) -> None:
+        super().__init__()
+        self._diário = diário
+
+    @sincronizado
+    def adicionar(self, sala: Sala) -> Sala:
+        self._diário.registrar(_registro_sala(sala))
+        return super().adicionar(sala)
+
+    @sincronizado
+    def remover(self, sala_id: int) -> bool:
+        if sala_id not in self._dados:
+            return False
+        self._diário.registrar(("-S", sala_id))
+        return super().remover(sala_id)
+
+
+class EventoRepositoryComDiário(MemEventoRepository):
+    """`MemEventoRepository` que registra cada escrita no diário antes de
+    aplicá-la (`criar`, `criar_em_lote` e `atualizar` passam por
+    `adicionar`). `tipo` é o tipo dos registros: "E" para os eventos, "A"
+    para o arquivo."""
+
+    def __init__(self, diário: Diário, tipo: str = "E") -> None:
+        super().__init__()
+        self._diário = diário
+        self._tipo = tipo
+        self._remoção = "-" + tipo
+
+    @sincronizado
+    def adicionar(self, evento: Evento) -> Evento:
+        self._diário.registrar(_registro_evento(evento, self._tipo))
+        return super().adicionar(evento)
+
+    @sincronizado
+    def remover(self, evento_id: int) -> bool:
+        if evento_id not in self._dados:
+            return False
+        self._diário.registrar((self._remoção, evento_id))
+        return super().remover(evento_id)
+
+    @sincronizado
+    def remover_por_sala(self, sala_id: int) -> list[Evento]:
+        for _, evento_id, _ in self._por_sala.get(sala_id, ()):
+            self._diário.registrar((self._remoção, evento_id))
+        return super().remover_por_sala(sala_id)
+
+
+class RecorrênciaRepositoryComDiário(MemRecorrênciaRepository):
+    """`MemRecorrênciaRepository` que registra cada escrita no diário antes
+    de aplicá-la (`criar` e `atualizar` passam por `adicionar`)."""
+
+    def __init__(self, diário: Diário) -> None:
+        super().__init__()
+        self._diário = diário
+
+    @sincronizado
+    def adicionar(self, recorrência: Recorrência) -> Recorrência:
+        self._diário.registrar(_registro_recorrência(recorrência))
+        return super().adicionar(recorrência)
+
+    @sincronizado
+    def remover(self, recorrência_id: int) -> bool:
+        if recorrência_id not in self._dados:
+            return False
+        self._diário.registrar(("-R", recorrência_id))
+        return super().remover(recorrência_id)
+
+    @sincronizado
+    def remover_por_sala(self, sala_id: int) -> list[Recorrência]:
+        for recorrência_id in self._por_sala.get(sala_id, ()):
+            self._diário.registrar(("-R", recorrência_id))
+        return super().remover_por_sala(sala_id)
@@ -0,0 +1,362 @@
+"""Importação e exportação de salas e eventos em CSV e JSONL, em streaming.
+
+Formatos (uma linha por registro; datas como "YYYY-MM-DD HH:MM"):
+
+- CSV: cabeçalho opcional. Com cabeçalho, as colunas são achadas pelo nome
+  (`nome`, `capacidade` para salas; `sala_id`, `titulo`, `inicio`, `fim`
+  para eventos) e as demais, como `id`, são ignoradas; sem cabeçalho, as
+  colunas vêm nessa ordem;
+- JSONL: um objeto por linha com as mesmas chaves; linhas vazias são
+  ignoradas.
+
+A leitura é feita por geradores e a importação grava em blocos de
+`tamanho_lote` linhas (eventos pelo `serviços.agendar_eventos_em_lote`, com
+as mesmas regras de conflito do agendamento avulso): a memória usada não
+depende do tamanho do arquivo. Uma linha inválida ou recusada não
+interrompe a importação; vira um `ErroLinha` (número da linha no arquivo e
+mensagem), entregue a `ao_recusar` e guardado no resumo até `max_erros`.
+
+Os ids não são importados: cada sala e evento recebe o próximo id livre do
+repositório de destino, na ordem do arquivo. A exportação lê os
+repositórios com `iterar_ordenado` (salas por id, eventos por (inicio,
+sala_id, id)) e escreve um registro por vez.
+"""
+
+import csv
+import json
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from typing import NamedTuple, TextIO
+
+from domínio.regras import validar_intervalo
+from domínio.repositórios import (
+    EventoRepository,
+    RecorrênciaRepository,
+    SalaRepository,
+)
+from domínio.serviços import PedidoEvento, agendar_eventos_em_lote
+
+FORMATOS = ("csv", "jsonl")
+FORMATO_DATA = "%Y-%m-%d %H:%M"  # o mesmo `FORMATO_DATETIME` da fachada
+
+COLUNAS_SALA = ("id", "nome", "capacidade")
+COLUNAS_EVENTO = ("id", "sala_id", "titulo", "inicio", "fim")
+
+
+class ErroLinha(NamedTuple):
+    linha: int  # número da linha no arquivo (1 = primeira)
+    erro: str
+
+
+class ResumoImportação(NamedTuple):
+    importados: int
+    recusados: int
+    erros: tuple[ErroLinha, ...]  # os primeiros `max_erros` recusados
+
+
+def _validar_formato(formato: str) -> None:
+    if formato not in FORMATOS:
+        raise ValueError(f"formato desconhecido: {formato!r} (csv ou jsonl)")
+
+
+# ------------------------------
+# Leitura (geradores de registros crus)
+# ------------------------------
+
+
+def _registros(
+    origem: Iterable[str], formato: str, colunas: tuple[str, ...]
+) -> Iterator[tuple[int, dict | str]]:
+    """(linha, dict com as `colunas` encontradas) ou (linha, mensagem de erro)."""
+    _validar_formato(formato)
+    if formato == "jsonl":
+        for n, texto in enumerate(origem, 1):
+            if not texto.strip():
+                continue
+            try:
+                obj = json.loads(texto)
+            except ValueError:
+                yield n, "JSON inválido"
+                continue
+            if not isinstance(obj, dict):
+                yield n, "esperado um objeto JSON"
+                continue
+            yield n, obj
+        return
+
+    leitor = csv.reader(origem)
+    posições: dict[str, int] | None = None
+    esperadas = len(colunas)
+    while True:
+        try:
+            campos = next(leitor)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            # ex.: campo maior que `csv.field_size_limit()`; o leitor segue
+            # na linha seguinte
+            yield leitor.line_num, f"linha CSV malformada: {e}"
+            continue
+        if not campos:
+            continue
+        if posições is None:
+            nomes = [c.strip().lower() for c in campos]
+            if colunas[0] in nomes:  # cabeçalho
+                posições = {c: nomes.index(c) for c in colunas if c in nomes}
+                esperadas = len(nomes)
+                continue
+            posições = {c: k for k, c in enumerate(colunas)}
+        if len(campos) != esperadas:
+            yield leitor.line_num, f"esperadas {esperadas} colunas"
+            continue
+        yield leitor.line_num, {c: campos[k] for c, k in posições.items()}
+
+
+def _int(valor: object) -> int | None:
+    if isinstance(valor, bool):
+        return None
+    if isinstance(valor, int):
+        return valor
+    try:
+        return int(str(valor).strip())
+    except ValueError:
+        return None
+
+
+# importações repetem muito os mesmos horários: um datetime por texto
+@lru_cache(maxsize=4096)
+def _data_texto(texto: str) -> datetime | None:
+    # Mesmo formato aceito pela fachada ("YYYY-MM-DD HH:MM", sem segundos nem
+    # fuso): só data, segundos ou "T" seriam aceitos pelo `fromisoformat`,
+    # mas não pelo resto da aplicação (nem pelo snapshot binário, em minutos)
+    texto = texto.strip()
+    if (
+        len(texto) == 16
+        and texto[4] == "-"
+        and texto[7] == "-"
+        and texto[10] == " "
+        and texto[13] == ":"
+        and texto.isascii()
+        and (texto[:4] + texto[5:7] + texto[8:10] + texto[11:13] + texto[14:]).isdigit()
+    ):
+        try:
+            return datetime.fromisoformat(texto)
+        except ValueError:  # data impossível (ex.: 02-30, 24:00)
+            return None
+    # formas raras que o strptime da fachada também aceita ("2025-1-6 8:05")
+    try:
+        return datetime.strptime(texto, FORMATO_DATA)
+    except ValueError:
+        return None
+
+
+def _data(valor: object) -> datetime | None:
+    return _data_texto(valor) if isinstance(valor, str) else None
+
+
+def _faltando(registro: dict, colunas: tuple[str, ...]) -> str | None:
+    ausentes = [c for c in colunas if c not in registro]
+    return "colunas ausentes: " + ", ".join(ausentes) if ausentes else None
+
+
+def ler_salas(
+    origem: Iterable[str], formato: str = "csv"
+) -> Iterator[tuple[int, tuple[str, int] | str]]:
+    """Gera (linha, (nome, capacidade)) ou (linha, mensagem de erro)."""
+    for n, registro in _registros(origem, formato, COLUNAS_SALA[1:]):
+        if isinstance(registro, str):
+            yield n, registro
+            continue
+        erro = _faltando(registro, COLUNAS_SALA[1:])
+        if erro is not None:
+            yield n, erro
+            continue
+        nome = str(registro["nome"]).strip()
+        capacidade = _int(registro["capacidade"])
+        if capacidade is None or capacidade <= 0:
+            yield n, "capacidade inválida"
+        elif not nome:
+            yield n, "nome inválido"
+        else:
+            yield n, (nome, capacidade)
+
+
+def ler_eventos(
+    origem: Iterable[str], formato: str = "csv"
+) -> Iterator[tuple[int, PedidoEvento | str]]:
+    """Gera (linha, PedidoEvento) ou (linha, mensagem de erro).
+
+    Só confere o formato de cada campo e o título; sala, intervalo e
+    conflitos ficam para a importação.
+    """
+    for n, registro in _registros(origem, formato, COLUNAS_EVENTO[1:]):
+        if isinstance(registro, str):
+            yield n, registro
+            continue
+        erro = _faltando(registro, COLUNAS_EVENTO[1:])
+        if erro is not None:
+            yield n, erro
+            continue
+        sala_id = _int(registro["sala_id"])
+        inicio = _data(registro["inicio"])
+        fim = _data(registro["fim"])
+        titulo = str(registro["titulo"] or "").strip()
+        if sala_id is None or sala_id <= 0:
+            yield n, "id da sala inválido"
+        elif inicio is None or fim is None:
+            yield n, "formato de data inválido (YYYY-MM-DD HH:MM)"
+        elif not titulo:
+            yield n, "título inválido"
+        else:
+            yield n, PedidoEvento(sala_id, titulo, inicio, fim)
+
+
+# ------------------------------
+# Importação
+# ------------------------------
+
+
+class _Coletor:
+    """Conta as recusas, guarda as primeiras e repassa cada uma ao chamador."""
+
+    def __init__(
+        self, max_erros: int, ao_recusar: Callable[[ErroLinha], None] | None
+    ) -> None:
+        self.recusados = 0
+        self.erros: list[ErroLinha] = []
+        self._max = max_erros
+        self._ao_recusar = ao_recusar
+
+    def __call__(self, linha: int, erro: str) -> None:
+        self.recusados += 1
+        e = ErroLinha(linha, erro)
+        if len(self.erros) < self._max:
+            self.erros.append(e)
+        if self._ao_recusar is not None:
+            self._ao_recusar(e)
+
+    def resumo(self, importados: int) -> ResumoImportação:
+        return ResumoImportação(importados, self.recusados, tuple(self.erros))
+
+
+def importar_salas(
+    origem: Iterable[str],
+    salas: SalaRepository,
+    formato: str = "csv",
+    *,
+    max_erros: int = 100,
+    ao_recusar: Callable[[ErroLinha], None] | None = None,
+) -> ResumoImportação:
+    """Cadastra as salas lidas de `origem` (linhas de texto: um arquivo
+    aberto, `sys.stdin`...), uma a uma, na ordem do arquivo."""
+    _validar_formato(formato)
+    recusar = _Coletor(max_erros, ao_recusar)
+    importados = 0
+    for n, item in ler_salas(origem, formato):
+        if isinstance(item, str):
+            recusar(n, item)
+        else:
+            salas.criar(*item)
+            importados += 1
+    return recusar.resumo(importados)
+
+
+def importar_eventos(
+    origem: Iterable[str],
+    eventos: EventoRepository,
+    salas: SalaRepository,
+    formato: str = "csv",
+    recorrências: RecorrênciaRepository | None = None,
+    *,
+    tamanho_lote: int = 1000,
+    max_erros: int = 100,
+    ao_recusar: Callable[[ErroLinha], None] | None = None,
+) -> ResumoImportação:
+    """Agenda os eventos lidos de `origem` em blocos de `tamanho_lote`.
+
+    Dentro de um bloco valem as regras de `serviços.agendar_eventos_em_lote`
+    (no conflito entre linhas, vence a que começa antes); entre blocos, a
+    linha posterior é recusada por conflitar com um evento já importado.
+    """
+    _validar_formato(formato)
+    recusar = _Coletor(max_erros, ao_recusar)
+    importados = 0
+    salas_existentes: dict[int, bool] = {}  # evita consultar a mesma sala
+    itens = ler_eventos(origem, formato)
+    for bloco in iter(lambda: list(islice(itens, tamanho_lote)), []):
+        recusas: list[tuple[int, str]] = []
+        linhas: list[int] = []
+        pedidos: list[PedidoEvento] = []
+        for n, item in bloco:
+            if isinstance(item, str):
+                recusas.append((n, item))
+                continue
+            existe = salas_existentes.get(item.sala_id)
+            if existe is None:
+                existe = salas_existentes[item.sala_id] = (
+                    salas.obter_por_id(item.sala_id) is not None
+                )
+            if not existe:
+                recusas.append((n, "sala não existe"))
+            elif not validar_intervalo(item.inicio, item.fim):
+                recusas.append((n, "intervalo de datas inválido"))
+            else:
+                linhas.append(n)
+                pedidos.append(item)
+        criados = agendar_eventos_em_lote(eventos, salas, pedidos, recorrências)
+        for n, ev in zip(linhas, criados):
+            if ev is None:
+                # linhas já validadas: a única recusa possível é o conflito
+                recusas.append((n, "conflito de horário"))
+            else:
+                importados += 1
+        recusas.sort()  # na ordem do arquivo
+        for n, erro in recusas:
+            recusar(n, erro)
+    return recusar.resumo(importados)
+
+
+# ------------------------------
+# Exportação
+# ------------------------------
+
+
+def _texto_data(dt: datetime) -> str:
+    return dt.isoformat(" ", "minutes")
+
+
+def _escrever(
+    destino: TextIO, formato: str, colunas: tuple[str, ...], linhas: Iterator[tuple]
+) -> int:
+    _validar_formato(formato)
+    n = 0
+    if formato == "csv":
+        escritor = csv.writer(destino, lineterminator="\n")
+        escritor.writerow(colunas)
+        for n, linha in enumerate(linhas, 1):
+            escritor.writerow(linha)
+        return n
+    for n, linha in enumerate(linhas, 1):
+        destino.write(json.dumps(dict(zip(colunas, linha)), ensure_ascii=False))
+        destino.write("\n")
+    return n
+
+
+def exportar_salas(salas: SalaRepository, destino: TextIO, formato: str = "csv") -> int:
+    """Escreve as salas (por id) em `destino`; retorna quantas."""
+    linhas = ((s.id, s.nome, s.capacidade) for s in salas.iterar_ordenado())
+    return _escrever(destino, formato, COLUNAS_SALA, linhas)
+
+
+def exportar_eventos(
+    eventos: EventoRepository, destino: TextIO, formato: str = "csv"
+) -> int:
+    """Escreve os eventos, na ordem (inicio, sala_id, id), em `destino`;
+    retorna quantos."""
+    linhas = (
+        (e.id, e.sala_id, e.titulo, _texto_data(e.inicio), _texto_data(e.fim))
+        for e in eventos.iterar_ordenado()
+    )
+    return _escrever(destino, formato, COLUNAS_EVENTO, linhas)
@@ -0,0 +1,100 @@
+"""Lista ordenada em blocos, usada pelos índices dos repositórios em memória.
+
+Uma lista Python ordenada com `bisect.insort` custa O(n) por inserção/remoção
+(desloca todos os elementos seguintes). Aqui os itens ficam em blocos de até
+`2 * _CARGA` elementos, com o maior item de cada bloco em `_maximos`: buscar o
+bloco é O(log n) e a inserção/remoção só desloca itens dentro de um bloco.
+
+Os itens devem ser comparáveis entre si (tipicamente tuplas). Como tuplas
+comparam por prefixo, dá para buscar por uma chave parcial: `(inicio,)` vem
+antes de qualquer `(inicio, id, ...)`.
+"""
+
+from bisect import bisect_left, insort
+from typing import Any, Iterator
+
+
+_CARGA = 512
+
+
+class ListaOrdenada:
+    """Coleção ordenada com busca por chave em O(log n) e inserção/remoção
+    que deslocam no máximo um bloco."""
+
+    def __init__(self) -> None:
+        self._blocos: list[list[Any]] = []
+        self._maximos: list[Any] = []
+        self._tamanho = 0
+
+    @classmethod
+    def de_ordenados(cls, itens: list[Any]) -> "ListaOrdenada":
+        """Cria a lista a partir de `itens` já em ordem crescente, em O(n).
+
+        Usado para reconstruir índices de uma vez (ex.: ao carregar um
+        snapshot), sem uma busca binária por item. A ordem não é conferida.
+        """
+        lista = cls()
+        lista._blocos = [itens[i : i + _CARGA] for i in range(0, len(itens), _CARGA)]
+        lista._maximos = [bloco[-1] for bloco in lista._blocos]
+        lista._tamanho = len(itens)
+        return lista
+
+    def __len__(self) -> int:
+        return self._tamanho
+
+    def __iter__(self) -> Iterator[Any]:
+        for bloco in self._blocos:
+            yield from bloco
+
+    def adicionar(self, item: Any) -> None:
+        """Insere `item` mantendo a ordem."""
+        self._tamanho += 1
+        if not self._blocos:
+            self._blocos.append([item])
+            self._maximos.append(item)
+            return
+
+        b = bisect_left(self._maximos, item)
+        if b == len(self._blocos):
+            # maior que todos: vai para o fim do último bloco
+            b -= 1
+            self._blocos[b].append(item)
+            self._maximos[b] = item
+        else:
+            insort(self._blocos[b], item)
+
+        bloco = self._blocos[b]
+        if len(bloco) > 2 * _CARGA:
+            # divide o bloco cheio em dois
+            self._blocos[b : b + 1] = [bloco[:_CARGA], bloco[_CARGA:]]
+            self._maximos[b : b + 1] = [bloco[_CARGA - 1], bloco[-1]]
+
+    def remover(self, item: Any) -> None:
+        """Remove `item`. Lança ValueError se ele não estiver na lista."""
+        b = bisect_left(self._maximos, item)
+        if b < len(self._blocos):
+            bloco = self._blocos[b]
+            i = bisect_left(bloco, item)
+            if i < len(bloco) and bloco[i] == item:
+                del bloco[i]
+                self._tamanho -= 1
+                if not bloco:
+                    del self._blocos[b]
+                    del self._maximos[b]
+                elif i == len(bloco):
+                    self._maximos[b] = bloco[-1]
+                return
+        raise ValueError("item não está na lista")
+
+    def a_partir_de(self, chave: Any) -> Iterator[Any]:
+        """Itera, em ordem, os itens >= `chave`.
+
+        Não modifique a lista enquanto consome o iterador.
+        """
+        b = bisect_left(self._maximos, chave)
+        if b == len(self._blocos):
+            return
+        bloco = self._blocos[b]
+        yield from bloco[bisect_left(bloco, chave) :]
+        for bloco in self._blocos[b + 1 :]:
+            yield from bloco
@@ -0,0 +1,213 @@
+"""Adaptadores que expõem repositórios síncronos como repositórios assíncronos.
+
+Cada chamada roda o método síncrono em um pool de threads
+(`loop.run_in_executor`), então um backend que bloqueia (disco, banco) não
+trava o loop `asyncio`: enquanto uma consulta espera, o loop atende outras.
+O pool é compartilhado pelos adaptadores de um mesmo container.
+"""
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Executor
+from contextlib import asynccontextmanager
+from datetime import datetime
+from functools import partial
+from typing import Any, AsyncIterator, TypeVar
+
+from domínio.modelos import Sala, Evento, Recorrência
+from domínio.repositórios import (
+    SalaRepository,
+    EventoRepository,
+    RecorrênciaRepository,
+    CursorEvento,
+)
+from domínio.repositórios_async import (
+    AsyncSalaRepository,
+    AsyncEventoRepository,
+    AsyncRecorrênciaRepository,
+)
+
+_T = TypeVar("_T")
+
+
+class _EmThreads:
+    """Base dos adaptadores: roda funções síncronas no `executor`."""
+
+    def __init__(self, executor: Executor | None = None) -> None:
+        # None: pool padrão do loop
+        self._executor = executor
+
+    async def _rodar(self, fn: Callable[..., _T], *args: Any) -> _T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args))
+
+
+class SalaRepositoryEmThreads(_EmThreads, AsyncSalaRepository):
+    """`AsyncSalaRepository` sobre um `SalaRepository` síncrono."""
+
+    def __init__(self, repo: SalaRepository, executor: Executor | None = None) -> None:
+        super().__init__(executor)
+        self.síncrono = repo
+
+    async def proximo_id(self) -> int:
+        return await self._rodar(self.síncrono.proximo_id)
+
+    async def criar(self, nome: str, capacidade: int) -> Sala:
+        return await self._rodar(self.síncrono.criar, nome, capacidade)
+
+    async def adicionar(self, sala: Sala) -> Sala:
+        return await self._rodar(self.síncrono.adicionar, sala)
+
+    async def obter_por_id(self, sala_id: int) -> Sala | None:
+        return await self._rodar(self.síncrono.obter_por_id, sala_id)
+
+    async def listar(self) -> list[Sala]:
+        return await self._rodar(self.síncrono.listar)
+
+    async def remover(self, sala_id: int) -> bool:
+        return await self._rodar(self.síncrono.remover, sala_id)
+
+    async def atualizar(self, sala: Sala) -> Sala:
+        return await self._rodar(self.síncrono.atualizar, sala)
+
+    async def listar_pagina(self, limite: int, após: int | None = None) -> list[Sala]:
+        return await self._rodar(self.síncrono.listar_pagina, limite, após)
+
+    async def listar_por_capacidade_mínima(self, capacidade_min: int) -> list[Sala]:
+        return await self._rodar(
+            self.síncrono.listar_por_capacidade_mínima, capacidade_min
+        )
+
+
+class EventoRepositoryEmThreads(_EmThreads, AsyncEventoRepository):
+    """`AsyncEventoRepository` sobre um `EventoRepository` síncrono.
+
+    `travar_salas` combina duas travas: uma `asyncio.Lock` por sala, para que
+    corrotinas do mesmo loop esperem a vez sem ocupar threads do pool, e a
+    trava síncrona do repositório (`EventoRepository.travar_salas`), que
+    também exclui quem usa o repositório direto de outras threads.
+    """
+
+    def __init__(
+        self, repo: EventoRepository, executor: Executor | None = None
+    ) -> None:
+        super().__init__(executor)
+        self.síncrono = repo
+        self._travas: dict[int, asyncio.Lock] = {}
+
+    @asynccontextmanager
+    async def travar_salas(self, *sala_ids: int) -> AsyncIterator[None]:
+        ids = sorted(set(sala_ids))
+        travas = [self._travas.setdefault(sid, asyncio.Lock()) for sid in ids]
+        for t in travas:
+            await t.acquire()
+        try:
+            contexto = self.síncrono.travar_salas(*ids)
+            entrada = asyncio.ensure_future(self._rodar(contexto.__enter__))
+            try:
+                await asyncio.shield(entrada)
+            except asyncio.CancelledError:
+                # a thread pode ainda conseguir a trava: libera quando conseguir
+                entrada.add_done_callback(
+                    lambda f: f.exception() or contexto.__exit__(None, None, None)
+                )
+                raise
+            try:
+                yield
+            finally:
+                contexto.__exit__(None, None, None)  # liberar não bloqueia
+        finally:
+            for t in reversed(travas):
+                t.release()
+
+    async def proximo_id(self) -> int:
+        return await self._rodar(self.síncrono.proximo_id)
+
+    async def criar(
+        self, sala_id: int, titulo: str, inicio: datetime, fim: datetime
+    ) -> Evento:
+        return await self._rodar(self.síncrono.criar, sala_id, titulo, inicio, fim)
+
+    async def adicionar(self, evento: Evento) -> Evento:
+        return await self._rodar(self.síncrono.adicionar, evento)
+
+    async def atualizar(self, evento: Evento) -> Evento:
+        return await self._rodar(self.síncrono.atualizar, evento)
+
+    async def remover(self, evento_id: int) -> bool:
+        return await self._rodar(self.síncrono.remover, evento_id)
+
+    async def obter_por_id(self, evento_id: int) -> Evento | None:
+        return await self._rodar(self.síncrono.obter_por_id, evento_id)
+
+    async def listar(self) -> list[Evento]:
+        return await self._rodar(self.síncrono.listar)
+
+    async def listar_por_sala(self, sala_id: int) -> list[Evento]:
+        return await self._rodar(self.síncrono.listar_por_sala, sala_id)
+
+    async def listar_pagina(
+        self, limite: int, após: CursorEvento | None = None
+    ) -> list[Evento]:
+        return await self._rodar(self.síncrono.listar_pagina, limite, após)
+
+    async def listar_no_intervalo(
+        self, inicio: datetime, fim: datetime, sala_id: int | None = None
+    ) -> list[Evento]:
+        return await self._rodar(
+            self.síncrono.listar_no_intervalo, inicio, fim, sala_id
+        )
+
+    async def encontrar_conflito(
+        self,
+        sala_id: int,
+        inicio: datetime,
+        fim: datetime,
+        ignorar_evento_id: int | None = None,
+    ) -> Evento | None:
+        return await self._rodar(
+            self.síncrono.encontrar_conflito, sala_id, inicio, fim, ignorar_evento_id
+        )
+
+    async def existe_sobreposição(
+        self,
+        sala_id: int,
+        inicio: datetime,
+        fim: datetime,
+        ignorar_evento_id: int | None = None,
+    ) -> bool:
+        return await self._rodar(
+            self.síncrono.existe_sobreposição, sala_id, inicio, fim, ignorar_evento_id
+        )
+
+
+class RecorrênciaRepositoryEmThreads(_EmThreads, AsyncRecorrênciaRepository):
+    """`AsyncRecorrênciaRepository` sobre um `RecorrênciaRepository` síncrono."""
+
+    def __init__(
+        self, repo: RecorrênciaRepository, executor: Executor | None = None
+    ) -> None:
+        super().__init__(executor)
+        self.síncrono = repo
+
+    async def proximo_id(self) -> int:
+        return await self._rodar(self.síncrono.proximo_id)
+
+    async def adicionar(self, recorrência: Recorrência) -> Recorrência:
+        return await self._rodar(self.síncrono.adicionar, recorrência)
+
+    async def remover(self, recorrência_id: int) -> bool:
+        return await self._rodar(self.síncrono.remover, recorrência_id)
+
+    async def obter_por_id(self, recorrência_id: int) -> Recorrência | None:
+        return await self._rodar(self.síncrono.obter_por_id, recorrência_id)
+
+    async def listar_por_sala(self, sala_id: int) -> list[Recorrência]:
+        return await self._rodar(self.síncrono.listar_por_sala, sala_id)
+
+    async def listar_ativas_no_intervalo(
+        self, inicio: datetime, fim: datetime, sala_id: int
+    ) -> list[Recorrência]:
+        return await self._rodar(
+            self.síncrono.listar_ativas_no_intervalo, inicio, fim, sala_id
+        )
@@ -0,0 +1,238 @@
+"""Cache LRU de consultas sobre um `EventoRepository` qualquer.
+
+`CacheEventoRepository` embrulha outro repositório de eventos e guarda as
+respostas das consultas por sala e janela de tempo, as que dominam a carga
+de leitura ("a sala X está livre em Y?", "eventos de hoje"):
+
+- `encontrar_conflito` (e, por ele, `existe_sobreposição`);
+- `listar_no_intervalo` (de uma sala ou de todas);
+- `listar_por_sala`.
+
+O tamanho é limitado (`capacidade` entradas) e a entrada usada há mais
+tempo é descartada primeiro. Cada escrita (`adicionar`, `atualizar`,
+`remover`, `remover_por_sala`, ...) invalida só as entradas da sala do
+evento (e as de todas as salas) cuja janela cruza o intervalo do evento; o
+resto do cache continua valendo. Todas as escritas precisam passar por este
+repositório: uma escrita direta no repositório de baixo não invalida nada.
+
+Contadores (`estatísticas()`) de acertos, falhas, invalidações e descartes
+ajudam a dimensionar a capacidade.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from datetime import datetime
+from typing import Any, Iterable, Iterator, NamedTuple
+
+from domínio.modelos import Evento
+from domínio.repositórios import CursorEvento, EventoRepository
+
+_AUSENTE = object()
+
+# Chave de uma entrada: (consulta, sala_id ou None, inicio, fim, extra).
+# Em `listar_por_sala` a janela é None: qualquer evento da sala a invalida.
+_Chave = tuple[str, int | None, datetime | None, datetime | None, Any]
+
+
+class EstatísticasCache(NamedTuple):
+    acertos: int
+    falhas: int
+    invalidadas: int  # entradas removidas por escritas
+    descartadas: int  # entradas removidas por falta de espaço (LRU)
+    tamanho: int
+    capacidade: int
+
+    @property
+    def taxa_de_acerto(self) -> float:
+        consultas = self.acertos + self.falhas
+        return self.acertos / consultas if consultas else 0.0
+
+
+class CacheEventoRepository(EventoRepository):
+    """`EventoRepository` com cache LRU das consultas por sala e janela.
+
+    Seguro para uso com threads se `base` também for: o cache tem uma trava
+    própria, curta, e as consultas ao `base` rodam fora dela. Uma resposta
+    calculada enquanto alguma escrita acontecia não é guardada (poderia ser
+    anterior à escrita), só devolvida.
+    """
+
+    def __init__(self, base: EventoRepository, capacidade: int = 4096) -> None:
+        if capacidade <= 0:
+            raise ValueError("capacidade deve ser > 0")
+        self.base = base
+        self.capacidade = capacidade
+        self._itens: OrderedDict[_Chave, Any] = OrderedDict()
+        self._chaves_por_sala: dict[int | None, set[_Chave]] = {}
+        self._trava = threading.Lock()
+        self._escritas = 0  # muda a cada invalidação
+        self._acertos = self._falhas = self._invalidadas = self._descartadas = 0
+
+    # --- cache ---
+
+    def _consultar(self, chave: _Chave, calcular: Callable[[], Any]) -> Any:
+        with self._trava:
+            valor = self._itens.get(chave, _AUSENTE)
+            if valor is not _AUSENTE:
+                self._itens.move_to_end(chave)
+                self._acertos += 1
+                return valor
+            self._falhas += 1
+            escritas = self._escritas
+        valor = calcular()
+        with self._trava:
+            if escritas == self._escritas and chave not in self._itens:
+                self._itens[chave] = valor
+                self._chaves_por_sala.setdefault(chave[1], set()).add(chave)
+                if len(self._itens) > self.capacidade:
+                    antiga, _ = self._itens.popitem(last=False)
+                    self._chaves_por_sala[antiga[1]].discard(antiga)
+                    self._descartadas += 1
+        return valor
+
+    def _invalidar(self, *eventos: Evento | None) -> None:
+        with self._trava:
+            self._escritas += 1
+            for e in eventos:
+                if e is None:
+                    continue
+                for sala in (e.sala_id, None):
+                    chaves = self._chaves_por_sala.get(sala)
+                    if not chaves:
+                        continue
+                    afetadas = [
+                        c
+                        for c in chaves
+                        if c[2] is None or (c[2] < e.fim and c[3] > e.inicio)
+                    ]
+                    for c in afetadas:
+                        chaves.discard(c)
+                        del self._itens[c]
+                    self._invalidadas += len(afetadas)
+
+    def estatísticas(self) -> EstatísticasCache:
+        with self._trava:
+            return EstatísticasCache(
+                self._acertos,
+                self._falhas,
+                self._invalidadas,
+                self._descartadas,
+                len(self._itens),
+                self.capacidade,
+            )
+
+    def limpar(self) -> None:
+        """Esvazia o cache (os contadores continuam)."""
+        with self._trava:
+            self._escritas += 1
+            self._itens.clear()
+            self._chaves_por_sala.clear()
+
+    # --- consultas com cache ---
+
+    def encontrar_conflito(
+        self,
+        sala_id: int,
+        inicio: datetime,
+        fim: datetime,
+        ignorar_evento_id: int | None = None,
+    ) -> Evento | None:
+        return self._consultar(
+            ("conflito", sala_id, inicio, fim, ignorar_evento_id),
+            lambda: self.base.encontrar_conflito(
+                sala_id, inicio, fim, ignorar_evento_id
+            ),
+        )
+
+    def listar_no_intervalo(
+        self, inicio: datetime, fim: datetime, sala_id: int | None = None
+    ) -> list[Evento]:
+        # guarda tuplas: quem recebe a lista pode alterá-la à vontade
+        return list(
+            self._consultar(
+                ("intervalo", sala_id, inicio, fim, None),
+                lambda: tuple(self.base.listar_no_intervalo(inicio, fim, sala_id)),
+            )
+        )
+
+    def listar_por_sala(self, sala_id: int) -> list[Evento]:
+        return list(
+            self._consultar(
+                ("sala", sala_id, None, None, None),
+                lambda: tuple(self.base.listar_por_sala(sala_id)),
+            )
+        )
+
+    # --- escritas (invalidam) ---
+
+    def adicionar(self, evento: Evento) -> Evento:
+        salvo = self.base.adicionar(evento)
+        self._invalidar(salvo)
+        return salvo
+
+    def criar(
+        self, sala_id: int, titulo: str, inicio: datetime, fim: datetime
+    ) -> Evento:
+        # o `criar` do base reserva o id e grava de forma atômica
+        criado = self.base.criar(sala_id, titulo, inicio, fim)
+        self._invalidar(criado)
+        return criado
+
+    def criar_em_lote(
+        self, dados: Iterable[tuple[int, str, datetime, datetime]]
+    ) -> list[Evento]:
+        criados = self.base.criar_em_lote(dados)
+        self._invalidar(*criados)
+        return criados
+
+    def adicionar_em_lote(self, eventos: Iterable[Evento]) -> list[Evento]:
+        salvos = self.base.adicionar_em_lote(eventos)
+        self._invalidar(*salvos)
+        return salvos
+
+    def atualizar(self, evento: Evento) -> Evento:
+        anterior = self.base.obter_por_id(evento.id)
+        salvo = self.base.atualizar(evento)
+        self._invalidar(anterior, salvo)
+        return salvo
+
+    def remover(self, evento_id: int) -> bool:
+        anterior = self.base.obter_por_id(evento_id)
+        removeu = self.base.remover(evento_id)
+        if removeu:
+            self._invalidar(anterior)
+        return removeu
+
+    def remover_por_sala(self, sala_id: int) -> list[Evento]:
+        removidos = self.base.remover_por_sala(sala_id)
+        self._invalidar(*removidos)
+        return removidos
+
+    # --- repassadas ao base ---
+
+    def proximo_id(self) -> int:
+        return self.base.proximo_id()
+
+    def obter_por_id(self, evento_id: int) -> Evento | None:
+        return self.base.obter_por_id(evento_id)
+
+    def listar(self) -> list[Evento]:
+        return self.base.listar()
+
+    def listar_pagina(
+        self, limite: int, após: CursorEvento | None = None
+    ) -> list[Evento]:
+        return self.base.listar_pagina(limite, após)
+
+    def iterar_ordenado(self, tamanho_lote: int = 1000) -> Iterator[Evento]:
+        return self.base.iterar_ordenado(tamanho_lote)
+
+    def travar_salas(self, *sala_ids: int) -> AbstractContextManager[None]:
+        return self.base.travar_salas(*sala_ids)
+
+    def fechar(self) -> None:
+        fechar = getattr(self.base, "fechar", None)
+        if fechar is not None:
+            fechar()
@@ -1,72 +1,456 @@
-from domínio.modelos import Sala, Evento
-from domínio.repositórios import SalaRepository, EventoRepository
+import threading
+from collections import Counter
+from collections.abc import Iterable
+from contextlib import AbstractContextManager
+from dataclasses import replace
+from datetime import datetime, timedelta
+from heapq import heapify, heappop, heappush
+from itertools import islice
+from typing import Iterator
+
+from domínio.modelos import Sala, Evento, Recorrência
+from domínio.regras import validar_intervalo
+from domínio.repositórios import (
+    SalaRepository,
+    EventoRepository,
+    RecorrênciaRepository,
+    CursorEvento,
+)
+from infra.lista_ordenada import ListaOrdenada
+from infra.travas import TravasPorSala, sincronizado
 
 
 class MemSalaRepository(SalaRepository):
     """Implementação em memória de SalaRepository.
 
-    Armazena entidades em uma lista interna e provê operações básicas
-    de CRUD com id sequencial simples.
+    Armazena entidades em um dict indexado por id (que preserva a ordem de
+    inserção) e provê operações básicas de CRUD em O(1). O próximo id vem
+    de um contador monotônico, então ids removidos nunca são reutilizados.
+    Índices ordenados por id (páginas) e por (capacidade, id) atendem
+    listagens paginadas e buscas por capacidade mínima sem ordenar tudo.
     """
 
     def __init__(self) -> None:
-        self._dados: list[Sala] = []
+        self._trava = threading.RLock()
+        self._dados: dict[int, Sala] = {}
+        self._ultimo_id = 0
+        self._ids = ListaOrdenada()
+        self._por_capacidade = ListaOrdenada()
 
+    @sincronizado
     def proximo_id(self) -> int:
-        return (self._dados[-1].id + 1) if self._dados else 1
+        return self._ultimo_id + 1
+
+    @sincronizado
+    def criar(self, nome: str, capacidade: int) -> Sala:
+        return self.adicionar(Sala(self._ultimo_id + 1, nome, capacidade))
 
+    @sincronizado
     def adicionar(self, sala: Sala) -> Sala:
-        self._dados.append(sala)
+        anterior = self._dados.get(sala.id)
+        if anterior is not None:
+            self._desindexar(anterior)
+        self._dados[sala.id] = sala
+        self._ultimo_id = max(self._ultimo_id, sala.id)
+        self._ids.adicionar(sala.id)
+        self._por_capacidade.adicionar((sala.capacidade, sala.id))
         return sala
 
+    @sincronizado
     def obter_por_id(self, sala_id: int) -> Sala | None:
-        return next((s for s in self._dados if s.id == sala_id), None)
+        return self._dados.get(sala_id)
 
+    @sincronizado
     def listar(self) -> list[Sala]:
         # retorna uma cópia para evitar mutações externas do estado interno
-        return list(self._dados)
+        return list(self._dados.values())
 
+    @sincronizado
     def remover(self, sala_id: int) -> bool:
-        antes = len(self._dados)
-        self._dados = [s for s in self._dados if s.id != sala_id]
-        return len(self._dados) < antes
+        alvo = self._dados.pop(sala_id, None)
+        if alvo is None:
+            return False
+        self._desindexar(alvo)
+        return True
 
+    @sincronizado
     def atualizar(self, sala: Sala) -> Sala:
-        # remove o existente (se houver) e insere o atualizado
-        self.remover(sala.id)
-        self._dados.append(sala)
-        return sala
+        # substitui no lugar, mantendo a posição original em `listar()`
+        return self.adicionar(sala)
+
+    @sincronizado
+    def listar_por_capacidade_mínima(self, capacidade_min: int) -> list[Sala]:
+        return [
+            self._dados[sid]
+            for _, sid in self._por_capacidade.a_partir_de((capacidade_min,))
+        ]
+
+    @sincronizado
+    def listar_pagina(self, limite: int, após: int | None = None) -> list[Sala]:
+        ids = iter(self._ids) if após is None else self._ids.a_partir_de(após + 1)
+        return [self._dados[sid] for sid in islice(ids, max(limite, 0))]
+
+    def iterar_ordenado(self, tamanho_lote: int = 1000) -> Iterator[Sala]:
+        após: int | None = None
+        while página := self.listar_pagina(tamanho_lote, após):
+            yield from página
+            após = página[-1].id
+
+    def _desindexar(self, sala: Sala) -> None:
+        self._ids.remover(sala.id)
+        self._por_capacidade.remover((sala.capacidade, sala.id))
+
+    @sincronizado
+    def _carregar(self, salas: Iterable[Sala], último_id: int = 0) -> None:
+        """Acrescenta `salas` (ex.: lidas de um snapshot) e garante que
+        `proximo_id()` fique acima de `último_id`."""
+        for sala in salas:
+            # sem passar por sobrescritas de `adicionar` (ex.: o diário, que
+            # não deve registrar de novo o que está carregando)
+            MemSalaRepository.adicionar(self, sala)
+        self._ultimo_id = max(self._ultimo_id, último_id)
+
+
+class _Durações:
+    """Multiconjunto das durações de um grupo de eventos, com a maior delas.
+
+    Cada duração distinta entra uma vez num heap de máximo (negada); as que
+    deixam de existir só saem do heap quando chegam ao topo (remoção
+    preguiçosa). Inserir e remover custam O(log d) amortizado para d
+    durações distintas, e `máxima()` acompanha as remoções: um evento longo
+    removido deixa de alargar a busca.
+    """
+
+    __slots__ = ("_contagem", "_heap")
+
+    def __init__(self, durações: Iterable[timedelta] = ()) -> None:
+        self._contagem: Counter[timedelta] = Counter(durações)
+        self._heap = [-d for d in self._contagem]
+        heapify(self._heap)
+
+    def adicionar(self, duração: timedelta) -> None:
+        if not self._contagem[duração]:
+            heappush(self._heap, -duração)
+        self._contagem[duração] += 1
+
+    def remover(self, duração: timedelta) -> None:
+        restantes = self._contagem[duração] - 1
+        if restantes:
+            self._contagem[duração] = restantes
+            return
+        del self._contagem[duração]
+        # entradas mortas abaixo do topo só saem ao chegar nele: se forem a
+        # maioria (muitas durações indo e voltando), o heap é refeito
+        if len(self._heap) > 2 * len(self._contagem) + 16:
+            self._heap = [-d for d in self._contagem]
+            heapify(self._heap)
+
+    def máxima(self) -> timedelta:
+        heap, contagem = self._heap, self._contagem
+        while heap and -heap[0] not in contagem:
+            heappop(heap)
+        return -heap[0] if heap else timedelta(0)
 
 
 class MemEventoRepository(EventoRepository):
-    """Implementação em memória de EventoRepository."""
+    """Implementação em memória de EventoRepository.
+
+    Guarda os eventos em um dict por id (O(1) para obter e remover) e mantém
+    dois índices ordenados (`ListaOrdenada`):
+    - global, por (inicio, sala_id, id): serve páginas e streaming já na
+      ordem de listagem, sem ordenar tudo a cada chamada;
+    - por sala, por (inicio, id), junto das durações dos eventos da sala
+      (`_Durações`): a checagem de conflito só visita eventos que começam em
+      (inicio - maior duração atual, fim), em O(log n + m) para m eventos da
+      sala nessa faixa. Com durações parecidas, m é o número de conflitos
+      mais um punhado de vizinhos; a maior duração acompanha remoções e
+      atualizações, então um evento longo só alarga a faixa enquanto existe.
+    Consultas por intervalo usam o mesmo recorte: no índice da sala, ou no
+    global com a maior duração entre todas as salas.
+
+    Pode ser compartilhado entre threads: cada método segura uma trava curta
+    sobre as estruturas internas, e `travar_salas` entrega uma trava por sala
+    para os serviços fecharem "checa conflito -> grava" sem bloquear as
+    outras salas.
+    """
 
     def __init__(self) -> None:
-        self._dados: list[Evento] = []
+        self._trava = threading.RLock()
+        self._dados: dict[int, Evento] = {}
+        self._ultimo_id = 0
+        # [(inicio, sala_id, id, evento), ...]
+        self._ordenados = ListaOrdenada()
+        # sala_id -> [(inicio, id, evento), ...]
+        self._por_sala: dict[int, ListaOrdenada] = {}
+        # durações dos eventos indexados, por sala e de todas as salas
+        self._durações: dict[int, _Durações] = {}
+        self._durações_global = _Durações()
+        self._travas = TravasPorSala()
 
+    def travar_salas(self, *sala_ids: int) -> AbstractContextManager[None]:
+        return self._travas.travar(*sala_ids)
+
+    @sincronizado
     def proximo_id(self) -> int:
-        return (self._dados[-1].id + 1) if self._dados else 1
+        return self._ultimo_id + 1
+
+    @sincronizado
+    def criar(
+        self, sala_id: int, titulo: str, inicio: datetime, fim: datetime
+    ) -> Evento:
+        # reserva do id e gravação sob a mesma trava
+        return self.adicionar(Evento(self._ultimo_id + 1, sala_id, titulo, inicio, fim))
+
+    @sincronizado
+    def criar_em_lote(
+        self, dados: Iterable[tuple[int, str, datetime, datetime]]
+    ) -> list[Evento]:
+        return [self.criar(*campos) for campos in dados]
 
+    @sincronizado
     def adicionar(self, evento: Evento) -> Evento:
-        self._dados.append(evento)
+        anterior = self._dados.get(evento.id)
+        if anterior is not None:
+            self._desindexar(anterior)
+        self._dados[evento.id] = evento
+        self._ultimo_id = max(self._ultimo_id, evento.id)
+        self._indexar(evento)
         return evento
 
+    @sincronizado
     def atualizar(self, evento: Evento) -> Evento:
-        self.remover(evento.id)
-        self._dados.append(evento)
-        return evento
+        # substitui no lugar (mantém a ordem de `listar()`) e reindexa
+        return self.adicionar(evento)
 
+    @sincronizado
     def remover(self, evento_id: int) -> bool:
-        antes = len(self._dados)
-        self._dados = [e for e in self._dados if e.id != evento_id]
-        return len(self._dados) < antes
+        alvo = self._dados.pop(evento_id, None)
+        if alvo is None:
+            return False
+        self._desindexar(alvo)
+        return True
+
+    @sincronizado
+    def remover_por_sala(self, sala_id: int) -> list[Evento]:
+        # o índice da sala já tem os eventos dela: O(k log n) para k eventos,
+        # sem percorrer os das outras salas
+        índice = self._por_sala.pop(sala_id, None)
+        if not índice:
+            return []
+        removidos = [e for _, _, e in índice]
+        for e in removidos:
+            del self._dados[e.id]
+            self._ordenados.remover((e.inicio, e.sala_id, e.id, e))
+            self._durações_global.remover(e.fim - e.inicio)
+        del self._durações[sala_id]
+        return removidos
 
+    @sincronizado
     def obter_por_id(self, evento_id: int) -> Evento | None:
-        return next((e for e in self._dados if e.id == evento_id), None)
+        return self._dados.get(evento_id)
 
+    @sincronizado
     def listar(self) -> list[Evento]:
-        return list(self._dados)
+        return list(self._dados.values())
 
+    @sincronizado
     def listar_por_sala(self, sala_id: int) -> list[Evento]:
-        # retorna cópia filtrada para não expor a lista interna
-        return [e for e in self._dados if e.sala_id == sala_id]
+        # usa o índice da sala (ordem por início); retorna uma cópia
+        return [e for _, _, e in self._por_sala.get(sala_id, ())]
+
+    @sincronizado
+    def listar_pagina(
+        self, limite: int, após: CursorEvento | None = None
+    ) -> list[Evento]:
+        if após is None:
+            itens = iter(self._ordenados)
+        else:
+            itens = self._ordenados.a_partir_de(após)
+        página: list[Evento] = []
+        for inicio, sala_id, eid, e in itens:
+            if len(página) >= limite:
+                break
+            if (inicio, sala_id, eid) == após:
+                continue  # o cursor é exclusivo
+            página.append(e)
+        return página
+
+    def iterar_ordenado(self, tamanho_lote: int = 1000) -> Iterator[Evento]:
+        # Busca em páginas: escritas entre um lote e outro não invalidam o cursor
+        após: CursorEvento | None = None
+        while página := self.listar_pagina(tamanho_lote, após):
+            yield from página
+            último = página[-1]
+            após = (último.inicio, último.sala_id, último.id)
+
+    @sincronizado
+    def listar_no_intervalo(
+        self, inicio: datetime, fim: datetime, sala_id: int | None = None
+    ) -> list[Evento]:
+        if not validar_intervalo(inicio, fim):
+            return []
+        if sala_id is None:
+            índice, duração_máx = self._ordenados, self._durações_global.máxima()
+        else:
+            índice = self._por_sala.get(sala_id)
+            if not índice:
+                return []
+            duração_máx = self._durações[sala_id].máxima()
+
+        # Só pode sobrepor quem começa em (inicio - duração_máx, fim); os dois
+        # índices começam por `inicio` e terminam com o evento
+        resultado: list[Evento] = []
+        for item in índice.a_partir_de((inicio - duração_máx,)):
+            if item[0] >= fim:
+                break
+            e = item[-1]
+            if e.fim > inicio:
+                resultado.append(e)
+        return resultado
+
+    @sincronizado
+    def encontrar_conflito(
+        self,
+        sala_id: int,
+        inicio: datetime,
+        fim: datetime,
+        ignorar_evento_id: int | None = None,
+    ) -> Evento | None:
+        if not validar_intervalo(inicio, fim):
+            return None
+        índice = self._por_sala.get(sala_id)
+        if not índice:
+            return None
+
+        # Só pode sobrepor quem começa em (inicio - duração_máx, fim)
+        duração_máx = self._durações[sala_id].máxima()
+        for ini, eid, e in índice.a_partir_de((inicio - duração_máx,)):
+            if ini >= fim:
+                break
+            if eid != ignorar_evento_id and e.fim > inicio:
+                return e
+        return None
+
+    # --- manutenção dos índices ---
+
+    def _indexar(self, evento: Evento) -> None:
+        self._ordenados.adicionar((evento.inicio, evento.sala_id, evento.id, evento))
+        índice = self._por_sala.get(evento.sala_id)
+        if índice is None:
+            índice = self._por_sala[evento.sala_id] = ListaOrdenada()
+        índice.adicionar((evento.inicio, evento.id, evento))
+        durações = self._durações.get(evento.sala_id)
+        if durações is None:
+            durações = self._durações[evento.sala_id] = _Durações()
+        duração = evento.fim - evento.inicio
+        durações.adicionar(duração)
+        self._durações_global.adicionar(duração)
+
+    def _desindexar(self, evento: Evento) -> None:
+        self._ordenados.remover((evento.inicio, evento.sala_id, evento.id, evento))
+        self._por_sala[evento.sala_id].remover((evento.inicio, evento.id, evento))
+        duração = evento.fim - evento.inicio
+        self._durações[evento.sala_id].remover(duração)
+        self._durações_global.remover(duração)
+
+    @sincronizado
+    def _carregar(self, eventos: Iterable[Evento], último_id: int = 0) -> None:
+        """Acrescenta `eventos` (ex.: lidos de um snapshot), garante que
+        `proximo_id()` fique acima de `último_id` e remonta os índices de uma
+        vez: uma ordenação global e um corte por sala, em vez de uma inserção
+        ordenada por evento."""
+        self._dados.update((e.id, e) for e in eventos)
+        self._ultimo_id = max(self._ultimo_id, último_id, max(self._dados, default=0))
+        ordenados = [(e.inicio, e.sala_id, e.id, e) for e in self._dados.values()]
+        ordenados.sort()
+        por_sala: dict[int, list[tuple[datetime, int, Evento]]] = {}
+        for inicio, sala_id, eid, e in ordenados:
+            itens = por_sala.get(sala_id)
+            if itens is None:
+                itens = por_sala[sala_id] = []
+            # na ordem global, os eventos de uma sala já saem por (inicio, id)
+            itens.append((inicio, eid, e))
+        self._ordenados = ListaOrdenada.de_ordenados(ordenados)
+        self._por_sala = {
+            sid: ListaOrdenada.de_ordenados(itens) for sid, itens in por_sala.items()
+        }
+        self._durações = {
+            sid: _Durações(e.fim - e.inicio for _, _, e in itens)
+            for sid, itens in por_sala.items()
+        }
+        self._durações_global = _Durações(
+            e.fim - e.inicio for e in self._dados.values()
+        )
+
+
+class MemRecorrênciaRepository(RecorrênciaRepository):
+    """Implementação em memória de RecorrênciaRepository.
+
+    Guarda as regras em um dict por id e, por sala, os ids das suas regras;
+    nenhuma ocorrência é materializada.
+    """
+
+    def __init__(self) -> None:
+        self._trava = threading.RLock()
+        self._dados: dict[int, Recorrência] = {}
+        self._ultimo_id = 0
+        # sala_id -> {id: None} (dict como conjunto ordenado por inserção)
+        self._por_sala: dict[int, dict[int, None]] = {}
+
+    @sincronizado
+    def proximo_id(self) -> int:
+        return self._ultimo_id + 1
+
+    @sincronizado
+    def adicionar(self, recorrência: Recorrência) -> Recorrência:
+        anterior = self._dados.get(recorrência.id)
+        if anterior is not None:
+            del self._por_sala[anterior.sala_id][anterior.id]
+        self._dados[recorrência.id] = recorrência
+        self._ultimo_id = max(self._ultimo_id, recorrência.id)
+        self._por_sala.setdefault(recorrência.sala_id, {})[recorrência.id] = None
+        return recorrência
+
+    @sincronizado
+    def criar(self, recorrência: Recorrência) -> Recorrência:
+        return self.adicionar(replace(recorrência, id=self._ultimo_id + 1))
+
+    @sincronizado
+    def atualizar(self, recorrência: Recorrência) -> Recorrência:
+        return self.adicionar(recorrência)
+
+    @sincronizado
+    def remover(self, recorrência_id: int) -> bool:
+        alvo = self._dados.pop(recorrência_id, None)
+        if alvo is None:
+            return False
+        del self._por_sala[alvo.sala_id][alvo.id]
+        return True
+
+    @sincronizado
+    def remover_por_sala(self, sala_id: int) -> list[Recorrência]:
+        return [self._dados.pop(rid) for rid in self._por_sala.pop(sala_id, ())]
+
+    @sincronizado
+    def obter_por_id(self, recorrência_id: int) -> Recorrência | None:
+        return self._dados.get(recorrência_id)
+
+    @sincronizado
+    def listar(self) -> list[Recorrência]:
+        return list(self._dados.values())
+
+    @sincronizado
+    def listar_por_sala(self, sala_id: int) -> list[Recorrência]:
+        return [self._dados[rid] for rid in self._por_sala.get(sala_id, ())]
+
+    @sincronizado
+    def _carregar(
+        self, recorrências: Iterable[Recorrência], último_id: int = 0
+    ) -> None:
+        """Acrescenta `recorrências` (ex.: lidas de um snapshot) e garante
+        que `proximo_id()` fique acima de `último_id`."""
+        for recorrência in recorrências:
+            # sem passar por sobrescritas de `adicionar` (ex.: o diário, que
+            # não deve registrar de novo o que está carregando)
+            MemRecorrênciaRepository.adicionar(self, recorrência)
+        self._ultimo_id = max(self._ultimo_id, último_id)
@@ -0,0 +1,513 @@
+"""Snapshot binário de largura fixa, lido via `mmap`, e um repositório de
+eventos que consulta o mapeamento sem carregá-lo.
+
+Abrir o snapshot só mapeia o arquivo e lê o cabeçalho (O(1), qualquer que
+seja o número de eventos): cada coluna é uma `memoryview` sobre o mapeamento,
+sem cópia, e um `Evento` só é montado quando uma consulta o devolve.
+
+Formato (little-endian, seções alinhadas em 8 bytes, na ordem abaixo):
+
+- cabeçalho (`_CABEÇALHO`): mágico, versão, quantidades de salas, eventos,
+  salas com eventos e textos, últimos ids usados, maior duração de evento
+  (minutos) e tamanho da tabela de textos;
+- salas, por id: `id`, `capacidade`, `nome` (int32 cada; `nome` é um índice
+  na tabela de textos);
+- eventos, por id: `id`, `sala_id`, `titulo` (int32) e `inicio`, `fim`
+  (int64, minutos desde 1970-01-01);
+- `ordem_global` (int32): posições dos eventos na ordem (inicio, sala_id, id);
+- `ordem_sala` (int32): posições na ordem (sala_id, inicio, id), então os
+  eventos de cada sala formam uma faixa contígua;
+- índice por sala, por sala_id: `sala_id`, início e tamanho da faixa em
+  `ordem_sala` (int32) e maior duração de evento da sala (int64, minutos);
+- textos: posição final de cada texto (int64) e os bytes UTF-8 em seguida.
+
+Datas são guardadas em minutos: gravar um evento com segundos é um erro.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager
+from datetime import datetime, timedelta
+from heapq import merge
+from itertools import islice
+from pathlib import Path
+
+from domínio.modelos import Evento, Sala
+from domínio.regras import validar_intervalo
+from domínio.repositórios import CursorEvento, EventoRepository
+from infra.repos_memória import MemEventoRepository
+from infra.travas import sincronizado
+
+
+_MÁGICO = b"SALASBIN"
+_VERSÃO = 1
+# mágico, versão, salas, eventos, salas com eventos, textos,
+# último id de sala, último id de evento, (alinhamento), maior duração,
+# bytes de texto
+_CABEÇALHO = struct.Struct("<8sIIIIIiiiqq")
+
+_EPOCA = datetime(1970, 1, 1)
+_MINUTO = timedelta(minutes=1)
+
+# colunas de cada seção: (nome, tipo do `array`)
+_SALAS = (("sala_id", "i"), ("sala_capacidade", "i"), ("sala_nome", "i"))
+_EVENTOS = (("id", "i"), ("sala", "i"), ("titulo", "i"), ("inicio", "q"), ("fim", "q"))
+_ORDENS = (("ordem_global", "i"), ("ordem_sala", "i"))
+_ÍNDICE = (
+    ("índice_sala", "i"),
+    ("índice_início", "i"),
+    ("índice_tamanho", "i"),
+    ("índice_duração", "q"),
+)
+
+assert array("i").itemsize == 4 and array("q").itemsize == 8
+
+
+def _para_minutos(dt: datetime) -> int:
+    minutos, resto = divmod(dt - _EPOCA, _MINUTO)
+    if resto:
+        raise ValueError(f"o snapshot binário guarda minutos; {dt} tem segundos")
+    return minutos
+
+
+def _piso(dt: datetime) -> int:
+    return (dt - _EPOCA) // _MINUTO
+
+
+def _teto(dt: datetime) -> int:
+    return -((_EPOCA - dt) // _MINUTO)
+
+
+def _alinhar(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _seções(
+    n_salas: int, n_eventos: int, n_índice: int, n_textos: int
+) -> tuple[dict[str, tuple[int, str, int]], int]:
+    """Posição, tipo e quantidade de cada coluna, e onde começam os bytes
+    dos textos (o leitor e o gravador usam o mesmo cálculo)."""
+    posição = _alinhar(_CABEÇALHO.size)
+    colunas: dict[str, tuple[int, str, int]] = {}
+    for grupo, n in (
+        (_SALAS, n_salas),
+        (_EVENTOS, n_eventos),
+        (_ORDENS, n_eventos),
+        (_ÍNDICE, n_índice),
+        ((("texto_fim", "q"),), n_textos),
+    ):
+        for nome, tipo in grupo:
+            colunas[nome] = (posição, tipo, n)
+            posição = _alinhar(posição + n * array(tipo).itemsize)
+    return colunas, posição
+
+
+def gravar_snapshot_binário(
+    caminho: str | os.PathLike[str],
+    salas: Iterable[Sala],
+    eventos: Iterable[Evento],
+    último_id_sala: int = 0,
+    último_id_evento: int = 0,
+) -> None:
+    """Grava salas e eventos no formato binário (ver o início do módulo).
+
+    O arquivo é gravado em um `.tmp` e renomeado. Lança ValueError para
+    datas com segundos e OverflowError para ids fora de int32.
+    """
+    salas = sorted(salas, key=lambda s: s.id)
+    eventos = sorted(eventos, key=lambda e: e.id)
+    textos: dict[str, int] = {}
+
+    def texto(t: str) -> int:
+        return textos.setdefault(t, len(textos))
+
+    colunas: dict[str, array] = {
+        nome: array(tipo) for nome, tipo in _SALAS + _EVENTOS + _ORDENS + _ÍNDICE
+    }
+    for s in salas:
+        colunas["sala_id"].append(s.id)
+        colunas["sala_capacidade"].append(s.capacidade)
+        colunas["sala_nome"].append(texto(s.nome))
+    for e in eventos:
+        colunas["id"].append(e.id)
+        colunas["sala"].append(e.sala_id)
+        colunas["titulo"].append(texto(e.titulo))
+        colunas["inicio"].append(_para_minutos(e.inicio))
+        colunas["fim"].append(_para_minutos(e.fim))
+
+    inicio, sala, ids = colunas["inicio"], colunas["sala"], colunas["id"]
+    posições = range(len(eventos))
+    colunas["ordem_global"].extend(
+        sorted(posições, key=lambda p: (inicio[p], sala[p], ids[p]))
+    )
+    ordem_sala = sorted(posições, key=lambda p: (sala[p], inicio[p], ids[p]))
+    colunas["ordem_sala"].extend(ordem_sala)
+    duração_global = 0
+    for k, p in enumerate(ordem_sala):
+        duração = colunas["fim"][p] - inicio[p]
+        duração_global = max(duração_global, duração)
+        if not colunas["índice_sala"] or colunas["índice_sala"][-1] != sala[p]:
+            colunas["índice_sala"].append(sala[p])
+            colunas["índice_início"].append(k)
+            colunas["índice_tamanho"].append(0)
+            colunas["índice_duração"].append(0)
+        colunas["índice_tamanho"][-1] += 1
+        colunas["índice_duração"][-1] = max(colunas["índice_duração"][-1], duração)
+
+    blob = bytearray()
+    colunas["texto_fim"] = array("q")
+    for t in textos:
+        blob += t.encode("utf-8")
+        colunas["texto_fim"].append(len(blob))
+
+    posições_seções, início_textos = _seções(
+        len(salas), len(eventos), len(colunas["índice_sala"]), len(textos)
+    )
+    if sys.byteorder != "little":
+        for valores in colunas.values():
+            valores.byteswap()
+    cabeçalho = _CABEÇALHO.pack(
+        _MÁGICO,
+        _VERSÃO,
+        len(salas),
+        len(eventos),
+        len(colunas["índice_sala"]),
+        len(textos),
+        max([último_id_sala] + [s.id for s in salas[-1:]]),
+        max([último_id_evento] + [e.id for e in eventos[-1:]]),
+        0,
+        duração_global,
+        len(blob),
+    )
+    temporário = Path(caminho).with_name(Path(caminho).name + ".tmp")
+    with open(temporário, "wb") as f:
+        f.write(cabeçalho)
+        for nome, (posição, _, _) in posições_seções.items():
+            f.write(b"\0" * (posição - f.tell()))
+            f.write(colunas[nome].tobytes())
+        f.write(b"\0" * (início_textos - f.tell()))
+        f.write(blob)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporário, caminho)
+
+
+class SnapshotBinário:
+    """Leitura de um snapshot binário mapeado em memória (somente leitura).
+
+    As colunas são `memoryview`s sobre o mapeamento; os métodos devolvem
+    posições de eventos (índices nas colunas) e `evento(p)` monta o `Evento`
+    da posição `p`.
+    """
+
+    def __init__(self, caminho: str | os.PathLike[str]) -> None:
+        if sys.byteorder != "little":
+            raise ValueError("snapshot binário só é lido em máquinas little-endian")
+        with open(caminho, "rb") as f:
+            self._mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            mágico,
+            versão,
+            self.n_salas,
+            self.n_eventos,
+            n_índice,
+            n_textos,
+            self.último_id_sala,
+            self.último_id_evento,
+            _,
+            duração_global,
+            tamanho_textos,
+        ) = _CABEÇALHO.unpack_from(self._mapa)
+        if mágico != _MÁGICO or versão != _VERSÃO:
+            self._mapa.close()
+            raise ValueError(f"não é um snapshot binário (versão {_VERSÃO}): {caminho}")
+        colunas, início_textos = _seções(
+            self.n_salas, self.n_eventos, n_índice, n_textos
+        )
+        if início_textos + tamanho_textos != len(self._mapa):
+            self._mapa.close()
+            raise ValueError(f"snapshot binário truncado: {caminho}")
+
+        bruto = memoryview(self._mapa)
+        self._views = [bruto]
+        c: dict[str, memoryview] = {}
+        for nome, (posição, tipo, n) in colunas.items():
+            c[nome] = bruto[posição : posição + n * array(tipo).itemsize].cast(tipo)
+        self._textos = bruto[início_textos:]
+        self._views += [*c.values(), self._textos]
+
+        self._sala_id, self._sala_cap, self._sala_nome = (
+            c["sala_id"],
+            c["sala_capacidade"],
+            c["sala_nome"],
+        )
+        self._id, self._sala, self._titulo = c["id"], c["sala"], c["titulo"]
+        self._inicio, self._fim = c["inicio"], c["fim"]
+        self._ordem_global, self._ordem_sala = c["ordem_global"], c["ordem_sala"]
+        self._índice_sala, self._índice_início = c["índice_sala"], c["índice_início"]
+        self._índice_tamanho, self._índice_duração = (
+            c["índice_tamanho"],
+            c["índice_duração"],
+        )
+        self._texto_fim = c["texto_fim"]
+        self._duração_global = duração_global
+        self._cache_textos: dict[int, str] = {}
+
+    def fechar(self) -> None:
+        """Libera as views e desfaz o mapeamento."""
+        for v in reversed(self._views):
+            v.release()
+        self._mapa.close()
+
+    # --- entidades ---
+
+    def _texto(self, i: int) -> str:
+        t = self._cache_textos.get(i)
+        if t is None:
+            início = self._texto_fim[i - 1] if i else 0
+            t = str(self._textos[início : self._texto_fim[i]], "utf-8")
+            self._cache_textos[i] = t
+        return t
+
+    def salas(self) -> Iterator[Sala]:
+        for k in range(self.n_salas):
+            yield Sala(
+                self._sala_id[k], self._texto(self._sala_nome[k]), self._sala_cap[k]
+            )
+
+    def evento(self, p: int) -> Evento:
+        return Evento(
+            self._id[p],
+            self._sala[p],
+            self._texto(self._titulo[p]),
+            _EPOCA + self._inicio[p] * _MINUTO,
+            _EPOCA + self._fim[p] * _MINUTO,
+        )
+
+    def chave(self, p: int) -> CursorEvento:
+        return (_EPOCA + self._inicio[p] * _MINUTO, self._sala[p], self._id[p])
+
+    def id_de(self, p: int) -> int:
+        return self._id[p]
+
+    # --- posições ---
+
+    def posição(self, evento_id: int) -> int | None:
+        p = bisect_left(self._id, evento_id)
+        if p < self.n_eventos and self._id[p] == evento_id:
+            return p
+        return None
+
+    def posições(self) -> range:
+        """Todas as posições, por id."""
+        return range(self.n_eventos)
+
+    def _faixa_da_sala(self, sala_id: int) -> tuple[int, int, int]:
+        k = bisect_left(self._índice_sala, sala_id)
+        if k == len(self._índice_sala) or self._índice_sala[k] != sala_id:
+            return 0, 0, 0
+        início = self._índice_início[k]
+        return início, início + self._índice_tamanho[k], self._índice_duração[k]
+
+    def posições_da_sala(self, sala_id: int) -> Iterator[int]:
+        """Posições dos eventos da sala, por (inicio, id)."""
+        início, fim, _ = self._faixa_da_sala(sala_id)
+        return iter(self._ordem_sala[início:fim])
+
+    def posições_no_intervalo(
+        self, inicio: datetime, fim: datetime, sala_id: int | None = None
+    ) -> Iterator[int]:
+        """Posições dos eventos que se sobrepõem a [inicio, fim), por
+        (inicio, sala_id, id): só visita quem começa em
+        (inicio - maior duração, fim), como os índices em memória."""
+        if sala_id is None:
+            ordem, lo, hi, duração = (
+                self._ordem_global,
+                0,
+                self.n_eventos,
+                self._duração_global,
+            )
+        else:
+            ordem = self._ordem_sala
+            lo, hi, duração = self._faixa_da_sala(sala_id)
+        # comparações em minutos inteiros: m < fim <=> m < teto(fim) e
+        # m > inicio <=> m > piso(inicio)
+        até, após = _teto(fim), _piso(inicio)
+        primeiro = bisect_left(
+            ordem, _teto(inicio) - duração, lo, hi, key=self._inicio.__getitem__
+        )
+        for p in ordem[primeiro:hi]:
+            if self._inicio[p] >= até:
+                break
+            if self._fim[p] > após:
+                yield p
+
+    def posições_após(self, após: CursorEvento | None) -> Iterator[int]:
+        """Posições na ordem (inicio, sala_id, id), depois do cursor `após`."""
+        k = 0
+        if após is not None:
+            k = bisect_right(self._ordem_global, após, key=self.chave)
+        return iter(self._ordem_global[k:])
+
+
+class MmapEventoRepository(EventoRepository):
+    """EventoRepository sobre um `SnapshotBinário`, com escritas em memória.
+
+    As consultas leem direto do mapeamento e só montam os eventos que
+    devolvem. Escritas feitas depois de abrir ficam em um
+    `MemEventoRepository` (`_escritas`); eventos do snapshot alterados ou
+    removidos entram em `_ocultos` e deixam de ser lidos do mapeamento. Os
+    resultados das duas fontes são intercalados na ordem de cada consulta.
+    Para persistir as escritas, grave um snapshot novo
+    (`gravar_snapshot_binário(caminho, salas, repo.listar())`).
+    """
+
+    def __init__(self, snapshot: SnapshotBinário) -> None:
+        self._trava = threading.RLock()
+        self._base = snapshot
+        self._escritas = MemEventoRepository()
+        self._escritas._carregar((), snapshot.último_id_evento)
+        self._ocultos: set[int] = set()
+
+    def fechar(self) -> None:
+        self._base.fechar()
+
+    def _visíveis(self, posições: Iterable[int]) -> Iterator[Evento]:
+        ocultos, base = self._ocultos, self._base
+        for p in posições:
+            if not ocultos or base.id_de(p) not in ocultos:
+                yield base.evento(p)
+
+    # --- escrita ---
+
+    def travar_salas(self, *sala_ids: int) -> AbstractContextManager[None]:
+        return self._escritas.travar_salas(*sala_ids)
+
+    def proximo_id(self) -> int:
+        return self._escritas.proximo_id()
+
+    def criar(
+        self, sala_id: int, titulo: str, inicio: datetime, fim: datetime
+    ) -> Evento:
+        # ids novos começam depois do último id do snapshot
+        return self._escritas.criar(sala_id, titulo, inicio, fim)
+
+    def criar_em_lote(
+        self, dados: Iterable[tuple[int, str, datetime, datetime]]
+    ) -> list[Evento]:
+        return self._escritas.criar_em_lote(dados)
+
+    @sincronizado
+    def adicionar(self, evento: Evento) -> Evento:
+        if self._base.posição(evento.id) is not None:
+            self._ocultos.add(evento.id)
+        return self._escritas.adicionar(evento)
+
+    def atualizar(self, evento: Evento) -> Evento:
+        return self.adicionar(evento)
+
+    @sincronizado
+    def remover(self, evento_id: int) -> bool:
+        if self._escritas.remover(evento_id):
+            return True
+        if evento_id in self._ocultos or self._base.posição(evento_id) is None:
+            return False
+        self._ocultos.add(evento_id)
+        return True
+
+    # --- leitura ---
+
+    @sincronizado
+    def obter_por_id(self, evento_id: int) -> Evento | None:
+        if evento_id in self._ocultos:
+            return self._escritas.obter_por_id(evento_id)
+        p = self._base.posição(evento_id)
+        if p is None:
+            return self._escritas.obter_por_id(evento_id)
+        return self._base.evento(p)
+
+    @sincronizado
+    def listar(self) -> list[Evento]:
+        # snapshot por id (com as alterações no lugar), depois os novos
+        resultado = []
+        for p in self._base.posições():
+            eid = self._base.id_de(p)
+            if eid not in self._ocultos:
+                resultado.append(self._base.evento(p))
+            elif (e := self._escritas.obter_por_id(eid)) is not None:
+                resultado.append(e)
+        alterados = self._ocultos
+        resultado.extend(e for e in self._escritas.listar() if e.id not in alterados)
+        return resultado
+
+    @sincronizado
+    def listar_por_sala(self, sala_id: int) -> list[Evento]:
+        return list(
+            merge(
+                self._visíveis(self._base.posições_da_sala(sala_id)),
+                self._escritas.listar_por_sala(sala_id),
+                key=lambda e: (e.inicio, e.id),
+            )
+        )
+
+    @sincronizado
+    def listar_pagina(
+        self, limite: int, após: CursorEvento | None = None
+    ) -> list[Evento]:
+        return list(
+            islice(
+                merge(
+                    self._visíveis(self._base.posições_após(após)),
+                    self._escritas.listar_pagina(limite, após),
+                    key=lambda e: (e.inicio, e.sala_id, e.id),
+                ),
+                max(limite, 0),
+            )
+        )
+
+    def iterar_ordenado(self, tamanho_lote: int = 1000) -> Iterator[Evento]:
+        após: CursorEvento | None = None
+        while página := self.listar_pagina(tamanho_lote, após):
+            yield from página
+            último = página[-1]
+            após = (último.inicio, último.sala_id, último.id)
+
+    @sincronizado
+    def listar_no_intervalo(
+        self, inicio: datetime, fim: datetime, sala_id: int | None = None
+    ) -> list[Evento]:
+        if not validar_intervalo(inicio, fim):
+            return []
+        return list(
+            merge(
+                self._visíveis(self._base.posições_no_intervalo(inicio, fim, sala_id)),
+                self._escritas.listar_no_intervalo(inicio, fim, sala_id),
+                key=lambda e: (e.inicio, e.sala_id, e.id),
+            )
+        )
+
+    @sincronizado
+    def encontrar_conflito(
+        self,
+        sala_id: int,
+        inicio: datetime,
+        fim: datetime,
+        ignorar_evento_id: int | None = None,
+    ) -> Evento | None:
+        if not validar_intervalo(inicio, fim):
+            return None
+        conflito = self._escritas.encontrar_conflito(
+            sala_id, inicio, fim, ignorar_evento_id
+        )
+        if conflito is not None:
+            return conflito
+        for e in self._visíveis(self._base.posições_no_intervalo(inicio, fim, sala_id)):
+            if e.id != ignorar_evento_id:
+                return e
+        return None
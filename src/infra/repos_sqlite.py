@@ -0,0 +1,573 @@
+"""Repositórios persistentes usando o `sqlite3` da biblioteca padrão.
+
+Datas são gravadas como inteiros (microssegundos desde 1970-01-01, sem fuso),
+o que mantém a ordenação natural e permite aritmética direto no SQL. A tabela
+de eventos tem índice composto em (sala_id, inicio, fim), então a checagem de
+conflito vira uma única consulta indexada.
+"""
+
+import os
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator
+
+from domínio.modelos import Sala, Evento, Frequência, Recorrência
+from domínio.regras import validar_intervalo
+from domínio.repositórios import (
+    SalaRepository,
+    EventoRepository,
+    RecorrênciaRepository,
+    CursorEvento,
+)
+
+
+_EPOCA = datetime(1970, 1, 1)
+_MICROSSEGUNDO = timedelta(microseconds=1)
+
+
+def _para_int(dt: datetime) -> int:
+    return (dt - _EPOCA) // _MICROSSEGUNDO
+
+
+def _de_int(valor: int) -> datetime:
+    return _EPOCA + timedelta(microseconds=valor)
+
+
+def conectar(caminho: str | os.PathLike[str] = ":memory:") -> sqlite3.Connection:
+    """Abre (ou cria) o banco SQLite em `caminho`."""
+    return sqlite3.connect(caminho)
+
+
+def _proximo_id(con: sqlite3.Connection, tabela: str) -> int:
+    # Com AUTOINCREMENT o SQLite guarda o maior id já usado em `sqlite_sequence`,
+    # então ids removidos não são reutilizados (mesmo contrato dos repos em memória).
+    linha = con.execute(
+        "SELECT seq FROM sqlite_sequence WHERE name = ?", (tabela,)
+    ).fetchone()
+    return (linha[0] + 1) if linha else 1
+
+
+class SQLiteSalaRepository(SalaRepository):
+    """Implementação de SalaRepository sobre uma conexão SQLite."""
+
+    def __init__(self, conexão: sqlite3.Connection) -> None:
+        self._con = conexão
+        with self._con:
+            self._con.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS salas (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    nome TEXT NOT NULL,
+                    capacidade INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_salas_capacidade
+                    ON salas (capacidade, id);
+                """
+            )
+
+    def proximo_id(self) -> int:
+        return _proximo_id(self._con, "salas")
+
+    def adicionar(self, sala: Sala) -> Sala:
+        with self._con:
+            self._con.execute(
+                "INSERT INTO salas (id, nome, capacidade) VALUES (?, ?, ?)",
+                (sala.id, sala.nome, sala.capacidade),
+            )
+        return sala
+
+    def obter_por_id(self, sala_id: int) -> Sala | None:
+        linha = self._con.execute(
+            "SELECT id, nome, capacidade FROM salas WHERE id = ?", (sala_id,)
+        ).fetchone()
+        return Sala(*linha) if linha else None
+
+    def listar(self) -> list[Sala]:
+        cur = self._con.execute("SELECT id, nome, capacidade FROM salas ORDER BY id")
+        return [Sala(*linha) for linha in cur]
+
+    def remover(self, sala_id: int) -> bool:
+        with self._con:
+            cur = self._con.execute("DELETE FROM salas WHERE id = ?", (sala_id,))
+        return cur.rowcount > 0
+
+    def atualizar(self, sala: Sala) -> Sala:
+        with self._con:
+            self._con.execute(
+                """
+                INSERT INTO salas (id, nome, capacidade) VALUES (?, ?, ?)
+                ON CONFLICT (id) DO UPDATE
+                SET nome = excluded.nome, capacidade = excluded.capacidade
+                """,
+                (sala.id, sala.nome, sala.capacidade),
+            )
+        return sala
+
+    def listar_por_capacidade_mínima(self, capacidade_min: int) -> list[Sala]:
+        cur = self._con.execute(
+            "SELECT id, nome, capacidade FROM salas"
+            " WHERE capacidade >= ? ORDER BY capacidade, id",
+            (capacidade_min,),
+        )
+        return [Sala(*linha) for linha in cur]
+
+    def listar_pagina(self, limite: int, após: int | None = None) -> list[Sala]:
+        cur = self._con.execute(
+            "SELECT id, nome, capacidade FROM salas WHERE id > ? ORDER BY id LIMIT ?",
+            (0 if após is None else após, max(limite, 0)),
+        )
+        return [Sala(*linha) for linha in cur]
+
+    def iterar_ordenado(self, tamanho_lote: int = 1000) -> Iterator[Sala]:
+        após: int | None = None
+        while página := self.listar_pagina(tamanho_lote, após):
+            yield from página
+            após = página[-1].id
+
+
+# Os textos SQL abaixo são modelos: `{tabela}` é a tabela de eventos do
+# repositório (ver `SQLiteEventoRepository`).
+
+# Sobreposição com [:inicio, :fim) na sala. O limite inferior usa a maior
+# duração registrada na sala, para que o índice (sala_id, inicio, fim)
+# percorra só os eventos que começam em (inicio - duração_máx, fim).
+_FILTRO_CONFLITO = """
+    sala_id = :sala_id
+    AND inicio < :fim
+    AND inicio > :inicio - COALESCE(
+        (SELECT duracao FROM {tabela}_duracao_max WHERE sala_id = :sala_id), 0
+    )
+    AND fim > :inicio
+    AND id IS NOT :ignorar
+"""
+
+# Eventos que se sobrepõem a [:inicio, :fim), na ordem de listagem. Como em
+# _FILTRO_CONFLITO, a maior duração registrada limita por baixo a faixa de
+# `inicio` percorrida: com sala, no índice (sala_id, inicio, fim); sem sala,
+# no índice (inicio, sala_id, id) com a maior duração entre todas as salas.
+_SQL_NO_INTERVALO_SALA = """
+    SELECT id, sala_id, titulo, inicio, fim FROM {tabela}
+    WHERE sala_id = :sala_id
+      AND inicio < :fim
+      AND inicio > :inicio - COALESCE(
+          (SELECT duracao FROM {tabela}_duracao_max WHERE sala_id = :sala_id), 0
+      )
+      AND fim > :inicio
+    ORDER BY inicio, id
+"""
+
+_SQL_NO_INTERVALO = """
+    SELECT id, sala_id, titulo, inicio, fim FROM {tabela}
+    WHERE inicio < :fim
+      AND inicio > :inicio - COALESCE(
+          (SELECT MAX(duracao) FROM {tabela}_duracao_max), 0
+      )
+      AND fim > :inicio
+    ORDER BY inicio, sala_id, id
+"""
+
+_SQL_DURACAO_MAX = """
+    INSERT INTO {tabela}_duracao_max (sala_id, duracao) VALUES (?, ?)
+    ON CONFLICT (sala_id) DO UPDATE SET duracao = MAX(duracao, excluded.duracao)
+"""
+
+# Depois de remover (ou mudar) um evento de :duracao na sala, refaz a maior
+# duração da sala se ele podia ser o mais longo; o MAX sai do índice
+# (sala_id, fim - inicio) sem percorrer os eventos da sala.
+_SQL_RECALCULAR_DURACAO = """
+    UPDATE {tabela}_duracao_max
+    SET duracao = (
+        SELECT COALESCE(MAX(fim - inicio), 0) FROM {tabela} WHERE sala_id = :sala_id
+    )
+    WHERE sala_id = :sala_id AND duracao <= :duracao
+"""
+
+
+def _evento(linha: tuple) -> Evento:
+    eid, sala_id, titulo, inicio, fim = linha
+    return Evento(
+        id=eid,
+        sala_id=sala_id,
+        titulo=titulo,
+        inicio=_de_int(inicio),
+        fim=_de_int(fim),
+    )
+
+
+class SQLiteEventoRepository(EventoRepository):
+    """Implementação de EventoRepository sobre uma conexão SQLite.
+
+    `tabela` permite guardar outro conjunto de eventos na mesma conexão (o
+    arquivo de eventos de salas removidas usa "eventos_arquivados"); cada
+    tabela tem os próprios índices e a sua tabela `<tabela>_duracao_max`.
+    """
+
+    def __init__(self, conexão: sqlite3.Connection, tabela: str = "eventos") -> None:
+        if not tabela.isidentifier():
+            raise ValueError(f"nome de tabela inválido: {tabela!r}")
+        self._con = conexão
+        self._tabela = tabela
+        self._filtro_conflito = _FILTRO_CONFLITO.format(tabela=tabela)
+        self._sql_no_intervalo = _SQL_NO_INTERVALO.format(tabela=tabela)
+        self._sql_no_intervalo_sala = _SQL_NO_INTERVALO_SALA.format(tabela=tabela)
+        self._sql_duracao_max = _SQL_DURACAO_MAX.format(tabela=tabela)
+        self._sql_recalcular_duracao = _SQL_RECALCULAR_DURACAO.format(tabela=tabela)
+        with self._con:
+            self._con.executescript(
+                f"""
+                CREATE TABLE IF NOT EXISTS {tabela} (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    sala_id INTEGER NOT NULL,
+                    titulo TEXT NOT NULL,
+                    inicio INTEGER NOT NULL,
+                    fim INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_{tabela}_sala_periodo
+                    ON {tabela} (sala_id, inicio, fim);
+                CREATE INDEX IF NOT EXISTS idx_{tabela}_ordem
+                    ON {tabela} (inicio, sala_id, id);
+                CREATE INDEX IF NOT EXISTS idx_{tabela}_sala_duracao
+                    ON {tabela} (sala_id, (fim - inicio));
+                CREATE TABLE IF NOT EXISTS {tabela}_duracao_max (
+                    sala_id INTEGER PRIMARY KEY,
+                    duracao INTEGER NOT NULL
+                );
+                """
+            )
+
+    def proximo_id(self) -> int:
+        return _proximo_id(self._con, self._tabela)
+
+    def _gravar(self, evento: Evento, sql: str) -> None:
+        inicio, fim = _para_int(evento.inicio), _para_int(evento.fim)
+        with self._con:
+            anterior = self._sala_e_duração(evento.id)
+            self._con.execute(
+                sql, (evento.id, evento.sala_id, evento.titulo, inicio, fim)
+            )
+            self._con.execute(self._sql_duracao_max, (evento.sala_id, fim - inicio))
+            if anterior is not None:
+                self._recalcular_duração(*anterior)
+
+    def _sala_e_duração(self, evento_id: int) -> tuple[int, int] | None:
+        return self._con.execute(
+            f"SELECT sala_id, fim - inicio FROM {self._tabela} WHERE id = ?",
+            (evento_id,),
+        ).fetchone()
+
+    def _recalcular_duração(self, sala_id: int, duração: int) -> None:
+        self._con.execute(
+            self._sql_recalcular_duracao, {"sala_id": sala_id, "duracao": duração}
+        )
+
+    def adicionar(self, evento: Evento) -> Evento:
+        self._gravar(
+            evento,
+            f"INSERT INTO {self._tabela} (id, sala_id, titulo, inicio, fim)"
+            " VALUES (?, ?, ?, ?, ?)",
+        )
+        return evento
+
+    def adicionar_em_lote(self, eventos: Iterable[Evento]) -> list[Evento]:
+        novos = list(eventos)
+        linhas = [
+            (e.id, e.sala_id, e.titulo, _para_int(e.inicio), _para_int(e.fim))
+            for e in novos
+        ]
+        # uma única transação para todo o lote
+        with self._con:
+            self._con.executemany(
+                f"INSERT INTO {self._tabela} (id, sala_id, titulo, inicio, fim)"
+                " VALUES (?, ?, ?, ?, ?)",
+                linhas,
+            )
+            self._con.executemany(
+                self._sql_duracao_max,
+                [(sala_id, fim - inicio) for _, sala_id, _, inicio, fim in linhas],
+            )
+        return novos
+
+    def atualizar(self, evento: Evento) -> Evento:
+        self._gravar(
+            evento,
+            f"""
+            INSERT INTO {self._tabela} (id, sala_id, titulo, inicio, fim)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (id) DO UPDATE
+            SET sala_id = excluded.sala_id, titulo = excluded.titulo,
+                inicio = excluded.inicio, fim = excluded.fim
+            """,
+        )
+        return evento
+
+    def remover(self, evento_id: int) -> bool:
+        with self._con:
+            anterior = self._sala_e_duração(evento_id)
+            if anterior is None:
+                return False
+            self._con.execute(f"DELETE FROM {self._tabela} WHERE id = ?", (evento_id,))
+            self._recalcular_duração(*anterior)
+        return True
+
+    def remover_por_sala(self, sala_id: int) -> list[Evento]:
+        # leitura e remoção na mesma transação, pelo índice (sala_id, ...)
+        with self._con:
+            removidos = self.listar_por_sala(sala_id)
+            self._con.execute(
+                f"DELETE FROM {self._tabela} WHERE sala_id = ?", (sala_id,)
+            )
+            self._con.execute(
+                f"DELETE FROM {self._tabela}_duracao_max WHERE sala_id = ?", (sala_id,)
+            )
+        return removidos
+
+    def obter_por_id(self, evento_id: int) -> Evento | None:
+        linha = self._con.execute(
+            f"SELECT id, sala_id, titulo, inicio, fim FROM {self._tabela} WHERE id = ?",
+            (evento_id,),
+        ).fetchone()
+        return _evento(linha) if linha else None
+
+    def listar(self) -> list[Evento]:
+        cur = self._con.execute(
+            f"SELECT id, sala_id, titulo, inicio, fim FROM {self._tabela} ORDER BY id"
+        )
+        return [_evento(linha) for linha in cur]
+
+    def listar_por_sala(self, sala_id: int) -> list[Evento]:
+        cur = self._con.execute(
+            f"SELECT id, sala_id, titulo, inicio, fim FROM {self._tabela}"
+            " WHERE sala_id = ? ORDER BY inicio, id",
+            (sala_id,),
+        )
+        return [_evento(linha) for linha in cur]
+
+    def listar_pagina(
+        self, limite: int, após: CursorEvento | None = None
+    ) -> list[Evento]:
+        if após is None:
+            cur = self._con.execute(
+                f"SELECT id, sala_id, titulo, inicio, fim FROM {self._tabela}"
+                " ORDER BY inicio, sala_id, id LIMIT ?",
+                (max(limite, 0),),
+            )
+        else:
+            inicio, sala_id, eid = após
+            # comparação de "row values" usa o índice (inicio, sala_id, id)
+            cur = self._con.execute(
+                f"SELECT id, sala_id, titulo, inicio, fim FROM {self._tabela}"
+                " WHERE (inicio, sala_id, id) > (?, ?, ?)"
+                " ORDER BY inicio, sala_id, id LIMIT ?",
+                (_para_int(inicio), sala_id, eid, max(limite, 0)),
+            )
+        return [_evento(linha) for linha in cur]
+
+    def iterar_ordenado(self, tamanho_lote: int = 1000) -> Iterator[Evento]:
+        após: CursorEvento | None = None
+        while página := self.listar_pagina(tamanho_lote, após):
+            yield from página
+            último = página[-1]
+            após = (último.inicio, último.sala_id, último.id)
+
+    def listar_no_intervalo(
+        self, inicio: datetime, fim: datetime, sala_id: int | None = None
+    ) -> list[Evento]:
+        if not validar_intervalo(inicio, fim):
+            return []
+        cur = self._con.execute(
+            self._sql_no_intervalo if sala_id is None else self._sql_no_intervalo_sala,
+            {"sala_id": sala_id, "inicio": _para_int(inicio), "fim": _para_int(fim)},
+        )
+        return [_evento(linha) for linha in cur]
+
+    def encontrar_conflito(
+        self,
+        sala_id: int,
+        inicio: datetime,
+        fim: datetime,
+        ignorar_evento_id: int | None = None,
+    ) -> Evento | None:
+        if not validar_intervalo(inicio, fim):
+            return None
+        linha = self._con.execute(
+            f"SELECT id, sala_id, titulo, inicio, fim FROM {self._tabela}"
+            f" WHERE {self._filtro_conflito} ORDER BY inicio, id LIMIT 1",
+            self._parâmetros(sala_id, inicio, fim, ignorar_evento_id),
+        ).fetchone()
+        return _evento(linha) if linha else None
+
+    def existe_sobreposição(
+        self,
+        sala_id: int,
+        inicio: datetime,
+        fim: datetime,
+        ignorar_evento_id: int | None = None,
+    ) -> bool:
+        if not validar_intervalo(inicio, fim):
+            return False
+        (existe,) = self._con.execute(
+            f"SELECT EXISTS (SELECT 1 FROM {self._tabela}"
+            f" WHERE {self._filtro_conflito})",
+            self._parâmetros(sala_id, inicio, fim, ignorar_evento_id),
+        ).fetchone()
+        return bool(existe)
+
+    @staticmethod
+    def _parâmetros(
+        sala_id: int, inicio: datetime, fim: datetime, ignorar_evento_id: int | None
+    ) -> dict:
+        return {
+            "sala_id": sala_id,
+            "inicio": _para_int(inicio),
+            "fim": _para_int(fim),
+            "ignorar": ignorar_evento_id,
+        }
+
+
+_COLUNAS_RECORRENCIA = (
+    "id, sala_id, titulo, inicio, fim, frequencia, intervalo, ate, excecoes"
+)
+
+
+_SQL_INSERIR_RECORRENCIA = """
+    INSERT INTO recorrencias (
+        id, sala_id, titulo, inicio, fim, frequencia, intervalo, ate,
+        fim_vigencia, excecoes
+    ) VALUES (
+        :id, :sala_id, :titulo, :inicio, :fim, :frequencia, :intervalo, :ate,
+        :fim_vigencia, :excecoes
+    )
+"""
+
+
+def _recorrência(linha: tuple) -> Recorrência:
+    rid, sala_id, titulo, inicio, fim, frequência, intervalo, até, exceções = linha
+    return Recorrência(
+        id=rid,
+        sala_id=sala_id,
+        titulo=titulo,
+        inicio=_de_int(inicio),
+        fim=_de_int(fim),
+        frequência=Frequência[frequência],
+        até=_de_int(até),
+        intervalo=intervalo,
+        exceções=frozenset(_de_int(int(x)) for x in exceções.split()),
+    )
+
+
+class SQLiteRecorrênciaRepository(RecorrênciaRepository):
+    """Implementação de RecorrênciaRepository sobre uma conexão SQLite.
+
+    Uma linha por regra; as exceções vão numa coluna de texto (inteiros
+    separados por espaço). A coluna `fim_vigencia` permite achar, por índice,
+    as regras que podem ter ocorrências numa janela.
+    """
+
+    def __init__(self, conexão: sqlite3.Connection) -> None:
+        self._con = conexão
+        with self._con:
+            self._con.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS recorrencias (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    sala_id INTEGER NOT NULL,
+                    titulo TEXT NOT NULL,
+                    inicio INTEGER NOT NULL,
+                    fim INTEGER NOT NULL,
+                    frequencia TEXT NOT NULL,
+                    intervalo INTEGER NOT NULL,
+                    ate INTEGER NOT NULL,
+                    fim_vigencia INTEGER NOT NULL,
+                    excecoes TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_recorrencias_sala_vigencia
+                    ON recorrencias (sala_id, inicio, fim_vigencia);
+                """
+            )
+
+    def proximo_id(self) -> int:
+        return _proximo_id(self._con, "recorrencias")
+
+    def _gravar(self, r: Recorrência, sql: str) -> None:
+        with self._con:
+            self._con.execute(
+                sql,
+                {
+                    "id": r.id,
+                    "sala_id": r.sala_id,
+                    "titulo": r.titulo,
+                    "inicio": _para_int(r.inicio),
+                    "fim": _para_int(r.fim),
+                    "frequencia": r.frequência.name,
+                    "intervalo": r.intervalo,
+                    "ate": _para_int(r.até),
+                    "fim_vigencia": _para_int(r.fim_da_vigência),
+                    "excecoes": " ".join(str(_para_int(x)) for x in sorted(r.exceções)),
+                },
+            )
+
+    def adicionar(self, recorrência: Recorrência) -> Recorrência:
+        self._gravar(recorrência, _SQL_INSERIR_RECORRENCIA)
+        return recorrência
+
+    def atualizar(self, recorrência: Recorrência) -> Recorrência:
+        self._gravar(
+            recorrência,
+            _SQL_INSERIR_RECORRENCIA
+            + """
+            ON CONFLICT (id) DO UPDATE
+            SET sala_id = excluded.sala_id, titulo = excluded.titulo,
+                inicio = excluded.inicio, fim = excluded.fim,
+                frequencia = excluded.frequencia, intervalo = excluded.intervalo,
+                ate = excluded.ate, fim_vigencia = excluded.fim_vigencia,
+                excecoes = excluded.excecoes
+            """,
+        )
+        return recorrência
+
+    def remover(self, recorrência_id: int) -> bool:
+        with self._con:
+            cur = self._con.execute(
+                "DELETE FROM recorrencias WHERE id = ?", (recorrência_id,)
+            )
+        return cur.rowcount > 0
+
+    def remover_por_sala(self, sala_id: int) -> list[Recorrência]:
+        with self._con:
+            removidas = self.listar_por_sala(sala_id)
+            self._con.execute("DELETE FROM recorrencias WHERE sala_id = ?", (sala_id,))
+        return removidas
+
+    def obter_por_id(self, recorrência_id: int) -> Recorrência | None:
+        linha = self._con.execute(
+            f"SELECT {_COLUNAS_RECORRENCIA} FROM recorrencias WHERE id = ?",
+            (recorrência_id,),
+        ).fetchone()
+        return _recorrência(linha) if linha else None
+
+    def listar(self) -> list[Recorrência]:
+        cur = self._con.execute(
+            f"SELECT {_COLUNAS_RECORRENCIA} FROM recorrencias ORDER BY id"
+        )
+        return [_recorrência(linha) for linha in cur]
+
+    def listar_por_sala(self, sala_id: int) -> list[Recorrência]:
+        cur = self._con.execute(
+            f"SELECT {_COLUNAS_RECORRENCIA} FROM recorrencias"
+            " WHERE sala_id = ? ORDER BY id",
+            (sala_id,),
+        )
+        return [_recorrência(linha) for linha in cur]
+
+    def listar_ativas_no_intervalo(
+        self, inicio: datetime, fim: datetime, sala_id: int | None = None
+    ) -> list[Recorrência]:
+        filtro = "inicio < :fim AND fim_vigencia > :inicio"
+        if sala_id is not None:
+            filtro = "sala_id = :sala_id AND " + filtro
+        cur = self._con.execute(
+            f"SELECT {_COLUNAS_RECORRENCIA} FROM recorrencias"
+            f" WHERE {filtro} ORDER BY id",
+            {"sala_id": sala_id, "inicio": _para_int(inicio), "fim": _para_int(fim)},
+        )
+        return [_recorrência(linha) for linha in cur]
@@ -0,0 +1,60 @@
+"""Travas (locks) usadas pelos repositórios em memória para uso com threads.
+
+Dois níveis:
+- `sincronizado`: protege as estruturas internas de um repositório (dicts e
+  índices) durante cada chamada, por uma trava curta do próprio objeto;
+- `TravasPorSala`: uma trava por sala, que os serviços seguram durante a
+  sequência "checa conflito -> grava". Agendamentos em salas diferentes não
+  disputam a mesma trava.
+"""
+
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, TypeVar
+
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def sincronizado(método: _F) -> _F:
+    """Executa o método segurando `self._trava`."""
+
+    @wraps(método)
+    def envoltório(self, *args, **kwargs):
+        with self._trava:
+            return método(self, *args, **kwargs)
+
+    return envoltório  # type: ignore[return-value]
+
+
+class TravasPorSala:
+    """Cria sob demanda e entrega uma trava (`threading.Lock`) por sala."""
+
+    def __init__(self) -> None:
+        self._travas: dict[int, threading.Lock] = {}
+        self._criação = threading.Lock()
+
+    def _trava(self, sala_id: int) -> threading.Lock:
+        trava = self._travas.get(sala_id)
+        if trava is None:
+            with self._criação:
+                trava = self._travas.setdefault(sala_id, threading.Lock())
+        return trava
+
+    @contextmanager
+    def travar(self, *sala_ids: int) -> Iterator[None]:
+        """Segura as travas das salas informadas até o fim do bloco.
+
+        As travas são adquiridas em ordem crescente de id (e sem repetição),
+        então duas threads travando as mesmas salas nunca entram em deadlock.
+        """
+        travas = [self._trava(sid) for sid in sorted(set(sala_ids))]
+        for t in travas:
+            t.acquire()
+        try:
+            yield
+        finally:
+            for t in reversed(travas):
+                t.release()
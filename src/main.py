@@ -1,16 +1,41 @@
-from datetime import datetime
+import sys
+from itertools import chain
+from typing import TYPE_CHECKING
 
 # Integração com a camada de domínio (DDD), agora sem variáveis globais de dados.
-from domínio.repositórios import (
-    SalaRepository as _SalaRepository,
-    EventoRepository as _EventoRepository,
-)
-from app.container import criar_container_memória as _criar_container_memória
-from app import fachada as _fachada
+# Fachada, container e repositórios são importados só no primeiro uso: abrir o
+# menu (ou rodar um comando que não toca nos dados) não paga por eles.
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from app.container import Container
+    from domínio.repositórios import (
+        SalaRepository as _SalaRepository,
+        EventoRepository as _EventoRepository,
+    )
+
+# Container de repositórios, criado no primeiro uso (`_obter_container`). Ao
+# recarregar o módulo (usado nos testes), o estado é isolado automaticamente,
+# substituindo as antigas listas globais.
+_container: "Container | None" = None
+# Instrumentação de desempenho (opção 10 do menu); None enquanto desligada.
+_instrumentação = None
+
+
+def _obter_container() -> "Container":
+    global _container
+    if _container is None:
+        from app.container import criar_container_memória
+
+        _container = criar_container_memória()
+    return _container
 
-# Container de repositórios em memória. Ao recarregar o módulo (usado nos testes),
-# o estado é isolado automaticamente, substituindo as antigas listas globais.
-_container = _criar_container_memória()
+
+def _fachada() -> "ModuleType":
+    # depois da primeira chamada o import é só uma consulta a sys.modules
+    from app import fachada
+
+    return fachada
 
 
 def cadastrar_sala() -> dict | None:
@@ -34,7 +59,7 @@ def cadastrar_sala() -> dict | None:
         return None
 
     # Encaminha via fachada (UI -> domínio), preservando mensagens/retorno
-    ok, result = _fachada.cadastrar_sala_ui(_container, nome, str(capacidade))
+    ok, result = _fachada().cadastrar_sala_ui(_obter_container(), nome, str(capacidade))
     if not ok:
         print("[erro] Dados inválidos para cadastro da sala.")
         return None
@@ -50,9 +75,11 @@ def remover_sala() -> bool:
     Remove uma sala por id da variável global SALAS.
 
     Exibe a lista atual (id - nome [capacidade]) para auxiliar a escolha.
+    Se a sala tiver reservas, pergunta se elas devem ser removidas junto
+    (cascata), arquivadas ou se a remoção deve ser cancelada.
     Retorna True se removeu, False caso contrário.
     """
-    repo: _SalaRepository = _container.sala_repo
+    repo: _SalaRepository = _obter_container().sala_repo
     if not repo.listar():
         print("[aviso] Não há salas cadastradas para remover.")
         return False
@@ -71,7 +98,19 @@ def remover_sala() -> bool:
         pass
     s = repo.obter_por_id(alvo_int) if isinstance(alvo_int, int) else None
 
-    ok, result = _fachada.remover_sala_ui(_container, id_str)
+    ok, result = _fachada().remover_sala_ui(_obter_container(), id_str)
+    if not ok and result == "sala possui reservas":
+        print("[aviso] A sala possui eventos ou recorrências agendados.")
+        escolha = (
+            input("Remover mesmo assim? (c)ascata, (a)rquivar eventos, (n)ão: ")
+            .strip()
+            .lower()
+        )
+        modo = {"c": "cascata", "a": "arquivar"}.get(escolha[:1])
+        if modo is None:
+            print("[ok] Remoção cancelada.")
+            return False
+        ok, result = _fachada().remover_sala_ui(_obter_container(), id_str, modo)
     if not ok:
         msg = str(result)
         if msg == "id da sala inválido":
@@ -91,19 +130,24 @@ def remover_sala() -> bool:
         else {"id": int(id_str)}
     )
     print("[ok] Sala removida:", removida)
+    if result["eventos"] or result["recorrencias"]:
+        print(
+            f"[ok] Junto com ela: {result['eventos']} evento(s) e "
+            f"{result['recorrencias']} recorrência(s)."
+        )
     return True
 
 
 def buscar_sala_por_id() -> dict | None:
     """Busca uma sala por id em SALAS e imprime o resultado."""
-    repo: _SalaRepository = _container.sala_repo
+    repo: _SalaRepository = _obter_container().sala_repo
     if not repo.listar():
         print("[aviso] Não há salas cadastradas para buscar.")
         return None
 
     print("=== Buscar Sala por ID ===")
     id_str = input("Digite o id da sala para buscar: ").strip()
-    ok, result = _fachada.buscar_sala_por_id_ui(_container, id_str)
+    ok, result = _fachada().buscar_sala_por_id_ui(_obter_container(), id_str)
     if not ok:
         msg = str(result)
         if msg == "id da sala inválido":
@@ -126,17 +170,17 @@ def buscar_sala_por_id() -> dict | None:
 def listar_salas() -> None:
     """Lista todas as salas cadastradas em SALAS."""
     print("=== Listar Salas ===")
-    itens = _fachada.listar_salas_ui(_container)
-    if not itens:
-        print("[aviso] Não há salas cadastradas.")
-        return
-    for s in itens:
+    vazio = True
+    for s in _fachada().iterar_salas_ui(_obter_container()):
+        vazio = False
         print(f"- {s['id']}: {s['nome']} [{s['capacidade']}]")
+    if vazio:
+        print("[aviso] Não há salas cadastradas.")
 
 
 def criar_evento() -> dict | None:
     """Fluxo interativo para criar (agendar) um evento na variável global EVENTOS."""
-    repo_salas: _SalaRepository = _container.sala_repo
+    repo_salas: _SalaRepository = _obter_container().sala_repo
     if not repo_salas.listar():
         print(
             "[aviso] Não há salas cadastradas. Cadastre uma sala antes de agendar eventos."
@@ -164,16 +208,17 @@ def criar_evento() -> dict | None:
     print("Formato de data/hora: YYYY-MM-DD HH:MM (ex.: 2025-10-31 14:30)")
     inicio_str = input("Início: ").strip()
     fim_str = input("Fim: ").strip()
-    # Validação de parsing de datas para manter mensagens
-    try:
-        datetime.strptime(inicio_str, "%Y-%m-%d %H:%M")
-        datetime.strptime(fim_str, "%Y-%m-%d %H:%M")
-    except ValueError:
+    # Validação de parsing de datas para manter mensagens (o parser da fachada
+    # guarda o resultado, então o agendamento abaixo não refaz o parsing)
+    if (
+        _fachada().parse_datetime_ui(inicio_str) is None
+        or _fachada().parse_datetime_ui(fim_str) is None
+    ):
         print("[erro] Datas inválidas. Use o formato YYYY-MM-DD HH:MM.")
         return None
 
-    ok, result = _fachada.agendar_evento_ui(
-        _container, sala_id_str, titulo, inicio_str, fim_str
+    ok, result = _fachada().agendar_evento_ui(
+        _obter_container(), sala_id_str, titulo, inicio_str, fim_str
     )
     if not ok:
         msg = str(result)
@@ -208,7 +253,7 @@ def criar_evento() -> dict | None:
 
 def cancelar_evento() -> bool:
     """Remove um evento por id da variável global EVENTOS."""
-    repo_eventos: _EventoRepository = _container.evento_repo
+    repo_eventos: _EventoRepository = _obter_container().evento_repo
     if not repo_eventos.listar():
         print("[aviso] Não há eventos agendados para cancelar.")
         return False
@@ -229,7 +274,7 @@ def cancelar_evento() -> bool:
         pass
     e = repo_eventos.obter_por_id(alvo) if isinstance(alvo, int) else None
 
-    ok, result = _fachada.cancelar_evento_ui(_container, id_str)
+    ok, result = _fachada().cancelar_evento_ui(_obter_container(), id_str)
     if not ok:
         msg = str(result)
         if msg == "id do evento inválido":
@@ -255,8 +300,8 @@ def cancelar_evento() -> bool:
 
 def atualizar_evento() -> dict | None:
     """Atualiza campos de um evento existente (título, sala, início, fim)."""
-    repo_eventos: _EventoRepository = _container.evento_repo
-    repo_salas: _SalaRepository = _container.sala_repo
+    repo_eventos: _EventoRepository = _obter_container().evento_repo
+    repo_salas: _SalaRepository = _obter_container().sala_repo
     if not repo_eventos.listar():
         print("[aviso] Não há eventos para atualizar.")
         return None
@@ -278,8 +323,8 @@ def atualizar_evento() -> dict | None:
         pass
     if ev is None:
         # Delega validação/mensagem detalhada para a fachada
-        ok, result = _fachada.atualizar_evento_ui(
-            _container, id_str, titulo=None, sala_id=None, inicio=None, fim=None
+        ok, result = _fachada().atualizar_evento_ui(
+            _obter_container(), id_str, titulo=None, sala_id=None, inicio=None, fim=None
         )
         if not ok:
             msg = str(result)
@@ -313,8 +358,8 @@ def atualizar_evento() -> dict | None:
     inicio_arg = None if ini_in == "" else ini_in
     fim_arg = None if fim_in == "" else fim_in
 
-    ok, result = _fachada.atualizar_evento_ui(
-        _container,
+    ok, result = _fachada().atualizar_evento_ui(
+        _obter_container(),
         id_str,
         titulo=titulo_arg,
         sala_id=sala_arg,
@@ -357,15 +402,17 @@ def atualizar_evento() -> dict | None:
 def listar_eventos() -> None:
     """Lista todos os eventos cadastrados."""
     print("=== Listar Eventos ===")
-    repo_salas: _SalaRepository = _container.sala_repo
-    itens = _fachada.listar_eventos_ui(_container)
-    if not itens:
+    repo_salas: _SalaRepository = _obter_container().sala_repo
+    # Consome os eventos em streaming para não montar a lista inteira
+    itens = _fachada().iterar_eventos_ui(_obter_container())
+    primeiro = next(itens, None)
+    if primeiro is None:
         print("[aviso] Não há eventos cadastrados.")
         return
 
     # Mantém a impressão anterior incluindo o nome da sala
     mapa_salas = {s.id: s.nome for s in repo_salas.listar()}
-    for e in itens:
+    for e in chain((primeiro,), itens):
         sid = e["sala_id"]
         snome = mapa_salas.get(sid, "(desconhecida)")
         ini = e["inicio"]
@@ -373,6 +420,71 @@ def listar_eventos() -> None:
         print(f"- {e['id']}: {e['titulo']} (sala {sid} - {snome}) [{ini} -> {fim}]")
 
 
+def relatório_ocupação() -> dict | None:
+    """Imprime a ocupação das salas num período, por dia ou por semana."""
+    print("=== Relatório de Ocupação ===")
+    print("Formato de data/hora: YYYY-MM-DD HH:MM (ex.: 2025-10-31 14:30)")
+    inicio_str = input("Início do período: ").strip()
+    fim_str = input("Fim do período: ").strip()
+    agrupar = input("Agrupar por (dia/semana) [dia]: ").strip() or "dia"
+
+    ok, result = _fachada().relatório_ocupação_ui(
+        _obter_container(), inicio_str, fim_str, agrupar
+    )
+    if not ok:
+        msg = str(result)
+        if msg.startswith("formato de data inválido"):
+            print("[erro] Datas inválidas. Use o formato YYYY-MM-DD HH:MM.")
+        elif msg == "intervalo de datas inválido":
+            print("[erro] O horário de fim deve ser maior que o de início.")
+        else:
+            print("[erro] Agrupamento inválido. Use dia ou semana.")
+        return None
+    if not result["salas"]:
+        print("[aviso] Não há salas cadastradas.")
+        return result
+
+    formato = "%Y-%m-%d" if agrupar.lower() != "semana" else "sem. %Y-%m-%d"
+    cabeçalho = "".join(f"{p.strftime(formato):>16}" for p in result["periodos"])
+    print(f"{'sala':<20}{cabeçalho}{'total (h)':>11}{'uso':>7}{'pico':>6}")
+    for s in result["salas"]:
+        horas = "".join(f"{h:>16.1f}" for h in s["horas_por_periodo"])
+        print(
+            f"{s['id']:>3} {s['nome'][:16]:<16}{horas}{s['horas']:>11.1f}"
+            f"{s['utilizacao']:>7.0%}{s['pico']:>6}"
+        )
+    print(
+        f"Pico de salas ocupadas: {result['pico_salas']} | "
+        f"pico de assentos: {result['pico_assentos']} | "
+        f"ocupação ponderada pela capacidade: {result['ocupacao_ponderada']:.0%}"
+    )
+    return result
+
+
+def métricas() -> str | None:
+    """Liga a instrumentação de desempenho ou, se já ligada, imprime o relatório.
+
+    Na primeira chamada os repositórios, serviços e fachada passam a ser
+    medidos (contagem, tempo total e latência) e uma amostra das chamadas
+    com mais de 100 ms tem o cProfile guardado. Retorna o relatório impresso.
+    """
+    global _container, _instrumentação
+    if _instrumentação is None:
+        from app.instrumentação import Instrumentação
+
+        _instrumentação = Instrumentação(perfil_limite=0.1, perfil_amostragem=0.01)
+        _container = _instrumentação.instrumentar(_obter_container())
+        _instrumentação.ativar()
+        print("[ok] Instrumentação ligada. Escolha esta opção de novo para ver")
+        print("     as chamadas medidas desde agora.")
+        return None
+
+    print("=== Métricas de desempenho ===")
+    relatório = _instrumentação.relatório(25)
+    print(relatório)
+    return relatório
+
+
 def menu():
     """Menu monolítico para escolher operações sobre SALAS."""
     while True:
@@ -385,6 +497,8 @@ def menu():
         print("6) Cancelar evento")
         print("7) Atualizar evento")
         print("8) Listar eventos")
+        print("9) Relatório de ocupação")
+        print("10) Métricas de desempenho (liga/mostra)")
         print("0) Sair")
         opção = input("Escolha uma opção: ").strip()
 
@@ -404,6 +518,10 @@ def menu():
             atualizar_evento()
         elif opção == "8":
             listar_eventos()
+        elif opção == "9":
+            relatório_ocupação()
+        elif opção == "10":
+            métricas()
         elif opção == "0":
             print("Saindo...")
             break
@@ -411,9 +529,17 @@ def menu():
             print("[erro] Opção inválida. Tente novamente.")
 
 
-def main():
-    menu()
+def main(argv: list[str] | None = None) -> int:
+    """Sem argumentos abre o menu; com argumentos roda um subcomando ou um
+    lote de comandos (`app.cli`) e devolve o código de saída."""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        menu()
+        return 0
+    from app import cli
+
+    return cli.executar(argv)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,6 +1,9 @@
 import builtins
 import importlib
+import subprocess
+import sys
 from datetime import datetime
+from pathlib import Path
 
 import pytest
 
@@ -107,6 +110,43 @@ def test_remover_sala_sucesso(monkeypatch, capsys):
     assert "[ok] Sala removida:" in out
 
 
+def _sala_com_eventos(monkeypatch):
+    feed_input(monkeypatch, ["Sala 1", "5"])
+    main.cadastrar_sala()
+    feed_input(monkeypatch, ["1", "A", "2025-01-01 09:00", "2025-01-01 10:00"])
+    assert main.criar_evento() is not None
+
+
+def test_remover_sala_com_eventos_pode_cancelar(monkeypatch, capsys):
+    _sala_com_eventos(monkeypatch)
+    feed_input(monkeypatch, ["1", "n"])
+    assert main.remover_sala() is False
+    out = capsys.readouterr().out
+    assert "possui eventos" in out and "Remoção cancelada" in out
+    feed_input(monkeypatch, ["1"])
+    assert main.buscar_sala_por_id() is not None
+
+
+def test_remover_sala_em_cascata_não_deixa_eventos_órfãos(monkeypatch, capsys):
+    _sala_com_eventos(monkeypatch)
+    feed_input(monkeypatch, ["1", "c"])
+    assert main.remover_sala() is True
+    out = capsys.readouterr().out
+    assert "1 evento(s) e 0 recorrência(s)" in out
+    main.listar_eventos()
+    out = capsys.readouterr().out
+    assert "Não há eventos cadastrados" in out
+    assert "(desconhecida)" not in out
+
+
+def test_remover_sala_arquivando_eventos(monkeypatch, capsys):
+    _sala_com_eventos(monkeypatch)
+    feed_input(monkeypatch, ["1", "a"])
+    assert main.remover_sala() is True
+    assert main._container.evento_repo.listar() == []
+    assert [e.titulo for e in main._container.arquivo_repo.listar()] == ["A"]
+
+
 # --- buscar_sala_por_id ---
 
 
@@ -515,3 +555,82 @@ def test_menu_sai_imediato(monkeypatch, capsys):
     main.menu()
     out = capsys.readouterr().out
     assert "Saindo..." in out
+
+
+# --- relatório de ocupação ---
+
+
+def test_relatório_ocupação(monkeypatch, capsys):
+    _seed_salas_evento_básico(monkeypatch)
+    feed_input(monkeypatch, ["2025-01-01 00:00", "2025-01-03 00:00", ""])
+    r = main.relatório_ocupação()
+    out = capsys.readouterr().out
+    assert [s["horas"] for s in r["salas"]] == [1.0, 0.0]
+    assert "Sala 1" in out and "2025-01-02" in out
+    assert "Pico de salas ocupadas: 1" in out
+
+
+def test_relatório_ocupação_datas_inválidas(monkeypatch, capsys):
+    feed_input(monkeypatch, ["ontem", "hoje", "dia"])
+    assert main.relatório_ocupação() is None
+    assert "Datas inválidas" in capsys.readouterr().out
+
+
+# --- métricas de desempenho ---
+
+
+def test_métricas_liga_e_depois_mostra_o_relatório(monkeypatch, capsys):
+    feed_input(monkeypatch, ["10", "1", "Sala 1", "5", "4", "10", "0"])
+    try:
+        main.menu()
+    finally:
+        main._instrumentação.desativar()
+    out = capsys.readouterr().out
+    assert "Instrumentação ligada" in out
+    assert "=== Métricas de desempenho ===" in out
+    assert "fachada.cadastrar_sala_ui" in out
+    assert "sala_repo.criar" in out
+
+
+# --- partida ---
+
+
+def test_import_main_não_carrega_fachada_nem_repositórios():
+    # processo novo: neste, os testes já importaram tudo
+    código = (
+        "import sys, main; print(sorted(m for m in sys.modules"
+        " if m.split('.')[0] in ('app', 'domínio', 'infra')))"
+    )
+    r = subprocess.run(
+        [sys.executable, "-c", código],
+        cwd=Path(main.__file__).parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert r.stdout.strip() == "[]"
+
+    main._obter_container()  # criado no primeiro uso e reaproveitado depois
+    assert main._obter_container() is main._container
+
+
+# --- modo não interativo ---
+
+
+def test_main_com_argumentos_roda_o_lote_num_só_processo(tmp_path):
+    comandos = "salas add Lab 10\nsalas list\nsalas get 2\n"
+    r = subprocess.run(
+        [sys.executable, "main.py", "--dados", str(tmp_path), "lote"],
+        cwd=Path(main.__file__).parent,
+        input=comandos,
+        capture_output=True,
+        text=True,
+    )
+    assert r.returncode == 1
+    assert r.stdout.splitlines() == [
+        '{"linha":1,"ok":true,"resultado":{"id":1,"nome":"Lab","capacidade":10}}',
+        '{"linha":2,"ok":true,"resultado":[{"id":1,"nome":"Lab","capacidade":10}]}',
+        '{"linha":3,"ok":false,"erro":"sala não encontrada"}',
+    ]
+    # persistido no diário: visível para o próximo processo
+    assert main.main(["--dados", str(tmp_path), "salas", "get", "1"]) == 0
@@ -0,0 +1,282 @@
+import io
+import json
+
+import pytest
+
+from app import cli
+from app.container import criar_container_memória
+
+
+def rodar(argv, capsys):
+    código = cli.executar(argv)
+    capturado = capsys.readouterr()
+    return código, capturado.out, capturado.err
+
+
+def test_subcomandos_texto_e_json_com_sqlite(tmp_path, capsys):
+    banco = ["--sqlite", str(tmp_path / "agenda.db")]
+    assert rodar([*banco, "salas", "add", "Lab 1", "10"], capsys)[1] == "1\tLab 1\t10\n"
+    rodar(
+        [*banco, "eventos", "add", "1", "Aula", "2025-01-06 08:00", "2025-01-06 09:00"],
+        capsys,
+    )
+
+    # cada processo reabre o mesmo banco
+    código, out, _ = rodar([*banco, "eventos", "list", "--json"], capsys)
+    assert código == 0
+    assert json.loads(out) == [
+        {
+            "id": 1,
+            "sala_id": 1,
+            "titulo": "Aula",
+            "inicio": "2025-01-06 08:00",
+            "fim": "2025-01-06 09:00",
+        }
+    ]
+    código, out, _ = rodar(
+        [
+            *banco,
+            "eventos",
+            "list",
+            "--inicio",
+            "2025-01-06 08:30",
+            "--fim",
+            "2025-01-06 10:00",
+            "--sala",
+            "1",
+        ],
+        capsys,
+    )
+    assert out == "1\t1\tAula\t2025-01-06 08:00\t2025-01-06 09:00\n"
+    assert rodar([*banco, "salas", "list", "--json"], capsys)[1] == (
+        '[{"id":1,"nome":"Lab 1","capacidade":10}]\n'
+    )
+
+
+def test_recusa_vai_para_stderr_e_erro_de_uso_sai_com_2(tmp_path, capsys):
+    banco = ["--sqlite", str(tmp_path / "agenda.db")]
+    assert rodar([*banco, "salas", "get", "7"], capsys) == (
+        1,
+        "",
+        "[erro] sala não encontrada\n",
+    )
+    código, out, err = rodar(["salas", "voar"], capsys)
+    assert (código, out) == (2, "")
+    assert "gerenciador: erro:" in err
+    código, _, err = rodar(["eventos", "list", "--sala", "1"], capsys)
+    assert código == 2 and "--sala exige --inicio e --fim" in err
+
+
+def test_import_csv_em_blocos_relata_linhas_recusadas(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(cli, "_LOTE_IMPORTAÇÃO", 2)
+    banco = ["--sqlite", str(tmp_path / "agenda.db")]
+    rodar([*banco, "salas", "add", "Lab", "10"], capsys)
+    csv = tmp_path / "eventos.csv"
+    csv.write_text(
+        "sala_id,titulo,inicio,fim\n"
+        "1,Aula A,2025-01-06 08:00,2025-01-06 09:00\n"
+        "1,Conflito,2025-01-06 08:30,2025-01-06 09:30\n"
+        "\n"
+        "9,Sem sala,2025-01-06 08:00,2025-01-06 09:00\n"
+        "1,faltando\n"
+        '1,"Aula, B",2025-01-06 09:00,2025-01-06 10:00\n',
+        encoding="utf-8",
+    )
+    código, out, _ = rodar([*banco, "eventos", "import", str(csv), "--json"], capsys)
+    assert código == 0
+    assert json.loads(out) == {
+        "importados": 2,
+        "recusados": 3,
+        "erros": [
+            {"linha": 3, "erro": "conflito de horário"},
+            {"linha": 5, "erro": "sala não existe"},
+            {"linha": 6, "erro": "esperadas 4 colunas"},
+        ],
+    }
+    _, out, _ = rodar([*banco, "eventos", "list"], capsys)
+    assert [linha.split("\t")[2] for linha in out.splitlines()] == ["Aula A", "Aula, B"]
+
+
+def test_lote_no_mesmo_container_uma_linha_json_por_comando():
+    comandos = [
+        "# cria e consulta no mesmo processo",
+        "salas add 'Sala A' 20",
+        "",
+        "eventos add 1 'Reunião geral' '2025-01-06 08:00' '2025-01-06 09:00'",
+        "eventos add 1 Outra '2025-01-06 08:30' '2025-01-06 09:30'",
+        "salas rm 1 --modo cascata",
+        "salas fugir",
+        "lote outro.txt",
+        "salas list",
+    ]
+    saída = io.StringIO()
+    código = cli.executar_lote(criar_container_memória(), comandos, saída)
+    registros = [json.loads(linha) for linha in saída.getvalue().splitlines()]
+
+    assert código == 1
+    assert [r["linha"] for r in registros] == [2, 4, 5, 6, 7, 8, 9]
+    assert registros[0] == {
+        "linha": 2,
+        "ok": True,
+        "resultado": {"id": 1, "nome": "Sala A", "capacidade": 20},
+    }
+    assert registros[1]["resultado"]["titulo"] == "Reunião geral"
+    assert registros[2] == {"linha": 5, "ok": False, "erro": "conflito de horário"}
+    assert registros[3]["resultado"] == {"id": 1, "eventos": 1, "recorrencias": 0}
+    assert registros[4]["erro"].startswith("uso: ")
+    assert registros[5]["erro"] == "uso: lote não pode ser aninhado"
+    assert registros[6] == {"linha": 9, "ok": True, "resultado": []}
+
+
+def test_arquivo_inacessível_vira_erro_da_linha_no_lote(tmp_path):
+    faltando = tmp_path / "faltando.csv"
+    comandos = [
+        f"salas import {faltando}",
+        f"eventos export {tmp_path / 'não' / 'existe.csv'}",
+        "salas list",
+    ]
+    saída = io.StringIO()
+    código = cli.executar_lote(criar_container_memória(), comandos, saída)
+    registros = [json.loads(r) for r in saída.getvalue().splitlines()]
+    assert código == 1
+    assert registros[0] == {
+        "linha": 1,
+        "ok": False,
+        "erro": f"No such file or directory: {faltando}",
+    }
+    assert registros[1]["ok"] is False
+    assert registros[2] == {"linha": 3, "ok": True, "resultado": []}
+
+
+@pytest.mark.parametrize("comando", [["salas", "import"], ["lote"]])
+def test_arquivo_inacessível_fora_do_lote_é_erro_sem_traceback(
+    comando, tmp_path, capsys
+):
+    faltando = tmp_path / "faltando.csv"
+    código, out, err = rodar([*comando, str(faltando)], capsys)
+    assert código == 1
+    assert out == ""
+    assert err == f"[erro] No such file or directory: {faltando}\n"
+
+
+def test_lote_parar_no_erro(tmp_path, capsys):
+    arquivo = tmp_path / "comandos.txt"
+    arquivo.write_text("salas get 1\nsalas add Lab 5\n", encoding="utf-8")
+    código, out, _ = rodar(["lote", str(arquivo), "--parar-no-erro"], capsys)
+    assert código == 1
+    assert out == '{"linha":1,"ok":false,"erro":"sala não encontrada"}\n'
+
+
+@pytest.mark.parametrize("argv", [[], ["--sqlite", "x.db"]])
+def test_sem_subcomando_é_erro_de_uso(argv, capsys):
+    assert rodar(argv, capsys)[0] == 2
+
+
+def test_exportar_e_importar_jsonl_pelo_cli(tmp_path, capsys):
+    origem = ["--sqlite", str(tmp_path / "origem.db")]
+    destino = ["--sqlite", str(tmp_path / "destino.db")]
+    rodar([*origem, "salas", "add", "Lab", "10"], capsys)
+    rodar(
+        [
+            *origem,
+            "eventos",
+            "add",
+            "1",
+            "Aula",
+            "2025-01-06 08:00",
+            "2025-01-06 09:00",
+        ],
+        capsys,
+    )
+
+    assert (
+        rodar([*origem, "salas", "export"], capsys)[1]
+        == "id,nome,capacidade\n1,Lab,10\n"
+    )
+    arquivo = str(tmp_path / "eventos.jsonl")
+    _, out, _ = rodar([*origem, "eventos", "export", arquivo, "--json"], capsys)
+    assert json.loads(out) == {"exportados": 1}
+
+    rodar([*destino, "salas", "add", "Lab", "10"], capsys)
+    _, out, _ = rodar([*destino, "eventos", "import", arquivo, "--json"], capsys)
+    assert json.loads(out) == {"importados": 1, "recusados": 0, "erros": []}
+    saída = io.StringIO()
+    cli.executar_lote(criar_container_memória(), ["salas export"], saída)
+    assert (
+        json.loads(saída.getvalue())["erro"] == "uso: no lote, exporte para um arquivo"
+    )
+
+
+def test_importar_da_entrada_padrão_no_lote_é_recusado(monkeypatch):
+    # o lote vem da entrada padrão: "import -" não pode consumir o resto dele
+    monkeypatch.setattr(
+        "sys.stdin", io.StringIO("salas import -\neventos import -\nsalas list\n")
+    )
+    saída = io.StringIO()
+    código = cli.executar(["lote", "-"], saída)
+    registros = [json.loads(r) for r in saída.getvalue().splitlines()]
+    assert código == 1
+    assert registros == [
+        {"linha": 1, "ok": False, "erro": "uso: no lote, importe de um arquivo"},
+        {"linha": 2, "ok": False, "erro": "uso: no lote, importe de um arquivo"},
+        {"linha": 3, "ok": True, "resultado": []},
+    ]
+
+
+def test_eventos_validar_no_lote():
+    comandos = [
+        "salas add Lab 10",
+        "eventos add 1 A '2025-01-06 08:00' '2025-01-06 09:00'",
+        "eventos add 1 B '2025-01-06 09:05' '2025-01-06 10:00'",
+        "eventos validar --folga 10",
+        "eventos validar --folga 10 --inicio '2025-01-07 00:00' --fim '2025-01-08 00:00'",
+        "eventos validar --inicio '2025-01-07 00:00'",
+    ]
+    saída = io.StringIO()
+    assert cli.executar_lote(criar_container_memória(), comandos, saída) == 1
+    tudo, janela, sem_fim = map(json.loads, saída.getvalue().splitlines()[-3:])
+    assert tudo["resultado"] == [{"sala_id": 1, "primeiro": 1, "segundo": 2}]
+    assert janela["resultado"] == []
+    assert sem_fim["erro"] == "uso: --inicio e --fim devem ser usados juntos"
+
+
+def test_arquivo_persiste_entre_processos_com_sqlite(tmp_path, capsys):
+    banco = ["--sqlite", str(tmp_path / "agenda.db")]
+    rodar([*banco, "salas", "add", "Velha", "10"], capsys)
+    rodar(
+        [*banco, "eventos", "add", "1", "Aula", "2025-01-06 08:00", "2025-01-06 09:00"],
+        capsys,
+    )
+    assert rodar([*banco, "salas", "rm", "1", "--modo", "arquivar"], capsys)[0] == 0
+
+    # outro processo enxerga o arquivo e restaura numa sala nova
+    _, out, _ = rodar([*banco, "salas", "arquivados", "--json"], capsys)
+    assert [e["titulo"] for e in json.loads(out)] == ["Aula"]
+    rodar([*banco, "salas", "add", "Nova", "10"], capsys)
+    código, out, _ = rodar([*banco, "salas", "restaurar", "1", "2", "--json"], capsys)
+    assert código == 0
+    restauração = json.loads(out)
+    assert restauração["recusados"] == []
+    assert [e["sala_id"] for e in restauração["restaurados"]] == [2]
+    assert rodar([*banco, "salas", "arquivados"], capsys)[1] == ""
+
+
+@pytest.mark.parametrize("linha", ["--help", "salas -h", "eventos add --help"])
+def test_ajuda_no_lote_não_sai_na_saída(linha, capsys):
+    saída = io.StringIO()
+    código = cli.executar_lote(criar_container_memória(), [linha, "salas list"], saída)
+    assert código == 1
+    # só linhas JSON na saída, e o lote segue depois da linha recusada
+    registros = [json.loads(r) for r in saída.getvalue().splitlines()]
+    assert registros == [
+        {"linha": 1, "ok": False, "erro": "uso: ajuda não disponível no lote"},
+        {"linha": 2, "ok": True, "resultado": []},
+    ]
+    assert capsys.readouterr().out == ""
+
+
+def test_ajuda_fora_do_lote_continua_disponível(capsys):
+    with pytest.raises(SystemExit) as saída:
+        cli.executar(["salas", "--help"])
+    assert saída.value.code == 0
+    assert "arquivados" in capsys.readouterr().out
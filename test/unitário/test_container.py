@@ -1,9 +1,18 @@
 from datetime import datetime
 
 from domínio.modelos import Sala, Evento
-from infra.repos_memória import MemSalaRepository, MemEventoRepository
+from infra.repos_memória import (
+    MemSalaRepository,
+    MemEventoRepository,
+    MemRecorrênciaRepository,
+)
+from infra.repos_sqlite import (
+    SQLiteSalaRepository,
+    SQLiteEventoRepository,
+    SQLiteRecorrênciaRepository,
+)
 
-from app.container import criar_container_memória
+from app.container import criar_container_memória, criar_container_sqlite
 
 
 def dt(hm: str) -> datetime:
@@ -15,6 +24,7 @@ def test_criar_container_memoria_tipos():
     c = criar_container_memória()
     assert isinstance(c.sala_repo, MemSalaRepository)
     assert isinstance(c.evento_repo, MemEventoRepository)
+    assert isinstance(c.recorrencia_repo, MemRecorrênciaRepository)
 
 
 def test_containers_isolados_por_instancia():
@@ -41,3 +51,44 @@ def test_proximo_id_determinístico_por_container():
         Evento(id=1, sala_id=1, titulo="A", inicio=dt("09:00"), fim=dt("10:00"))
     )
     assert c.evento_repo.proximo_id() == 2
+
+
+def test_criar_container_sqlite_tipos_e_fluxo():
+    c = criar_container_sqlite(":memory:")
+    assert isinstance(c.sala_repo, SQLiteSalaRepository)
+    assert isinstance(c.evento_repo, SQLiteEventoRepository)
+    assert isinstance(c.recorrencia_repo, SQLiteRecorrênciaRepository)
+
+    c.sala_repo.adicionar(Sala(id=c.sala_repo.proximo_id(), nome="S1", capacidade=5))
+    c.evento_repo.adicionar(
+        Evento(id=1, sala_id=1, titulo="A", inicio=dt("09:00"), fim=dt("10:00"))
+    )
+    assert c.sala_repo.proximo_id() == 2
+    assert c.evento_repo.proximo_id() == 2
+
+
+def test_arquivo_do_container_sqlite_persiste_no_banco(tmp_path):
+    from domínio import serviços
+
+    caminho = tmp_path / "agenda.db"
+    c = criar_container_sqlite(caminho)
+    assert isinstance(c.arquivo_repo, SQLiteEventoRepository)
+    sala = c.sala_repo.criar("S1", 5)
+    evento = c.evento_repo.criar(sala.id, "A", dt("09:00"), dt("10:00"))
+    r = serviços.remover_sala_detalhado(
+        c.sala_repo,
+        c.evento_repo,
+        sala.id,
+        serviços.ModoRemoçãoSala.ARQUIVAR,
+        arquivo=c.arquivo_repo,
+    )
+    assert r.ok
+
+    c2 = criar_container_sqlite(caminho)
+    assert c2.arquivo_repo.listar() == [evento]
+    assert c2.evento_repo.listar() == []
+    # arquivo e agenda são tabelas separadas: o id arquivado não volta
+    assert c2.evento_repo.proximo_id() == evento.id + 1
+    assert (
+        c2.arquivo_repo.encontrar_conflito(sala.id, dt("09:30"), dt("09:45")) == evento
+    )
@@ -127,3 +127,380 @@ def test_listar_salas_eventos_ui_retorna_estruturas_simples(container_memoria):
     assert isinstance(eventos, list)
     assert any(isinstance(x, dict) and x.get("nome") == "Sala 1" for x in salas)
     assert any(isinstance(x, dict) and x.get("titulo") == "Evt" for x in eventos)
+
+
+def test_agendar_eventos_em_lote_ui_resultados_por_linha(container_memoria):
+    c = container_memoria
+    s = Sala(id=c.sala_repo.proximo_id(), nome="Sala 1", capacidade=5)
+    c.sala_repo.adicionar(s)
+
+    resultados = fachada.agendar_eventos_em_lote_ui(
+        c,
+        [
+            (str(s.id), "A", "2025-01-01 09:00", "2025-01-01 10:00"),
+            (str(s.id), "B", "2025-01-01 09:30", "2025-01-01 10:30"),
+            ("x", "C", "2025-01-01 11:00", "2025-01-01 12:00"),
+            (str(s.id), "D", "ontem", "2025-01-01 12:00"),
+            ("99", "E", "2025-01-01 11:00", "2025-01-01 12:00"),
+            (str(s.id), "", "2025-01-01 11:00", "2025-01-01 12:00"),
+            (str(s.id), "F", "2025-01-01 12:00", "2025-01-01 11:00"),
+            (str(s.id), "G", "2025-01-01 10:00", "2025-01-01 11:00"),
+        ],
+    )
+
+    oks = [ok for ok, _ in resultados]
+    assert oks == [True, False, False, False, False, False, False, True]
+    mensagens = [r for ok, r in resultados if not ok]
+    assert mensagens == [
+        "conflito de horário",
+        "id da sala inválido",
+        "formato de data inválido (YYYY-MM-DD HH:MM)",
+        "sala não existe",
+        "título inválido",
+        "intervalo de datas inválido",
+    ]
+    assert [e.titulo for e in c.evento_repo.listar()] == ["A", "G"]
+
+
+def test_buscar_salas_disponíveis_ui(container_memoria):
+    c = container_memoria
+    fachada.cadastrar_sala_ui(c, "Auditório", "100")
+    fachada.cadastrar_sala_ui(c, "Sala 40", "40")
+    fachada.agendar_evento_ui(c, "2", "Aula", "2025-01-07 14:00", "2025-01-07 16:00")
+
+    ok, salas = fachada.buscar_salas_disponíveis_ui(
+        c, "40", "2025-01-07 14:00", "2025-01-07 16:00"
+    )
+    assert ok is True
+    assert salas == [{"id": 1, "nome": "Auditório", "capacidade": 100}]
+
+    ok, erro = fachada.buscar_salas_disponíveis_ui(
+        c, "0", "2025-01-07 14:00", "2025-01-07 16:00"
+    )
+    assert ok is False and "capacidade" in erro
+    ok, erro = fachada.buscar_salas_disponíveis_ui(c, "10", "x", "2025-01-07 16:00")
+    assert ok is False and "formato" in erro
+    ok, erro = fachada.buscar_salas_disponíveis_ui(
+        c, "10", "2025-01-07 16:00", "2025-01-07 14:00"
+    )
+    assert ok is False and "intervalo" in erro
+
+
+def test_listar_eventos_pagina_ui_devolve_cursor(container_memoria):
+    c = container_memoria
+    fachada.cadastrar_sala_ui(c, "Sala 1", "10")
+    for h in ("09", "10", "11"):
+        fachada.agendar_evento_ui(
+            c, "1", f"E{h}", f"2025-01-07 {h}:00", f"2025-01-07 {h}:30"
+        )
+
+    itens, cursor = fachada.listar_eventos_pagina_ui(c, limite=2)
+    assert [e["titulo"] for e in itens] == ["E09", "E10"]
+    assert cursor == (datetime(2025, 1, 7, 10, 0), 1, 2)
+    itens, cursor = fachada.listar_eventos_pagina_ui(c, limite=2, após=cursor)
+    assert [e["titulo"] for e in itens] == ["E11"]
+    assert cursor is None
+    assert [e["titulo"] for e in fachada.iterar_eventos_ui(c)] == ["E09", "E10", "E11"]
+
+    salas, cursor = fachada.listar_salas_pagina_ui(c, limite=1)
+    assert salas == [{"id": 1, "nome": "Sala 1", "capacidade": 10}]
+    assert cursor == 1
+    assert fachada.listar_salas_pagina_ui(c, limite=1, após=cursor) == ([], None)
+    assert list(fachada.iterar_salas_ui(c)) == salas
+
+
+def test_listar_eventos_no_intervalo_ui(container_memoria):
+    c = container_memoria
+    fachada.cadastrar_sala_ui(c, "Sala 1", "10")
+    fachada.cadastrar_sala_ui(c, "Sala 2", "10")
+    fachada.agendar_evento_ui(c, "1", "Seg", "2025-01-06 09:00", "2025-01-06 10:00")
+    fachada.agendar_evento_ui(c, "2", "Ter", "2025-01-07 09:00", "2025-01-07 10:00")
+    fachada.agendar_evento_ui(c, "1", "Seg+7", "2025-01-13 09:00", "2025-01-13 10:00")
+
+    ok, semana = fachada.listar_eventos_no_intervalo_ui(
+        c, "2025-01-06 00:00", "2025-01-13 00:00"
+    )
+    assert ok is True
+    assert [e["titulo"] for e in semana] == ["Seg", "Ter"]
+    ok, sala_1 = fachada.listar_eventos_no_intervalo_ui(
+        c, "2025-01-06 00:00", "2025-01-13 00:00", "1"
+    )
+    assert [e["titulo"] for e in sala_1] == ["Seg"]
+
+    ok, erro = fachada.listar_eventos_no_intervalo_ui(c, "x", "2025-01-13 00:00")
+    assert ok is False and "formato" in erro
+    ok, erro = fachada.listar_eventos_no_intervalo_ui(
+        c, "2025-01-13 00:00", "2025-01-06 00:00"
+    )
+    assert ok is False and "intervalo" in erro
+    ok, erro = fachada.listar_eventos_no_intervalo_ui(
+        c, "2025-01-06 00:00", "2025-01-13 00:00", "abc"
+    )
+    assert ok is False and "sala" in erro
+
+
+def test_agendar_evento_ui_consulta_conflito_uma_vez(container_memoria):
+    c = container_memoria
+    fachada.cadastrar_sala_ui(c, "Sala 1", "10")
+    chamadas = []
+    original = c.evento_repo.encontrar_conflito
+
+    def contando(*args, **kwargs):
+        chamadas.append(args)
+        return original(*args, **kwargs)
+
+    c.evento_repo.encontrar_conflito = contando
+    ok, ev = fachada.agendar_evento_ui(
+        c, "1", "A", "2025-01-07 09:00", "2025-01-07 10:00"
+    )
+    assert ok is True
+    ok, _ = fachada.atualizar_evento_ui(c, str(ev.id), titulo=" ")
+    assert (ok, _) == (False, "título inválido")
+    ok, _ = fachada.atualizar_evento_ui(c, str(ev.id), fim="2025-01-07 11:00")
+    assert ok is True
+    assert len(chamadas) == 2
+
+
+def test_agendar_recorrência_ui_e_ocorrências(container_memoria):
+    c = container_memoria
+    fachada.cadastrar_sala_ui(c, "Sala 1", "10")
+    ok, r = fachada.agendar_recorrência_ui(
+        c,
+        "1",
+        "Aula",
+        "2025-01-06 09:00",
+        "2025-01-06 11:00",
+        "Semanal",
+        "2025-06-30 00:00",
+    )
+    assert ok is True and r.id == 1
+
+    ok, erro = fachada.agendar_evento_ui(
+        c, "1", "Prova", "2025-03-10 10:00", "2025-03-10 12:00"
+    )
+    assert (ok, erro) == (False, "conflito de horário")
+    ok, _ = fachada.cancelar_ocorrência_ui(c, "1", "2025-03-10 09:00")
+    assert ok is True
+    ok, _ = fachada.agendar_evento_ui(
+        c, "1", "Prova", "2025-03-10 10:00", "2025-03-10 12:00"
+    )
+    assert ok is True
+
+    livres = fachada.buscar_salas_disponíveis_ui(
+        c, "1", "2025-03-17 09:00", "2025-03-17 10:00"
+    )
+    assert livres == (True, [])
+
+    ok, itens = fachada.listar_ocorrências_ui(c, "2025-03-03 00:00", "2025-03-17 00:00")
+    assert ok is True
+    assert [o["inicio"].day for o in itens] == [3]  # 10/03 foi cancelada
+
+    erros = [
+        fachada.agendar_recorrência_ui(
+            c,
+            "1",
+            "X",
+            "2025-01-07 09:00",
+            "2025-01-07 10:00",
+            "mensal",
+            "2025-02-01 00:00",
+        ),
+        fachada.agendar_recorrência_ui(
+            c,
+            "1",
+            "X",
+            "2025-01-07 09:00",
+            "2025-01-07 10:00",
+            "diária",
+            "2025-02-01 00:00",
+            "0",
+        ),
+        fachada.agendar_recorrência_ui(
+            c,
+            "1",
+            "X",
+            "2025-01-07 09:00",
+            "2025-01-08 10:00",
+            "diária",
+            "2025-02-01 00:00",
+        ),
+        fachada.agendar_recorrência_ui(
+            c,
+            "1",
+            "X",
+            "2025-01-06 10:00",
+            "2025-01-06 12:00",
+            "diária",
+            "2025-02-01 00:00",
+        ),
+    ]
+    assert [e for _, e in erros] == [
+        "frequência inválida (diária ou semanal)",
+        "intervalo inválido",
+        "recorrência inválida",
+        "conflito de horário",
+    ]
+    assert fachada.cancelar_recorrência_ui(c, "1") == (True, None)
+    assert fachada.cancelar_recorrência_ui(c, "1") == (
+        False,
+        "recorrência não encontrada",
+    )
+
+
+def test_parse_datetime_ui_equivale_ao_strptime():
+    def por_strptime(texto):
+        try:
+            return datetime.strptime(texto, fachada.FORMATO_DATETIME)
+        except (TypeError, ValueError):
+            return None
+
+    casos = [
+        "2025-01-06 08:00",
+        "2025-12-31 23:59",
+        "2024-02-29 00:00",
+        "2025-02-29 10:00",  # ano não bissexto
+        "2025-13-01 10:00",
+        "2025-00-10 10:00",
+        "2025-01-06 24:00",
+        "2025-01-06 23:60",
+        "0000-01-01 00:00",
+        "2025-1-6 8:05",  # campos sem zero à esquerda: strptime aceita
+        "2025-01-06  08:00",  # espaço duplo: strptime aceita
+        "2025-01-06T08:00",
+        " 2025-01-06 08:00",
+        "2025-01-06 08:00 ",
+        "2025-01-06 08:00:00",
+        "٢٠٢٥-01-06 08:00",  # dígitos não ASCII
+        "2025-01-06 0８:00",
+        "+025-01-06 08:00",
+        "2025-01-0a 08:00",
+        "",
+        None,
+    ]
+    for texto in casos:
+        assert fachada.parse_datetime_ui(texto) == por_strptime(texto), texto
+
+
+def test_parse_datetime_ui_reaproveita_resultado():
+    a = fachada.parse_datetime_ui("2031-05-04 10:30")
+    assert a == datetime(2031, 5, 4, 10, 30)
+    assert fachada.parse_datetime_ui("2031-05-04 10:30") is a
+
+
+def test_relatório_ocupação_ui(container_memoria):
+    fachada.cadastrar_sala_ui(container_memoria, "Sala 1", "10")
+    fachada.agendar_evento_ui(
+        container_memoria, "1", "Aula", "2025-01-06 08:00", "2025-01-06 11:00"
+    )
+
+    ok, r = fachada.relatório_ocupação_ui(
+        container_memoria, "2025-01-06 00:00", "2025-01-20 00:00", "semana"
+    )
+    assert ok
+    assert r["periodos"] == [datetime(2025, 1, 6), datetime(2025, 1, 13)]
+    (sala,) = r["salas"]
+    assert sala["horas_por_periodo"] == [3.0, 0.0]
+    assert (sala["pico"], r["pico_salas"], r["pico_assentos"]) == (1, 1, 10)
+
+    assert fachada.relatório_ocupação_ui(
+        container_memoria, "2025-01-06 00:00", "2025-01-07 00:00", "mês"
+    ) == (False, "agrupamento inválido (dia ou semana)")
+    assert fachada.relatório_ocupação_ui(
+        container_memoria, "2025-01-07 00:00", "2025-01-06 00:00"
+    ) == (False, "intervalo de datas inválido")
+
+
+def test_validar_agenda_ui_com_folga(container_memoria):
+    c = container_memoria
+    fachada.cadastrar_sala_ui(c, "Sala 1", "10")
+    for ini, fim in [("08:00", "09:00"), ("09:10", "10:00"), ("10:00", "11:00")]:
+        assert fachada.agendar_evento_ui(
+            c, "1", "Aula", f"2025-01-06 {ini}", f"2025-01-06 {fim}"
+        )[0]
+
+    assert fachada.validar_agenda_ui(c) == (True, [])
+    assert fachada.validar_agenda_ui(c, "15") == (
+        True,
+        [
+            {"sala_id": 1, "primeiro": 1, "segundo": 2},
+            {"sala_id": 1, "primeiro": 2, "segundo": 3},
+        ],
+    )
+    assert fachada.validar_agenda_ui(c, "-5") == (
+        False,
+        "folga inválida (minutos >= 0)",
+    )
+
+
+def test_validar_agenda_ui_com_ocorrências_e_janela(container_memoria):
+    c = container_memoria
+    fachada.cadastrar_sala_ui(c, "Sala 1", "10")
+    assert fachada.agendar_recorrência_ui(
+        c,
+        "1",
+        "Aula",
+        "2025-01-06 08:00",
+        "2025-01-06 09:00",
+        "semanal",
+        "2025-01-13 08:00",
+    )[0]
+    assert fachada.agendar_evento_ui(
+        c, "1", "Prova", "2025-01-13 09:00", "2025-01-13 10:00"
+    )[0]
+
+    assert fachada.validar_agenda_ui(c) == (True, [])
+    ocorrência = {"recorrencia_id": 1, "inicio": datetime(2025, 1, 13, 8)}
+    par = {"sala_id": 1, "primeiro": ocorrência, "segundo": 1}
+    assert fachada.validar_agenda_ui(c, "10") == (True, [par])
+    assert fachada.validar_agenda_ui(
+        c, "10", "2025-01-06 00:00", "2025-01-07 00:00"
+    ) == (True, [])
+    assert fachada.validar_agenda_ui(c, "10", "2025-01-06 00:00", None) == (
+        False,
+        "formato de data inválido (YYYY-MM-DD HH:MM)",
+    )
+
+
+def test_remover_sala_ui_modos(container_memoria):
+    c = container_memoria
+    s = c.sala_repo.criar("Sala 1", 5)
+    c.evento_repo.criar(s.id, "Evt", dt("09:00"), dt("10:00"))
+
+    assert fachada.remover_sala_ui(c, str(s.id)) == (False, "sala possui reservas")
+    ok, erro = fachada.remover_sala_ui(c, str(s.id), "apagar")
+    assert ok is False and "modo" in erro
+    ok, dados = fachada.remover_sala_ui(c, str(s.id), "Arquivar")
+    assert (ok, dados) == (True, {"id": s.id, "eventos": 1, "recorrencias": 0})
+    assert c.evento_repo.listar() == [] and len(c.arquivo_repo.listar()) == 1
+    assert fachada.remover_sala_ui(c, str(s.id), "cascata") == (
+        False,
+        "sala não encontrada",
+    )
+
+
+def test_listar_e_restaurar_arquivados_ui(container_memoria):
+    c = container_memoria
+    velha = c.sala_repo.criar("Velha", 5)
+    evento = c.evento_repo.criar(velha.id, "Evt", dt("09:00"), dt("10:00"))
+    assert fachada.remover_sala_ui(c, str(velha.id), "arquivar")[0]
+
+    assert fachada.listar_arquivados_ui(c) == (True, [fachada._evento_dict(evento)])
+    assert fachada.listar_arquivados_ui(c, str(velha.id))[1] == [
+        fachada._evento_dict(evento)
+    ]
+    assert fachada.listar_arquivados_ui(c, "x") == (False, "id da sala inválido")
+
+    assert fachada.restaurar_arquivados_ui(c, str(velha.id), "99") == (
+        False,
+        "sala não encontrada",
+    )
+    nova = c.sala_repo.criar("Nova", 5)
+    ok, dados = fachada.restaurar_arquivados_ui(c, str(velha.id), str(nova.id))
+    assert ok and dados["recusados"] == []
+    (restaurado,) = dados["restaurados"]
+    assert (restaurado["sala_id"], restaurado["inicio"]) == (nova.id, evento.inicio)
+    assert fachada.listar_arquivados_ui(c) == (True, [])
+    assert fachada.restaurar_arquivados_ui(c, str(velha.id), str(nova.id)) == (
+        False,
+        "nenhum evento arquivado da sala",
+    )
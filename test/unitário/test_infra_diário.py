@@ -0,0 +1,276 @@
+import os
+import zlib
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.container import criar_container_diário
+from domínio import serviços
+from domínio.modelos import Evento, Frequência, Recorrência
+from infra.diário import Diário, DiárioCorrompido
+from infra.repos_memória import MemEventoRepository
+
+
+def dt(hm: str, dia: int = 1) -> datetime:
+    h, m = map(int, hm.split(":"))
+    return datetime(2025, 1, dia, h, m)
+
+
+def abrir(diretório, **opções):
+    # intervalo longo: a thread de fundo não interfere nos testes
+    return criar_container_diário(diretório, intervalo=60, **opções)
+
+
+def povoar(c) -> None:
+    serviços.cadastrar_sala(c.sala_repo, "A", 10)
+    serviços.cadastrar_sala(c.sala_repo, "B, com vírgula", 20)
+    serviços.cadastrar_sala(c.sala_repo, "C", 30)
+    for i, titulo in enumerate(['Aula "1"', "linha\nnova", "barra \\n", "X"]):
+        serviços.agendar_evento(
+            c.evento_repo,
+            c.sala_repo,
+            1 + i % 2,
+            titulo,
+            dt("09:00") + timedelta(hours=i),
+            dt("10:00") + timedelta(hours=i),
+        )
+    c.recorrencia_repo.criar(
+        Recorrência(
+            id=1,
+            sala_id=3,
+            titulo="Semanal",
+            inicio=dt("08:00", 6),
+            fim=dt("09:30", 6),
+            frequência=Frequência.SEMANAL,
+            até=dt("08:00", 27),
+            exceções=frozenset({dt("08:00", 13)}),
+        )
+    )
+    # atualizações e remoções também vão para o diário
+    c.evento_repo.atualizar(replace(c.evento_repo.obter_por_id(4), titulo="Y"))
+    c.evento_repo.remover(3)
+    c.sala_repo.remover(3)
+
+
+def estado(c):
+    return (
+        c.sala_repo.listar(),
+        c.evento_repo.listar(),
+        c.recorrencia_repo.listar(),
+        c.sala_repo.proximo_id(),
+        c.evento_repo.proximo_id(),
+        c.recorrencia_repo.proximo_id(),
+    )
+
+
+def test_reabrir_reaplica_o_diário(tmp_path):
+    c = abrir(tmp_path)
+    povoar(c)
+    antes = estado(c)
+    c.fechar()
+
+    c2 = abrir(tmp_path)
+    assert estado(c2) == antes
+    # ids removidos não são reutilizados e os textos voltam sem escapes
+    assert (c2.sala_repo.proximo_id(), c2.evento_repo.proximo_id()) == (4, 5)
+    assert c2.evento_repo.obter_por_id(2).titulo == "linha\nnova"
+    # índices reconstruídos: conflitos e consultas por intervalo funcionam
+    assert c2.evento_repo.encontrar_conflito(1, dt("09:30"), dt("09:45")).id == 1
+    assert [
+        e.id for e in c2.evento_repo.listar_no_intervalo(dt("00:00"), dt("23:00"))
+    ] == [1, 2, 4]
+    c2.fechar()
+
+
+def test_compactar_grava_snapshot_e_descarta_gerações(tmp_path):
+    c = abrir(tmp_path)
+    povoar(c)
+    c.diário.compactar()
+    # escritas depois do snapshot vão para a geração nova
+    c.evento_repo.remover(1)
+    antes = estado(c)
+    c.fechar()
+
+    arquivos = sorted(p.name for p in tmp_path.iterdir())
+    assert arquivos == ["diario-2.log", "snapshot.csv"]
+    assert (tmp_path / "diario-2.log").read_text() == "-E,1\n"
+
+    c2 = abrir(tmp_path)
+    assert estado(c2) == antes
+    c2.fechar()
+
+
+def test_geração_antiga_que_sobrou_da_compactação_é_ignorada(tmp_path):
+    c = abrir(tmp_path)
+    povoar(c)
+    c.diário.compactar()
+    c.fechar()
+    # queda entre gravar o snapshot e apagar o diário antigo
+    (tmp_path / "diario-1.log").write_text("-S,1\n")
+
+    c2 = abrir(tmp_path)
+    assert c2.sala_repo.obter_por_id(1) is not None
+    assert not (tmp_path / "diario-1.log").exists()
+    c2.fechar()
+
+
+def test_registro_cortado_no_fim_é_descartado(tmp_path):
+    c = abrir(tmp_path)
+    serviços.cadastrar_sala(c.sala_repo, "A", 10)
+    c.fechar()
+    with open(tmp_path / "diario-1.log", "a") as f:
+        f.write("S,2,Cort")  # queda no meio da escrita
+
+    c2 = abrir(tmp_path)
+    assert [s.id for s in c2.sala_repo.listar()] == [1]
+    serviços.cadastrar_sala(c2.sala_repo, "B", 10)
+    c2.fechar()
+
+    c3 = abrir(tmp_path)
+    assert [s.nome for s in c3.sala_repo.listar()] == ["A", "B"]
+    c3.fechar()
+
+
+def test_snapshot_corrompido(tmp_path):
+    c = abrir(tmp_path)
+    povoar(c)
+    c.diário.compactar()
+    c.fechar()
+    caminho = tmp_path / "snapshot.csv"
+    caminho.write_bytes(caminho.read_bytes().replace(b"Aula", b"Aulb"))
+    with pytest.raises(DiárioCorrompido):
+        Diário.abrir(tmp_path)
+
+
+def test_fsync_em_lotes(tmp_path, monkeypatch):
+    c = abrir(tmp_path, lote=3)
+    chamadas = []
+    original = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: chamadas.append(fd) or original(fd))
+    for i in range(7):
+        c.sala_repo.criar(f"S{i}", 10)
+    assert len(chamadas) == 2  # 3 + 3; o sétimo espera o lote ou o intervalo
+    c.diário.sincronizar()
+    assert len(chamadas) == 3
+    c.diário.sincronizar()  # nada pendente
+    assert len(chamadas) == 3
+    c.fechar()
+    with pytest.raises(ValueError):
+        c.sala_repo.criar("depois de fechar", 10)
+
+
+def test_compactação_automática_em_segundo_plano(tmp_path):
+    c = criar_container_diário(tmp_path, intervalo=0.01, compactar_após=5)
+    for i in range(6):
+        c.sala_repo.criar(f"S{i}", 10)
+    for _ in range(200):
+        if (tmp_path / "snapshot.csv").exists():
+            break
+        c.diário._parar.wait(0.01)
+    c.fechar()
+    assert (tmp_path / "snapshot.csv").exists()
+    c2 = abrir(tmp_path)
+    assert [s.id for s in c2.sala_repo.listar()] == [1, 2, 3, 4, 5, 6]
+    c2.fechar()
+
+
+def test_carregar_em_lote_equivale_a_adicionar_um_a_um():
+    eventos = [
+        Evento(
+            i,
+            1 + i % 3,
+            f"E{i}",
+            dt("08:00") + timedelta(minutes=37 * i),
+            dt("08:00") + timedelta(minutes=37 * i + 20 + i),
+        )
+        for i in range(1, 60)
+    ]
+    um_a_um, em_lote = MemEventoRepository(), MemEventoRepository()
+    for e in eventos:
+        um_a_um.adicionar(e)
+    em_lote._carregar(eventos, último_id=100)
+    assert em_lote.listar() == um_a_um.listar()
+    assert em_lote.proximo_id() == 101
+    for sala in (1, 2, 3):
+        assert em_lote.listar_por_sala(sala) == um_a_um.listar_por_sala(sala)
+        for h in range(8, 22):
+            ini, fim = dt(f"{h}:10"), dt(f"{h}:50")
+            assert em_lote.encontrar_conflito(
+                sala, ini, fim
+            ) == um_a_um.encontrar_conflito(sala, ini, fim)
+            assert em_lote.listar_no_intervalo(
+                ini, fim, sala
+            ) == um_a_um.listar_no_intervalo(ini, fim, sala)
+    assert em_lote.listar_pagina(10) == um_a_um.listar_pagina(10)
+
+
+def test_remover_sala_em_cascata_vai_para_o_diário(tmp_path):
+    c = abrir(tmp_path)
+    povoar(c)
+    r = serviços.remover_sala_detalhado(
+        c.sala_repo, c.evento_repo, 1, serviços.ModoRemoçãoSala.CASCATA
+    )
+    assert [e.id for e in r.eventos] == [1]
+    antes = estado(c)
+    c.fechar()
+
+    c2 = abrir(tmp_path)
+    assert estado(c2) == antes
+    assert c2.evento_repo.listar_por_sala(1) == []
+    c2.fechar()
+
+
+@pytest.mark.parametrize("compactar", [False, True])
+def test_arquivo_de_eventos_sobrevive_à_reabertura(tmp_path, compactar):
+    c = abrir(tmp_path)
+    povoar(c)
+    r = serviços.remover_sala_detalhado(
+        c.sala_repo,
+        c.evento_repo,
+        2,
+        serviços.ModoRemoçãoSala.ARQUIVAR,
+        arquivo=c.arquivo_repo,
+    )
+    arquivados = sorted(r.eventos, key=lambda e: e.id)
+    assert [e.id for e in arquivados] == [2, 4]
+    if compactar:
+        c.diário.compactar()
+    c.fechar()
+
+    c2 = abrir(tmp_path)
+    assert c2.arquivo_repo.listar() == arquivados
+    assert c2.evento_repo.listar_por_sala(2) == []
+    # restaurar tira do arquivo, e a retirada também vai para o diário
+    sala = serviços.cadastrar_sala(c2.sala_repo, "D", 10)
+    restauração = serviços.restaurar_arquivados(
+        c2.arquivo_repo, c2.evento_repo, c2.sala_repo, 2, sala.id
+    )
+    assert restauração.ok and len(restauração.restaurados) == 2
+    antes = estado(c2)
+    c2.fechar()
+
+    c3 = abrir(tmp_path)
+    assert c3.arquivo_repo.listar() == []
+    assert estado(c3) == antes
+    c3.fechar()
+
+
+def test_snapshot_sem_seção_de_arquivo_ainda_abre(tmp_path):
+    c = abrir(tmp_path)
+    povoar(c)
+    c.diário.compactar()
+    antes = estado(c)
+    c.fechar()
+    # snapshot gravado antes de existir o arquivo: sem a seção "#,A"
+    caminho = tmp_path / "snapshot.csv"
+    linhas = caminho.read_text(encoding="utf-8").splitlines(keepends=True)
+    corpo = "".join(linhas[:-1])
+    assert linhas[-2] == "#,A,0,0\n"
+    corpo = corpo[: -len(linhas[-2])]
+    dados = corpo.encode("utf-8")
+    caminho.write_bytes(dados + f"F,{zlib.crc32(dados)}\n".encode())
+
+    c2 = abrir(tmp_path)
+    assert estado(c2) == antes and c2.arquivo_repo.listar() == []
+    c2.fechar()
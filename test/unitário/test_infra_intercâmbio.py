@@ -0,0 +1,173 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+from infra.intercâmbio import (
+    ErroLinha,
+    exportar_eventos,
+    exportar_salas,
+    importar_eventos,
+    importar_salas,
+    ler_eventos,
+)
+from infra.repos_memória import MemEventoRepository, MemSalaRepository
+
+
+def test_importa_csv_sem_abortar_e_relata_cada_linha():
+    salas = MemSalaRepository()
+    r = importar_salas(
+        io.StringIO("nome,capacidade\nLab,10\nSem vaga,0\n,5\nAuditório,100\n"),
+        salas,
+    )
+    assert (r.importados, r.recusados) == (2, 2)
+    assert r.erros == (
+        ErroLinha(3, "capacidade inválida"),
+        ErroLinha(4, "nome inválido"),
+    )
+    assert [s.nome for s in salas.listar()] == ["Lab", "Auditório"]
+
+    eventos = MemEventoRepository()
+    texto = (
+        "1,Aula,2025-01-06 08:00,2025-01-06 09:00\n"
+        "1,Conflito,2025-01-06 08:30,2025-01-06 09:30\n"
+        "9,Sem sala,2025-01-06 08:00,2025-01-06 09:00\n"
+        "1,Invertido,2025-01-06 10:00,2025-01-06 09:00\n"
+        "x,Id ruim,2025-01-06 10:00,2025-01-06 11:00\n"
+        "1,Data ruim,06/01/2025,2025-01-06 11:00\n"
+        "1,Colunas\n"
+        '2,"Aula, 2",2025-01-06 08:00,2025-01-06 09:00\n'
+    )
+    recusas = []
+    r = importar_eventos(
+        io.StringIO(texto),
+        eventos,
+        salas,
+        tamanho_lote=3,
+        max_erros=2,
+        ao_recusar=recusas.append,
+    )
+    assert (r.importados, r.recusados) == (2, 6)
+    assert r.erros == tuple(recusas[:2])  # o resumo guarda só os primeiros
+    assert [(e.linha, e.erro) for e in recusas] == [
+        (2, "conflito de horário"),
+        (3, "sala não existe"),
+        (4, "intervalo de datas inválido"),
+        (5, "id da sala inválido"),
+        (6, "formato de data inválido (YYYY-MM-DD HH:MM)"),
+        (7, "esperadas 4 colunas"),
+    ]
+    assert [e.titulo for e in eventos.listar()] == ["Aula", "Aula, 2"]
+
+
+def test_jsonl_e_cabeçalho_com_colunas_em_outra_ordem():
+    linhas = [
+        '{"sala_id": 1, "titulo": "A", "inicio": "2025-01-06 08:00", "fim": "2025-01-06 09:00"}\n',
+        "\n",
+        "[1, 2]\n",
+        "{quebrado\n",
+        '{"sala_id": 1, "titulo": "B"}\n',
+    ]
+    itens = list(ler_eventos(linhas, "jsonl"))
+    assert itens[0][0] == 1 and itens[0][1].inicio == datetime(2025, 1, 6, 8)
+    assert itens[1:] == [
+        (3, "esperado um objeto JSON"),
+        (4, "JSON inválido"),
+        (5, "colunas ausentes: inicio, fim"),
+    ]
+
+    csv = "fim,titulo,id,sala_id,inicio\n2025-01-06 09:00,A,77,1,2025-01-06 08:00\n"
+    ((n, pedido),) = ler_eventos(io.StringIO(csv))
+    assert (n, pedido.sala_id, pedido.titulo) == (2, 1, "A")
+
+    with pytest.raises(ValueError):
+        importar_salas([], MemSalaRepository(), "xml")
+
+
+@pytest.mark.parametrize("formato", ["csv", "jsonl"])
+def test_exportar_e_reimportar_preserva_a_agenda(formato):
+    salas, eventos = MemSalaRepository(), MemEventoRepository()
+    for nome in ("Lab", "Sala, grande"):
+        salas.criar(nome, 20)
+    for h in (10, 8, 9):
+        eventos.criar(
+            h % 2 + 1,
+            f"Evento {h}",
+            datetime(2025, 1, 6, h),
+            datetime(2025, 1, 6, h + 1),
+        )
+
+    saída_salas, saída_eventos = io.StringIO(), io.StringIO()
+    assert exportar_salas(salas, saída_salas, formato) == 2
+    assert exportar_eventos(eventos, saída_eventos, formato) == 3
+    if formato == "jsonl":
+        primeira = json.loads(saída_eventos.getvalue().splitlines()[0])
+        assert primeira == {
+            "id": 2,
+            "sala_id": 1,
+            "titulo": "Evento 8",
+            "inicio": "2025-01-06 08:00",
+            "fim": "2025-01-06 09:00",
+        }
+    else:
+        assert (
+            saída_salas.getvalue()
+            == 'id,nome,capacidade\n1,Lab,20\n2,"Sala, grande",20\n'
+        )
+
+    novas_salas, novos_eventos = MemSalaRepository(), MemEventoRepository()
+    saída_salas.seek(0)
+    saída_eventos.seek(0)
+    assert importar_salas(saída_salas, novas_salas, formato).importados == 2
+    r = importar_eventos(saída_eventos, novos_eventos, novas_salas, formato)
+    assert (r.importados, r.recusados) == (3, 0)
+    assert novas_salas.listar() == salas.listar()
+    # ids novos, na ordem do arquivo (a da exportação)
+    assert [
+        (e.sala_id, e.titulo, e.inicio) for e in novos_eventos.iterar_ordenado()
+    ] == [(e.sala_id, e.titulo, e.inicio) for e in eventos.iterar_ordenado()]
+
+
+def test_linha_csv_malformada_vira_erro_da_linha():
+    # um campo acima do limite do módulo csv não aborta a importação
+    limite = csv.field_size_limit(20)
+    try:
+        salas = MemSalaRepository()
+        r = importar_salas(
+            io.StringIO("nome,capacidade\nLab,10\n" + "x" * 50 + ",5\nSem,3\n"),
+            salas,
+        )
+    finally:
+        csv.field_size_limit(limite)
+    assert (r.importados, r.recusados) == (2, 1)
+    (erro,) = r.erros
+    assert erro.linha == 3 and erro.erro.startswith("linha CSV malformada")
+    assert [s.nome for s in salas.listar()] == ["Lab", "Sem"]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "2025-01-05",
+        "2025-01-07 10:00:30",
+        "2025-01-07T10:00",
+        "2025-01-07 10:00+00:00",
+        "2025-02-30 10:00",
+    ],
+)
+def test_datas_fora_do_formato_da_fachada_são_recusadas(data):
+    linha = f"1,A,{data},2025-01-08 11:00\n"
+    assert list(ler_eventos(io.StringIO(linha))) == [
+        (1, "formato de data inválido (YYYY-MM-DD HH:MM)")
+    ]
+
+
+def test_datas_no_formato_da_fachada():
+    linhas = io.StringIO("1,A, 2025-01-07 10:00 ,2025-1-7 11:05\n")
+    ((_, pedido),) = ler_eventos(linhas)
+    assert (pedido.inicio, pedido.fim) == (
+        datetime(2025, 1, 7, 10),
+        datetime(2025, 1, 7, 11, 5),
+    )
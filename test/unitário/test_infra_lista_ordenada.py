@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from infra import lista_ordenada
+from infra.lista_ordenada import ListaOrdenada
+
+
+def test_lista_ordenada_mantém_ordem_entre_blocos(monkeypatch):
+    # blocos pequenos para exercitar divisão e remoção de blocos
+    monkeypatch.setattr(lista_ordenada, "_CARGA", 2)
+    lo = ListaOrdenada()
+    valores = list(range(50))
+    random.Random(0).shuffle(valores)
+    for v in valores:
+        lo.adicionar(v)
+    assert list(lo) == list(range(50))
+    assert len(lo) == 50
+
+    for v in valores[:30]:
+        lo.remover(v)
+    assert list(lo) == sorted(valores[30:])
+    assert list(lo.a_partir_de(25)) == [v for v in sorted(valores[30:]) if v >= 25]
+    assert list(lo.a_partir_de(100)) == []
+
+
+def test_lista_ordenada_chave_parcial_e_remover_ausente():
+    lo = ListaOrdenada()
+    for item in ((2, "b"), (1, "a"), (2, "a")):
+        lo.adicionar(item)
+    assert list(lo.a_partir_de((2,))) == [(2, "a"), (2, "b")]
+    with pytest.raises(ValueError):
+        lo.remover((3, "x"))
+
+
+def test_lista_ordenada_de_ordenados_equivale_a_inserir(monkeypatch):
+    monkeypatch.setattr(lista_ordenada, "_CARGA", 3)
+    lo = ListaOrdenada.de_ordenados(list(range(20)))
+    assert list(lo) == list(range(20)) and len(lo) == 20
+    assert list(lo.a_partir_de(17)) == [17, 18, 19]
+    # continua aceitando inserções e remoções depois da carga
+    lo.adicionar(7.5)
+    lo.remover(0)
+    assert list(lo)[:8] == [1, 2, 3, 4, 5, 6, 7, 7.5]
+    assert list(ListaOrdenada.de_ordenados([])) == []
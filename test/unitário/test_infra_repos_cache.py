@@ -0,0 +1,160 @@
+import random
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.container import criar_container_com_cache
+from domínio.serviços import agendar_evento, buscar_salas_disponíveis
+from infra.repos_cache import CacheEventoRepository
+from infra.repos_memória import MemEventoRepository
+
+
+def _h(hora: int, minuto: int = 0) -> datetime:
+    return datetime(2025, 1, 6, hora, minuto)
+
+
+def test_cache_conta_acertos_e_falhas():
+    repo = CacheEventoRepository(MemEventoRepository())
+    e = repo.criar(1, "Aula", _h(8), _h(9))
+
+    assert repo.encontrar_conflito(1, _h(8, 30), _h(10)) == e
+    assert repo.encontrar_conflito(1, _h(8, 30), _h(10)) == e
+    assert repo.existe_sobreposição(1, _h(8, 30), _h(10))
+    assert repo.listar_no_intervalo(_h(0), _h(23)) == [e]
+    repo.listar_no_intervalo(_h(0), _h(23)).clear()  # cópia: não afeta o cache
+    assert repo.listar_no_intervalo(_h(0), _h(23)) == [e]
+
+    st = repo.estatísticas()
+    assert (st.acertos, st.falhas, st.tamanho) == (4, 2, 2)
+    assert st.taxa_de_acerto == pytest.approx(4 / 6)
+
+
+def test_escrita_invalida_só_a_sala_e_janela_afetadas():
+    repo = CacheEventoRepository(MemEventoRepository())
+    consultas = [
+        (1, _h(8), _h(9)),  # afetada
+        (1, _h(14), _h(15)),  # mesma sala, outra janela
+        (2, _h(8), _h(9)),  # outra sala, mesma janela
+    ]
+    for c in consultas:
+        assert repo.encontrar_conflito(*c) is None
+    assert repo.listar_no_intervalo(_h(8), _h(9)) == []  # todas as salas: afetada
+    assert repo.listar_por_sala(1) == []  # a sala inteira: afetada
+
+    novo = repo.criar(1, "Reunião", _h(8, 30), _h(8, 45))
+
+    st = repo.estatísticas()
+    assert (st.invalidadas, st.tamanho) == (3, 2)
+    assert repo.encontrar_conflito(*consultas[0]) == novo
+    assert repo.encontrar_conflito(*consultas[1]) is None
+    assert repo.encontrar_conflito(*consultas[2]) is None
+    assert repo.listar_no_intervalo(_h(8), _h(9)) == [novo]
+    assert repo.listar_por_sala(1) == [novo]
+    assert repo.estatísticas().acertos == 2
+
+
+def test_atualizar_e_remover_invalidam_antes_e_depois():
+    repo = CacheEventoRepository(MemEventoRepository())
+    e = repo.criar(1, "Aula", _h(8), _h(9))
+    assert repo.encontrar_conflito(1, _h(8), _h(9)) == e
+    assert repo.encontrar_conflito(2, _h(10), _h(11)) is None
+
+    movido = repo.atualizar(replace(e, sala_id=2, inicio=_h(10), fim=_h(11)))
+    assert repo.encontrar_conflito(1, _h(8), _h(9)) is None
+    assert repo.encontrar_conflito(2, _h(10), _h(11)) == movido
+
+    assert repo.remover(e.id)
+    assert repo.encontrar_conflito(2, _h(10), _h(11)) is None
+    assert not repo.remover(e.id)
+
+
+def test_remover_por_sala_invalida_as_consultas_da_sala():
+    repo = CacheEventoRepository(MemEventoRepository())
+    e = repo.criar(1, "Aula", _h(8), _h(9))
+    outro = repo.criar(2, "Aula", _h(8), _h(9))
+    assert repo.encontrar_conflito(1, _h(8), _h(9)) == e
+    assert repo.encontrar_conflito(2, _h(8), _h(9)) == outro
+    assert repo.listar_por_sala(1) == [e]
+
+    assert repo.remover_por_sala(1) == [e]
+    assert repo.encontrar_conflito(1, _h(8), _h(9)) is None
+    assert repo.listar_por_sala(1) == []
+    assert repo.encontrar_conflito(2, _h(8), _h(9)) == outro
+    assert repo.estatísticas().acertos == 1  # só a sala 2 continuou no cache
+
+
+def test_descarta_a_entrada_usada_há_mais_tempo():
+    repo = CacheEventoRepository(MemEventoRepository(), capacidade=2)
+    repo.encontrar_conflito(1, _h(8), _h(9))
+    repo.encontrar_conflito(1, _h(9), _h(10))
+    repo.encontrar_conflito(1, _h(8), _h(9))  # acerto: vira a mais recente
+    repo.encontrar_conflito(1, _h(10), _h(11))  # descarta (9, 10)
+
+    st = repo.estatísticas()
+    assert (st.descartadas, st.tamanho) == (1, 2)
+    repo.encontrar_conflito(1, _h(8), _h(9))
+    assert repo.estatísticas().acertos == 2
+
+    with pytest.raises(ValueError):
+        CacheEventoRepository(MemEventoRepository(), capacidade=0)
+
+
+def test_cache_responde_igual_ao_repositório_sem_cache():
+    rng = random.Random(3)
+    referência = MemEventoRepository()
+    repo = CacheEventoRepository(MemEventoRepository(), capacidade=64)
+
+    def janela():
+        inicio = _h(0) + timedelta(minutes=30 * rng.randrange(48))
+        return inicio, inicio + timedelta(minutes=30 * rng.randint(1, 6))
+
+    for _ in range(2000):
+        op = rng.random()
+        sala = rng.randint(1, 4)
+        ids = [e.id for e in referência.listar()]
+        if op < 0.1:
+            inicio, fim = janela()
+            assert repo.criar(sala, "x", inicio, fim) == referência.criar(
+                sala, "x", inicio, fim
+            )
+        elif op < 0.15 and ids:
+            e = referência.obter_por_id(rng.choice(ids))
+            inicio, fim = janela()
+            novo = replace(e, sala_id=sala, inicio=inicio, fim=fim)
+            assert repo.atualizar(novo) == referência.atualizar(novo)
+        elif op < 0.2 and ids:
+            eid = rng.choice(ids)
+            assert repo.remover(eid) == referência.remover(eid)
+        elif op < 0.6:
+            inicio, fim = janela()
+            assert repo.encontrar_conflito(
+                sala, inicio, fim
+            ) == referência.encontrar_conflito(sala, inicio, fim)
+        elif op < 0.9:
+            inicio, fim = janela()
+            filtro = sala if op < 0.75 else None
+            assert repo.listar_no_intervalo(
+                inicio, fim, filtro
+            ) == referência.listar_no_intervalo(inicio, fim, filtro)
+        else:
+            assert repo.listar_por_sala(sala) == referência.listar_por_sala(sala)
+    st = repo.estatísticas()
+    assert st.acertos > 0 and st.invalidadas > 0 and st.descartadas > 0
+
+
+def test_container_com_cache_e_serviços():
+    c = criar_container_com_cache(capacidade=128)
+    assert isinstance(c.evento_repo, CacheEventoRepository)
+    sala = c.sala_repo.criar("Lab", 20)
+
+    livres = buscar_salas_disponíveis(c.evento_repo, c.sala_repo, 10, _h(8), _h(9))
+    assert livres == [sala]
+    assert agendar_evento(c.evento_repo, c.sala_repo, sala.id, "A", _h(8), _h(9))
+    # o agendamento invalidou a consulta anterior
+    assert buscar_salas_disponíveis(c.evento_repo, c.sala_repo, 10, _h(8), _h(9)) == []
+    assert (
+        agendar_evento(c.evento_repo, c.sala_repo, sala.id, "B", _h(8, 30), _h(10))
+        is None
+    )
+    c.fechar()
@@ -1,9 +1,14 @@
-from datetime import datetime
+from dataclasses import replace
+from datetime import datetime, timedelta
 
 
-from domínio.modelos import Sala, Evento
+from domínio.modelos import Sala, Evento, Frequência, Recorrência
 
-from infra.repos_memória import MemSalaRepository, MemEventoRepository
+from infra.repos_memória import (
+    MemSalaRepository,
+    MemEventoRepository,
+    MemRecorrênciaRepository,
+)
 
 
 def dt(hm: str) -> datetime:
@@ -96,3 +101,291 @@ def test_mem_evento_repo_listar_por_sala_nao_muda_estado():
     # Checa que o estado interno continua com 3 elementos, e listar_por_sala(1) continua [1,3]
     assert [e.id for e in re.listar()] == [1, 2, 3]
     assert [e.id for e in re.listar_por_sala(1)] == [1, 3]
+
+
+def test_mem_evento_repo_existe_sobreposição_usa_índice_por_sala():
+    re = MemEventoRepository()
+    # evento longo seguido de eventos curtos: o longo ainda cobre 11:00
+    re.adicionar(
+        Evento(id=1, sala_id=1, titulo="Longo", inicio=dt("08:00"), fim=dt("12:00"))
+    )
+    re.adicionar(
+        Evento(id=2, sala_id=1, titulo="Curto", inicio=dt("09:00"), fim=dt("09:30"))
+    )
+    re.adicionar(
+        Evento(id=3, sala_id=2, titulo="Outra", inicio=dt("13:00"), fim=dt("14:00"))
+    )
+
+    assert re.existe_sobreposição(1, dt("11:00"), dt("11:30")) is True
+    c = re.encontrar_conflito(1, dt("11:00"), dt("11:30"))
+    assert c is not None and c.id == 1
+    # bordas não conflitam
+    assert re.existe_sobreposição(1, dt("12:00"), dt("13:00")) is False
+    assert re.existe_sobreposição(1, dt("07:00"), dt("08:00")) is False
+    # outra sala / sala sem eventos
+    assert re.existe_sobreposição(2, dt("09:00"), dt("10:00")) is False
+    assert re.existe_sobreposição(99, dt("09:00"), dt("10:00")) is False
+    # ignora o próprio evento
+    assert re.existe_sobreposição(2, dt("13:00"), dt("14:00"), 3) is False
+    # intervalo inválido nunca conflita
+    assert re.existe_sobreposição(1, dt("11:00"), dt("10:00")) is False
+
+
+def test_mem_evento_repo_índice_acompanha_atualizar_e_remover():
+    re = MemEventoRepository()
+    re.adicionar(
+        Evento(id=1, sala_id=1, titulo="A", inicio=dt("09:00"), fim=dt("10:00"))
+    )
+
+    # move o evento para a sala 2: sala 1 fica livre
+    re.atualizar(
+        Evento(id=1, sala_id=2, titulo="A", inicio=dt("09:00"), fim=dt("10:00"))
+    )
+    assert re.existe_sobreposição(1, dt("09:00"), dt("10:00")) is False
+    assert re.existe_sobreposição(2, dt("09:30"), dt("09:45")) is True
+
+    assert re.remover(1) is True
+    assert re.existe_sobreposição(2, dt("09:30"), dt("09:45")) is False
+
+
+def test_mem_repos_proximo_id_monotônico_após_remover_o_último():
+    rs = MemSalaRepository()
+    rs.adicionar(Sala(id=rs.proximo_id(), nome="S1", capacidade=1))
+    rs.adicionar(Sala(id=rs.proximo_id(), nome="S2", capacidade=1))
+    assert rs.remover(2) is True
+    # o id 2 não é reutilizado
+    assert rs.proximo_id() == 3
+
+    re = MemEventoRepository()
+    re.adicionar(
+        Evento(
+            id=re.proximo_id(),
+            sala_id=1,
+            titulo="A",
+            inicio=dt("09:00"),
+            fim=dt("10:00"),
+        )
+    )
+    assert re.remover(1) is True
+    assert re.proximo_id() == 2
+
+    # ids explícitos maiores avançam o contador
+    re.adicionar(
+        Evento(id=10, sala_id=1, titulo="B", inicio=dt("09:00"), fim=dt("10:00"))
+    )
+    assert re.proximo_id() == 11
+
+
+def test_mem_repos_atualizar_preserva_ordem_de_listar():
+    rs = MemSalaRepository()
+    for nome in ("S1", "S2", "S3"):
+        rs.adicionar(Sala(id=rs.proximo_id(), nome=nome, capacidade=1))
+    rs.atualizar(Sala(id=1, nome="S1X", capacidade=2))
+    assert [s.nome for s in rs.listar()] == ["S1X", "S2", "S3"]
+
+    re = MemEventoRepository()
+    for titulo, hm in (("A", "07:00"), ("B", "08:00"), ("C", "09:00")):
+        h = int(hm[:2])
+        re.adicionar(
+            Evento(
+                id=re.proximo_id(),
+                sala_id=1,
+                titulo=titulo,
+                inicio=dt(hm),
+                fim=dt(f"{h:02d}:30"),
+            )
+        )
+    re.atualizar(
+        Evento(id=1, sala_id=1, titulo="AX", inicio=dt("10:00"), fim=dt("11:00"))
+    )
+    assert [e.titulo for e in re.listar()] == ["AX", "B", "C"]
+    # listar_por_sala segue a ordem de início
+    assert [e.titulo for e in re.listar_por_sala(1)] == ["B", "C", "AX"]
+
+
+def test_mem_sala_repo_listar_por_capacidade_mínima():
+    rs = MemSalaRepository()
+    for nome, cap in (("Grande", 80), ("Média", 40), ("Pequena", 10), ("Média 2", 40)):
+        rs.adicionar(Sala(id=rs.proximo_id(), nome=nome, capacidade=cap))
+
+    assert [s.nome for s in rs.listar_por_capacidade_mínima(40)] == [
+        "Média",
+        "Média 2",
+        "Grande",
+    ]
+    assert rs.listar_por_capacidade_mínima(81) == []
+
+    # índice acompanha atualização de capacidade e remoção
+    rs.atualizar(Sala(id=3, nome="Pequena", capacidade=50))
+    rs.remover(2)
+    assert [s.nome for s in rs.listar_por_capacidade_mínima(40)] == [
+        "Média 2",
+        "Pequena",
+        "Grande",
+    ]
+
+
+def test_mem_sala_repo_paginação_por_id():
+    rs = MemSalaRepository()
+    for i in range(1, 6):
+        rs.adicionar(Sala(id=i, nome=f"S{i}", capacidade=10))
+    rs.remover(3)
+
+    assert [s.id for s in rs.listar_pagina(2)] == [1, 2]
+    assert [s.id for s in rs.listar_pagina(2, após=2)] == [4, 5]
+    assert rs.listar_pagina(2, após=5) == []
+    assert [s.id for s in rs.iterar_ordenado(tamanho_lote=1)] == [1, 2, 4, 5]
+
+
+def test_mem_evento_repo_paginação_segue_índice_ordenado():
+    re = MemEventoRepository()
+    for eid, sala, ini in ((1, 2, "10:00"), (2, 1, "10:00"), (3, 1, "08:00")):
+        re.adicionar(
+            Evento(
+                id=eid, sala_id=sala, titulo=f"E{eid}", inicio=dt(ini), fim=dt("12:00")
+            )
+        )
+
+    assert [e.id for e in re.listar_pagina(2)] == [3, 2]
+    assert [e.id for e in re.listar_pagina(5, após=(dt("10:00"), 1, 2))] == [1]
+    # o cursor não precisa existir no repositório
+    assert [e.id for e in re.listar_pagina(5, após=(dt("09:00"), 0, 0))] == [2, 1]
+
+    # atualizar reposiciona o evento no índice global
+    re.atualizar(
+        Evento(id=3, sala_id=1, titulo="E3", inicio=dt("11:00"), fim=dt("12:00"))
+    )
+    assert [e.id for e in re.iterar_ordenado(tamanho_lote=1)] == [2, 1, 3]
+    re.remover(2)
+    assert [e.id for e in re.iterar_ordenado()] == [1, 3]
+
+
+def test_mem_evento_repo_listar_no_intervalo():
+    re = MemEventoRepository()
+    for eid, sala, ini, fim in (
+        (1, 1, "08:00", "12:00"),
+        (2, 2, "09:00", "09:30"),
+        (3, 1, "10:00", "10:30"),
+        (4, 2, "11:00", "12:00"),
+    ):
+        re.adicionar(
+            Evento(id=eid, sala_id=sala, titulo=f"E{eid}", inicio=dt(ini), fim=dt(fim))
+        )
+
+    # o evento 1 começou antes, mas ainda está em andamento; o 4 começa no fim
+    assert [e.id for e in re.listar_no_intervalo(dt("09:15"), dt("11:00"))] == [1, 2, 3]
+    assert [e.id for e in re.listar_no_intervalo(dt("09:15"), dt("11:00"), 1)] == [1, 3]
+    assert [e.id for e in re.listar_no_intervalo(dt("09:15"), dt("11:00"), 2)] == [2]
+    assert re.listar_no_intervalo(dt("12:00"), dt("13:00")) == []
+    assert re.listar_no_intervalo(dt("09:15"), dt("11:00"), 9) == []
+    assert re.listar_no_intervalo(dt("11:00"), dt("09:00")) == []
+
+
+def test_mem_recorrência_repo_básico():
+    rr = MemRecorrênciaRepository()
+    r1 = Recorrência(
+        id=rr.proximo_id(),
+        sala_id=1,
+        titulo="Aula",
+        inicio=datetime(2025, 1, 6, 9),
+        fim=datetime(2025, 1, 6, 11),
+        frequência=Frequência.SEMANAL,
+        até=datetime(2025, 3, 31),
+        exceções=frozenset({datetime(2025, 1, 13, 9)}),
+    )
+    rr.adicionar(r1)
+    r2 = replace(r1, id=rr.proximo_id(), sala_id=2, até=datetime(2025, 1, 31))
+    rr.adicionar(r2)
+    assert rr.obter_por_id(1) == r1
+    assert [r.id for r in rr.listar()] == [1, 2]
+    assert rr.listar_por_sala(2) == [r2]
+
+    fev = (datetime(2025, 2, 1), datetime(2025, 3, 1))
+    assert rr.listar_ativas_no_intervalo(*fev) == [r1]
+    assert rr.listar_ativas_no_intervalo(*fev, sala_id=2) == []
+    assert [
+        r.id for r in rr.listar_ativas_no_intervalo(datetime(2025, 1, 1), fev[0])
+    ] == [1, 2]
+
+    r1x = replace(r1, exceções=r1.exceções | {datetime(2025, 1, 20, 9)})
+    rr.atualizar(r1x)
+    assert rr.obter_por_id(1).exceções == r1x.exceções
+    assert rr.remover(2) is True
+    assert rr.remover(2) is False
+    assert rr.listar_por_sala(2) == []
+    assert rr.proximo_id() == 3
+
+
+def test_mem_repos_remover_por_sala_usa_o_índice_da_sala():
+    re = MemEventoRepository()
+    for i, (sala, hm) in enumerate([(1, "09:00"), (2, "09:00"), (1, "08:00")]):
+        ini = dt(hm)
+        re.adicionar(
+            Evento(
+                id=i + 1,
+                sala_id=sala,
+                titulo="A",
+                inicio=ini,
+                fim=ini.replace(hour=ini.hour + 1),
+            )
+        )
+
+    removidos = re.remover_por_sala(1)
+    assert [e.id for e in removidos] == [3, 1]  # ordem de listar_por_sala
+    assert [e.id for e in re.listar()] == [2]
+    assert re.listar_por_sala(1) == []
+    assert re.existe_sobreposição(1, dt("08:00"), dt("10:00")) is False
+    assert [e.id for e in re.listar_no_intervalo(dt("00:00"), dt("23:00"))] == [2]
+    assert re.remover_por_sala(1) == []
+    # a sala volta a receber eventos normalmente
+    re.adicionar(
+        Evento(id=4, sala_id=1, titulo="B", inicio=dt("09:00"), fim=dt("10:00"))
+    )
+    assert re.existe_sobreposição(1, dt("09:30"), dt("09:45")) is True
+
+    rr = MemRecorrênciaRepository()
+    for rid, sala in ((1, 1), (2, 2), (3, 1)):
+        rr.adicionar(
+            Recorrência(
+                id=rid,
+                sala_id=sala,
+                titulo="R",
+                inicio=dt("08:00"),
+                fim=dt("09:00"),
+                frequência=Frequência.SEMANAL,
+                até=datetime(2025, 2, 1),
+            )
+        )
+    assert [r.id for r in rr.remover_por_sala(1)] == [1, 3]
+    assert [r.id for r in rr.listar()] == [2]
+    assert rr.listar_por_sala(1) == []
+
+
+def test_mem_evento_repo_maior_duração_acompanha_remoções():
+    re = MemEventoRepository()
+    re.adicionar(
+        Evento(id=1, sala_id=1, titulo="Curto", inicio=dt("09:00"), fim=dt("09:30"))
+    )
+    re.adicionar(
+        Evento(id=2, sala_id=1, titulo="Longo", inicio=dt("01:00"), fim=dt("23:00"))
+    )
+    re.adicionar(
+        Evento(id=3, sala_id=1, titulo="Longo", inicio=dt("02:00"), fim=dt("12:00"))
+    )
+    assert re._durações[1].máxima() == timedelta(hours=22)
+
+    # a faixa de busca encolhe quando o evento mais longo sai
+    re.remover(2)
+    assert re._durações[1].máxima() == timedelta(hours=10)
+    assert re._durações_global.máxima() == timedelta(hours=10)
+    re.atualizar(
+        Evento(id=3, sala_id=2, titulo="Longo", inicio=dt("02:00"), fim=dt("12:00"))
+    )
+    assert re._durações[1].máxima() == timedelta(minutes=30)
+    assert re.existe_sobreposição(1, dt("09:15"), dt("10:00")) is True
+    assert re.existe_sobreposição(2, dt("11:00"), dt("11:30")) is True
+
+    re.remover_por_sala(2)
+    assert re._durações_global.máxima() == timedelta(minutes=30)
+    re.remover(1)
+    assert re._durações[1].máxima() == timedelta(0)
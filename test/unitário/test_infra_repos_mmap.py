@@ -0,0 +1,144 @@
+import random
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.container import criar_container_mmap
+from domínio import serviços
+from domínio.modelos import Evento, Sala
+from infra.repos_memória import MemEventoRepository
+from infra.repos_mmap import (
+    MmapEventoRepository,
+    SnapshotBinário,
+    gravar_snapshot_binário,
+)
+
+
+def dt(hm: str, dia: int = 1) -> datetime:
+    h, m = map(int, hm.split(":"))
+    return datetime(2025, 1, dia, h, m)
+
+
+def eventos_aleatórios(n: int, salas: int = 4, semente: int = 0) -> list[Evento]:
+    rng = random.Random(semente)
+    eventos = []
+    for i in range(1, n + 1):
+        inicio = dt("07:00") + timedelta(minutes=15 * rng.randrange(300))
+        duração = timedelta(minutes=15 * rng.randint(1, 12))
+        titulo = rng.choice(["Aula", "Reunião", "Prova, final", "Çá\nx"])
+        eventos.append(
+            Evento(i, rng.randint(1, salas), titulo, inicio, inicio + duração)
+        )
+    return eventos
+
+
+@pytest.fixture
+def par(tmp_path):
+    """Mesmo conteúdo em um repositório mapeado e em um em memória."""
+    eventos = eventos_aleatórios(300)
+    caminho = tmp_path / "agenda.bin"
+    gravar_snapshot_binário(caminho, [Sala(1, "A", 10)], eventos, último_id_evento=400)
+    mem = MemEventoRepository()
+    for e in eventos:
+        mem.adicionar(e)
+    mem._carregar((), 400)
+    repo = MmapEventoRepository(SnapshotBinário(caminho))
+    yield repo, mem
+    repo.fechar()
+
+
+def conferir(repo, mem) -> None:
+    assert sorted(repo.listar(), key=lambda e: e.id) == sorted(
+        mem.listar(), key=lambda e: e.id
+    )
+    assert repo.proximo_id() == mem.proximo_id()
+    for sala in range(0, 6):
+        assert repo.listar_por_sala(sala) == mem.listar_por_sala(sala)
+    for h in range(6, 23):
+        ini, fim = dt(f"{h}:10"), dt(f"{h}:10") + timedelta(minutes=50)
+        assert repo.listar_no_intervalo(ini, fim) == mem.listar_no_intervalo(ini, fim)
+        for sala in range(1, 5):
+            assert repo.listar_no_intervalo(ini, fim, sala) == mem.listar_no_intervalo(
+                ini, fim, sala
+            )
+            assert repo.existe_sobreposição(sala, ini, fim) == mem.existe_sobreposição(
+                sala, ini, fim
+            )
+    assert list(repo.iterar_ordenado(7)) == list(mem.iterar_ordenado(7))
+
+
+def test_consultas_equivalentes_ao_repositório_em_memória(par):
+    repo, mem = par
+    conferir(repo, mem)
+    assert repo.obter_por_id(5) == mem.obter_por_id(5)
+    assert repo.obter_por_id(999) is None
+
+
+def test_escritas_sobrepõem_o_snapshot(par):
+    repo, mem = par
+    for r in (repo, mem):
+        r.remover(3)
+        r.atualizar(replace(r.obter_por_id(10), sala_id=2, inicio=dt("06:00")))
+        novo = r.criar(1, "Novo", dt("05:00"), dt("05:30"))
+        assert novo.id == 401  # ids do snapshot não são reutilizados
+        r.atualizar(replace(novo, titulo="Novo 2"))
+        r.remover(11)
+        r.adicionar(replace(r.obter_por_id(12), titulo="X"))
+    assert not repo.remover(3) and not repo.remover(11)
+    assert repo.obter_por_id(3) is None and repo.obter_por_id(10).sala_id == 2
+    conferir(repo, mem)
+    # conflito com evento alterado e ignorando o próprio evento
+    e10 = repo.obter_por_id(10)
+    for r in (repo, mem):
+        assert r.encontrar_conflito(2, e10.inicio, e10.fim) == e10
+    livre = [
+        r.encontrar_conflito(2, e10.inicio, e10.fim, ignorar_evento_id=10) is None
+        for r in (repo, mem)
+    ]
+    assert livre[0] == livre[1]
+
+
+def test_container_mmap_com_serviços(tmp_path):
+    caminho = tmp_path / "agenda.bin"
+    gravar_snapshot_binário(
+        caminho,
+        [Sala(1, "Lab", 20), Sala(3, "Auditório", 100)],
+        [Evento(1, 1, "Aula", dt("09:00"), dt("10:00"))],
+        último_id_sala=5,
+    )
+    c = criar_container_mmap(caminho)
+    assert [s.nome for s in c.sala_repo.listar()] == ["Lab", "Auditório"]
+    assert c.sala_repo.proximo_id() == 6
+    r = serviços.agendar_evento_detalhado(
+        c.evento_repo, c.sala_repo, 1, "Outra", dt("09:30"), dt("10:30")
+    )
+    assert r.conflito == Evento(1, 1, "Aula", dt("09:00"), dt("10:00"))
+    assert (
+        serviços.agendar_evento(
+            c.evento_repo, c.sala_repo, 1, "Outra", dt("10:00"), dt("11:00")
+        ).id
+        == 2
+    )
+    c.fechar()
+
+
+def test_formato_e_erros(tmp_path):
+    caminho = tmp_path / "agenda.bin"
+    with pytest.raises(ValueError, match="segundos"):
+        gravar_snapshot_binário(
+            caminho, [], [Evento(1, 1, "A", dt("09:00").replace(second=5), dt("10:00"))]
+        )
+    gravar_snapshot_binário(caminho, [], [])
+    vazio = SnapshotBinário(caminho)
+    assert vazio.n_eventos == 0
+    vazio.fechar()
+
+    gravar_snapshot_binário(caminho, [], eventos_aleatórios(10))
+    dados = caminho.read_bytes()
+    caminho.write_bytes(dados[:-3])
+    with pytest.raises(ValueError, match="truncado"):
+        SnapshotBinário(caminho)
+    caminho.write_bytes(b"outra coisa" + dados)
+    with pytest.raises(ValueError, match="não é um snapshot"):
+        SnapshotBinário(caminho)
@@ -0,0 +1,273 @@
+from dataclasses import replace
+from datetime import datetime
+
+from domínio.modelos import Sala, Evento, Frequência, Recorrência
+
+from infra.repos_sqlite import (
+    SQLiteSalaRepository,
+    SQLiteEventoRepository,
+    SQLiteRecorrênciaRepository,
+    conectar,
+)
+
+
+def dt(hm: str) -> datetime:
+    h, m = map(int, hm.split(":"))
+    return datetime(2025, 1, 1, h, m)
+
+
+def test_sqlite_sala_repo_básico():
+    rs = SQLiteSalaRepository(conectar())
+
+    # estado inicial
+    assert rs.listar() == []
+    assert rs.obter_por_id(1) is None
+    assert rs.proximo_id() == 1
+
+    # adicionar
+    s1 = Sala(id=rs.proximo_id(), nome="Sala 1", capacidade=10)
+    rs.adicionar(s1)
+    assert rs.obter_por_id(1) == s1
+    assert [s.id for s in rs.listar()] == [1]
+    assert rs.proximo_id() == 2
+
+    # atualizar
+    s1x = Sala(id=1, nome="Sala 1X", capacidade=20)
+    assert rs.atualizar(s1x) is s1x
+    assert rs.obter_por_id(1) == s1x
+
+    # remover (id não é reutilizado)
+    assert rs.remover(999) is False
+    assert rs.remover(1) is True
+    assert rs.listar() == []
+    assert rs.proximo_id() == 2
+
+
+def test_sqlite_evento_repo_básico():
+    re = SQLiteEventoRepository(conectar())
+
+    assert re.listar() == []
+    assert re.obter_por_id(1) is None
+    assert re.proximo_id() == 1
+
+    e1 = Evento(
+        id=re.proximo_id(), sala_id=1, titulo="A", inicio=dt("09:00"), fim=dt("10:00")
+    )
+    re.adicionar(e1)
+    assert re.obter_por_id(1) == e1
+    assert [e.id for e in re.listar()] == [1]
+    assert [e.id for e in re.listar_por_sala(1)] == [1]
+    assert re.listar_por_sala(2) == []
+    assert re.proximo_id() == 2
+
+    e1x = Evento(id=1, sala_id=1, titulo="AX", inicio=dt("09:30"), fim=dt("10:30"))
+    assert re.atualizar(e1x) is e1x
+    assert re.obter_por_id(1) == e1x
+
+    assert re.remover(999) is False
+    assert re.remover(1) is True
+    assert re.listar() == []
+
+
+def test_sqlite_evento_repo_conflitos():
+    re = SQLiteEventoRepository(conectar())
+    re.adicionar(
+        Evento(id=1, sala_id=1, titulo="Longo", inicio=dt("08:00"), fim=dt("12:00"))
+    )
+    re.adicionar(
+        Evento(id=2, sala_id=1, titulo="Curto", inicio=dt("09:00"), fim=dt("09:30"))
+    )
+
+    c = re.encontrar_conflito(1, dt("11:00"), dt("11:30"))
+    assert c is not None and c.id == 1
+    assert re.existe_sobreposição(1, dt("11:00"), dt("11:30")) is True
+    assert re.existe_sobreposição(1, dt("12:00"), dt("13:00")) is False
+    assert re.existe_sobreposição(1, dt("07:00"), dt("08:00")) is False
+    assert re.existe_sobreposição(2, dt("09:00"), dt("10:00")) is False
+    assert re.existe_sobreposição(1, dt("11:00"), dt("11:30"), 1) is False
+    assert re.existe_sobreposição(1, dt("11:00"), dt("10:00")) is False
+
+    # mover para outra sala atualiza a checagem
+    re.atualizar(
+        Evento(id=1, sala_id=2, titulo="Longo", inicio=dt("08:00"), fim=dt("12:00"))
+    )
+    assert re.existe_sobreposição(1, dt("11:00"), dt("11:30")) is False
+    assert re.existe_sobreposição(2, dt("11:00"), dt("11:30")) is True
+
+
+def test_sqlite_evento_repo_maior_duração_acompanha_remoções():
+    con = conectar()
+    re = SQLiteEventoRepository(con)
+
+    def duração_máx(sala_id):
+        (minutos,) = con.execute(
+            "SELECT duracao / 60000000 FROM eventos_duracao_max WHERE sala_id = ?",
+            (sala_id,),
+        ).fetchone()
+        return minutos
+
+    re.adicionar(
+        Evento(id=1, sala_id=1, titulo="Curto", inicio=dt("09:00"), fim=dt("09:30"))
+    )
+    re.adicionar(
+        Evento(id=2, sala_id=1, titulo="Longo", inicio=dt("01:00"), fim=dt("23:00"))
+    )
+    re.adicionar(
+        Evento(id=3, sala_id=1, titulo="Longo", inicio=dt("02:00"), fim=dt("12:00"))
+    )
+    assert duração_máx(1) == 22 * 60
+
+    # a faixa de busca encolhe quando o evento mais longo sai
+    assert re.remover(2) is True
+    assert duração_máx(1) == 10 * 60
+    re.atualizar(
+        Evento(id=3, sala_id=2, titulo="Longo", inicio=dt("02:00"), fim=dt("12:00"))
+    )
+    assert duração_máx(1) == 30
+    assert duração_máx(2) == 10 * 60
+    assert re.existe_sobreposição(1, dt("09:15"), dt("10:00")) is True
+    assert re.existe_sobreposição(2, dt("11:00"), dt("11:30")) is True
+
+    assert re.remover(3) is True
+    assert re.remover(3) is False
+    assert duração_máx(2) == 0
+
+
+def test_sqlite_persiste_entre_conexões(tmp_path):
+    caminho = tmp_path / "salas.db"
+    con = conectar(caminho)
+    SQLiteSalaRepository(con).adicionar(Sala(id=1, nome="S1", capacidade=5))
+    SQLiteEventoRepository(con).adicionar(
+        Evento(id=1, sala_id=1, titulo="A", inicio=dt("09:00"), fim=dt("10:00"))
+    )
+    con.close()
+
+    con2 = conectar(caminho)
+    assert SQLiteSalaRepository(con2).listar() == [Sala(id=1, nome="S1", capacidade=5)]
+    re = SQLiteEventoRepository(con2)
+    assert [e.titulo for e in re.listar()] == ["A"]
+    assert re.existe_sobreposição(1, dt("09:30"), dt("09:45")) is True
+    con2.close()
+
+
+def test_sqlite_evento_repo_adicionar_em_lote():
+    re = SQLiteEventoRepository(conectar())
+    novos = [
+        Evento(id=1, sala_id=1, titulo="A", inicio=dt("09:00"), fim=dt("10:00")),
+        Evento(id=2, sala_id=2, titulo="B", inicio=dt("09:00"), fim=dt("12:00")),
+    ]
+    assert re.adicionar_em_lote(novos) == novos
+    assert [e.id for e in re.listar()] == [1, 2]
+    assert re.proximo_id() == 3
+    assert re.existe_sobreposição(2, dt("11:00"), dt("11:30")) is True
+
+
+def test_sqlite_sala_repo_listar_por_capacidade_mínima():
+    rs = SQLiteSalaRepository(conectar())
+    for nome, cap in (("Grande", 80), ("Média", 40), ("Pequena", 10)):
+        rs.adicionar(Sala(id=rs.proximo_id(), nome=nome, capacidade=cap))
+    assert [s.nome for s in rs.listar_por_capacidade_mínima(20)] == ["Média", "Grande"]
+
+
+def test_sqlite_paginação_por_cursor():
+    con = conectar()
+    rs = SQLiteSalaRepository(con)
+    re = SQLiteEventoRepository(con)
+    for i in (1, 2, 3):
+        rs.adicionar(Sala(id=i, nome=f"S{i}", capacidade=10))
+    assert [s.id for s in rs.listar_pagina(2, após=1)] == [2, 3]
+    assert [s.id for s in rs.iterar_ordenado(tamanho_lote=2)] == [1, 2, 3]
+
+    for eid, sala, ini in ((1, 2, "10:00"), (2, 1, "10:00"), (3, 1, "08:00")):
+        re.adicionar(
+            Evento(
+                id=eid, sala_id=sala, titulo=f"E{eid}", inicio=dt(ini), fim=dt("12:00")
+            )
+        )
+    assert [e.id for e in re.listar_pagina(2)] == [3, 2]
+    assert [e.id for e in re.listar_pagina(5, após=(dt("10:00"), 1, 2))] == [1]
+    assert [e.id for e in re.iterar_ordenado(tamanho_lote=1)] == [3, 2, 1]
+
+
+def test_sqlite_evento_repo_listar_no_intervalo():
+    re = SQLiteEventoRepository(conectar())
+    for eid, sala, ini, fim in (
+        (1, 1, "08:00", "12:00"),
+        (2, 2, "09:00", "09:30"),
+        (3, 1, "10:00", "10:30"),
+        (4, 2, "11:00", "12:00"),
+    ):
+        re.adicionar(
+            Evento(id=eid, sala_id=sala, titulo=f"E{eid}", inicio=dt(ini), fim=dt(fim))
+        )
+
+    # o evento 1 começou antes, mas ainda está em andamento; o 4 começa no fim
+    assert [e.id for e in re.listar_no_intervalo(dt("09:15"), dt("11:00"))] == [1, 2, 3]
+    assert [e.id for e in re.listar_no_intervalo(dt("09:15"), dt("11:00"), 1)] == [1, 3]
+    assert [e.id for e in re.listar_no_intervalo(dt("09:15"), dt("11:00"), 2)] == [2]
+    assert re.listar_no_intervalo(dt("12:00"), dt("13:00")) == []
+    assert re.listar_no_intervalo(dt("09:15"), dt("11:00"), 9) == []
+    assert re.listar_no_intervalo(dt("11:00"), dt("09:00")) == []
+
+
+def test_sqlite_recorrência_repo_básico():
+    rr = SQLiteRecorrênciaRepository(conectar())
+    r1 = Recorrência(
+        id=rr.proximo_id(),
+        sala_id=1,
+        titulo="Aula",
+        inicio=datetime(2025, 1, 6, 9),
+        fim=datetime(2025, 1, 6, 11),
+        frequência=Frequência.SEMANAL,
+        até=datetime(2025, 3, 31),
+        exceções=frozenset({datetime(2025, 1, 13, 9)}),
+    )
+    rr.adicionar(r1)
+    r2 = replace(r1, id=rr.proximo_id(), sala_id=2, até=datetime(2025, 1, 31))
+    rr.adicionar(r2)
+    assert rr.obter_por_id(1) == r1
+    assert [r.id for r in rr.listar()] == [1, 2]
+    assert rr.listar_por_sala(2) == [r2]
+
+    fev = (datetime(2025, 2, 1), datetime(2025, 3, 1))
+    assert rr.listar_ativas_no_intervalo(*fev) == [r1]
+    assert rr.listar_ativas_no_intervalo(*fev, sala_id=2) == []
+    assert [
+        r.id for r in rr.listar_ativas_no_intervalo(datetime(2025, 1, 1), fev[0])
+    ] == [1, 2]
+
+    r1x = replace(r1, exceções=r1.exceções | {datetime(2025, 1, 20, 9)})
+    rr.atualizar(r1x)
+    assert rr.obter_por_id(1).exceções == r1x.exceções
+    assert rr.remover(2) is True
+    assert rr.remover(2) is False
+    assert rr.listar_por_sala(2) == []
+    assert rr.proximo_id() == 3
+
+
+def test_sqlite_remover_por_sala():
+    con = conectar()
+    re, rr = SQLiteEventoRepository(con), SQLiteRecorrênciaRepository(con)
+    e1 = re.criar(1, "A", dt("09:00"), dt("12:00"))
+    e2 = re.criar(2, "B", dt("09:00"), dt("10:00"))
+    e3 = re.criar(1, "C", dt("08:00"), dt("09:00"))
+    r1 = rr.adicionar(
+        Recorrência(
+            id=1,
+            sala_id=1,
+            titulo="Aula",
+            inicio=datetime(2025, 1, 6, 9),
+            fim=datetime(2025, 1, 6, 11),
+            frequência=Frequência.SEMANAL,
+            até=datetime(2025, 3, 31),
+        )
+    )
+
+    assert re.remover_por_sala(1) == [e3, e1]
+    assert re.listar() == [e2]
+    assert re.remover_por_sala(1) == []
+    assert rr.remover_por_sala(1) == [r1]
+    assert rr.listar() == []
+    # a duração máxima da sala recomeça: eventos novos ainda são achados
+    e4 = re.criar(1, "D", dt("10:00"), dt("10:30"))
+    assert re.encontrar_conflito(1, dt("10:15"), dt("11:00")) == e4
@@ -0,0 +1,176 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from domínio.modelos import Frequência, Recorrência, Sala
+from domínio.serviços import (
+    PedidoEvento,
+    agendar_evento_detalhado,
+    agendar_eventos_em_lote,
+    atualizar_evento,
+    cancelar_ocorrência,
+    MotivoRecusa,
+)
+from infra.repos_memória import (
+    MemEventoRepository,
+    MemRecorrênciaRepository,
+    MemSalaRepository,
+)
+from infra.travas import TravasPorSala
+
+
+def dt(hm: str) -> datetime:
+    h, m = map(int, hm.split(":"))
+    return datetime(2025, 1, 1, h, m)
+
+
+def repos(n_salas: int = 2) -> tuple[MemSalaRepository, MemEventoRepository]:
+    salas = MemSalaRepository()
+    for sid in range(1, n_salas + 1):
+        salas.adicionar(Sala(id=sid, nome=f"S{sid}", capacidade=10))
+    return salas, MemEventoRepository()
+
+
+def alargar_janela(monkeypatch, eventos: MemEventoRepository) -> None:
+    # atraso entre a checagem de conflito e a gravação: sem a trava da sala,
+    # todas as threads passariam pela checagem antes de qualquer gravação
+    original = eventos.encontrar_conflito
+
+    def lento(*args, **kwargs):
+        r = original(*args, **kwargs)
+        time.sleep(0.005)
+        return r
+
+    monkeypatch.setattr(eventos, "encontrar_conflito", lento)
+
+
+def test_travas_por_sala_ordem_oposta_sem_deadlock():
+    travas = TravasPorSala()
+    contador = [0]
+
+    def trabalho(ids):
+        for _ in range(500):
+            with travas.travar(*ids):
+                contador[0] += 1
+
+    ts = [threading.Thread(target=trabalho, args=(ids,)) for ids in ((1, 2), (2, 1))]
+    for t in ts:
+        t.start()
+    for t in ts:
+        t.join(timeout=5)
+    assert not any(t.is_alive() for t in ts)
+    assert contador[0] == 1000
+
+
+def test_travas_por_sala_salas_diferentes_não_se_bloqueiam():
+    travas = TravasPorSala()
+    with travas.travar(1, 1):  # ids repetidos não travam duas vezes
+        conseguiu = threading.Event()
+
+        def outra_sala():
+            with travas.travar(2):
+                conseguiu.set()
+
+        t = threading.Thread(target=outra_sala)
+        t.start()
+        assert conseguiu.wait(timeout=2)
+        t.join()
+
+
+def test_agendamentos_concorrentes_mesmo_horário_só_um_vence(monkeypatch):
+    salas, eventos = repos()
+    alargar_janela(monkeypatch, eventos)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        resultados = list(
+            pool.map(
+                lambda i: agendar_evento_detalhado(
+                    eventos, salas, 1, f"E{i}", dt("09:00"), dt("10:00")
+                ),
+                range(8),
+            )
+        )
+
+    assert sum(r.ok for r in resultados) == 1
+    assert {r.motivo for r in resultados if not r.ok} == {MotivoRecusa.CONFLITO}
+    assert len(eventos.listar_por_sala(1)) == 1
+
+
+def test_agendamentos_concorrentes_salas_diferentes_ids_únicos():
+    salas, eventos = repos(n_salas=4)
+
+    def agendar(i):
+        sala = i % 4 + 1
+        ini = datetime(2025, 1, 1, 9, 0) + timedelta(days=i // 4)
+        return agendar_evento_detalhado(
+            eventos, salas, sala, "Aula", ini, ini + timedelta(hours=1)
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        resultados = list(pool.map(agendar, range(200)))
+
+    assert all(r.ok for r in resultados)
+    ids = [r.evento.id for r in resultados]
+    assert sorted(ids) == list(range(1, 201))
+
+
+def test_atualizar_e_lote_concorrentes_não_sobrepõem(monkeypatch):
+    salas, eventos = repos()
+    alargar_janela(monkeypatch, eventos)
+    a = agendar_evento_detalhado(eventos, salas, 2, "A", dt("08:00"), dt("09:00"))
+
+    def mover():
+        return atualizar_evento(eventos, salas, a.evento.id, sala_id=1)
+
+    def lote():
+        return agendar_eventos_em_lote(
+            eventos, salas, [PedidoEvento(1, "L", dt("08:30"), dt("09:30"))]
+        )[0]
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        f1, f2 = pool.submit(mover), pool.submit(lote)
+        movido, criado = f1.result(), f2.result()
+
+    # exatamente um dos dois ocupa a sala 1 às 08:30
+    assert (movido is None) != (criado is None)
+    assert len(eventos.listar_por_sala(1)) == 1
+
+
+def test_cancelamentos_concorrentes_da_mesma_recorrência_não_se_perdem(monkeypatch):
+    _, eventos = repos()
+    recorrências = MemRecorrênciaRepository()
+    segunda = datetime(2025, 1, 6, 8)
+    recorrências.criar(
+        Recorrência(
+            id=1,
+            sala_id=1,
+            titulo="Aula",
+            inicio=segunda,
+            fim=segunda + timedelta(hours=1),
+            frequência=Frequência.SEMANAL,
+            até=segunda + timedelta(weeks=11),
+        )
+    )
+    # atraso entre ler a regra e gravá-la: sem a trava, todas as threads
+    # leriam a mesma versão e cada gravação apagaria as exceções das outras
+    original = recorrências.obter_por_id
+
+    def lento(*args, **kwargs):
+        r = original(*args, **kwargs)
+        time.sleep(0.005)
+        return r
+
+    monkeypatch.setattr(recorrências, "obter_por_id", lento)
+
+    semanas = [segunda + timedelta(weeks=k) for k in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        resultados = list(
+            pool.map(
+                lambda inicio: cancelar_ocorrência(recorrências, 1, inicio, eventos),
+                semanas,
+            )
+        )
+
+    assert all(r is not None for r in resultados)
+    assert original(1).exceções == frozenset(semanas)
@@ -0,0 +1,108 @@
+import time
+from datetime import datetime
+
+import pytest
+
+from app import fachada
+from app.container import criar_container_memória
+from app.instrumentação import EstatísticasChamada, Instrumentação
+from domínio import serviços
+
+
+@pytest.fixture
+def instrumentação():
+    inst = Instrumentação()
+    yield inst
+    inst.desativar()
+
+
+def test_registrar_conta_tempo_e_histograma():
+    inst = Instrumentação()
+    for segundos in (0.000_010, 0.000_012, 0.000_500, 0.002):
+        inst.registrar("x", segundos)
+    inst.registrar("y", 0.1)
+
+    y, x = inst.estatísticas()  # maior tempo total primeiro
+    assert (x.nome, x.chamadas, x.máximo) == ("x", 4, 0.002)
+    assert x.total == pytest.approx(0.002_522)
+    assert x.média == pytest.approx(0.002_522 / 4)
+    # 10 e 12 µs caem na faixa [8, 16) µs; o p99 é limitado pelo máximo
+    assert x.percentil(50) == pytest.approx(16e-6)
+    assert x.percentil(99) == 0.002
+    assert y.chamadas == 1
+    assert EstatísticasChamada("z", 0, 0.0, 0.0, ()).média == 0.0
+
+    inst.limpar()
+    assert inst.estatísticas() == []
+    assert "nenhuma chamada" in inst.relatório()
+
+
+def test_instrumentar_container_mede_os_repositórios(instrumentação):
+    base = criar_container_memória()
+    c = instrumentação.instrumentar(base)
+    sala = c.sala_repo.criar("Lab", 10)
+    c.evento_repo.criar(
+        sala.id, "Aula", datetime(2025, 1, 6, 8), datetime(2025, 1, 6, 9)
+    )
+    c.evento_repo.listar()
+    c.evento_repo.listar()
+
+    # mesmos dados do container original; atributos privados passam direto
+    assert base.evento_repo.listar() == c.evento_repo.listar()
+    assert c.evento_repo._dados is base.evento_repo._dados
+    nomes = {e.nome: e.chamadas for e in instrumentação.estatísticas()}
+    assert nomes["sala_repo.criar"] == 1
+    assert nomes["evento_repo.listar"] == 3
+    c.fechar()
+
+
+def test_ativar_mede_serviços_e_fachada_e_desativar_restaura(instrumentação):
+    original = fachada.agendar_evento_ui
+    c = instrumentação.instrumentar(criar_container_memória())
+    instrumentação.ativar()
+    assert instrumentação.ativa
+    assert fachada.agendar_evento_ui is not original
+
+    assert fachada.cadastrar_sala_ui(c, "Lab", "10")[0]
+    ok, _ = fachada.agendar_evento_ui(
+        c, "1", "A", "2025-01-06 08:00", "2025-01-06 09:00"
+    )
+    assert ok
+    serviços.listar_salas(c.sala_repo)
+
+    nomes = {e.nome: e.chamadas for e in instrumentação.estatísticas()}
+    assert nomes["fachada.agendar_evento_ui"] == 1
+    # a fachada chama o serviço pelo nome importado: também medido
+    assert nomes["serviços.agendar_evento_detalhado"] == 1
+    assert nomes["serviços.listar_salas"] == 1
+    assert nomes["evento_repo.encontrar_conflito"] == 1
+    relatório = instrumentação.relatório()
+    assert "fachada.agendar_evento_ui" in relatório
+
+    instrumentação.desativar()
+    assert not instrumentação.ativa
+    assert fachada.agendar_evento_ui is original
+    assert fachada._agendar_evento_detalhado is serviços.agendar_evento_detalhado
+    assert not hasattr(serviços.agendar_evento_detalhado, "__wrapped__")
+
+
+def test_perfil_da_chamada_lenta_amostrada():
+    inst = Instrumentação(perfil_limite=0.005, perfil_amostragem=1.0)
+
+    def lenta(n):
+        time.sleep(0.01)
+        return n
+
+    medida = inst.medir("lenta", lenta)
+    rápida = inst.medir("rápida", lambda: None)
+    assert medida(3) == 3
+    rápida()
+
+    assert inst.perfil is not None
+    assert inst.perfil.nome == "lenta" and inst.perfil.duração >= 0.005
+    assert "sleep" in inst.perfil.texto
+    assert "perfil da chamada lenta: lenta" in inst.relatório()
+    assert {e.nome for e in inst.estatísticas()} == {"lenta", "rápida"}
+
+    with pytest.raises(ValueError):
+        Instrumentação(perfil_amostragem=2)
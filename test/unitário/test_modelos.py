@@ -1,7 +1,9 @@
+import dataclasses
+
 import pytest
 from datetime import datetime
 
-from domínio.modelos import Sala, Evento
+from domínio.modelos import Sala, Evento, Recorrência, Frequência
 
 
 def test_sala_criação_ok():
@@ -89,3 +91,76 @@ def test_evento_validações(kwargs, erro):
     with pytest.raises(ValueError) as exc:
         Evento(**kwargs)
     assert erro in str(exc.value)
+
+
+def test_entidades_imutáveis_e_sem_dict():
+    s = Sala(id=1, nome="Sala 1", capacidade=10)
+    e = Evento(
+        id=1,
+        sala_id=1,
+        titulo="A",
+        inicio=datetime(2025, 1, 1, 9),
+        fim=datetime(2025, 1, 1, 10),
+    )
+    for entidade in (s, e):
+        assert not hasattr(entidade, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        s.nome = "Outra"  # type: ignore[misc]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        e.titulo = "B"  # type: ignore[misc]
+    # alterações passam por `replace`, que revalida
+    assert dataclasses.replace(e, titulo="B").titulo == "B"
+    with pytest.raises(ValueError):
+        dataclasses.replace(e, fim=e.inicio)
+
+
+def _semanal(**kwargs) -> Recorrência:
+    base = dict(
+        id=1,
+        sala_id=1,
+        titulo="Aula",
+        inicio=datetime(2025, 1, 6, 9),
+        fim=datetime(2025, 1, 6, 11),
+        frequência=Frequência.SEMANAL,
+        até=datetime(2025, 6, 30),
+    )
+    base.update(kwargs)
+    return Recorrência(**base)
+
+
+def test_recorrência_gera_só_as_ocorrências_da_janela():
+    r = _semanal(exceções={datetime(2025, 1, 20, 9)})
+    # `até` é 30/06 00:00, então a última segunda possível é 23/06
+    assert r.último_índice == 24
+    assert r.fim_da_vigência == datetime(2025, 6, 23, 11)
+
+    # a ocorrência de 13/01 ainda está em andamento às 10h; a de 20/01 foi cancelada
+    janela = r.ocorrências(datetime(2025, 1, 13, 10), datetime(2025, 1, 28))
+    assert [o.inicio.day for o in janela] == [13, 27]
+    o = next(r.ocorrências(datetime(2025, 6, 1), datetime(2025, 12, 1)))
+    assert (o.recorrencia_id, o.inicio, o.fim) == (
+        1,
+        datetime(2025, 6, 2, 9),
+        datetime(2025, 6, 2, 11),
+    )
+    assert list(r.ocorrências(datetime(2025, 7, 1), datetime(2025, 8, 1))) == []
+
+
+@pytest.mark.parametrize(
+    "kwargs,erro",
+    [
+        ({"titulo": " "}, "título da recorrência não pode ser vazio"),
+        ({"fim": datetime(2025, 1, 6, 8)}, "fim deve ser maior que início"),
+        ({"intervalo": 0}, "intervalo deve ser inteiro > 0"),
+        ({"até": datetime(2025, 1, 1)}, "até deve ser datetime >= início"),
+        ({"frequência": "semanal"}, "frequência inválida"),
+        (
+            {"frequência": Frequência.DIÁRIA, "fim": datetime(2025, 1, 7, 10)},
+            "duração não pode exceder o período",
+        ),
+    ],
+)
+def test_recorrência_validações(kwargs, erro):
+    with pytest.raises(ValueError) as exc:
+        _semanal(**kwargs)
+    assert erro in str(exc.value)
@@ -1,8 +1,14 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import cast
 
-from domínio.modelos import Evento
-from domínio.regras import validar_intervalo, intervalos_sobrepostos, encontrar_conflito
+from domínio.modelos import Evento, Frequência, Recorrência
+from domínio.regras import (
+    validar_intervalo,
+    intervalos_sobrepostos,
+    encontrar_conflito,
+    conflito_com_recorrência,
+    conflito_entre_recorrências,
+)
 
 
 def dt(hm: str) -> datetime:
@@ -67,3 +73,71 @@ def test_encontrar_conflito():
         )
         is None
     )
+
+
+def rec(
+    rid: int,
+    inicio: datetime,
+    horas: int = 2,
+    frequência: Frequência = Frequência.SEMANAL,
+    intervalo: int = 1,
+    até: datetime = datetime(2025, 6, 30),
+    sala_id: int = 1,
+    exceções: frozenset[datetime] = frozenset(),
+) -> Recorrência:
+    return Recorrência(
+        id=rid,
+        sala_id=sala_id,
+        titulo=f"R{rid}",
+        inicio=inicio,
+        fim=inicio + timedelta(hours=horas),
+        frequência=frequência,
+        até=até,
+        intervalo=intervalo,
+        exceções=exceções,
+    )
+
+
+def test_conflito_com_recorrência():
+    r = rec(1, datetime(2025, 1, 6, 9))  # segundas, 9h-11h
+    seg = datetime(2025, 3, 10, 10)
+    assert conflito_com_recorrência(r, 1, seg, seg + timedelta(hours=1)).inicio == (
+        datetime(2025, 3, 10, 9)
+    )
+    assert conflito_com_recorrência(r, 2, seg, seg + timedelta(hours=1)) is None
+    ter = datetime(2025, 3, 11, 10)
+    assert conflito_com_recorrência(r, 1, ter, ter + timedelta(hours=1)) is None
+
+
+def test_conflito_entre_recorrências_quinzenais_alternadas():
+    # semanas alternadas na mesma sala/horário não colidem...
+    a = rec(1, datetime(2025, 1, 6, 9), intervalo=2)
+    b = rec(2, datetime(2025, 1, 13, 9), intervalo=2)
+    assert conflito_entre_recorrências(a, b) is None
+    # ...mas uma diária colide com ambas
+    c = rec(3, datetime(2025, 1, 1, 10), horas=1, frequência=Frequência.DIÁRIA)
+    oa, oc = conflito_entre_recorrências(a, c)
+    assert (oa.inicio, oc.inicio) == (datetime(2025, 1, 6, 9), datetime(2025, 1, 6, 10))
+    assert conflito_entre_recorrências(c, b) is not None
+    # salas diferentes ou vigências disjuntas nunca conflitam
+    assert (
+        conflito_entre_recorrências(a, rec(4, datetime(2025, 1, 6, 9), sala_id=2))
+        is None
+    )
+    depois = rec(5, datetime(2025, 7, 7, 9), até=datetime(2025, 12, 31))
+    assert conflito_entre_recorrências(a, depois) is None
+
+
+def test_conflito_entre_recorrências_respeita_exceções():
+    a = rec(1, datetime(2025, 1, 6, 9), até=datetime(2025, 1, 31))
+    b = rec(2, datetime(2025, 1, 20, 10), até=datetime(2025, 2, 28))
+    oa, _ = conflito_entre_recorrências(a, b)
+    assert oa.inicio == datetime(2025, 1, 20, 9)
+    # cancelando as duas semanas em que se cruzam, o conflito some
+    a2 = rec(
+        1,
+        datetime(2025, 1, 6, 9),
+        até=datetime(2025, 1, 31),
+        exceções=frozenset({datetime(2025, 1, 20, 9), datetime(2025, 1, 27, 9)}),
+    )
+    assert conflito_entre_recorrências(a2, b) is None
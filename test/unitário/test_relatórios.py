@@ -0,0 +1,336 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.container import criar_container_memória
+from domínio.modelos import Evento, Frequência, Ocorrência, Recorrência
+from domínio.relatórios import (
+    Conflito,
+    pares_em_conflito,
+    relatório_ocupação,
+    validar_agenda,
+)
+from domínio.serviços import agendar_recorrência
+
+DIA = timedelta(days=1)
+
+
+def _container_com_eventos():
+    c = criar_container_memória()
+    c.sala_repo.criar("Pequena", 10)  # id 1
+    c.sala_repo.criar("Grande", 30)  # id 2
+    c.sala_repo.criar("Vazia", 60)  # id 3
+    for sala_id, ini, fim in [
+        (1, datetime(2025, 1, 6, 8), datetime(2025, 1, 6, 10)),
+        (1, datetime(2025, 1, 6, 22), datetime(2025, 1, 7, 2)),  # cruza o dia
+        (2, datetime(2025, 1, 6, 9), datetime(2025, 1, 6, 12)),
+        (2, datetime(2025, 1, 7, 23), datetime(2025, 1, 8, 1)),  # sai do período
+        (2, datetime(2025, 1, 10, 9), datetime(2025, 1, 10, 10)),  # fora
+    ]:
+        c.evento_repo.criar(sala_id, "Aula", ini, fim)
+    return c
+
+
+def test_relatório_ocupação_por_dia():
+    c = _container_com_eventos()
+    r = relatório_ocupação(
+        c.evento_repo, c.sala_repo, datetime(2025, 1, 6), datetime(2025, 1, 8)
+    )
+
+    assert r.períodos == [datetime(2025, 1, 6), datetime(2025, 1, 7)]
+    pequena, grande, vazia = r.salas
+    assert pequena.horas_por_período == [4.0, 2.0]
+    assert pequena.horas == 6.0
+    assert pequena.utilização == pytest.approx(6 / 48)
+    assert pequena.pico == 1
+    assert grande.horas_por_período == [3.0, 1.0]  # recortado em `fim`
+    assert vazia.horas_por_período == [0.0, 0.0]
+    assert vazia.pico == 0
+    # 09:00-10:00 as salas 1 e 2 estão ocupadas ao mesmo tempo
+    assert (r.pico_salas, r.pico_assentos) == (2, 40)
+    assert r.ocupação_ponderada == pytest.approx((6 * 10 + 4 * 30) / (100 * 48))
+
+
+def test_relatório_ocupação_sobreposições_e_última_fatia_parcial():
+    c = criar_container_memória()
+    c.sala_repo.criar("A", 10)
+    # o repositório não checa conflitos: duas reservas simultâneas na sala
+    c.evento_repo.criar(1, "x", datetime(2025, 1, 6, 8), datetime(2025, 1, 6, 10))
+    c.evento_repo.criar(1, "y", datetime(2025, 1, 6, 9), datetime(2025, 1, 6, 11))
+    c.evento_repo.criar(1, "z", datetime(2025, 1, 6, 11), datetime(2025, 1, 6, 12))
+    r = relatório_ocupação(
+        c.evento_repo,
+        c.sala_repo,
+        datetime(2025, 1, 6),
+        datetime(2025, 1, 6, 10, 30),
+        timedelta(hours=4),
+    )
+
+    assert r.períodos == [datetime(2025, 1, 6, h) for h in (0, 4, 8)]
+    (a,) = r.salas
+    assert a.horas_por_período == [0.0, 0.0, 2.5]  # sobreposição conta uma vez
+    assert a.pico == 2
+    assert r.pico_salas == 1  # a sala conta uma vez no pico do conjunto
+
+
+def test_relatório_ocupação_inclui_recorrências():
+    c = criar_container_memória()
+    c.sala_repo.criar("A", 10)
+    agendar_recorrência(
+        c.recorrencia_repo,
+        c.evento_repo,
+        c.sala_repo,
+        1,
+        "Aula",
+        datetime(2025, 1, 6, 8),
+        datetime(2025, 1, 6, 9),
+        Frequência.DIÁRIA,
+        datetime(2025, 1, 31),
+    )
+    inicio, fim = datetime(2025, 1, 6), datetime(2025, 1, 13)
+
+    sem = relatório_ocupação(c.evento_repo, c.sala_repo, inicio, fim, 7 * DIA)
+    com = relatório_ocupação(
+        c.evento_repo, c.sala_repo, inicio, fim, 7 * DIA, c.recorrencia_repo
+    )
+
+    assert sem.salas[0].horas == 0.0
+    assert com.salas[0].horas_por_período == [7.0]
+
+
+def test_relatório_ocupação_entradas_inválidas():
+    c = _container_com_eventos()
+    d = datetime(2025, 1, 6)
+    assert relatório_ocupação(c.evento_repo, c.sala_repo, d, d) is None
+    assert (
+        relatório_ocupação(c.evento_repo, c.sala_repo, d, d + DIA, timedelta(0)) is None
+    )
+
+
+def _aleatório(semente: int):
+    rng = random.Random(semente)
+    c = criar_container_memória()
+    for s in range(8):
+        c.sala_repo.criar(f"S{s}", 5 + s)
+    base = datetime(2025, 1, 6)
+    eventos = []
+    for i in range(400):
+        ini = base + timedelta(minutes=rng.randrange(10 * 24 * 60))
+        dur = timedelta(minutes=rng.randint(1, 600))
+        # sala 9 não existe: ignorada
+        eventos.append(Evento(i + 1, rng.randint(1, 9), "x", ini, ini + dur))
+    c.evento_repo._carregar(eventos)
+    return c, eventos
+
+
+def test_relatório_ocupação_confere_com_força_bruta():
+    c, eventos = _aleatório(7)
+    inicio, fim = datetime(2025, 1, 7, 6), datetime(2025, 1, 11, 18)
+    passo = timedelta(hours=10)
+    r = relatório_ocupação(
+        c.evento_repo, c.sala_repo, inicio, fim, passo, usar_numpy=False
+    )
+
+    minutos = int((fim - inicio) / timedelta(minutes=1))
+    ocupação = {s: [0] * minutos for s in range(1, 9)}
+    for e in eventos:
+        if e.sala_id in ocupação:
+            a = max(0, int((e.inicio - inicio) / timedelta(minutes=1)))
+            b = min(minutos, int((e.fim - inicio) / timedelta(minutes=1)))
+            for m in range(a, b):
+                ocupação[e.sala_id][m] += 1
+    por_fatia = int(passo / timedelta(minutes=1))
+    for s in r.salas:
+        m = ocupação[s.sala_id]
+        esperado = [
+            sum(1 for x in m[k : k + por_fatia] if x) / 60
+            for k in range(0, minutos, por_fatia)
+        ]
+        assert s.horas_por_período == pytest.approx(esperado)
+        assert s.pico == max(m)
+    salas_por_minuto = [
+        sum(1 for s in ocupação if ocupação[s][k]) for k in range(minutos)
+    ]
+    assert r.pico_salas == max(salas_por_minuto)
+
+
+def test_relatório_ocupação_numpy_igual_ao_python():
+    pytest.importorskip("numpy")
+    c, _ = _aleatório(11)
+    args = (c.evento_repo, c.sala_repo, datetime(2025, 1, 7), datetime(2025, 1, 14))
+    for passo in (DIA, timedelta(hours=5), timedelta(weeks=2)):
+        py = relatório_ocupação(*args, passo, usar_numpy=False)
+        np_ = relatório_ocupação(*args, passo, usar_numpy=True)
+        assert np_.períodos == py.períodos
+        assert (np_.pico_salas, np_.pico_assentos) == (py.pico_salas, py.pico_assentos)
+        assert np_.ocupação_ponderada == pytest.approx(py.ocupação_ponderada)
+        for a, b in zip(np_.salas, py.salas):
+            assert a.horas_por_período == pytest.approx(b.horas_por_período)
+            assert a.pico == b.pico
+
+
+# --- validação da agenda ---
+
+
+def _pares_força_bruta(eventos, folga):
+    return sorted(
+        (a.id, b.id)
+        for a in eventos
+        for b in eventos
+        if a.sala_id == b.sala_id
+        and (a.inicio, a.id) < (b.inicio, b.id)
+        and b.inicio < a.fim + folga
+        and a.inicio < b.fim + folga
+    )
+
+
+@pytest.mark.parametrize("folga", [timedelta(0), timedelta(minutes=45)])
+def test_validar_agenda_lista_todos_os_pares(folga):
+    c, eventos = _aleatório(3)
+    conflitos = validar_agenda(c.evento_repo, folga, usar_numpy=False)
+    assert sorted((x.primeiro.id, x.segundo.id) for x in conflitos) == (
+        _pares_força_bruta(eventos, folga)
+    )
+    chaves = [(x.sala_id, x.primeiro.inicio, x.segundo.inicio) for x in conflitos]
+    assert chaves == sorted(chaves)
+
+
+def test_validar_agenda_folga_e_eventos_encostados():
+    c = criar_container_memória()
+    for sala_id, ini, fim in [
+        (1, datetime(2025, 1, 6, 8), datetime(2025, 1, 6, 9)),
+        (
+            1,
+            datetime(2025, 1, 6, 9),
+            datetime(2025, 1, 6, 10),
+        ),  # encostado no anterior: não conflita sem folga
+        (1, datetime(2025, 1, 6, 10, 10), datetime(2025, 1, 6, 11)),
+        (2, datetime(2025, 1, 6, 8), datetime(2025, 1, 6, 12)),
+        (2, datetime(2025, 1, 6, 8), datetime(2025, 1, 6, 9)),  # mesmo início
+    ]:
+        c.evento_repo.criar(sala_id, "x", ini, fim)
+
+    sem_folga = validar_agenda(c.evento_repo, usar_numpy=False)
+    assert [(x.sala_id, x.primeiro.id, x.segundo.id) for x in sem_folga] == [(2, 4, 5)]
+    assert isinstance(sem_folga[0], Conflito)
+    com_folga = validar_agenda(c.evento_repo, timedelta(minutes=15), usar_numpy=False)
+    assert [(x.primeiro.id, x.segundo.id) for x in com_folga] == [
+        (1, 2),
+        (2, 3),
+        (4, 5),
+    ]
+    assert validar_agenda(criar_container_memória().evento_repo) == []
+    with pytest.raises(ValueError):
+        validar_agenda(c.evento_repo, timedelta(minutes=-1))
+
+
+def test_validar_agenda_numpy_igual_ao_python():
+    pytest.importorskip("numpy")
+    c, _ = _aleatório(5)
+    for folga in (timedelta(0), timedelta(hours=2)):
+        assert validar_agenda(c.evento_repo, folga, usar_numpy=True) == validar_agenda(
+            c.evento_repo, folga, usar_numpy=False
+        )
+    assert validar_agenda(criar_container_memória().evento_repo, usar_numpy=True) == []
+
+
+def _container_com_recorrências():
+    c = criar_container_memória()
+    c.sala_repo.criar("Sala", 10)
+    segunda = datetime(2025, 1, 6)
+    # gravadas direto no repositório: sem as checagens do agendamento
+    for rid, ini, fim, até, exceções in [
+        (1, 8, 9, datetime(2025, 1, 27, 8), {segunda + 7 * DIA + timedelta(hours=8)}),
+        (2, 9, 10, datetime(2025, 1, 13, 9, 10), set()),
+    ]:
+        c.recorrencia_repo.criar(
+            Recorrência(
+                id=rid,
+                sala_id=1,
+                titulo=f"R{rid}",
+                inicio=segunda + timedelta(hours=ini, minutes=10 * (rid - 1)),
+                fim=segunda + timedelta(hours=fim),
+                frequência=Frequência.SEMANAL,
+                até=até,
+                exceções=frozenset(exceções),
+            )
+        )
+    for dia, ini, fim in [
+        (20, (9, 0), (9, 30)),  # encostado na ocorrência de R1
+        (27, (8, 30), (8, 45)),  # dentro da ocorrência de R1
+        (13, (8, 30), (8, 45)),  # no dia da ocorrência cancelada de R1
+    ]:
+        c.evento_repo.criar(
+            1, "x", datetime(2025, 1, dia, *ini), datetime(2025, 1, dia, *fim)
+        )
+    return c
+
+
+def _resumo_pares(conflitos):
+    def ref(r):
+        if isinstance(r, Ocorrência):
+            return f"R{r.recorrencia_id}@{r.inicio.day}"
+        return f"E{r.id}"
+
+    return [(ref(x.primeiro), ref(x.segundo)) for x in conflitos]
+
+
+def test_validar_agenda_inclui_ocorrências_de_recorrências():
+    c = _container_com_recorrências()
+    rr = c.recorrencia_repo
+    # sem as recorrências, os eventos avulsos não conflitam entre si
+    assert validar_agenda(c.evento_repo, timedelta(minutes=15)) == []
+    assert _resumo_pares(validar_agenda(c.evento_repo, recorrências=rr)) == [
+        ("R1@27", "E2")
+    ]
+    com_folga = validar_agenda(c.evento_repo, timedelta(minutes=15), recorrências=rr)
+    assert _resumo_pares(com_folga) == [
+        ("R1@6", "R2@6"),  # 10 min entre as duas regras
+        ("R1@20", "E1"),  # encostados
+        ("R1@27", "E2"),
+    ]
+    # só a janela: reservas que tocam [20/01, 21/01)
+    janela = (datetime(2025, 1, 20), datetime(2025, 1, 21))
+    assert _resumo_pares(
+        validar_agenda(c.evento_repo, timedelta(minutes=15), False, rr, *janela)
+    ) == [("R1@20", "E1")]
+    with pytest.raises(ValueError):
+        validar_agenda(c.evento_repo, recorrências=rr, inicio=janela[0])
+    with pytest.raises(ValueError):
+        validar_agenda(c.evento_repo, inicio=janela[1], fim=janela[0])
+
+
+def test_validar_agenda_numpy_com_recorrências():
+    pytest.importorskip("numpy")
+    c = _container_com_recorrências()
+    for folga in (timedelta(0), timedelta(minutes=15)):
+        assert validar_agenda(
+            c.evento_repo, folga, True, c.recorrencia_repo
+        ) == validar_agenda(c.evento_repo, folga, False, c.recorrencia_repo)
+
+
+def test_pares_em_conflito_sobre_arrays_int64_fora_de_ordem():
+    np = pytest.importorskip("numpy")
+    rng = random.Random(9)
+    sala = [rng.randint(1, 4) for _ in range(300)]
+    inicio = [rng.randrange(5_000) for _ in range(300)]
+    fim = [i + rng.randint(1, 120) for i in inicio]
+    i, j = pares_em_conflito(np.array(sala), np.array(inicio), np.array(fim), 10)
+    obtidos = sorted(zip(i.tolist(), j.tolist()))
+    esperados = sorted(
+        (a, b)
+        for a in range(300)
+        for b in range(300)
+        if sala[a] == sala[b]
+        and (inicio[a], a) < (inicio[b], b)
+        and inicio[b] < fim[a] + 10
+    )
+    assert obtidos == esperados
+
+    # faixas que não cabem em int64 juntas: busca sala a sala, mesmo resultado
+    grande = 2**62
+    i, j = pares_em_conflito([1, 2, 2], [0, 0, grande - 5], [grande, 10, grande])
+    assert list(zip(i.tolist(), j.tolist())) == []
+    i, j = pares_em_conflito([1, 1, 2], [0, grande - 5, 3], [grande, grande, 9])
+    assert list(zip(i.tolist(), j.tolist())) == [(0, 1)]
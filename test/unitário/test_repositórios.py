@@ -1,5 +1,8 @@
+from datetime import datetime
+
 import pytest
 
+from domínio.modelos import Evento
 from domínio.repositórios import SalaRepository, EventoRepository
 
 
@@ -62,3 +65,42 @@ def test_subclasse_minima_pode_instanciar():
 
     assert MemSalaRepo() is not None
     assert MemEventoRepo() is not None
+
+
+def test_evento_repository_sobreposição_padrão_usa_listar_por_sala():
+    existente = Evento(
+        id=1,
+        sala_id=1,
+        titulo="A",
+        inicio=datetime(2025, 1, 1, 9),
+        fim=datetime(2025, 1, 1, 10),
+    )
+
+    class RepoSóListagem(EventoRepository):
+        def proximo_id(self) -> int:
+            return 2
+
+        def adicionar(self, evento):
+            return evento
+
+        def atualizar(self, evento):
+            return evento
+
+        def remover(self, evento_id: int):
+            return False
+
+        def obter_por_id(self, evento_id: int):
+            return None
+
+        def listar(self):
+            return [existente]
+
+        def listar_por_sala(self, sala_id: int):
+            return [existente] if sala_id == 1 else []
+
+    r = RepoSóListagem()
+    ini, fim = datetime(2025, 1, 1, 9, 30), datetime(2025, 1, 1, 11)
+    assert r.encontrar_conflito(1, ini, fim) is existente
+    assert r.existe_sobreposição(1, ini, fim) is True
+    assert r.existe_sobreposição(1, ini, fim, ignorar_evento_id=1) is False
+    assert r.existe_sobreposição(2, ini, fim) is False
@@ -0,0 +1,237 @@
+import http.client
+import json
+import socket
+import threading
+
+import pytest
+
+from app.servidor import ServidorHTTP, serializar
+from domínio.modelos import Frequência, Sala
+
+
+@pytest.fixture
+def servidor():
+    s = ServidorHTTP(("127.0.0.1", 0), threads=4)
+    t = threading.Thread(target=s.serve_forever, daemon=True)
+    t.start()
+    yield s
+    s.shutdown()
+    s.server_close()
+
+
+@pytest.fixture
+def con(servidor):
+    c = http.client.HTTPConnection("127.0.0.1", servidor.server_port, timeout=5)
+    yield c
+    c.close()
+
+
+def pedir(con, método, caminho, corpo=None):
+    dados = None if corpo is None else json.dumps(corpo).encode()
+    con.request(método, caminho, body=dados)
+    r = con.getresponse()
+    return r.status, json.loads(r.read()), r
+
+
+def test_fluxo_salas_e_eventos_na_mesma_conexão(con):
+    status, sala, r = pedir(con, "POST", "/salas", {"nome": "A", "capacidade": 10})
+    assert status == 201 and sala == {"id": 1, "nome": "A", "capacidade": 10}
+    assert "fachada;dur=" in r.getheader("Server-Timing")
+
+    ev = {
+        "sala_id": 1,
+        "titulo": "X",
+        "inicio": "2025-01-01 09:00",
+        "fim": "2025-01-01 10:00",
+    }
+    status, criado, _ = pedir(con, "POST", "/eventos", ev)
+    assert status == 201
+    assert criado == {"id": 1, **ev}
+
+    status, erro, _ = pedir(con, "POST", "/eventos", {**ev, "titulo": "Y"})
+    assert (status, erro) == (409, {"erro": "conflito de horário"})
+
+    status, lista, _ = pedir(con, "GET", "/eventos")
+    assert status == 200 and [e["titulo"] for e in lista] == ["X"]
+
+    consulta = "?inicio=2025-01-01%2000:00&fim=2025-01-02%2000:00&sala_id=1"
+    status, dia, _ = pedir(con, "GET", "/eventos" + consulta)
+    assert status == 200 and [e["id"] for e in dia] == [1]
+
+    status, movido, _ = pedir(con, "PATCH", "/eventos/1", {"titulo": "Z"})
+    assert status == 200 and movido["titulo"] == "Z"
+    assert pedir(con, "DELETE", "/eventos/1")[0] == 200
+    assert pedir(con, "DELETE", "/eventos/1")[:2] == (
+        404,
+        {"erro": "evento não encontrado"},
+    )
+
+
+def test_disponíveis_paginação_lote_e_recorrências(con):
+    for nome, cap in (("P", 10), ("G", 40)):
+        pedir(con, "POST", "/salas", {"nome": nome, "capacidade": cap})
+    status, livres, _ = pedir(
+        con,
+        "GET",
+        "/salas/disponiveis?capacidade=5&inicio=2025-01-01%2009:00&fim=2025-01-01%2010:00",
+    )
+    assert status == 200 and [s["nome"] for s in livres] == ["P", "G"]
+
+    status, página, _ = pedir(con, "GET", "/salas?limite=1")
+    assert página == {"salas": [{"id": 1, "nome": "P", "capacidade": 10}], "proximo": 1}
+
+    lote = [
+        {
+            "sala_id": 1,
+            "titulo": "A",
+            "inicio": "2025-01-01 09:00",
+            "fim": "2025-01-01 10:00",
+        },
+        {
+            "sala_id": 9,
+            "titulo": "B",
+            "inicio": "2025-01-01 09:00",
+            "fim": "2025-01-01 10:00",
+        },
+    ]
+    status, resultados, _ = pedir(con, "POST", "/eventos/lote", lote)
+    assert status == 200
+    assert [r["ok"] for r in resultados] == [True, False]
+    assert resultados[1]["erro"] == "sala não existe"
+
+    rec = {
+        "sala_id": 2,
+        "titulo": "Aula",
+        "inicio": "2025-01-06 08:00",
+        "fim": "2025-01-06 10:00",
+        "frequencia": "semanal",
+        "ate": "2025-02-03 08:00",
+    }
+    status, criada, _ = pedir(con, "POST", "/recorrencias", rec)
+    assert status == 201
+    assert criada["frequência"] == "semanal" and criada["exceções"] == []
+    status, ocorrências, _ = pedir(
+        con, "GET", "/ocorrencias?inicio=2025-01-01%2000:00&fim=2025-01-20%2000:00"
+    )
+    assert [o["inicio"] for o in ocorrências] == [
+        "2025-01-06 08:00",
+        "2025-01-13 08:00",
+    ]
+    status, _, _ = pedir(
+        con, "DELETE", "/recorrencias/1/ocorrencias?inicio=2025-01-13%2008:00"
+    )
+    assert status == 200
+
+
+def test_erros_de_requisição(con):
+    assert pedir(con, "GET", "/nada")[0] == 404
+    assert pedir(con, "PUT", "/salas")[0] == 405
+    assert pedir(con, "POST", "/salas", {"nome": "A"})[:2] == (
+        400,
+        {"erro": "campo ausente: capacidade"},
+    )
+    assert pedir(con, "GET", "/salas/x")[:2] == (400, {"erro": "id da sala inválido"})
+    con.request("POST", "/salas", body=b"{nao json")
+    r = con.getresponse()
+    assert (r.status, json.loads(r.read())) == (400, {"erro": "JSON inválido"})
+    # a conexão continua utilizável depois dos erros
+    assert pedir(con, "GET", "/salas")[:2] == (200, [])
+
+
+def test_recusa_com_corpo_não_contamina_a_próxima_requisição(con):
+    sala = {"nome": "A", "capacidade": 10}
+    assert pedir(con, "POST", "/inexistente", sala)[:2] == (
+        404,
+        {"erro": "rota não encontrada"},
+    )
+    assert pedir(con, "PUT", "/salas", sala)[0] == 405
+    # mesma conexão: o corpo das recusas já foi consumido
+    status, criada, _ = pedir(con, "POST", "/salas", sala)
+    assert (status, criada["nome"]) == (201, "A")
+
+
+def test_content_length_inválido_responde_400(servidor):
+    with socket.create_connection(("127.0.0.1", servidor.server_port), timeout=5) as s:
+        s.sendall(b"POST /salas HTTP/1.1\r\nHost: x\r\nContent-Length: abc\r\n\r\n{}")
+        resposta = s.makefile("rb").read()  # o servidor fecha a conexão
+    assert resposta.startswith(b"HTTP/1.1 400")
+    assert "Content-Length inválido".encode() in resposta
+
+
+def test_remover_sala_com_eventos(con):
+    pedir(con, "POST", "/salas", {"nome": "A", "capacidade": 10})
+    ev = {
+        "sala_id": 1,
+        "titulo": "X",
+        "inicio": "2025-01-01 09:00",
+        "fim": "2025-01-01 10:00",
+    }
+    assert pedir(con, "POST", "/eventos", ev)[0] == 201
+
+    assert pedir(con, "DELETE", "/salas/1")[:2] == (
+        409,
+        {"erro": "sala possui reservas"},
+    )
+    status, dados, _ = pedir(con, "DELETE", "/salas/1?modo=cascata")
+    assert (status, dados) == (200, {"id": 1, "eventos": 1, "recorrencias": 0})
+    assert pedir(con, "GET", "/eventos")[:2] == (200, [])
+
+
+def test_serializar_objetos_do_domínio_sem_asdict():
+    assert json.loads(serializar(Sala(1, "A", 10))) == {
+        "id": 1,
+        "nome": "A",
+        "capacidade": 10,
+    }
+    assert json.loads(serializar([Frequência.DIÁRIA])) == ["diária"]
+
+
+def test_conexões_concorrentes_não_duplicam_reserva(servidor):
+    porta = servidor.server_port
+    c = http.client.HTTPConnection("127.0.0.1", porta, timeout=5)
+    pedir(c, "POST", "/salas", {"nome": "A", "capacidade": 10})
+    c.close()
+    ev = {
+        "sala_id": 1,
+        "titulo": "X",
+        "inicio": "2025-01-01 09:00",
+        "fim": "2025-01-01 10:00",
+    }
+    status: list[int] = []
+
+    def reservar():
+        c = http.client.HTTPConnection("127.0.0.1", porta, timeout=5)
+        status.append(pedir(c, "POST", "/eventos", ev)[0])
+        c.close()
+
+    ts = [threading.Thread(target=reservar) for _ in range(8)]
+    for t in ts:
+        t.start()
+    for t in ts:
+        t.join()
+    assert sorted(status) == [201] + [409] * 7
+
+
+def test_arquivo_listar_e_restaurar(con):
+    pedir(con, "POST", "/salas", {"nome": "Velha", "capacidade": 10})
+    ev = {
+        "sala_id": 1,
+        "titulo": "X",
+        "inicio": "2025-01-01 09:00",
+        "fim": "2025-01-01 10:00",
+    }
+    pedir(con, "POST", "/eventos", ev)
+    assert pedir(con, "DELETE", "/salas/1?modo=arquivar")[0] == 200
+
+    status, arquivados, _ = pedir(con, "GET", "/arquivo?sala_id=1")
+    assert (status, arquivados) == (200, [{"id": 1, **ev}])
+    assert pedir(con, "POST", "/arquivo/1/restaurar", {"sala_id": 9})[:2] == (
+        404,
+        {"erro": "sala não encontrada"},
+    )
+    pedir(con, "POST", "/salas", {"nome": "Nova", "capacidade": 10})
+    status, r, _ = pedir(con, "POST", "/arquivo/1/restaurar", {"sala_id": 2})
+    assert status == 201
+    assert r == {"restaurados": [{**ev, "id": 2, "sala_id": 2}], "recusados": []}
+    assert pedir(con, "GET", "/arquivo")[:2] == (200, [])
+    assert pedir(con, "POST", "/arquivo/1/restaurar", {"sala_id": 2})[0] == 404
@@ -1,6 +1,8 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from domínio.modelos import Sala, Evento
+import pytest
+
+from domínio.modelos import Sala, Evento, Frequência, Recorrência
 from domínio.serviços import (
     cadastrar_sala,
     listar_salas,
@@ -9,8 +11,30 @@ from domínio.serviços import (
     cancelar_evento,
     atualizar_evento,
     listar_eventos,
+    agendar_eventos_em_lote,
+    PedidoEvento,
+    buscar_salas_disponíveis,
+    listar_salas_paginado,
+    iterar_salas,
+    listar_eventos_paginado,
+    iterar_eventos,
+    listar_eventos_no_intervalo,
+    agendar_evento_detalhado,
+    atualizar_evento_detalhado,
+    MotivoRecusa,
+    agendar_recorrência,
+    cancelar_ocorrência,
+    listar_ocorrências,
+    remover_sala_detalhado,
+    ModoRemoçãoSala,
+    listar_arquivados,
+    restaurar_arquivados,
+)
+from domínio.repositórios import (
+    SalaRepository,
+    EventoRepository,
+    RecorrênciaRepository,
 )
-from domínio.repositórios import SalaRepository, EventoRepository
 
 
 class MemSalaRepo(SalaRepository):
@@ -73,6 +97,33 @@ class MemEventoRepo(EventoRepository):
         return [e for e in self._dados if e.sala_id == sala_id]
 
 
+class MemRecorrênciaRepo(RecorrênciaRepository):
+    def __init__(self) -> None:
+        self._dados: dict[int, Recorrência] = {}
+
+    def proximo_id(self) -> int:
+        return max(self._dados, default=0) + 1
+
+    def adicionar(self, recorrência: Recorrência) -> Recorrência:
+        self._dados[recorrência.id] = recorrência
+        return recorrência
+
+    def atualizar(self, recorrência: Recorrência) -> Recorrência:
+        return self.adicionar(recorrência)
+
+    def remover(self, recorrência_id: int) -> bool:
+        return self._dados.pop(recorrência_id, None) is not None
+
+    def obter_por_id(self, recorrência_id: int) -> Recorrência | None:
+        return self._dados.get(recorrência_id)
+
+    def listar(self) -> list[Recorrência]:
+        return list(self._dados.values())
+
+    def listar_por_sala(self, sala_id: int) -> list[Recorrência]:
+        return [r for r in self._dados.values() if r.sala_id == sala_id]
+
+
 def dt(hm: str) -> datetime:
     h, m = map(int, hm.split(":"))
     return datetime(2025, 1, 1, h, m)
@@ -204,3 +255,400 @@ def test_cancelar_atualizar_e_listar_eventos():
     ids = [e.id for e in ordenados]
     # Os três primeiros devem ser e3, e4 (mesmo horário, ordena por sala_id), depois e5
     assert ids[:3] == [e3.id, e4.id, e5.id]
+
+
+def test_agendar_eventos_em_lote():
+    rs = MemSalaRepo()
+    re = MemEventoRepo()
+    s1 = cadastrar_sala(rs, "Sala 1", 5)
+    s2 = cadastrar_sala(rs, "Sala 2", 10)
+    assert s1 is not None and s2 is not None
+    existente = agendar_evento(
+        re, rs, sala_id=s1.id, titulo="Existente", inicio=dt("10:00"), fim=dt("11:00")
+    )
+    assert existente is not None
+
+    resultado = agendar_eventos_em_lote(
+        re,
+        rs,
+        [
+            PedidoEvento(s1.id, "Conflita existente", dt("10:30"), dt("11:30")),
+            PedidoEvento(s1.id, "Ok antes", dt("09:00"), dt("10:00")),
+            PedidoEvento(s1.id, "Conflita no lote", dt("09:30"), dt("09:45")),
+            PedidoEvento(s1.id, "Engloba existente", dt("08:00"), dt("12:00")),
+            PedidoEvento(s2.id, "Outra sala", dt("09:30"), dt("09:45")),
+            PedidoEvento(999, "Sala inexistente", dt("09:00"), dt("10:00")),
+            PedidoEvento(s2.id, " ", dt("12:00"), dt("13:00")),
+            (s2.id, "Tupla simples", dt("13:00"), dt("12:00")),
+            PedidoEvento(s1.id, "  Ok depois  ", dt("11:00"), dt("12:00")),
+        ],
+    )
+
+    aceitos = [e.titulo if e is not None else None for e in resultado]
+    assert aceitos == [
+        None,
+        "Ok antes",
+        None,
+        None,
+        "Outra sala",
+        None,
+        None,
+        None,
+        "Ok depois",
+    ]
+    # ids sequenciais na ordem dos pedidos, após o existente
+    assert [e.id for e in resultado if e is not None] == [2, 3, 4]
+    assert [e.titulo for e in listar_eventos(re)] == [
+        "Ok antes",
+        "Outra sala",
+        "Existente",
+        "Ok depois",
+    ]
+
+
+def test_agendar_eventos_em_lote_empate_no_início_vence_o_primeiro():
+    rs = MemSalaRepo()
+    re = MemEventoRepo()
+    s = cadastrar_sala(rs, "Sala", 5)
+    assert s is not None
+
+    resultado = agendar_eventos_em_lote(
+        re,
+        rs,
+        [
+            PedidoEvento(s.id, "A", dt("09:00"), dt("10:00")),
+            PedidoEvento(s.id, "B", dt("09:00"), dt("09:30")),
+        ],
+    )
+    assert [e.titulo if e else None for e in resultado] == ["A", None]
+    assert agendar_eventos_em_lote(re, rs, []) == []
+
+
+def test_buscar_salas_disponíveis_por_melhor_encaixe():
+    rs = MemSalaRepo()
+    re = MemEventoRepo()
+    grande = cadastrar_sala(rs, "Grande", 100)
+    média = cadastrar_sala(rs, "Média", 40)
+    ocupada = cadastrar_sala(rs, "Ocupada", 45)
+    _ = cadastrar_sala(rs, "Pequena", 10)
+    assert grande and média and ocupada
+    agendar_evento(
+        re, rs, sala_id=ocupada.id, titulo="Aula", inicio=dt("14:00"), fim=dt("16:00")
+    )
+
+    livres = buscar_salas_disponíveis(re, rs, 40, dt("15:00"), dt("16:00"))
+    assert [s.nome for s in livres] == ["Média", "Grande"]
+
+    # fora do horário ocupado, a sala de 45 volta a ser opção
+    livres = buscar_salas_disponíveis(re, rs, 40, dt("16:00"), dt("17:00"))
+    assert [s.nome for s in livres] == ["Média", "Ocupada", "Grande"]
+
+    assert buscar_salas_disponíveis(re, rs, 200, dt("16:00"), dt("17:00")) == []
+    assert buscar_salas_disponíveis(re, rs, 1, dt("17:00"), dt("16:00")) == []
+
+
+def test_listar_salas_paginado_e_iterar_salas():
+    rs = MemSalaRepo()
+    for nome in ("A", "B", "C"):
+        cadastrar_sala(rs, nome, 10)
+    rs.remover(2)
+
+    assert [s.nome for s in listar_salas_paginado(rs, 1)] == ["A"]
+    assert [s.nome for s in listar_salas_paginado(rs, 5, após=1)] == ["C"]
+    assert listar_salas_paginado(rs, 5, após=3) == []
+    assert [s.nome for s in iterar_salas(rs)] == ["A", "C"]
+
+
+def test_listar_eventos_paginado_segue_o_cursor():
+    rs = MemSalaRepo()
+    re = MemEventoRepo()
+    s1 = cadastrar_sala(rs, "Sala 1", 5)
+    s2 = cadastrar_sala(rs, "Sala 2", 5)
+    assert s1 and s2
+    for sala, titulo, ini, fim in (
+        (s2, "B", "10:00", "11:00"),
+        (s1, "A", "10:00", "11:00"),
+        (s1, "C", "09:00", "10:00"),
+    ):
+        agendar_evento(
+            re, rs, sala_id=sala.id, titulo=titulo, inicio=dt(ini), fim=dt(fim)
+        )
+
+    página = listar_eventos_paginado(re, 2)
+    assert [e.titulo for e in página] == ["C", "A"]
+    último = página[-1]
+    cursor = (último.inicio, último.sala_id, último.id)
+    assert [e.titulo for e in listar_eventos_paginado(re, 2, cursor)] == ["B"]
+    assert listar_eventos_paginado(re, 0) == []
+    assert [e.titulo for e in iterar_eventos(re)] == ["C", "A", "B"]
+
+
+def test_listar_eventos_no_intervalo_padrão_filtra_e_ordena():
+    rs = MemSalaRepo()
+    re = MemEventoRepo()
+    s1 = cadastrar_sala(rs, "Sala 1", 5)
+    s2 = cadastrar_sala(rs, "Sala 2", 5)
+    assert s1 and s2
+    for sala, titulo, ini, fim in (
+        (s2, "B", "10:00", "11:00"),
+        (s1, "A", "10:00", "12:00"),
+        (s1, "Antes", "07:00", "08:00"),
+    ):
+        agendar_evento(
+            re, rs, sala_id=sala.id, titulo=titulo, inicio=dt(ini), fim=dt(fim)
+        )
+
+    dia = listar_eventos_no_intervalo(re, dt("09:00"), dt("18:00"))
+    assert [e.titulo for e in dia] == ["A", "B"]
+    sala_2 = listar_eventos_no_intervalo(re, dt("09:00"), dt("18:00"), s2.id)
+    assert [e.titulo for e in sala_2] == ["B"]
+    assert [
+        e.titulo for e in listar_eventos_no_intervalo(re, dt("11:30"), dt("18:00"))
+    ] == ["A"]
+    assert listar_eventos_no_intervalo(re, dt("18:00"), dt("09:00")) == []
+
+
+def test_agendar_evento_detalhado_informa_motivo_e_conflito():
+    rs = MemSalaRepo()
+    re = MemEventoRepo()
+    s1 = cadastrar_sala(rs, "Sala 1", 5)
+    assert s1 is not None
+
+    ok = agendar_evento_detalhado(re, rs, s1.id, " Aula ", dt("09:00"), dt("10:00"))
+    assert ok.ok and ok.motivo is None and ok.evento.titulo == "Aula"
+
+    r = agendar_evento_detalhado(re, rs, s1.id, "B", dt("09:30"), dt("10:30"))
+    assert not r.ok
+    assert r.motivo is MotivoRecusa.CONFLITO and r.conflito == ok.evento
+
+    casos = [
+        ((999, "B", dt("11:00"), dt("12:00")), MotivoRecusa.SALA_INEXISTENTE),
+        ((s1.id, " ", dt("11:00"), dt("12:00")), MotivoRecusa.TITULO_INVALIDO),
+        ((s1.id, "B", dt("12:00"), dt("11:00")), MotivoRecusa.INTERVALO_INVALIDO),
+    ]
+    for args, motivo in casos:
+        r = agendar_evento_detalhado(re, rs, *args)
+        assert r == (None, motivo, None)
+    assert len(re.listar()) == 1
+
+
+def test_atualizar_evento_detalhado_informa_motivo_e_conflito():
+    rs = MemSalaRepo()
+    re = MemEventoRepo()
+    s1 = cadastrar_sala(rs, "Sala 1", 5)
+    assert s1 is not None
+    a = agendar_evento(re, rs, s1.id, "A", dt("09:00"), dt("10:00"))
+    b = agendar_evento(re, rs, s1.id, "B", dt("10:00"), dt("11:00"))
+    assert a and b
+
+    r = atualizar_evento_detalhado(re, rs, b.id, inicio=dt("09:30"))
+    assert r.motivo is MotivoRecusa.CONFLITO and r.conflito == a
+    # mover o próprio evento não conflita consigo mesmo
+    r = atualizar_evento_detalhado(re, rs, a.id, fim=dt("09:45"))
+    assert r.ok and r.evento.fim == dt("09:45")
+
+    assert atualizar_evento_detalhado(re, rs, 999).motivo is (
+        MotivoRecusa.EVENTO_INEXISTENTE
+    )
+    assert atualizar_evento_detalhado(re, rs, a.id, sala_id=999).motivo is (
+        MotivoRecusa.SALA_INEXISTENTE
+    )
+    assert atualizar_evento_detalhado(re, rs, a.id, titulo=" ").motivo is (
+        MotivoRecusa.TITULO_INVALIDO
+    )
+    assert atualizar_evento_detalhado(re, rs, a.id, fim=dt("08:00")).motivo is (
+        MotivoRecusa.INTERVALO_INVALIDO
+    )
+
+
+def test_agendar_recorrência_conflitos_regra_a_regra():
+    rs, re, rr = MemSalaRepo(), MemEventoRepo(), MemRecorrênciaRepo()
+    sala = cadastrar_sala(rs, "Sala 1", 30)
+    assert sala is not None
+    seg = datetime(2025, 1, 6, 9)  # segunda-feira
+    até = datetime(2025, 6, 30)
+    semanal = Frequência.SEMANAL
+
+    def agendar(titulo, inicio, horas=2, **kw):
+        return agendar_recorrência(
+            rr,
+            re,
+            rs,
+            sala.id,
+            titulo,
+            inicio,
+            inicio + timedelta(hours=horas),
+            kw.pop("frequência", semanal),
+            kw.pop("até", até),
+            **kw,
+        )
+
+    a = agendar("Cálculo", seg, intervalo=2)
+    assert a.ok and a.recorrência.id == 1
+    # semanas alternadas no mesmo horário cabem; toda semana não
+    assert agendar("Física", seg + timedelta(weeks=1), intervalo=2).ok
+    r = agendar("Química", seg + timedelta(hours=1))
+    assert r.motivo is MotivoRecusa.CONFLITO and r.conflito.recorrencia_id == 1
+
+    # evento avulso dentro da vigência bloqueia a regra; fora dela, não
+    terça = datetime(2025, 3, 11, 14)
+    agendar_evento(re, rs, sala.id, "Palestra", terça, terça + timedelta(hours=1))
+    r = agendar("Lab", datetime(2025, 1, 7, 13))
+    assert r.motivo is MotivoRecusa.CONFLITO and r.conflito.titulo == "Palestra"
+    assert agendar("Lab", datetime(2025, 1, 7, 13), até=datetime(2025, 3, 1)).ok
+
+    # e a regra bloqueia eventos avulsos numa ocorrência
+    terça_lab = datetime(2025, 2, 4, 14)
+    res = agendar_evento_detalhado(
+        re, rs, sala.id, "Reunião", terça_lab, terça_lab + timedelta(hours=1), rr
+    )
+    assert res.motivo is MotivoRecusa.CONFLITO and res.conflito.titulo == "Lab"
+
+    assert agendar("X", seg, intervalo=0).motivo is MotivoRecusa.RECORRENCIA_INVALIDA
+    assert agendar("X", seg, até=seg - timedelta(days=1)).motivo is (
+        MotivoRecusa.RECORRENCIA_INVALIDA
+    )
+
+
+def test_cancelar_ocorrência_e_listar_ocorrências():
+    rs, re, rr = MemSalaRepo(), MemEventoRepo(), MemRecorrênciaRepo()
+    s1 = cadastrar_sala(rs, "Sala 1", 30)
+    s2 = cadastrar_sala(rs, "Sala 2", 30)
+    assert s1 and s2
+    seg = datetime(2025, 1, 6, 9)
+    for sala, inicio in ((s1, seg), (s2, seg - timedelta(hours=1))):
+        agendar_recorrência(
+            rr,
+            re,
+            rs,
+            sala.id,
+            "Aula",
+            inicio,
+            inicio + timedelta(hours=2),
+            Frequência.SEMANAL,
+            datetime(2025, 6, 30),
+        )
+
+    semana = (datetime(2025, 1, 13), datetime(2025, 1, 20))
+    assert [(o.sala_id, o.inicio.hour) for o in listar_ocorrências(rr, *semana)] == [
+        (2, 8),
+        (1, 9),
+    ]
+    assert cancelar_ocorrência(rr, 1, datetime(2025, 1, 13, 9)) is not None
+    assert cancelar_ocorrência(rr, 1, datetime(2025, 1, 13, 9)) is None  # já cancelada
+    assert cancelar_ocorrência(rr, 1, datetime(2025, 1, 14, 9)) is None  # não existe
+    assert cancelar_ocorrência(rr, 99, seg) is None
+    assert [o.sala_id for o in listar_ocorrências(rr, *semana)] == [2]
+    assert listar_ocorrências(rr, *semana, sala_id=1) == []
+
+    # o horário liberado pode receber um evento avulso
+    ev = agendar_evento(
+        re, rs, s1.id, "Prova", datetime(2025, 1, 13, 9), datetime(2025, 1, 13, 11), rr
+    )
+    assert ev is not None
+
+
+def test_remover_sala_detalhado_recusa_cascata_e_arquivo():
+    rs, re, rr = MemSalaRepo(), MemEventoRepo(), MemRecorrênciaRepo()
+    s1 = cadastrar_sala(rs, "A", 10)
+    s2 = cadastrar_sala(rs, "B", 10)
+    s3 = cadastrar_sala(rs, "C", 10)
+    e1 = agendar_evento(re, rs, s1.id, "X", dt("09:00"), dt("10:00"))
+    e2 = agendar_evento(re, rs, s1.id, "Y", dt("08:00"), dt("09:00"))
+    outro = agendar_evento(re, rs, s2.id, "Z", dt("09:00"), dt("10:00"))
+    regra = agendar_recorrência(
+        rr,
+        re,
+        rs,
+        s2.id,
+        "Aula",
+        datetime(2025, 1, 6, 8),
+        datetime(2025, 1, 6, 9),
+        Frequência.SEMANAL,
+        datetime(2025, 3, 31),
+    ).recorrência
+
+    # padrão: recusa e aponta as reservas que impedem
+    r = remover_sala_detalhado(rs, re, s1.id, recorrências=rr)
+    assert not r.ok
+    assert r.motivo is MotivoRecusa.SALA_COM_RESERVAS
+    assert set(r.eventos) == {e1, e2}
+    assert rs.obter_por_id(s1.id) is not None
+    r = remover_sala_detalhado(rs, re, s3.id)
+    assert r.ok and r.removida == s3 and r.eventos == ()
+
+    # arquivar: os eventos vão para o arquivo com os mesmos ids
+    arquivo = MemEventoRepo()
+    r = remover_sala_detalhado(
+        rs, re, s1.id, ModoRemoçãoSala.ARQUIVAR, rr, arquivo=arquivo
+    )
+    assert r.ok and set(r.eventos) == {e1, e2}
+    assert sorted(arquivo.listar(), key=lambda e: e.id) == [e1, e2]
+    assert re.listar() == [outro]
+
+    # cascata: eventos e recorrências saem junto
+    r = remover_sala_detalhado(rs, re, s2.id, ModoRemoçãoSala.CASCATA, rr)
+    assert r.ok and r.eventos == (outro,) and r.recorrências == (regra,)
+    assert re.listar() == [] and rr.listar() == [] and rs.listar() == []
+
+    r = remover_sala_detalhado(rs, re, s2.id, ModoRemoçãoSala.CASCATA, rr)
+    assert r.motivo is MotivoRecusa.SALA_INEXISTENTE
+    with pytest.raises(ValueError):
+        remover_sala_detalhado(rs, re, s2.id, ModoRemoçãoSala.ARQUIVAR)
+    # a sala removida não recebe mais agendamentos
+    assert agendar_evento(re, rs, s1.id, "W", dt("11:00"), dt("12:00")) is None
+
+
+def test_arquivar_grava_no_arquivo_antes_de_remover():
+    rs, re = MemSalaRepo(), MemEventoRepo()
+    s1 = cadastrar_sala(rs, "A", 10)
+    e1 = agendar_evento(re, rs, s1.id, "X", dt("09:00"), dt("10:00"))
+
+    class ArquivoComFalha(MemEventoRepo):
+        def adicionar_em_lote(self, eventos):
+            raise OSError("disco cheio")
+
+    with pytest.raises(OSError):
+        remover_sala_detalhado(
+            rs, re, s1.id, ModoRemoçãoSala.ARQUIVAR, arquivo=ArquivoComFalha()
+        )
+    # a falha no arquivo não perde nada: evento e sala continuam
+    assert re.listar() == [e1] and rs.obter_por_id(s1.id) == s1
+
+    # nova tentativa depois de uma interrupção entre arquivar e remover:
+    # o evento já arquivado não é gravado de novo
+    arquivo = MemEventoRepo()
+    arquivo.adicionar(e1)
+    r = remover_sala_detalhado(rs, re, s1.id, ModoRemoçãoSala.ARQUIVAR, arquivo=arquivo)
+    assert r.ok and r.eventos == (e1,)
+    assert arquivo.listar() == [e1] and re.listar() == []
+
+
+def test_listar_e_restaurar_arquivados():
+    rs, re = MemSalaRepo(), MemEventoRepo()
+    velha = cadastrar_sala(rs, "Velha", 10)
+    e1 = agendar_evento(re, rs, velha.id, "X", dt("09:00"), dt("10:00"))
+    e2 = agendar_evento(re, rs, velha.id, "Y", dt("08:00"), dt("09:00"))
+    arquivo = MemEventoRepo()
+    remover_sala_detalhado(rs, re, velha.id, ModoRemoçãoSala.ARQUIVAR, arquivo=arquivo)
+    assert listar_arquivados(arquivo, velha.id) == [e2, e1]
+    assert listar_arquivados(arquivo) == [e2, e1]
+    assert listar_arquivados(arquivo, 99) == []
+
+    r = restaurar_arquivados(arquivo, re, rs, velha.id, 99)
+    assert not r.ok and r.motivo is MotivoRecusa.SALA_INEXISTENTE
+
+    # a sala nova já tem um evento às 09:30: só "Y" cabe
+    nova = cadastrar_sala(rs, "Nova", 10)
+    ocupado = agendar_evento(re, rs, nova.id, "Z", dt("09:30"), dt("10:30"))
+    r = restaurar_arquivados(arquivo, re, rs, velha.id, nova.id)
+    assert r.ok and r.recusados == (e1,)
+    (restaurado,) = r.restaurados
+    assert (restaurado.sala_id, restaurado.titulo, restaurado.inicio) == (
+        nova.id,
+        "Y",
+        e2.inicio,
+    )
+    # o recusado continua no arquivo; o restaurado saiu dele
+    assert listar_arquivados(arquivo) == [e1]
+    assert sorted(re.listar(), key=lambda e: e.id) == [ocupado, restaurado]
@@ -0,0 +1,224 @@
+import asyncio
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.container import (
+    ContainerAsync,
+    criar_container_async,
+    criar_container_async_sqlite,
+    criar_container_memória,
+)
+from domínio import serviços_async as sa
+from domínio.modelos import Frequência, Recorrência, Sala
+from domínio.serviços import MotivoRecusa
+
+
+def dt(hm: str) -> datetime:
+    h, m = map(int, hm.split(":"))
+    return datetime(2025, 1, 1, h, m)
+
+
+@pytest.fixture
+def container():
+    c = criar_container_async(max_threads=4)
+    yield c
+    c.fechar()
+
+
+def rodar(coro):
+    return asyncio.run(coro)
+
+
+def test_salas_cadastro_listagem_remoção(container: ContainerAsync):
+    async def fluxo():
+        a = await sa.cadastrar_sala(container.sala_repo, "A", 10)
+        b = await sa.cadastrar_sala(container.sala_repo, "B", 20)
+        assert await sa.cadastrar_sala(container.sala_repo, "  ", 10) is None
+        assert await sa.cadastrar_sala(container.sala_repo, "C", 0) is None
+        assert [s.id for s in await sa.listar_salas(container.sala_repo)] == [1, 2]
+        assert await sa.remover_sala(container.sala_repo, a.id)
+        assert not await sa.remover_sala(container.sala_repo, a.id)
+        return [s async for s in sa.iterar_salas(container.sala_repo)] == [b]
+
+    assert rodar(fluxo())
+
+
+def test_agendar_atualizar_cancelar_motivos(container: ContainerAsync):
+    ev, salas = container.evento_repo, container.sala_repo
+
+    async def fluxo():
+        await sa.cadastrar_sala(salas, "A", 10)
+        await sa.cadastrar_sala(salas, "B", 10)
+        r = await sa.agendar_evento_detalhado(
+            ev, salas, 1, "X", dt("09:00"), dt("10:00")
+        )
+        assert r.ok and r.evento.id == 1
+
+        r2 = await sa.agendar_evento_detalhado(
+            ev, salas, 1, "Y", dt("09:30"), dt("10:30")
+        )
+        assert r2.motivo is MotivoRecusa.CONFLITO and r2.conflito == r.evento
+        r3 = await sa.agendar_evento_detalhado(
+            ev, salas, 9, "Y", dt("09:00"), dt("10:00")
+        )
+        assert r3.motivo is MotivoRecusa.SALA_INEXISTENTE
+        r4 = await sa.agendar_evento_detalhado(
+            ev, salas, 1, " ", dt("09:00"), dt("10:00")
+        )
+        assert r4.motivo is MotivoRecusa.TITULO_INVALIDO
+        r5 = await sa.agendar_evento_detalhado(
+            ev, salas, 1, "Y", dt("10:00"), dt("09:00")
+        )
+        assert r5.motivo is MotivoRecusa.INTERVALO_INVALIDO
+
+        movido = await sa.atualizar_evento(ev, salas, 1, sala_id=2, titulo="Z")
+        assert (movido.sala_id, movido.titulo) == (2, "Z")
+        r6 = await sa.atualizar_evento_detalhado(ev, salas, 99, titulo="W")
+        assert r6.motivo is MotivoRecusa.EVENTO_INEXISTENTE
+
+        assert [e.id for e in await sa.listar_eventos(ev)] == [1]
+        dia = await sa.listar_eventos_no_intervalo(ev, dt("00:00"), dt("23:59"), 2)
+        assert [e.id for e in dia] == [1]
+        assert await sa.cancelar_evento(ev, 1)
+        assert not await sa.cancelar_evento(ev, 1)
+        return await sa.listar_eventos(ev)
+
+    assert rodar(fluxo()) == []
+
+
+def test_recorrências_ocupam_horário():
+    base = criar_container_memória()
+    base.sala_repo.adicionar(Sala(id=1, nome="A", capacidade=10))
+    base.recorrencia_repo.adicionar(
+        Recorrência(
+            id=1,
+            sala_id=1,
+            titulo="Aula",
+            inicio=dt("09:00"),
+            fim=dt("10:00"),
+            frequência=Frequência.DIÁRIA,
+            até=dt("09:00") + timedelta(days=10),
+        )
+    )
+    c = criar_container_async(base)
+    amanhã = timedelta(days=1)
+
+    async def fluxo():
+        r = await sa.agendar_evento_detalhado(
+            c.evento_repo,
+            c.sala_repo,
+            1,
+            "X",
+            dt("09:30") + amanhã,
+            dt("10:30") + amanhã,
+            c.recorrencia_repo,
+        )
+        livre = await sa.sala_disponível(
+            c.evento_repo,
+            1,
+            dt("10:00") + amanhã,
+            dt("11:00") + amanhã,
+            c.recorrencia_repo,
+        )
+        return r, livre
+
+    try:
+        r, livre = rodar(fluxo())
+    finally:
+        c.fechar()
+    assert r.motivo is MotivoRecusa.CONFLITO and r.conflito.recorrencia_id == 1
+    assert livre
+
+
+def test_muitas_consultas_concorrentes_e_um_único_vencedor(container: ContainerAsync):
+    ev, salas = container.evento_repo, container.sala_repo
+
+    async def fluxo():
+        # cadastros concorrentes recebem ids distintos
+        await asyncio.gather(
+            *(sa.cadastrar_sala(salas, f"S{cap}", cap) for cap in (30, 10, 20))
+        )
+        cadastradas = await salas.listar()
+        assert sorted(s.id for s in cadastradas) == [1, 2, 3]
+        por_capacidade = {s.capacidade: s.id for s in cadastradas}
+        # mil pedidos simultâneos para o mesmo horário: só um agenda
+        pedidos = [
+            sa.agendar_evento_detalhado(
+                ev, salas, por_capacidade[30], f"E{i}", dt("09:00"), dt("10:00")
+            )
+            for i in range(1000)
+        ]
+        resultados = await asyncio.gather(*pedidos)
+        consultas = await asyncio.gather(
+            *(
+                sa.buscar_salas_disponíveis(ev, salas, 15, dt("09:00"), dt("10:00"))
+                for _ in range(1000)
+            )
+        )
+        return resultados, consultas, por_capacidade
+
+    resultados, consultas, por_capacidade = rodar(fluxo())
+    assert sum(r.ok for r in resultados) == 1
+    # sala de capacidade 30 ocupada; sobra a de 20, melhor encaixe
+    assert all([s.id for s in livres] == [por_capacidade[20]] for livres in consultas)
+
+
+def test_adaptador_roda_no_pool_e_respeita_trava_síncrona(container: ContainerAsync):
+    ev = container.evento_repo
+    threads: set[str] = set()
+    original = ev.síncrono.listar_por_sala
+
+    def espião(sala_id):
+        threads.add(threading.current_thread().name)
+        return original(sala_id)
+
+    ev.síncrono.listar_por_sala = espião
+
+    async def fluxo():
+        await ev.listar_por_sala(1)
+        # trava síncrona segura por outra thread: o async espera sem travar o loop
+        segura, solta = threading.Event(), threading.Event()
+
+        def outra_thread():
+            with ev.síncrono.travar_salas(1):
+                segura.set()
+                solta.wait()
+
+        t = threading.Thread(target=outra_thread)
+        t.start()
+        segura.wait()
+        entrou = asyncio.Event()
+
+        async def travar():
+            async with ev.travar_salas(1):
+                entrou.set()
+
+        tarefa = asyncio.create_task(travar())
+        await asyncio.sleep(0.05)
+        assert not entrou.is_set()
+        solta.set()
+        await asyncio.wait_for(tarefa, timeout=2)
+        t.join()
+        return entrou.is_set()
+
+    assert rodar(fluxo())
+    assert threads and all(n.startswith("repos") for n in threads)
+
+
+def test_container_async_sqlite():
+    c = criar_container_async_sqlite(":memory:")
+
+    async def fluxo():
+        await sa.cadastrar_sala(c.sala_repo, "A", 10)
+        await sa.agendar_evento(
+            c.evento_repo, c.sala_repo, 1, "X", dt("09:00"), dt("10:00")
+        )
+        return await sa.listar_eventos(c.evento_repo)
+
+    try:
+        eventos = rodar(fluxo())
+    finally:
+        c.fechar()
+    assert [e.titulo for e in eventos] == ["X"]